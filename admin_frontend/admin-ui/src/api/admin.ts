@@ -128,7 +128,7 @@ export type BackupJobEntry = {
   error?: string | null;
 };
 
-type BackupListResponse = { items: BackupApiEntry[] };
+type BackupListResponse = { items: BackupApiEntry[]; total: number };
 type BackupActionResponse = { backup: BackupApiEntry; message: string };
 type BackupJobResponse = { job: BackupJobEntry; message: string };
 type AdminGlobalCustomerSettingsResponse = GlobalCustomerSettingsResponse;
@@ -275,7 +275,7 @@ export async function adminUpdateEmailSettings(adminKey: string, actor: string |
 export async function adminListBackups(
   adminKey: string,
   actor?: string,
-  params?: { tenant_id?: string; scope?: "tenant" | "all" }
+  params?: { tenant_id?: string; scope?: "tenant" | "all"; limit?: number; offset?: number }
 ) {
   const res = await api.get<BackupListResponse>("/admin/backups", { ...withAdmin(adminKey, actor), params });
   return res.data.items;
@@ -1620,6 +1620,13 @@ export interface components {
             ok: boolean;
             /** Error */
             error?: string | null;
+            /**
+             * Queued
+             * @default false
+             */
+            queued?: boolean;
+            /** Outbox Id */
+            outbox_id?: string | null;
         };
         /** HTTPValidationError */
         HTTPValidationError: {
@@ -15,9 +15,13 @@ from app.models.tenant import Tenant  # noqa: F401
 from app.models.user import User  # noqa: F401
 from app.models.membership import Membership  # noqa: F401
 from app.models.audit_log import AdminAuditLog  # noqa: F401
+from app.models.background_job import BackgroundJob  # noqa: F401
+from app.models.backup import BackupJob, BackupRecord  # noqa: F401
+from app.models.email_outbox import EmailOutbox  # noqa: F401
 from app.models.item import Item  # noqa: F401
 from app.models.category import Category  # noqa: F401
 from app.models.movement import InventoryMovement  # noqa: F401
+from app.models.consumption_rollup import InventoryConsumptionMonthly  # noqa: F401
 from app.models.item_unit import ItemUnit  # noqa: F401
 from app.models.industry import Industry, IndustryArticle  # noqa: F401
 
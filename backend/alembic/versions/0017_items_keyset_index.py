@@ -0,0 +1,25 @@
+"""add items (tenant_id, name, id) index for keyset pagination
+
+Revision ID: 0017_items_keyset_index
+Revises: 0016_add_customer_support_settings
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0017_items_keyset_index"
+down_revision = "0016_add_customer_support_settings"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_items_tenant_name_id", "items", ["tenant_id", "name", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_items_tenant_name_id", table_name="items")
@@ -0,0 +1,37 @@
+"""add pg_trgm GIN indexes for item search
+
+Revision ID: 0018_items_trgm_search
+Revises: 0017_items_keyset_index
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0018_items_trgm_search"
+down_revision = "0017_items_keyset_index"
+branch_labels = None
+depends_on = None
+
+_TRGM_COLUMNS = ("sku", "barcode", "name")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in _TRGM_COLUMNS:
+        op.create_index(
+            f"ix_items_{column}_trgm",
+            "items",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in _TRGM_COLUMNS:
+        op.drop_index(f"ix_items_{column}_trgm", table_name="items")
+    # Extension bleibt bestehen (kann von anderen Objekten genutzt werden)
@@ -0,0 +1,58 @@
+"""add monthly consumption rollup table for reports
+
+Revision ID: 0019_consumption_monthly_rollup
+Revises: 0018_items_trgm_search
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0019_consumption_monthly_rollup"
+down_revision = "0018_items_trgm_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "inventory_consumption_monthly",
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "item_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("items.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("month", sa.Date(), primary_key=True),
+        sa.Column("qty_out", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("qty_in", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # Backfill aus den bestehenden Bewegungen (gleiche Logik wie rebuild_consumption_rollup)
+    op.execute(
+        """
+        INSERT INTO inventory_consumption_monthly (tenant_id, item_id, month, qty_out, qty_in)
+        SELECT
+            tenant_id,
+            item_id,
+            date_trunc('month', created_at AT TIME ZONE 'UTC')::date,
+            COALESCE(SUM(CASE WHEN type = 'OUT' THEN qty ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN type = 'IN' THEN qty ELSE 0 END), 0)
+        FROM inventory_movements
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("inventory_consumption_monthly")
@@ -0,0 +1,40 @@
+"""add composite indexes for inventory movement queries
+
+Revision ID: 0020_movements_composite_indexes
+Revises: 0019_consumption_monthly_rollup
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0020_movements_composite_indexes"
+down_revision = "0019_consumption_monthly_rollup"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_inventory_movements_tenant_created_at",
+        "inventory_movements",
+        ["tenant_id", sa.text("created_at DESC")],
+    )
+    op.create_index(
+        "ix_inventory_movements_tenant_type_created_at",
+        "inventory_movements",
+        ["tenant_id", "type", "created_at"],
+        postgresql_include=["item_id", "qty"],
+    )
+    # tenant_id ist jetzt führende Spalte der Composite-Indizes, der Einzelindex ist redundant
+    op.drop_index("ix_inventory_movements_tenant_id", table_name="inventory_movements")
+
+
+def downgrade() -> None:
+    op.create_index("ix_inventory_movements_tenant_id", "inventory_movements", ["tenant_id"])
+    op.drop_index("ix_inventory_movements_tenant_type_created_at", table_name="inventory_movements")
+    op.drop_index("ix_inventory_movements_tenant_created_at", table_name="inventory_movements")
@@ -0,0 +1,48 @@
+"""add updated_at columns for incremental tenant backups
+
+Revision ID: 0023_updated_at_change_tracking
+Revises: 0022_email_outbox
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0023_updated_at_change_tracking"
+down_revision = "0022_email_outbox"
+branch_labels = None
+depends_on = None
+
+# Veränderliche Tenant-Tabellen; inventory_movements ist append-only und nutzt recorded_at (0025),
+# nicht das vom Client rückdatierbare created_at
+_TABLES = (
+    "categories",
+    "inventory_orders",
+    "inventory_order_items",
+    "items",
+    "memberships",
+    "tenant_settings",
+)
+_INDEXED_TABLES = ("items", "inventory_orders", "inventory_order_items")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        # Bestehende Zeilen gelten als "jetzt geändert": das erste inkrementelle Backup ist ohnehin ein Voll-Backup
+        op.add_column(
+            table,
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        )
+    for table in _INDEXED_TABLES:
+        op.create_index(f"ix_{table}_tenant_updated_at", table, ["tenant_id", "updated_at"])
+
+
+def downgrade() -> None:
+    for table in reversed(_INDEXED_TABLES):
+        op.drop_index(f"ix_{table}_tenant_updated_at", table_name=table)
+    for table in reversed(_TABLES):
+        op.drop_column(table, "updated_at")
@@ -0,0 +1,80 @@
+"""move backup index and backup jobs from json files into tables
+
+Revision ID: 0024_backup_index_tables
+Revises: 0023_updated_at_change_tracking
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0024_backup_index_tables"
+down_revision = "0023_updated_at_change_tracking"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backup_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("status", sa.String(length=32), nullable=False, server_default="queued"),
+        sa.Column("kind", sa.String(length=16), nullable=False, server_default="full"),
+        sa.Column("trigger", sa.String(length=16), nullable=True),
+        sa.Column("total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("processed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "failed_tenants",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("scheduled_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_backup_jobs_status_created_at", "backup_jobs", ["status", "created_at"])
+    op.create_index("ix_backup_jobs_created_at", "backup_jobs", ["created_at"])
+
+    op.create_table(
+        "backups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("scope", sa.String(length=16), nullable=False, server_default="tenant"),
+        sa.Column("tenant_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("tenant_slug", sa.String(length=255), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False, server_default="ok"),
+        sa.Column("kind", sa.String(length=16), nullable=False, server_default="full"),
+        sa.Column("parent_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("backup_jobs.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("snapshot_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("restored_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_backups_created_at", "backups", ["created_at"])
+    op.create_index("ix_backups_tenant_created_at", "backups", ["tenant_id", "created_at"])
+    op.create_index("ix_backups_parent_id", "backups", ["parent_id"])
+    op.create_index("ix_backups_job_id", "backups", ["job_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_backups_job_id", table_name="backups")
+    op.drop_index("ix_backups_parent_id", table_name="backups")
+    op.drop_index("ix_backups_tenant_created_at", table_name="backups")
+    op.drop_index("ix_backups_created_at", table_name="backups")
+    op.drop_table("backups")
+    op.drop_index("ix_backup_jobs_created_at", table_name="backup_jobs")
+    op.drop_index("ix_backup_jobs_status_created_at", table_name="backup_jobs")
+    op.drop_table("backup_jobs")
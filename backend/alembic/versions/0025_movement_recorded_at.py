@@ -0,0 +1,36 @@
+"""add server-side recorded_at to inventory_movements for incremental backups
+
+Revision ID: 0025_movement_recorded_at
+Revises: 0024_backup_index_tables
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0025_movement_recorded_at"
+down_revision = "0024_backup_index_tables"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Bestehende Zeilen gelten als "jetzt gebucht": sie landen einmal im nächsten Delta
+    op.add_column(
+        "inventory_movements",
+        sa.Column("recorded_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+    op.create_index(
+        "ix_inventory_movements_tenant_recorded_at",
+        "inventory_movements",
+        ["tenant_id", "recorded_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_inventory_movements_tenant_recorded_at", table_name="inventory_movements")
+    op.drop_column("inventory_movements", "recorded_at")
@@ -0,0 +1,26 @@
+"""add heartbeat_at to backup_jobs for detecting jobs of crashed processes
+
+Revision ID: 0026_backup_job_heartbeat
+Revises: 0025_movement_recorded_at
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "0026_backup_job_heartbeat"
+down_revision = "0025_movement_recorded_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("backup_jobs", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("backup_jobs", "heartbeat_at")
@@ -0,0 +1,28 @@
+"""store the backup file list on backups (listing without one storage LIST per backup)
+
+Revision ID: 0027_backup_files
+Revises: 0026_backup_job_heartbeat
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "0027_backup_files"
+down_revision = "0026_backup_job_heartbeat"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Bestehende Backups bleiben NULL und werden beim ersten Listen aus dem Storage ergänzt
+    op.add_column("backups", sa.Column("files", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("backups", "files")
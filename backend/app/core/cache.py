@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+from app.observability.metrics import cache_entries, cache_requests_total
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Kleiner In-Process Cache mit TTL und LRU-Verdrängung.
+
+    - Einträge verfallen nach `ttl_seconds`
+    - Bei Überschreiten von `max_entries` wird der am längsten ungenutzte Eintrag verdrängt
+    - `ttl_seconds <= 0` deaktiviert den Cache (jeder Zugriff ist ein Miss)
+    - Treffer/Fehlschläge werden unter dem Cache-Namen als Prometheus Counter exportiert
+
+    Der Cache ist pro Prozess; Invalidierung wirkt nur im aktuellen Worker,
+    andere Worker holen sich spätestens nach Ablauf der TTL den neuen Stand.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > self._clock():
+                self._entries.move_to_end(key)
+                cache_requests_total.labels(self.name, "hit").inc()
+                return value
+            del self._entries[key]
+            self._update_size()
+        cache_requests_total.labels(self.name, "miss").inc()
+        return None
+
+    def set(self, key: K, value: V) -> None:
+        if not self.enabled:
+            return
+        self._entries[key] = (self._clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._update_size()
+
+    def pop(self, key: K) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._update_size()
+
+    def pop_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """
+        Entfernt alle Einträge, für die `predicate(key, value)` zutrifft.
+        Liefert die Anzahl entfernter Einträge.
+        """
+        doomed = [key for key, (_expires, value) in self._entries.items() if predicate(key, value)]
+        for key in doomed:
+            del self._entries[key]
+        if doomed:
+            self._update_size()
+        return len(doomed)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._update_size()
+
+    def _update_size(self) -> None:
+        cache_entries.labels(self.name).set(len(self._entries))
@@ -17,6 +17,47 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str = Field(..., description="PostgreSQL DSN")
+    DATABASE_READ_URL: str | None = Field(
+        None,
+        description="DSN einer Read-Replica für Listen, Reports und Exporte (leer = alles über DATABASE_URL)",
+    )
+    DB_READ_AFTER_WRITE_SECONDS: float = Field(
+        5,
+        description="Nach einem Schreibzugriff liest derselbe Client so lange von der Primary (read-your-writes)",
+        ge=0,
+    )
+    # Connection-Pool (nur PostgreSQL; SQLite nutzt die Pools des Treibers)
+    DB_POOL_SIZE: int = Field(5, description="Dauerhaft offene Verbindungen pro Prozess", ge=1)
+    DB_MAX_OVERFLOW: int = Field(
+        10,
+        description="Zusätzliche Verbindungen über DB_POOL_SIZE hinaus bei Lastspitzen",
+        ge=0,
+    )
+    DB_POOL_TIMEOUT_SECONDS: float = Field(
+        30,
+        description="Maximale Wartezeit auf eine freie Verbindung, danach Fehler (Pool erschöpft)",
+        gt=0,
+    )
+    DB_POOL_RECYCLE_SECONDS: int = Field(
+        1800,
+        description="Verbindungen nach dieser Zeit neu aufbauen (vor Idle-Timeouts von Server/Proxy), -1 deaktiviert",
+        ge=-1,
+    )
+    DB_POOL_PRE_PING: bool = Field(
+        False,
+        description="Verbindung vor jeder Ausgabe prüfen (zusätzlicher Roundtrip; nur bei instabilen Netzen)",
+    )
+    DB_ECHO: bool = Field(False, description="SQL-Statements loggen (nur zur Fehlersuche)")
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int | None = Field(
+        None,
+        description="asyncpg: Cache vorbereiteter Statements je Verbindung (Default 100, 0 deaktiviert)",
+        ge=0,
+    )
+    DB_STATEMENT_CACHE_SIZE: int | None = Field(
+        None,
+        description="asyncpg: serverseitiger Statement-Cache je Verbindung (0 für PgBouncer im Transaction-Mode)",
+        ge=0,
+    )
     ADMIN_API_KEY: str = Field(..., description="Shared secret for X-Admin-Key")
 
     # JWT
@@ -39,11 +80,47 @@ class Settings(BaseSettings):
     # Multi-Tenancy
     BASE_DOMAIN: str = Field(..., description="Base domain für Tenant Subdomains, z.B. test.myitnetwork.de")
     BASE_ADMIN_DOMAIN: str = Field(..., description="Base domain für Admin UI Subdomains")
+    TENANT_CACHE_TTL_SECONDS: float = Field(
+        30,
+        description="TTL des In-Process Caches für Tenant-Auflösung (Slug -> Tenant) in Sekunden, 0 deaktiviert",
+        ge=0,
+    )
+    TENANT_CACHE_MAX_ENTRIES: int = Field(
+        1024,
+        description="Maximale Anzahl gecachter Tenants pro Prozess (LRU)",
+        ge=0,
+    )
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(
+        15,
+        description="TTL des Caches für authentifizierte Principals (User + Membership) in Sekunden, 0 deaktiviert",
+        ge=0,
+    )
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = Field(
+        4096,
+        description="Maximale Anzahl gecachter Principals pro Prozess (LRU)",
+        ge=0,
+    )
     BACKUP_STORAGE_PATH: str = Field("storage/backups", description="Pfad für Backup-Dateien")
     BACKUP_STORAGE_DRIVER: str = Field(
         "local",
-        description="Storage-Treiber für Backups (z.B. local; andere Treiber optional)",
+        description="Storage-Treiber für Backups und Job-Dateien: local | s3",
+        pattern="^(local|s3)$",
     )
+    BACKUP_S3_ENDPOINT_URL: str | None = Field(
+        None,
+        description="S3-kompatibler Endpoint (z.B. https://s3.eu-central-1.amazonaws.com, http://minio:9000)",
+    )
+    BACKUP_S3_BUCKET: str | None = Field(None, description="Bucket für Backups (Treiber s3)")
+    BACKUP_S3_REGION: str = Field("us-east-1", description="Region für die SigV4-Signatur")
+    BACKUP_S3_ACCESS_KEY_ID: str | None = Field(None, description="Access-Key-ID für den Bucket")
+    BACKUP_S3_SECRET_ACCESS_KEY: str | None = Field(None, description="Secret-Access-Key für den Bucket")
+    BACKUP_S3_PREFIX: str = Field("", description="Schlüssel-Präfix im Bucket (z.B. lager/backups)")
+    BACKUP_S3_PART_SIZE_MB: int = Field(
+        8,
+        description="Teilgröße beim Multipart-Upload in MB (S3-Minimum 5; bestimmt den Speicher je offenem Objekt)",
+        ge=5,
+    )
+    BACKUP_S3_TIMEOUT_SECONDS: float = Field(30.0, description="HTTP-Timeout für S3-Requests in Sekunden", gt=0)
     BACKUP_RETENTION_MAX_DAYS: int | None = Field(
         None, description="Maximales Backup-Alter in Tagen (Retention)", ge=0
     )
@@ -64,6 +141,21 @@ class Settings(BaseSettings):
         description="Scheduler-Modus: app (in-process) oder worker (separater Prozess)",
         pattern="^(app|worker)$",
     )
+    BACKUP_SCHEDULE_KIND: str = Field(
+        "incremental",
+        description="Art der geplanten Backups: incremental (Kette auf Voll-Backup) oder full",
+        pattern="^(full|incremental)$",
+    )
+    BACKUP_FULL_INTERVAL_DAYS: int = Field(
+        7,
+        description="Spätestens nach so vielen Tagen beginnt eine neue Kette mit einem Voll-Backup",
+        ge=1,
+    )
+    BACKUP_INCREMENTAL_MAX_CHAIN: int = Field(
+        6,
+        description="Maximale Anzahl inkrementeller Backups auf einem Voll-Backup",
+        ge=1,
+    )
     BACKUP_SCHEDULE_LOCK_KEY: int = Field(
         932754,
         description="Advisory-Lock-Key für Scheduler-Leaderwahl (PostgreSQL)",
@@ -73,6 +165,27 @@ class Settings(BaseSettings):
         description="Maximale Retry-Anzahl pro Tenant im Backup-Job",
         ge=0,
     )
+    BACKUP_COMPRESSION_LEVEL: int = Field(
+        6,
+        description="gzip-Kompressionsstufe der Backup-Tabellendateien (1 = schnell, 9 = klein)",
+        ge=1,
+        le=9,
+    )
+    BACKUP_RESTORE_BATCH_SIZE: int = Field(
+        500,
+        description="Zeilen pro Upsert-Batch beim Restore (begrenzt zusätzlich durch das Bind-Parameter-Limit)",
+        ge=1,
+    )
+    BACKUP_JOB_CONCURRENCY: int = Field(
+        4,
+        description="Anzahl parallel gesicherter Tenants im All-Tenant-Backup (je eine DB-Session)",
+        ge=1,
+    )
+    BACKUP_JOB_HEARTBEAT_TIMEOUT_SECONDS: int = Field(
+        300,
+        description="Backup-Jobs ohne Heartbeat gelten danach als abgebrochen (failed)",
+        ge=10,
+    )
     BACKUP_JOB_RETRY_DELAY_SECONDS: int = Field(
         5,
         description="Wartezeit zwischen Retry-Versuchen in Sekunden",
@@ -88,5 +201,98 @@ class Settings(BaseSettings):
         ge=1,
     )
 
+    JOB_WORKER_MODE: str = Field(
+        "app",
+        description="Job-Worker-Modus: app (in-process) oder worker (separater Prozess, app.job_worker)",
+        pattern="^(app|worker)$",
+    )
+    JOB_POLL_INTERVAL_SECONDS: float = Field(
+        1.0,
+        description="Wartezeit des Job-Workers, wenn keine Jobs anstehen (Sekunden)",
+        gt=0,
+    )
+    JOB_HEARTBEAT_TIMEOUT_SECONDS: int = Field(
+        300,
+        description="Laufende Jobs ohne Heartbeat gelten danach als abgebrochen und werden neu eingeplant",
+        ge=10,
+    )
+    JOB_MAX_ATTEMPTS: int = Field(
+        3,
+        description="Maximale Ausführungsversuche pro Hintergrundjob",
+        ge=1,
+    )
+    JOB_RETENTION_DAYS: int | None = Field(
+        7,
+        description="Abgeschlossene/fehlgeschlagene Hintergrundjobs samt Dateien unter jobs/<id>/ nach so vielen Tagen löschen (leer = nie)",
+        ge=1,
+    )
+
+    SMTP_TIMEOUT_SECONDS: float = Field(
+        10.0,
+        description="Timeout für SMTP-Verbindungen und -Kommandos (Sekunden)",
+        gt=0,
+    )
+    SMTP_POOL_IDLE_SECONDS: float = Field(
+        60.0,
+        description="Leerlaufzeit, nach der eine gehaltene SMTP-Verbindung neu aufgebaut wird (Sekunden)",
+        ge=0,
+    )
+    SMTP_POOL_MAX_IDLE: int = Field(
+        4,
+        description="Maximale Anzahl gehaltener SMTP-Verbindungen pro Konfiguration (parallele Sends)",
+        ge=1,
+    )
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = Field(
+        6,
+        description="Maximale Zustellversuche pro Mail im Outbox, danach Status failed",
+        ge=1,
+    )
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = Field(
+        30,
+        description="Basis-Wartezeit für den exponentiellen Backoff nach Zustellfehlern (Sekunden)",
+        ge=1,
+    )
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS: int = Field(
+        3600,
+        description="Obergrenze der Wartezeit zwischen Zustellversuchen (Sekunden)",
+        ge=1,
+    )
+    EMAIL_OUTBOX_BATCH_SIZE: int = Field(
+        50,
+        description="Mails pro Zustell-Durchlauf des Outbox-Dispatchers",
+        ge=1,
+    )
+    EMAIL_OUTBOX_RETENTION_DAYS: int | None = Field(
+        30,
+        description="Zugestellte/fehlgeschlagene Mails (inkl. Inhalt) nach so vielen Tagen aus der Outbox löschen (leer = nie)",
+        ge=1,
+    )
+
+    PDF_RENDER_POOL: str = Field(
+        "process",
+        description="Pool für das PDF-Rendering: process (eigene Prozesse) oder thread",
+        pattern="^(process|thread)$",
+    )
+    PDF_RENDER_WORKERS: int = Field(
+        2,
+        description="Maximale Anzahl paralleler PDF-Renderings pro API-Prozess",
+        ge=1,
+    )
+    ORDER_PDF_CACHE_TTL_SECONDS: float = Field(
+        3600.0,
+        description="TTL für gecachte PDFs abgeschlossener/stornierter Bestellungen (0 = aus)",
+        ge=0,
+    )
+    ORDER_PDF_CACHE_MAX_ENTRIES: int = Field(
+        256,
+        description="Maximale Anzahl gecachter Bestell-PDFs pro Prozess (LRU)",
+        ge=0,
+    )
+    ORDER_PDF_BATCH_MAX: int = Field(
+        500,
+        description="Maximale Anzahl Bestellungen pro Sammel-PDF/ZIP",
+        ge=1,
+    )
+
 
 settings = Settings()
@@ -3,18 +3,36 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 import logging
+import time
+from typing import Any
 
+from fastapi import Request
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.engine.url import URL, make_url
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from app.models.base import Base
 from app.core.config import settings
+from app.core.read_routing import requires_primary
+from app.observability.db_timing import instrument_queries
+from app.observability.metrics import (
+    db_pool_checkout_timeouts_total,
+    db_pool_checkout_wait_seconds,
+    db_pool_connections_idle,
+    db_pool_connections_in_use,
+    db_pool_overflow,
+    db_pool_size,
+    db_read_sessions_total,
+)
 
 logger = logging.getLogger("app.db")
 
 _engine: AsyncEngine | None = None
 _sessionmaker: async_sessionmaker[AsyncSession] | None = None
+# Optionale Read-Replica (DATABASE_READ_URL)
+_read_engine: AsyncEngine | None = None
+_read_sessionmaker: async_sessionmaker[AsyncSession] | None = None
 
 
 def _is_sqlite(url: URL) -> bool:
@@ -30,7 +48,11 @@ def _import_models() -> None:
     Stellt sicher, dass alle Modelle in der Base.metadata registriert sind.
     """
     import app.models.audit_log  # noqa: F401
+    import app.models.background_job  # noqa: F401
+    import app.models.backup  # noqa: F401
+    import app.models.email_outbox  # noqa: F401
     import app.models.category  # noqa: F401
+    import app.models.consumption_rollup  # noqa: F401
     import app.models.item  # noqa: F401
     import app.models.order  # noqa: F401
     import app.models.membership  # noqa: F401
@@ -41,39 +63,139 @@ def _import_models() -> None:
     import app.models.user  # noqa: F401
 
 
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue-Pool, der die Wartezeit auf eine Verbindung misst und Checkout-Timeouts zählt.
+    Label ist der `pool_logging_name` der Engine (bleibt bei `dispose()`/Neuaufbau erhalten).
+    """
+
+    def _do_get(self):
+        engine = self.logging_name or "primary"
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            db_pool_checkout_timeouts_total.labels(engine).inc()
+            raise
+        finally:
+            db_pool_checkout_wait_seconds.labels(engine).observe(time.perf_counter() - started)
+
+
+def instrument_pool(engine: AsyncEngine, name: str) -> None:
+    """
+    Hängt die Pool-Gauges an die Engine; gelesen wird beim Scrape (engine.pool ist nach dispose() neu).
+    """
+    if not isinstance(engine.pool, AsyncAdaptedQueuePool):
+        return
+    db_pool_size.labels(name).set_function(lambda: engine.pool.size())
+    db_pool_connections_in_use.labels(name).set_function(lambda: engine.pool.checkedout())
+    db_pool_connections_idle.labels(name).set_function(lambda: engine.pool.checkedin())
+    # overflow() ist negativ, solange weniger als pool_size Verbindungen offen sind
+    db_pool_overflow.labels(name).set_function(lambda: max(engine.pool.overflow(), 0))
+
+
+def engine_kwargs(url: URL, *, name: str) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "echo": settings.DB_ECHO,
+    }
+    if _is_sqlite(url):
+        kwargs["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            kwargs["poolclass"] = StaticPool
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    )
+    connect_args: dict[str, Any] = {}
+    if url.get_driver_name() == "asyncpg":
+        if settings.DB_PREPARED_STATEMENT_CACHE_SIZE is not None:
+            connect_args["prepared_statement_cache_size"] = settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+        if settings.DB_STATEMENT_CACHE_SIZE is not None:
+            connect_args["statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+    if connect_args:
+        kwargs["connect_args"] = connect_args
+    return kwargs
+
+
+def create_engine_for(database_url: str, *, name: str) -> AsyncEngine:
+    url = make_url(database_url)
+    engine = create_async_engine(database_url, **engine_kwargs(url, name=name))
+    instrument_pool(engine, name)
+    instrument_queries(engine)
+    logger.info(
+        "Async DB engine created (name=%s, echo=%s, pool=%s, url=%s)",
+        name,
+        engine.echo,
+        engine.pool.status(),
+        url.set(password="***"),
+    )
+    return engine
+
+
 def get_engine() -> AsyncEngine:
     global _engine
     if _engine is None:
-        url = make_url(settings.DATABASE_URL)
-        safe_url = url.set(password="***")
-        engine_kwargs = {
-            "pool_pre_ping": True,
-            "echo": settings.ENVIRONMENT != "prod",
-        }
-
-        if _is_sqlite(url):
-            engine_kwargs["connect_args"] = {"check_same_thread": False}
-            if url.database in (None, "", ":memory:"):
-                engine_kwargs["poolclass"] = StaticPool
-
-        _engine = create_async_engine(settings.DATABASE_URL, **engine_kwargs)
-        logger.info("Async DB engine created (echo=%s, url=%s)", _engine.echo, safe_url)
+        _engine = create_engine_for(settings.DATABASE_URL, name="primary")
     return _engine
 
 
+def _create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
+
 def get_sessionmaker() -> async_sessionmaker[AsyncSession]:
     global _sessionmaker
     if _sessionmaker is None:
-        _sessionmaker = async_sessionmaker(
-            bind=get_engine(),
-            expire_on_commit=False,
-            autoflush=False,
-            autocommit=False,
-        )
+        _sessionmaker = _create_sessionmaker(get_engine())
     return _sessionmaker
 
 
+def has_read_replica() -> bool:
+    return bool(settings.DATABASE_READ_URL)
+
+
+def get_read_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Sessionmaker der Read-Replica; ohne DATABASE_READ_URL der Primary-Sessionmaker.
+    """
+    global _read_engine, _read_sessionmaker
+    if not has_read_replica():
+        return get_sessionmaker()
+    if _read_sessionmaker is None:
+        _read_engine = create_engine_for(settings.DATABASE_READ_URL, name="replica")
+        _read_sessionmaker = _create_sessionmaker(_read_engine)
+    return _read_sessionmaker
+
+
+async def release_connection(db: AsyncSession) -> None:
+    """
+    Beendet eine rein lesende Transaktion und gibt die Verbindung sofort an den Pool zurück,
+    statt sie bis zum Ende des Requests zu halten. Geladene Objekte bleiben an der Session
+    (expire_on_commit=False); das nächste Statement holt sich wieder eine Verbindung.
+    Nicht aufrufen, solange ungeschriebene Änderungen in der Session liegen.
+    """
+    if db.in_transaction() and not (db.new or db.dirty or db.deleted):
+        await db.commit()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Request-Session. Eine Pool-Verbindung wird erst beim ersten Statement belegt und nach
+    commit()/release_connection() wieder frei; Requests, die komplett aus Caches bedient
+    werden, belegen keine Verbindung.
+    """
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as session:
         logger.debug("DB session opened")
@@ -83,6 +205,26 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             logger.debug("DB session closed")
 
 
+def read_sessionmaker_for(request: Request) -> async_sessionmaker[AsyncSession]:
+    """
+    Sessionmaker für reine Lesezugriffe dieses Requests: Read-Replica, sofern konfiguriert und
+    der Client nicht gerade selbst geschrieben hat (read-your-writes), sonst Primary.
+    Als Dependency für gestreamte Exporte, die erst nach dem Handler eine eigene Session öffnen.
+    """
+    use_replica = has_read_replica() and not requires_primary(request)
+    db_read_sessions_total.labels("replica" if use_replica else "primary").inc()
+    return get_read_sessionmaker() if use_replica else get_sessionmaker()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Session für reine Lese-Endpunkte (Listen, Reports); Auswahl wie `read_sessionmaker_for`.
+    Handler mit dieser Session dürfen nichts schreiben.
+    """
+    async with read_sessionmaker_for(request)() as session:
+        yield session
+
+
 async def init_models() -> None:
     """
     Erstellt das Schema bei Bedarf (z. B. für SQLite Tests).
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from dataclasses import dataclass
 from typing import Literal
 
@@ -7,7 +8,9 @@ from fastapi import Depends, Header, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.db import get_db, release_connection
 from app.core.deps_tenant import get_tenant_context
 from app.core.security import decode_token
 from app.core.tenant import TenantContext
@@ -24,6 +27,48 @@ class CurrentUserContext:
     role: str
 
 
+@dataclass(frozen=True)
+class _PrincipalSnapshot:
+    """
+    Gecachter Stand von User + aktiver Membership (ohne Passwort-Hash, ohne Session-Bindung).
+    """
+
+    user_id: uuid.UUID
+    email: str
+    membership_role: str
+
+    def to_user(self) -> User:
+        return User(id=self.user_id, email=self.email, is_active=True)
+
+
+# Key: (user_id, tenant_id, token iat). Ein neu ausgestelltes Token erzeugt immer einen neuen Eintrag.
+_principal_cache: TTLCache[tuple[str, str, int | None], _PrincipalSnapshot] = TTLCache(
+    name="principal",
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_principal_cache(
+    *,
+    user_id: uuid.UUID | str | None = None,
+    tenant_id: uuid.UUID | str | None = None,
+) -> None:
+    """
+    Entfernt gecachte Principals für einen User und/oder Tenant.
+    Ohne Argumente wird der komplette Cache geleert.
+    """
+    if user_id is None and tenant_id is None:
+        _principal_cache.clear()
+        return
+    user_key = str(user_id) if user_id is not None else None
+    tenant_key = str(tenant_id) if tenant_id is not None else None
+    _principal_cache.pop_where(
+        lambda key, _snapshot: (user_key is None or key[0] == user_key)
+        and (tenant_key is None or key[1] == tenant_key)
+    )
+
+
 def _http_error(status: int, code: str, message: str) -> HTTPException:
     return HTTPException(status_code=status, detail={"error": {"code": code, "message": message}})
 
@@ -53,6 +98,11 @@ async def get_current_user(
     if not user_id or token_type != "access":
         raise _http_error(401, "unauthorized", "Invalid token payload")
 
+    cache_key = (str(user_id), str(tenant_ctx.tenant.id), payload.get("iat"))
+    cached = _principal_cache.get(cache_key)
+    if cached is not None:
+        return CurrentUserContext(user=cached.to_user(), role=role or cached.membership_role)
+
     user = await db.get(User, user_id)
     if user is None or not user.is_active:
         raise _http_error(403, "user_inactive", "User inactive or not found")
@@ -64,9 +114,15 @@ async def get_current_user(
             Membership.is_active.is_(True),
         )
     )
+    # user bleibt an der Session gebunden (Handler können ihn ändern), die Verbindung geht zurück
+    await release_connection(db)
     if membership is None:
         raise _http_error(403, "no_membership", "User has no active membership for this tenant")
 
+    _principal_cache.set(
+        cache_key,
+        _PrincipalSnapshot(user_id=user.id, email=user.email, membership_role=membership.role),
+    )
     return CurrentUserContext(user=user, role=role or membership.role)
 
 
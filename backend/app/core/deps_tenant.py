@@ -2,7 +2,7 @@ from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.db import get_db
+from app.core.db import get_db, release_connection
 from app.core.tenant import TenantContext, resolve_tenant
 
 
@@ -13,9 +13,12 @@ async def get_tenant_context(
     """
     Zentrale Tenant-Dependency mit BASE_DOMAIN-Suffixprüfung und Fallback localhost.
     """
-    return await resolve_tenant(
+    ctx = await resolve_tenant(
         request=request,
         db=db,
         base_domain=settings.BASE_DOMAIN,
         fallback_domains=("localhost",),
     )
+    # Lookup bei Cache-Miss: Verbindung nicht bis zum Ende des Handlers halten
+    await release_connection(db)
+    return ctx
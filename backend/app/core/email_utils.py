@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import smtplib
 import socket
+import threading
 import time
 from email.message import EmailMessage
-from typing import Optional, Tuple, List
+from typing import Any, Callable
 
+from app.core.config import settings
 from app.core.email_settings import EmailSettings
 
 
@@ -91,6 +94,137 @@ def smtp_ping(
     return True, resolved_ips, None
 
 
+class SmtpConnectionPool:
+    """
+    Hält pro SMTP-Konfiguration einen kleinen Vorrat offener Verbindungen und nutzt sie für
+    Folge-Mails weiter (kein Connect/STARTTLS/Login pro Mail). Blockierend; Aufrufer aus async-Code
+    gehen über `send_email_async` (Thread). Jede Verbindung wird exklusiv ausgeliehen; der Lock
+    schützt nur die Verwaltung, Netzwerk-I/O läuft ausserhalb. Parallele Sends bekommen eigene
+    Verbindungen, langsame Server blockieren andere Konfigurationen nicht.
+    """
+
+    def __init__(self, *, idle_seconds: float = 60.0, timeout: float = 10.0, max_idle: int = 4) -> None:
+        self.idle_seconds = idle_seconds
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        # pro Konfiguration: freie Verbindungen mit Zeitpunkt der letzten Nutzung (zuletzt genutzte hinten)
+        self._connections: dict[tuple, list[tuple[smtplib.SMTP, float]]] = {}
+
+    @staticmethod
+    def _key(email_settings: EmailSettings) -> tuple:
+        return (email_settings.host, email_settings.port, email_settings.user, email_settings.password, email_settings.use_tls)
+
+    def _connect(self, email_settings: EmailSettings, on_step: Callable[[str, float], None] | None) -> smtplib.SMTP:
+        use_ssl = bool(email_settings.use_tls and email_settings.port == 465)
+        use_starttls = bool(email_settings.use_tls and not use_ssl)
+        started = time.perf_counter()
+        smtp_cls = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
+        smtp = smtp_cls(email_settings.host, email_settings.port, timeout=self.timeout)
+        try:
+            if on_step:
+                on_step("connected", started)
+            if use_starttls:
+                started = time.perf_counter()
+                smtp.starttls()
+                if on_step:
+                    on_step("starttls", started)
+            if email_settings.user and email_settings.password:
+                started = time.perf_counter()
+                smtp.login(email_settings.user, email_settings.password)
+                if on_step:
+                    on_step("auth", started)
+        except Exception:
+            self._quit(smtp)
+            raise
+        return smtp
+
+    @staticmethod
+    def _quit(smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except Exception:  # noqa: BLE001
+            smtp.close()
+
+    def _acquire(
+        self, email_settings: EmailSettings, on_step: Callable[[str, float], None] | None
+    ) -> tuple[smtplib.SMTP, bool]:
+        key = self._key(email_settings)
+        now = time.monotonic()
+        smtp: smtplib.SMTP | None = None
+        expired: list[smtplib.SMTP] = []
+        with self._lock:
+            idle = self._connections.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used < self.idle_seconds:
+                    smtp = candidate
+                    break
+                expired.append(candidate)
+            if not idle:
+                self._connections.pop(key, None)
+        for stale in expired:
+            self._quit(stale)
+        if smtp is not None:
+            return smtp, True
+        return self._connect(email_settings, on_step), False
+
+    def _release(self, email_settings: EmailSettings, smtp: smtplib.SMTP) -> None:
+        with self._lock:
+            idle = self._connections.setdefault(self._key(email_settings), [])
+            if len(idle) < self.max_idle:
+                idle.append((smtp, time.monotonic()))
+                return
+        # Vorrat voll (Lastspitze vorbei): überzählige Verbindung schliessen
+        self._quit(smtp)
+
+    def send(
+        self,
+        email_settings: EmailSettings,
+        message: EmailMessage,
+        *,
+        on_step: Callable[[str, float], None] | None = None,
+    ) -> None:
+        smtp, reused = self._acquire(email_settings, on_step)
+        try:
+            smtp.send_message(message)
+        except (smtplib.SMTPServerDisconnected, OSError):
+            self._quit(smtp)
+            if not reused:
+                raise
+            # Server hat die gehaltene Verbindung geschlossen: einmal neu verbinden
+            smtp = self._connect(email_settings, on_step)
+            try:
+                smtp.send_message(message)
+            except Exception:
+                self._quit(smtp)
+                raise
+        except smtplib.SMTPException:
+            # z. B. Empfänger abgelehnt: Verbindung bleibt nutzbar
+            try:
+                smtp.rset()
+            except Exception:  # noqa: BLE001
+                self._quit(smtp)
+                raise
+            self._release(email_settings, smtp)
+            raise
+        self._release(email_settings, smtp)
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle = [smtp for entries in self._connections.values() for smtp, _last_used in entries]
+            self._connections.clear()
+        for smtp in idle:
+            self._quit(smtp)
+
+
+smtp_pool = SmtpConnectionPool(
+    idle_seconds=settings.SMTP_POOL_IDLE_SECONDS,
+    timeout=settings.SMTP_TIMEOUT_SECONDS,
+    max_idle=settings.SMTP_POOL_MAX_IDLE,
+)
+
+
 def send_email(
     *,
     email_settings: EmailSettings,
@@ -102,12 +236,12 @@ def send_email(
     logger: logging.Logger | None = None,
 ) -> tuple[bool, str | None, list[str]]:
     """
-    Send a plain-text email using the provided settings.
-    Returns (ok, error, resolved_ips).
+    Send a plain-text email using the provided settings over the pooled SMTP connection.
+    Returns (ok, error, resolved_ips); resolved_ips is empty because there is no pre-ping anymore.
+    Blocking - call `send_email_async` from async code.
     """
-    ok, resolved_ips, ping_error = smtp_ping(email_settings, logger=logger, request_id=request_id)
-    if not ok:
-        return False, ping_error, resolved_ips
+    if not email_settings.is_configured():
+        return False, "SMTP Konfiguration fehlt (Host/Port/From sind erforderlich)", []
 
     message = EmailMessage()
     message["Subject"] = subject
@@ -115,68 +249,37 @@ def send_email(
     message["To"] = recipient
     message.set_content(body)
 
-    use_ssl = bool(email_settings.use_tls and email_settings.port == 465)
-    use_starttls = bool(email_settings.use_tls and not use_ssl)
-
     log_extra = {
         "smtp_host": email_settings.host,
         "smtp_port": email_settings.port,
-        "resolved_ips": resolved_ips,
-        "use_tls": use_starttls,
-        "use_ssl": use_ssl,
+        "use_tls": email_settings.use_tls,
     }
     if actor:
         log_extra["actor"] = actor
 
+    def _on_step(step: str, started: float) -> None:
+        if logger:
+            _log(
+                logger,
+                logging.DEBUG,
+                f"SMTP {step} in {(time.perf_counter() - started) * 1000:.1f}ms",
+                request_id=request_id,
+                extra=log_extra,
+            )
+
     try:
-        connect_start = time.perf_counter()
-        smtp_cls = smtplib.SMTP_SSL if use_ssl else smtplib.SMTP
-        with smtp_cls(email_settings.host, email_settings.port, timeout=10) as smtp:
-            connect_duration = (time.perf_counter() - connect_start) * 1000
-            if logger:
-                _log(
-                    logger,
-                    logging.DEBUG,
-                    f"SMTP connected in {connect_duration:.1f}ms",
-                    request_id=request_id,
-                    extra=log_extra,
-                )
-            if use_starttls:
-                tls_start = time.perf_counter()
-                smtp.starttls()
-                tls_duration = (time.perf_counter() - tls_start) * 1000
-                if logger:
-                    _log(
-                        logger,
-                        logging.DEBUG,
-                        f"SMTP starttls in {tls_duration:.1f}ms",
-                        request_id=request_id,
-                        extra=log_extra,
-                    )
-            if email_settings.user and email_settings.password:
-                auth_start = time.perf_counter()
-                smtp.login(email_settings.user, email_settings.password)
-                auth_duration = (time.perf_counter() - auth_start) * 1000
-                if logger:
-                    _log(
-                        logger,
-                        logging.DEBUG,
-                        f"SMTP auth in {auth_duration:.1f}ms",
-                        request_id=request_id,
-                        extra=log_extra,
-                    )
-            send_start = time.perf_counter()
-            smtp.send_message(message)
-            send_duration = (time.perf_counter() - send_start) * 1000
-            if logger:
-                _log(
-                    logger,
-                    logging.INFO,
-                    f"SMTP send ok in {send_duration:.1f}ms",
-                    request_id=request_id,
-                    extra=log_extra,
-                )
-        return True, None, resolved_ips
+        send_start = time.perf_counter()
+        smtp_pool.send(email_settings, message, on_step=_on_step)
+        send_duration = (time.perf_counter() - send_start) * 1000
+        if logger:
+            _log(
+                logger,
+                logging.INFO,
+                f"SMTP send ok in {send_duration:.1f}ms",
+                request_id=request_id,
+                extra=log_extra,
+            )
+        return True, None, []
     except smtplib.SMTPAuthenticationError as exc:  # noqa: BLE001
         if logger:
             _log(
@@ -186,7 +289,7 @@ def send_email(
                 request_id=request_id,
                 extra=log_extra,
             )
-        return False, f"SMTP Auth fehlgeschlagen: {exc}", resolved_ips
+        return False, f"SMTP Auth fehlgeschlagen: {exc}", []
     except smtplib.SMTPException as exc:  # noqa: BLE001
         if logger:
             _log(
@@ -196,7 +299,7 @@ def send_email(
                 request_id=request_id,
                 extra=log_extra,
             )
-        return False, f"SMTP Fehler: {exc}", resolved_ips
+        return False, f"SMTP Fehler: {exc}", []
     except Exception as exc:  # noqa: BLE001
         if logger:
             _log(
@@ -206,4 +309,18 @@ def send_email(
                 request_id=request_id,
                 extra=log_extra,
             )
-        return False, f"E-Mail Versand fehlgeschlagen: {exc}", resolved_ips
+        return False, f"E-Mail Versand fehlgeschlagen: {exc}", []
+
+
+async def send_email_async(**kwargs: Any) -> tuple[bool, str | None, list[str]]:
+    """
+    Nicht-blockierende Variante von `send_email` (SMTP-I/O im Thread, Event-Loop bleibt frei).
+    """
+    return await asyncio.to_thread(send_email, **kwargs)
+
+
+async def smtp_ping_async(email_settings: EmailSettings, **kwargs: Any) -> tuple[bool, list[str], str | None]:
+    """
+    Nicht-blockierende Variante von `smtp_ping` (DNS + TCP im Thread).
+    """
+    return await asyncio.to_thread(smtp_ping, email_settings, **kwargs)
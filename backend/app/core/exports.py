@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import tempfile
+from io import StringIO
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Sequence
+
+from fastapi.responses import StreamingResponse
+from openpyxl import Workbook
+from sqlalchemy import Select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.db import get_sessionmaker
+
+# Zeilen pro DB-Fetch bzw. pro geschriebenem CSV-Chunk
+EXPORT_CHUNK_SIZE = 1000
+# Blockgröße beim Ausliefern der XLSX-Datei
+XLSX_READ_BLOCK = 64 * 1024
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+async def stream_rows(
+    stmt: Select,
+    *,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    sessionmaker: async_sessionmaker[AsyncSession] | None = None,
+) -> AsyncIterator[Row]:
+    """
+    Iteriert eine Query serverseitig (Cursor, `yield_per`), ohne alle Zeilen zu laden.
+
+    Läuft in einer eigenen Session: der Generator wird erst nach dem Endpoint konsumiert,
+    wenn die Request-Session (get_db) bereits geschlossen ist. Export-Endpunkte übergeben den
+    Sessionmaker aus `read_sessionmaker_for` (Read-Replica); ohne Angabe Primary (z.B. Jobs).
+    """
+    async with (sessionmaker or get_sessionmaker())() as db:
+        result = await db.stream(stmt.execution_options(yield_per=chunk_size))
+        async for partition in result.partitions(chunk_size):
+            for row in partition:
+                yield row
+
+
+async def iter_rows(rows: Iterable[Sequence[Any]]) -> AsyncIterator[Sequence[Any]]:
+    """
+    Adapter für bereits berechnete (kleine) Daten, z. B. Reports.
+    """
+    for row in rows:
+        yield row
+
+
+async def csv_chunks(
+    header: Sequence[str],
+    rows: AsyncIterable[Sequence[Any]],
+    *,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    buf = StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    pending = 0
+    async for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_size:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+            pending = 0
+    yield buf.getvalue()
+
+
+async def xlsx_chunks(title: str, header: Sequence[str], rows: AsyncIterable[Sequence[Any]]) -> AsyncIterator[bytes]:
+    """
+    Schreibt ein Workbook im write-only Modus (Zeilen landen in Temp-Dateien statt im Speicher)
+    und liefert die fertige Datei blockweise aus.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    ws.append(list(header))
+    async for row in rows:
+        ws.append(list(row))
+
+    with tempfile.TemporaryFile() as tmp:
+        await asyncio.to_thread(wb.save, tmp)
+        tmp.seek(0)
+        while chunk := tmp.read(XLSX_READ_BLOCK):
+            yield chunk
+
+
+def csv_response(chunks: AsyncIterator[str], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def xlsx_response(chunks: AsyncIterator[bytes], filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
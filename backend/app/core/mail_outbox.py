@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import get_sessionmaker
+from app.core.email_settings import load_email_settings
+from app.core.email_utils import send_email_async, smtp_pool
+from app.models.email_outbox import EmailOutbox
+from app.observability.metrics import email_outbox_deliveries_total
+
+logger = logging.getLogger("app.email")
+
+# Zustellung gilt nach dieser Zeit als abgebrochen (Prozess-Absturz) und wird erneut versucht
+SENDING_LEASE_SECONDS = 300
+FINISHED_EMAIL_STATUSES = ("sent", "failed")
+PURGE_BATCH_SIZE = 1000
+# Aufräumen läuft nicht in jedem Poll-Zyklus
+PURGE_INTERVAL_SECONDS = 3600.0
+
+_dispatcher_task: asyncio.Task | None = None
+_wakeup: asyncio.Event | None = None
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Exponentieller Backoff: Basis * 2^(Versuche-1), gedeckelt auf EMAIL_OUTBOX_RETRY_MAX_SECONDS.
+    """
+    seconds = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(seconds, settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS))
+
+
+def notify_outbox() -> None:
+    """
+    Weckt den In-App-Dispatcher nach dem Einreihen (sonst greift das Poll-Intervall).
+    """
+    if _wakeup is not None:
+        _wakeup.set()
+
+
+async def enqueue_email(
+    db: AsyncSession,
+    *,
+    recipient: str,
+    subject: str,
+    body: str,
+    tenant_id: uuid.UUID | None = None,
+    actor: str | None = None,
+    request_id: str | None = None,
+) -> EmailOutbox:
+    """
+    Reiht eine Mail in die Outbox ein und committet; der Request wartet nicht auf SMTP.
+    """
+    entry = EmailOutbox(
+        id=uuid.uuid4(),
+        tenant_id=tenant_id,
+        recipient=recipient,
+        subject=subject,
+        body=body,
+        status="pending",
+        attempts=0,
+        next_attempt_at=_now(),
+        actor=actor,
+        request_id=request_id,
+        created_at=_now(),
+    )
+    db.add(entry)
+    await db.commit()
+    notify_outbox()
+    return entry
+
+
+def _due(now: datetime):
+    return or_(EmailOutbox.status == "pending", EmailOutbox.status == "sending") & (
+        EmailOutbox.next_attempt_at <= now
+    )
+
+
+async def claim_next_email(db: AsyncSession) -> EmailOutbox | None:
+    """
+    Übernimmt die nächste fällige Mail (SKIP LOCKED + bedingtes UPDATE wie bei den Jobs).
+    Während der Zustellung schiebt ein Lease `next_attempt_at` nach hinten.
+    """
+    now = _now()
+    entry_id = await db.scalar(
+        select(EmailOutbox.id)
+        .where(_due(now))
+        .order_by(EmailOutbox.next_attempt_at.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if entry_id is None:
+        await db.rollback()
+        return None
+    claimed = await db.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id == entry_id, _due(now))
+        .values(
+            status="sending",
+            attempts=EmailOutbox.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=SENDING_LEASE_SECONDS),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if claimed.rowcount != 1:
+        return None
+    return await db.get(EmailOutbox, entry_id, populate_existing=True)
+
+
+async def _record_attempt(entry: EmailOutbox, ok: bool, error: str | None) -> str:
+    if ok:
+        values = {"status": "sent", "sent_at": _now(), "last_error": None}
+        status = "sent"
+    elif entry.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+        values = {"status": "failed", "last_error": error}
+        status = "failed"
+    else:
+        values = {"status": "pending", "last_error": error, "next_attempt_at": _now() + retry_delay(entry.attempts)}
+        status = "retry"
+    async with get_sessionmaker()() as db:
+        await db.execute(update(EmailOutbox).where(EmailOutbox.id == entry.id).values(**values))
+        await db.commit()
+    email_outbox_deliveries_total.labels(status).inc()
+    return status
+
+
+async def deliver_due_emails(*, limit: int | None = None) -> int:
+    """
+    Stellt fällige Mails nacheinander über die gehaltene SMTP-Verbindung zu.
+    Liefert die Anzahl der Zustellversuche.
+    """
+    limit = limit or settings.EMAIL_OUTBOX_BATCH_SIZE
+    email_settings = None
+    attempted = 0
+    while attempted < limit:
+        async with get_sessionmaker()() as db:
+            entry = await claim_next_email(db)
+            if entry is not None and email_settings is None:
+                email_settings = await load_email_settings(db)
+        if entry is None:
+            break
+        ok, error, _resolved = await send_email_async(
+            email_settings=email_settings,
+            recipient=entry.recipient,
+            subject=entry.subject,
+            body=entry.body,
+            request_id=entry.request_id,
+            actor=entry.actor,
+            logger=logger,
+        )
+        status = await _record_attempt(entry, ok, error)
+        if status != "sent":
+            logger.warning(
+                "outbox delivery %s id=%s attempts=%s error=%s", status, entry.id, entry.attempts, error
+            )
+        attempted += 1
+    return attempted
+
+
+async def purge_finished_emails() -> int:
+    """
+    Löscht zugestellte und endgültig fehlgeschlagene Mails, deren letzter Versuch länger als
+    `EMAIL_OUTBOX_RETENTION_DAYS` zurückliegt, blockweise. Bei abgeschlossenen Mails steht in
+    `next_attempt_at` das Lease des letzten Versuchs; so trägt ix_email_outbox_status_next_attempt.
+    """
+    if settings.EMAIL_OUTBOX_RETENTION_DAYS is None:
+        return 0
+    cutoff = _now() - timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+    purged = 0
+    async with get_sessionmaker()() as db:
+        while True:
+            entry_ids = list(
+                await db.scalars(
+                    select(EmailOutbox.id)
+                    .where(EmailOutbox.status.in_(FINISHED_EMAIL_STATUSES), EmailOutbox.next_attempt_at < cutoff)
+                    .limit(PURGE_BATCH_SIZE)
+                )
+            )
+            if not entry_ids:
+                await db.rollback()
+                break
+            await db.execute(
+                delete(EmailOutbox).where(EmailOutbox.id.in_(entry_ids)).execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            purged += len(entry_ids)
+            if len(entry_ids) < PURGE_BATCH_SIZE:
+                break
+    if purged:
+        logger.info("purged finished outbox emails count=%s", purged)
+    return purged
+
+
+async def run_outbox_loop() -> None:
+    global _wakeup
+    _wakeup = asyncio.Event()
+    next_purge = 0.0
+    while True:
+        try:
+            if time.monotonic() >= next_purge:
+                next_purge = time.monotonic() + PURGE_INTERVAL_SECONDS
+                await purge_finished_emails()
+            while await deliver_due_emails() >= settings.EMAIL_OUTBOX_BATCH_SIZE:
+                pass
+        except Exception:
+            logger.exception("email outbox cycle failed")
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=settings.JOB_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        _wakeup.clear()
+
+
+def start_outbox_dispatcher() -> None:
+    global _dispatcher_task
+    if settings.JOB_WORKER_MODE != "app":
+        return
+    if _dispatcher_task is None or _dispatcher_task.done():
+        _dispatcher_task = asyncio.create_task(run_outbox_loop())
+
+
+def stop_outbox_dispatcher() -> None:
+    global _dispatcher_task, _wakeup
+    if _dispatcher_task is not None:
+        _dispatcher_task.cancel()
+        _dispatcher_task = None
+    _wakeup = None
+    smtp_pool.close_all()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.db import has_read_replica
+from app.core.read_routing import is_write_request, mark_client_wrote
+from app.observability.db_timing import start_query_stats, stop_query_stats
+from app.observability.metrics import (
+    http_request_db_duration_seconds,
+    http_request_db_queries,
+    http_request_duration_seconds,
+    http_requests_total,
+)
+
+request_logger = logging.getLogger("app.request")
+
+
+def _route_label(scope: Scope) -> str:
+    """
+    Metrik-Label: Route-Template statt Pfad (IDs würden unbegrenzt viele Zeitreihen erzeugen).
+    """
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or "unmatched"
+
+
+class RequestContextMiddleware:
+    """
+    Reine ASGI-Middleware für alle HTTP-Requests: Request-ID, read-your-writes-Markierung,
+    Metriken und Access-Log. Body-Nachrichten werden unverändert durchgereicht (kein Puffern,
+    Backpressure von Streaming-Responses bleibt erhalten); gemessen wird bis zum letzten Body-Chunk.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        method = scope["method"]
+        headers = Headers(scope=scope)
+        request_id = headers.get("x-request-id") or str(uuid.uuid4())
+        # request.state liest aus scope["state"]
+        scope.setdefault("state", {})["request_id"] = request_id
+        status_code: int | str = "error"
+        query_stats, query_stats_token = start_query_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Request-Id"] = request_id
+                if has_read_replica() and is_write_request(method) and status_code < 400:
+                    cookie = mark_client_wrote(headers)
+                    if cookie is not None:
+                        response_headers.append("set-cookie", cookie)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            request_logger.exception("unhandled error for %s %s", method, scope["path"])
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            stop_query_stats(query_stats_token)
+            route = _route_label(scope)
+            try:
+                http_requests_total.labels(method, route, str(status_code)).inc()
+                http_request_duration_seconds.labels(method, route, str(status_code)).observe(duration_ms / 1000.0)
+                http_request_db_queries.labels(method, route).observe(query_stats.count)
+                http_request_db_duration_seconds.labels(method, route).observe(query_stats.seconds)
+            except Exception:
+                request_logger.debug("failed to record metric for %s %s", method, scope["path"])
+            request_logger.info(
+                "request %s %s -> %s in %.1fms (db %d queries, %.1fms) [req_id=%s actor=%s]",
+                method,
+                f"{scope['path']} host={headers.get('host', '-')}",
+                status_code,
+                duration_ms,
+                query_stats.count,
+                query_stats.seconds * 1000,
+                request_id,
+                headers.get("x-admin-actor") or "-",
+            )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from http.cookies import SimpleCookie
+
+from starlette.datastructures import Headers
+from starlette.requests import Request
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Cookie mit Unix-Zeitstempel, bis zu dem Lese-Endpunkte dieses Clients die Primary-DB nutzen
+READ_PRIMARY_COOKIE = "read_primary_until"
+_SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+# Clients mit kürzlichem Schreibzugriff (Key: Hash der Credentials). Greift auch ohne Cookie
+# (z.B. Scanner-Clients), aber nur im selben Prozess; prozessübergreifend trägt das Cookie.
+_recent_writers: TTLCache[str, bool] = TTLCache(
+    name="recent_writers",
+    max_entries=10_000,
+    ttl_seconds=settings.DB_READ_AFTER_WRITE_SECONDS,
+)
+
+
+def _client_key(headers: Headers) -> str | None:
+    credentials = headers.get("authorization")
+    if credentials is None and headers.get("x-admin-key"):
+        credentials = f"{headers['x-admin-key']}|{headers.get('x-admin-actor', '')}"
+    if not credentials:
+        return None
+    return hashlib.sha256(credentials.encode("utf-8")).hexdigest()
+
+
+def is_write_request(method: str) -> bool:
+    return method.upper() not in _SAFE_METHODS
+
+
+def mark_client_wrote(headers: Headers) -> str | None:
+    """
+    Nach einem erfolgreichen Schreibzugriff: Lesezugriffe desselben Clients laufen für
+    DB_READ_AFTER_WRITE_SECONDS gegen die Primary (Replica-Lag verdeckt sonst die eigene Änderung).
+    Liefert den Set-Cookie-Wert für die Response (None, wenn das Fenster deaktiviert ist).
+    """
+    window = settings.DB_READ_AFTER_WRITE_SECONDS
+    if window <= 0:
+        return None
+    key = _client_key(headers)
+    if key is not None:
+        _recent_writers.set(key, True)
+    cookie: SimpleCookie = SimpleCookie()
+    cookie[READ_PRIMARY_COOKIE] = str(int(time.time() + window) + 1)
+    morsel = cookie[READ_PRIMARY_COOKIE]
+    morsel["max-age"] = int(window) + 1
+    morsel["path"] = "/"
+    morsel["httponly"] = True
+    morsel["samesite"] = "lax"
+    return cookie.output(header="").strip()
+
+
+def requires_primary(request: Request) -> bool:
+    cookie = request.cookies.get(READ_PRIMARY_COOKIE)
+    if cookie:
+        try:
+            if float(cookie) > time.time():
+                return True
+        except ValueError:
+            pass
+    key = _client_key(request.headers)
+    return key is not None and _recent_writers.get(key) is not None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import uuid
 from dataclasses import dataclass
 from typing import Iterable
 
@@ -8,6 +9,8 @@ from fastapi import HTTPException, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.models.tenant import Tenant
 
 request_logger = logging.getLogger("app.request")
@@ -23,6 +26,62 @@ class TenantContext:
     slug: str
 
 
+@dataclass(frozen=True)
+class _TenantSnapshot:
+    """
+    Unveränderlicher Tenant-Stand für den Cache (ohne Session-Bindung).
+    """
+
+    id: uuid.UUID
+    slug: str
+    name: str
+    is_active: bool
+
+    @classmethod
+    def from_tenant(cls, tenant: Tenant) -> "_TenantSnapshot":
+        return cls(id=tenant.id, slug=tenant.slug, name=tenant.name, is_active=bool(tenant.is_active))
+
+    def to_tenant(self) -> Tenant:
+        # Jede Anfrage bekommt ein eigenes, detached Objekt, damit Änderungen nicht in den Cache durchschlagen
+        return Tenant(id=self.id, slug=self.slug, name=self.name, is_active=self.is_active)
+
+
+_tenant_cache: TTLCache[str, _TenantSnapshot] = TTLCache(
+    name="tenant",
+    max_entries=settings.TENANT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.TENANT_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_tenant_cache(*, slug: str | None = None, tenant_id: uuid.UUID | None = None) -> None:
+    """
+    Entfernt einen Tenant aus dem Resolve-Cache (per Slug oder ID).
+    Ohne Argumente wird der komplette Cache geleert.
+    """
+    if slug is None and tenant_id is None:
+        _tenant_cache.clear()
+        return
+    if slug is not None:
+        _tenant_cache.pop(slug.lower())
+    if tenant_id is not None:
+        _tenant_cache.pop_where(lambda _slug, snapshot: str(snapshot.id) == str(tenant_id))
+
+
+async def _load_tenant(db: AsyncSession, slug: str) -> Tenant | None:
+    cached = _tenant_cache.get(slug)
+    if cached is not None:
+        return cached.to_tenant()
+
+    result = await db.execute(select(Tenant).where(Tenant.slug == slug))
+    tenant = result.scalar_one_or_none()
+    # Nur aktive Tenants cachen, damit unbekannte Slugs den Cache nicht fluten
+    if tenant is not None and tenant.is_active:
+        snapshot = _TenantSnapshot.from_tenant(tenant)
+        _tenant_cache.set(slug, snapshot)
+        return snapshot.to_tenant()
+    return tenant
+
+
 def _get_effective_host(request: Request) -> str:
     """
     Ermittelt den Host, bevorzugt über Reverse Proxy Header.
@@ -63,7 +122,7 @@ async def resolve_tenant(
     fallback_domains: Iterable[str] = ("localhost",),
 ) -> TenantContext:
     """
-    Tenant aus Host Header auflösen und aus DB laden.
+    Tenant aus Host Header auflösen und aus DB laden (aktive Tenants kommen aus dem TTL-Cache).
     Regeln:
     - Genau eine Ebene vor BASE_DOMAIN (z. B. kunde1.test.myitnetwork.de)
     - Fallback-Domains (z. B. localhost) werden ebenfalls akzeptiert, ebenfalls mit einer Subdomain-Ebene (kunde1.localhost)
@@ -113,8 +172,7 @@ async def resolve_tenant(
             },
         )
 
-    result = await db.execute(select(Tenant).where(Tenant.slug == slug))
-    tenant = result.scalar_one_or_none()
+    tenant = await _load_tenant(db, slug)
 
     if tenant is None or not tenant.is_active:
         request_logger.warning(
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.core.logging import configure_logging
+from app.core.config import settings
+from app.core.mail_outbox import run_outbox_loop
+from app.modules.jobs.worker import load_job_handlers, run_job_worker_loop
+
+
+async def _run() -> None:
+    # Job-Queue und E-Mail-Outbox im selben Worker-Prozess
+    await asyncio.gather(run_job_worker_loop(), run_outbox_loop())
+
+
+def main() -> None:
+    configure_logging(environment=settings.ENVIRONMENT)
+    load_job_handlers()
+    logging.getLogger("app.jobs").info("background job worker started")
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
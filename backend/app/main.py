@@ -1,27 +1,31 @@
 from __future__ import annotations
 
-import uuid
 import logging
-import time
 import asyncio
 
-from fastapi import Depends, FastAPI, Request, Response
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-from app.observability.metrics import metrics_registry, http_requests_total, http_request_duration_seconds
+from app.observability.metrics import metrics_registry
 
 from app.core.config import settings
 from app.core.db import get_db, init_models, is_sqlite_database
+from app.core.middleware import RequestContextMiddleware
 from app.core.errors import register_exception_handlers
 from app.core.logging import configure_logging
 from app.modules.admin.routes import router as admin_router
 from app.modules.admin.login_routes import router as admin_login_router
 from app.modules.admin.backup_scheduler import start_backup_scheduler, stop_backup_scheduler
+from app.modules.admin.backups_routes import fail_stale_backup_jobs, import_legacy_backup_index
 from app.modules.inventory.routes import router as inventory_router
+from app.modules.jobs.routes import router as jobs_router
+from app.modules.jobs.worker import start_job_worker, stop_job_worker
+from app.core.mail_outbox import start_outbox_dispatcher, stop_outbox_dispatcher
+from app.modules.inventory.pdf_render import shutdown_pdf_pool
 from app.modules.auth.routes import router as auth_router
 from app.modules.public.routes import router as public_router
 from app.modules.public.routes import router as public_router
@@ -78,18 +82,36 @@ def create_app() -> FastAPI:
             settings.BASE_ADMIN_DOMAIN,
         )
         start_backup_scheduler()
+        start_job_worker()
+        start_outbox_dispatcher()
 
     @app.on_event("shutdown")
     async def shutdown_scheduler() -> None:
         stop_backup_scheduler()
+        stop_job_worker()
+        stop_outbox_dispatcher()
+        shutdown_pdf_pool()
 
     @app.on_event("startup")
     async def ensure_schema() -> None:
         if is_sqlite_database():
             await init_models()
 
+    @app.on_event("startup")
+    async def migrate_backup_index() -> None:
+        # nach ensure_schema: Tabellen existieren bereits
+        try:
+            await import_legacy_backup_index()
+        except Exception:
+            request_logger.exception("legacy backup index import failed")
+        try:
+            await fail_stale_backup_jobs()
+        except Exception:
+            request_logger.exception("stale backup job cleanup failed")
+
     app.include_router(admin_login_router)
     app.include_router(inventory_router)
+    app.include_router(jobs_router)
     app.include_router(admin_router)
     app.include_router(auth_router)
     app.include_router(public_router)
@@ -97,48 +119,8 @@ def create_app() -> FastAPI:
     
     register_exception_handlers(app)
 
-    @app.middleware("http")
-    async def request_id_middleware(request: Request, call_next):
-        request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
-        request.state.request_id = request_id
-
-        response = await call_next(request)
-        response.headers["X-Request-Id"] = request_id
-        return response
-
-    @app.middleware("http")
-    async def request_logging_middleware(request: Request, call_next):
-        start = time.perf_counter()
-        status_code: int | str = "error"
-        host = request.headers.get("host", "-")
-        try:
-            response = await call_next(request)
-            status_code = response.status_code
-            return response
-        except Exception:
-            request_logger.exception("unhandled error for %s %s", request.method, request.url.path)
-            raise
-        finally:
-            duration_ms = (time.perf_counter() - start) * 1000
-            request_id = getattr(request.state, "request_id", "-")
-            actor = request.headers.get("x-admin-actor") or "-"
-            try:
-                http_requests_total.labels(request.method, request.url.path, str(status_code)).inc()
-                http_request_duration_seconds.labels(request.method, request.url.path, str(status_code)).observe(
-                    duration_ms / 1000.0
-                )
-            except Exception:
-                request_logger.debug("failed to record metric for %s %s", request.method, request.url.path)
-            request_logger.info(
-                "request %s %s -> %s in %.1fms [req_id=%s actor=%s]",
-                request.method,
-                f"{request.url.path} host={host}",
-                status_code,
-                duration_ms,
-                request_id,
-                actor,
-            )
-
+    # Request-ID, Metriken, Access-Log und read-your-writes in einer reinen ASGI-Middleware (äußerste Schicht)
+    app.add_middleware(RequestContextMiddleware)
 
     @app.get("/health", tags=["platform"])
     async def health(db: AsyncSession = Depends(get_db)) -> dict:
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db_types import GUID, JSONBType
+from app.models.base import Base
+
+
+class BackgroundJob(Base):
+    """
+    Hintergrundjob (Import/Export) für den Job-Worker.
+    Eingabe- und Ergebnisdateien liegen im Backup-Storage unter `jobs/<id>/`.
+    """
+
+    __tablename__ = "background_jobs"
+    __table_args__ = (
+        # Worker: nächster wartender Job; Aufräumen hängender Jobs
+        Index("ix_background_jobs_status_created_at", "status", "created_at"),
+        Index("ix_background_jobs_tenant_created_at", "tenant_id", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    # Handler-Schlüssel, z. B. "inventory.items_import"
+    kind: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    # queued | running | completed | failed
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="queued")
+
+    # None für Admin-Jobs (globale Stammdaten)
+    tenant_id: Mapped[uuid.UUID | None] = mapped_column(
+        GUID(),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+
+    actor: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    params: Mapped[dict] = mapped_column(JSONBType(), nullable=False, default=dict)
+
+    input_filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    # Fortschritt (Zeilen); total ist unbekannt, solange die Eingabe gestreamt wird
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # Zusammenfassung (z. B. Import-Ergebnis) bzw. Ergebnisdatei im Storage
+    result: Mapped[dict | None] = mapped_column(JSONBType(), nullable=True)
+    result_filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    result_media_type: Mapped[str | None] = mapped_column(String(128), nullable=True)
+
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    worker_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
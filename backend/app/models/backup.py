@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db_types import GUID, JSONBType
+from app.models.base import Base
+
+
+class BackupJob(Base):
+    """
+    All-Tenant-Backup-Job (manuell oder Scheduler). Fortschritt wird per atomarem UPDATE
+    fortgeschrieben, damit parallele Tenants und mehrere Prozesse sich nicht überschreiben.
+    """
+
+    __tablename__ = "backup_jobs"
+    __table_args__ = (
+        # Scheduler: läuft bereits ein Job?; Listing nach Status
+        Index("ix_backup_jobs_status_created_at", "status", "created_at"),
+        Index("ix_backup_jobs_created_at", "created_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    # queued | running | completed | completed_with_errors | failed
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default="queued")
+
+    # full | incremental
+    kind: Mapped[str] = mapped_column(String(16), nullable=False, default="full")
+
+    # manual | scheduler
+    trigger: Mapped[str | None] = mapped_column(String(16), nullable=True)
+
+    total: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    processed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_tenants: Mapped[list] = mapped_column(JSONBType(), nullable=False, default=list)
+
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    scheduled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Lebenszeichen des ausführenden Prozesses; bleibt es aus, gilt der Job als abgebrochen
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class BackupRecord(Base):
+    """
+    Index-Eintrag eines Backups; die Dateien liegen im Backup-Storage unter `<id>/`.
+    """
+
+    __tablename__ = "backups"
+    __table_args__ = (
+        Index("ix_backups_created_at", "created_at"),
+        # Listing/Kettenaufbau je Tenant
+        Index("ix_backups_tenant_created_at", "tenant_id", "created_at"),
+        Index("ix_backups_parent_id", "parent_id"),
+        Index("ix_backups_job_id", "job_id"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    # tenant | all
+    scope: Mapped[str] = mapped_column(String(16), nullable=False, default="tenant")
+
+    # Ohne Fremdschlüssel: Backups bleiben auch nach dem Löschen eines Tenants gelistet
+    tenant_id: Mapped[uuid.UUID | None] = mapped_column(GUID(), nullable=True)
+    tenant_slug: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="ok")
+
+    # full | incremental (parent_id = Vorgänger in der Kette)
+    kind: Mapped[str] = mapped_column(String(16), nullable=False, default="full")
+    parent_id: Mapped[uuid.UUID | None] = mapped_column(GUID(), nullable=True)
+
+    job_id: Mapped[uuid.UUID | None] = mapped_column(
+        GUID(),
+        ForeignKey("backup_jobs.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    snapshot_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    restored_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    # Dateiliste [{name, size_bytes}] beim Anlegen, damit die Übersicht ohne Storage-LIST auskommt;
+    # None = Altbestand, wird beim ersten Listen einmalig aus dem Storage ergänzt
+    files: Mapped[list | None] = mapped_column(JSONBType(), nullable=True)
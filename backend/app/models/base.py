@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import DeclarativeBase
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
@@ -9,3 +12,22 @@ class Base(DeclarativeBase):
     Alembic nutzt diese Metadata für Autogenerate und Migrationen.
     """
     pass
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class UpdatedAtMixin:
+    """
+    Änderungszeitpunkt je Zeile; inkrementelle Backups sichern nur Zeilen mit
+    `updated_at` nach dem Vorgänger-Backup. Wird auch bei Core-`update()` gesetzt,
+    bei `ON CONFLICT DO UPDATE` muss die Spalte explizit ins SET.
+    """
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=_utcnow,
+        onupdate=_utcnow,
+    )
@@ -6,10 +6,10 @@ from sqlalchemy import Boolean, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db_types import GUID
-from app.models.base import Base
+from app.models.base import Base, UpdatedAtMixin
 
 
-class Category(Base):
+class Category(UpdatedAtMixin, Base):
     __tablename__ = "categories"
     __table_args__ = (
         UniqueConstraint("tenant_id", "name", name="uq_categories_tenant_name"),
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db_types import GUID
+from app.models.base import Base
+
+
+class InventoryConsumptionMonthly(Base):
+    """
+    Vorverdichtete Lagerbewegungen pro Tenant, Artikel und Monat (Reporting).
+    Wird bei jeder Bewegung inkrementell fortgeschrieben und ist jederzeit
+    aus `inventory_movements` rekonstruierbar (abgeleitete Daten, nicht im Backup).
+    """
+
+    __tablename__ = "inventory_consumption_monthly"
+
+    tenant_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    item_id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        ForeignKey("items.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Erster Tag des Monats (UTC)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    qty_out: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    qty_in: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
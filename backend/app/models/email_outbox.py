@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.db_types import GUID
+from app.models.base import Base
+
+
+class EmailOutbox(Base):
+    """
+    Ausgehende E-Mail in der Warteschlange. Der Outbox-Dispatcher stellt zu und plant
+    Fehlversuche mit exponentiellem Backoff neu ein.
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        # Dispatcher: fällige Mails in Reihenfolge
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        GUID(),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+
+    # None für System-Mails ohne Tenant-Bezug
+    tenant_id: Mapped[uuid.UUID | None] = mapped_column(
+        GUID(),
+        ForeignKey("tenants.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+
+    recipient: Mapped[str] = mapped_column(String(320), nullable=False)
+    subject: Mapped[str] = mapped_column(String(998), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # pending | sending | sent | failed
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="pending")
+
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    actor: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    request_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, Integer, SmallInteger, String, UniqueConstraint
+from sqlalchemy import Boolean, ForeignKey, Index, Integer, SmallInteger, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db_types import GUID
-from app.models.base import Base
+from app.models.base import Base, UpdatedAtMixin
 
 
-class Item(Base):
+class Item(UpdatedAtMixin, Base):
     __tablename__ = "items"
     __table_args__ = (
         UniqueConstraint("tenant_id", "sku", name="uq_items_tenant_sku"),
+        # Keyset-Pagination der Artikellisten (ORDER BY name, id pro Tenant)
+        Index("ix_items_tenant_name_id", "tenant_id", "name", "id"),
+        # Inkrementelle Backups: geänderte Zeilen pro Tenant
+        Index("ix_items_tenant_updated_at", "tenant_id", "updated_at"),
     )
 
     # Technischer Primärschlüssel
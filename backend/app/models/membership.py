@@ -6,10 +6,10 @@ from sqlalchemy import Boolean, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db_types import GUID
-from app.models.base import Base
+from app.models.base import Base, UpdatedAtMixin
 
 
-class Membership(Base):
+class Membership(UpdatedAtMixin, Base):
     __tablename__ = "memberships"
     __table_args__ = (
         UniqueConstraint("user_id", "tenant_id", name="uq_memberships_user_tenant"),
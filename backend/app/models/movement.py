@@ -3,11 +3,11 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db_types import GUID
-from app.models.base import Base
+from app.models.base import Base, _utcnow
 
 
 class InventoryMovement(Base):
@@ -23,11 +23,11 @@ class InventoryMovement(Base):
     )
 
     id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
+    # Kein Einzelindex: tenant_id ist führende Spalte der Composite-Indizes unten
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
         ForeignKey("tenants.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     item_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -45,3 +45,33 @@ class InventoryMovement(Base):
         server_default=func.now(),
         nullable=False,
     )
+    # Buchungszeitpunkt auf dem Server; created_at kann vom Client kommen (Offline-Replays, rückdatiert).
+    # Inkrementelle Backups erkennen neue Zeilen daher über recorded_at.
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=_utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+# Listen (neueste zuerst) pro Tenant: WHERE tenant_id = ? ORDER BY created_at DESC LIMIT n
+Index(
+    "ix_inventory_movements_tenant_created_at",
+    InventoryMovement.tenant_id,
+    InventoryMovement.created_at.desc(),
+)
+# Inkrementelle Backups: WHERE tenant_id = ? AND recorded_at >= ?
+Index(
+    "ix_inventory_movements_tenant_recorded_at",
+    InventoryMovement.tenant_id,
+    InventoryMovement.recorded_at,
+)
+# Reporting/Filter nach Typ und Zeitraum; INCLUDE erlaubt Index-Only-Scans für Summen (PostgreSQL)
+Index(
+    "ix_inventory_movements_tenant_type_created_at",
+    InventoryMovement.tenant_id,
+    InventoryMovement.type,
+    InventoryMovement.created_at,
+    postgresql_include=["item_id", "qty"],
+)
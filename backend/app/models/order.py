@@ -3,17 +3,19 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.db_types import GUID
-from app.models.base import Base
+from app.models.base import Base, UpdatedAtMixin
 
 
-class InventoryOrder(Base):
+class InventoryOrder(UpdatedAtMixin, Base):
     __tablename__ = "inventory_orders"
     __table_args__ = (
         UniqueConstraint("tenant_id", "number", name="uq_inventory_orders_number"),
+        # Inkrementelle Backups: geänderte Zeilen pro Tenant
+        Index("ix_inventory_orders_tenant_updated_at", "tenant_id", "updated_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
@@ -37,10 +39,11 @@ class InventoryOrder(Base):
     items = relationship("InventoryOrderItem", lazy="selectin", cascade="all, delete-orphan")
 
 
-class InventoryOrderItem(Base):
+class InventoryOrderItem(UpdatedAtMixin, Base):
     __tablename__ = "inventory_order_items"
     __table_args__ = (
         UniqueConstraint("tenant_id", "order_id", "item_id", name="uq_inventory_order_items_order_item"),
+        Index("ix_inventory_order_items_tenant_updated_at", "tenant_id", "updated_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
@@ -6,10 +6,10 @@ from sqlalchemy import Boolean, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db_types import GUID
-from app.models.base import Base
+from app.models.base import Base, UpdatedAtMixin
 
 
-class TenantSetting(Base):
+class TenantSetting(UpdatedAtMixin, Base):
     __tablename__ = "tenant_settings"
     __table_args__ = (
         UniqueConstraint("tenant_id", name="uq_tenant_settings_tenant"),
@@ -26,6 +26,7 @@ class TenantSetting(Base):
     contact_email: Mapped[str] = mapped_column(String(255), nullable=False, default="")
     order_email: Mapped[str] = mapped_column(String(255), nullable=False, default="")
     auto_order_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    barcode_scanner_reduce_enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     auto_order_min: Mapped[int] = mapped_column(nullable=False, default=0)
     export_format: Mapped[str] = mapped_column(String(32), nullable=False, default="xlsx")
     address: Mapped[str] = mapped_column(String(512), nullable=False, default="")
@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_read_db
 from app.models.audit_log import AdminAuditLog
 from app.modules.admin.schemas import AuditOut
 
@@ -15,7 +15,7 @@ router = APIRouter(prefix="/audit", tags=["admin-audit"])
 
 @router.get("", response_model=list[AuditOut])
 async def admin_get_audit(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     actor: str | None = Query(default=None),
     action: str | None = Query(default=None),
     entity_type: str | None = Query(default=None),
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+from typing import BinaryIO, Iterable, Iterator
+
+from app.modules.admin.backup_storage import ObjectWriter
+
+# Tabellen als gzip-komprimiertes NDJSON (eine Zeile pro Datensatz); Version 1 war ein
+# JSON-Dokument pro Tabelle (`<tabelle>.json` mit "rows") und wird weiterhin gelesen
+BACKUP_FORMAT = "ndjson-gzip-v2"
+TABLE_FILE_SUFFIX = ".ndjson.gz"
+LEGACY_TABLE_FILE_SUFFIX = ".json"
+
+# Blockgröße beim Prüfsummen-Lesen
+READ_BLOCK = 1024 * 1024
+
+
+class _HashingSink:
+    """
+    Ziel für GzipFile: zählt und hasht die komprimierten Bytes und reicht sie an den Storage weiter.
+    """
+
+    def __init__(self, target: ObjectWriter) -> None:
+        self._target = target
+        self.sha256 = hashlib.sha256()
+        self.size_bytes = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.size_bytes += len(data)
+        self._target.write(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+class NdjsonGzipWriter:
+    """
+    Schreibt Datensätze blockweise als NDJSON-gzip in ein Storage-Objekt. Prüfsumme und Größe
+    entstehen im selben Durchlauf; es liegt nie mehr als ein Block (bzw. ein Upload-Teil) im Speicher.
+    Blockierend (I/O, Kompression) - aus async-Code per `asyncio.to_thread` aufrufen.
+    """
+
+    def __init__(self, target: ObjectWriter, *, compresslevel: int = 6) -> None:
+        self.rows = 0
+        self._target = target
+        self._sink = _HashingSink(target)
+        # mtime=0: gleicher Inhalt ergibt gleiche Bytes (stabile Prüfsummen)
+        self._gzip = gzip.GzipFile(filename="", mode="wb", fileobj=self._sink, compresslevel=compresslevel, mtime=0)
+
+    def write_rows(self, rows: Iterable[dict]) -> None:
+        lines = [json.dumps(row, ensure_ascii=False, separators=(",", ":")) for row in rows]
+        if not lines:
+            return
+        self._gzip.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self.rows += len(lines)
+
+    def close(self) -> dict[str, str | int]:
+        """
+        Schließt das Objekt (erst dann ist es sichtbar) und liefert den Manifest-Eintrag
+        (checksum, size_bytes, rows).
+        """
+        self._gzip.close()
+        self._target.close()
+        return {
+            "checksum": self._sink.sha256.hexdigest(),
+            "size_bytes": self._sink.size_bytes,
+            "rows": self.rows,
+        }
+
+    def abort(self) -> None:
+        self._target.abort()
+
+
+def iter_ndjson_gz(source: BinaryIO) -> Iterator[dict]:
+    """
+    Liest einen NDJSON-gzip-Stream zeilenweise (konstanter Speicherbedarf) und schließt ihn am Ende.
+    """
+    with source, gzip.GzipFile(fileobj=source, mode="rb") as raw, io.TextIOWrapper(raw, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_table_rows(source: BinaryIO, *, streaming: bool = True) -> Iterator[dict]:
+    """
+    Zeilen einer Tabellendatei; Format-1-Dateien sind ein JSON-Dokument und werden am Stück geladen.
+    """
+    if streaming:
+        yield from iter_ndjson_gz(source)
+        return
+    with source:
+        yield from json.load(source).get("rows", [])
+
+
+def table_filename(table_name: str, *, streaming: bool = True) -> str:
+    return f"{table_name}{TABLE_FILE_SUFFIX if streaming else LEGACY_TABLE_FILE_SUFFIX}"
+
+
+def keys_filename(table_name: str) -> str:
+    # Inkrementell: Primärschlüssel aller aktuellen Zeilen (erkennt Löschungen beim Abspielen der Kette)
+    return f"{table_name}.keys{TABLE_FILE_SUFFIX}"
+
+
+def file_checksum(source: BinaryIO) -> dict[str, str | int]:
+    """
+    SHA-256 und Größe eines Streams, blockweise gelesen.
+    """
+    digest = hashlib.sha256()
+    size_bytes = 0
+    with source as fh:
+        while block := fh.read(READ_BLOCK):
+            digest.update(block)
+            size_bytes += len(block)
+    return {"checksum": digest.hexdigest(), "size_bytes": size_bytes}
+
+
+def is_streaming_format(meta: dict) -> bool:
+    return meta.get("format") == BACKUP_FORMAT
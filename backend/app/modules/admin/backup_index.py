@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.backup import BackupJob, BackupRecord
+from app.modules.admin.backup_storage import BackupStorage, read_bytes, write_bytes
+
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_uuid(value: str | uuid.UUID | None) -> uuid.UUID | None:
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def aware(value: datetime | None) -> datetime | None:
+    # SQLite liefert DateTime(timezone=True) ohne tzinfo zurück
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+async def get_backup(db: AsyncSession, backup_id: str | uuid.UUID) -> BackupRecord | None:
+    key = _as_uuid(backup_id)
+    return await db.get(BackupRecord, key) if key is not None else None
+
+
+async def list_backups(
+    db: AsyncSession,
+    *,
+    tenant_id: str | None = None,
+    scope: str | None = None,
+    kind: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+) -> tuple[list[BackupRecord], int]:
+    stmt = select(BackupRecord)
+    if tenant_id:
+        stmt = stmt.where(BackupRecord.tenant_id == _as_uuid(tenant_id))
+    if scope:
+        stmt = stmt.where(BackupRecord.scope == scope)
+    if kind:
+        stmt = stmt.where(BackupRecord.kind == kind)
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+    page = await db.scalars(
+        stmt.order_by(BackupRecord.created_at.desc(), BackupRecord.id.desc()).limit(limit).offset(offset)
+    )
+    return list(page.all()), int(total or 0)
+
+
+async def latest_tenant_backup(db: AsyncSession, tenant_id: uuid.UUID) -> BackupRecord | None:
+    return await db.scalar(
+        select(BackupRecord)
+        .where(BackupRecord.tenant_id == tenant_id, BackupRecord.scope == "tenant", BackupRecord.status == "ok")
+        .order_by(BackupRecord.created_at.desc())
+        .limit(1)
+    )
+
+
+async def last_tenant_restore(db: AsyncSession, tenant_id: uuid.UUID) -> datetime | None:
+    """
+    Zeitpunkt der letzten Wiederherstellung irgendeines Backups des Tenants.
+    """
+    restored_at = await db.scalar(
+        select(func.max(BackupRecord.restored_at)).where(
+            BackupRecord.tenant_id == tenant_id, BackupRecord.scope == "tenant"
+        )
+    )
+    return aware(restored_at)
+
+
+async def backup_chain(db: AsyncSession, record: BackupRecord) -> list[BackupRecord]:
+    """
+    Kette vom Voll-Backup bis `record` (älteste zuerst).
+    """
+    chain = [record]
+    while chain[-1].parent_id is not None:
+        parent = await db.get(BackupRecord, chain[-1].parent_id)
+        if parent is None or parent in chain:
+            raise HTTPException(status_code=400, detail="Backup-Kette unvollständig (Vorgänger fehlt)")
+        chain.append(parent)
+    return list(reversed(chain))
+
+
+async def expired_backup_ids(
+    db: AsyncSession,
+    *,
+    max_days: int | None,
+    max_count: int | None,
+) -> set[uuid.UUID]:
+    """
+    Backups außerhalb der Retention. Vorgänger behaltener inkrementeller Backups bleiben erhalten.
+    """
+    removed: set[uuid.UUID] = set()
+    if max_days is not None:
+        cutoff = _now() - timedelta(days=max_days)
+        removed |= set(await db.scalars(select(BackupRecord.id).where(BackupRecord.created_at < cutoff)))
+    if max_count is not None:
+        removed |= set(
+            await db.scalars(
+                select(BackupRecord.id)
+                .order_by(BackupRecord.created_at.desc(), BackupRecord.id.desc())
+                .offset(max_count)
+            )
+        )
+    if not removed:
+        return removed
+    protected = set(
+        await db.scalars(
+            select(BackupRecord.parent_id).where(
+                BackupRecord.parent_id.in_(removed),
+                BackupRecord.id.not_in(removed),
+            )
+        )
+    )
+    while protected:
+        removed -= protected
+        protected = set(
+            await db.scalars(
+                select(BackupRecord.parent_id).where(
+                    BackupRecord.id.in_(protected),
+                    BackupRecord.parent_id.in_(removed),
+                )
+            )
+        )
+    return removed
+
+
+async def create_job(
+    db: AsyncSession,
+    *,
+    kind: str,
+    trigger: str,
+    scheduled_at: datetime | None = None,
+) -> BackupJob:
+    job = BackupJob(
+        id=uuid.uuid4(),
+        status="queued",
+        kind=kind,
+        trigger=trigger,
+        total=0,
+        processed=0,
+        failed=0,
+        failed_tenants=[],
+        created_at=_now(),
+        scheduled_at=scheduled_at,
+    )
+    db.add(job)
+    await db.flush()
+    return job
+
+
+async def get_job(db: AsyncSession, job_id: str | uuid.UUID) -> BackupJob | None:
+    key = _as_uuid(job_id)
+    return await db.get(BackupJob, key, populate_existing=True) if key is not None else None
+
+
+async def list_jobs(
+    db: AsyncSession,
+    *,
+    status: str | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> list[BackupJob]:
+    stmt = select(BackupJob)
+    if status:
+        stmt = stmt.where(BackupJob.status == status)
+    page = await db.scalars(stmt.order_by(BackupJob.created_at.desc()).limit(limit).offset(offset))
+    return list(page.all())
+
+
+async def job_backup_ids(db: AsyncSession, job_ids: list[uuid.UUID]) -> dict[uuid.UUID, list[str]]:
+    if not job_ids:
+        return {}
+    rows = await db.execute(
+        select(BackupRecord.job_id, BackupRecord.id)
+        .where(BackupRecord.job_id.in_(job_ids))
+        .order_by(BackupRecord.created_at.asc())
+    )
+    result: dict[uuid.UUID, list[str]] = {}
+    for job_id, backup_id in rows.all():
+        result.setdefault(job_id, []).append(str(backup_id))
+    return result
+
+
+async def has_active_jobs(db: AsyncSession) -> bool:
+    return bool(
+        await db.scalar(select(BackupJob.id).where(BackupJob.status.in_(ACTIVE_JOB_STATUSES)).limit(1))
+    )
+
+
+async def fail_stale_jobs(db: AsyncSession, timeout_seconds: float) -> int:
+    """
+    Wartende/laufende Jobs, deren Prozess seit `timeout_seconds` kein Lebenszeichen gegeben hat
+    (Absturz, Redeploy), als failed markieren; sonst blockieren sie jeden weiteren geplanten Job.
+    Liefert die Anzahl betroffener Jobs.
+    """
+    cutoff = _now() - timedelta(seconds=timeout_seconds)
+    result = await db.execute(
+        update(BackupJob)
+        .where(
+            BackupJob.status.in_(ACTIVE_JOB_STATUSES),
+            func.coalesce(BackupJob.heartbeat_at, BackupJob.started_at, BackupJob.created_at) < cutoff,
+        )
+        .values(status="failed", finished_at=_now(), error="Job abgebrochen (kein Heartbeat)")
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount or 0
+
+
+async def update_job(db: AsyncSession, job_id: uuid.UUID, **values: object) -> None:
+    await db.execute(
+        update(BackupJob).where(BackupJob.id == job_id).values(**values).execution_options(synchronize_session=False)
+    )
+
+
+async def increment_job(db: AsyncSession, job_id: uuid.UUID, *, processed: int = 0, failed: int = 0) -> None:
+    """
+    Zähler relativ erhöhen (processed = processed + n): kein Lesen-Ändern-Schreiben über Prozesse hinweg.
+    """
+    await update_job(
+        db,
+        job_id,
+        processed=BackupJob.processed + processed,
+        failed=BackupJob.failed + failed,
+    )
+
+
+async def record_job_failure(db: AsyncSession, job_id: uuid.UUID, tenant_slug: str, error: str) -> None:
+    # Zeilensperre für die Liste der fehlgeschlagenen Tenants (JSON lässt sich nicht portabel anhängen)
+    job = await db.scalar(
+        select(BackupJob).where(BackupJob.id == job_id).with_for_update().execution_options(populate_existing=True)
+    )
+    if job is None:
+        return
+    await update_job(
+        db,
+        job_id,
+        failed=BackupJob.failed + 1,
+        failed_tenants=[*(job.failed_tenants or []), tenant_slug],
+        error=f"Backup fehlgeschlagen für {tenant_slug}: {error}",
+    )
+
+
+def _read_legacy(storage: BackupStorage, key: str) -> dict | None:
+    try:
+        return json.loads(read_bytes(storage, key))
+    except FileNotFoundError:
+        return None
+
+
+def _archive_legacy(storage: BackupStorage, key: str) -> None:
+    try:
+        data = read_bytes(storage, key)
+    except FileNotFoundError:
+        return
+    write_bytes(storage, f"{key}.imported", data)
+    storage.delete(key)
+
+
+async def import_legacy_index(db: AsyncSession, storage: BackupStorage, index_key: str, jobs_key: str) -> int:
+    """
+    Übernimmt `jobs.json`/`index.json` aus älteren Versionen einmalig in die Tabellen und legt
+    die Dateien danach als `*.imported` ab. Liefert die Anzahl übernommener Einträge.
+    """
+    imported = 0
+    backup_jobs: dict[str, uuid.UUID] = {}
+    legacy_jobs = await asyncio.to_thread(_read_legacy, storage, jobs_key)
+    legacy_index = await asyncio.to_thread(_read_legacy, storage, index_key)
+    if legacy_jobs is not None:
+        for item in legacy_jobs.get("items", []):
+            job_id = _as_uuid(item.get("id"))
+            if job_id is None or await db.get(BackupJob, job_id) is not None:
+                continue
+            status = item.get("status") or "failed"
+            db.add(
+                BackupJob(
+                    id=job_id,
+                    # Jobs eines beendeten Prozesses laufen nicht weiter
+                    status="failed" if status in ACTIVE_JOB_STATUSES else status,
+                    kind=item.get("kind") or "full",
+                    trigger=item.get("trigger"),
+                    total=int(item.get("total") or 0),
+                    processed=int(item.get("processed") or 0),
+                    failed=int(item.get("failed") or 0),
+                    failed_tenants=list(item.get("failed_tenants") or []),
+                    error=item.get("error"),
+                    created_at=_parse_datetime(item.get("created_at")) or _now(),
+                    scheduled_at=_parse_datetime(item.get("scheduled_at")),
+                    started_at=_parse_datetime(item.get("started_at")),
+                    finished_at=_parse_datetime(item.get("finished_at")),
+                )
+            )
+            for backup_id in item.get("backup_ids") or []:
+                backup_jobs[str(backup_id)] = job_id
+            imported += 1
+        await db.flush()
+    if legacy_index is not None:
+        for item in legacy_index.get("items", []):
+            backup_id = _as_uuid(item.get("id"))
+            if backup_id is None or await db.get(BackupRecord, backup_id) is not None:
+                continue
+            db.add(
+                BackupRecord(
+                    id=backup_id,
+                    scope=item.get("scope") or "tenant",
+                    tenant_id=_as_uuid(item.get("tenant_id")),
+                    tenant_slug=item.get("tenant_slug"),
+                    status=item.get("status") or "ok",
+                    kind=item.get("kind") or "full",
+                    parent_id=_as_uuid(item.get("parent_id")),
+                    job_id=backup_jobs.get(str(backup_id)),
+                    created_at=_parse_datetime(item.get("created_at")) or _now(),
+                    snapshot_at=_parse_datetime(item.get("snapshot_at")),
+                    restored_at=_parse_datetime(item.get("restored_at")),
+                )
+            )
+            imported += 1
+    await db.commit()
+    for key in (index_key, jobs_key):
+        await asyncio.to_thread(_archive_legacy, storage, key)
+    return imported
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timezone
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Iterator
+
+from fastapi import HTTPException
+from sqlalchemy import Column, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.schema import Table
+
+from app.modules.admin.backup_format import is_streaming_format, iter_table_rows, keys_filename, table_filename
+from app.modules.admin.backup_storage import BackupStorage, backup_key, read_bytes, restore_state_key, write_bytes
+
+# asyncpg erlaubt höchstens 32767 Bind-Parameter pro Statement
+MAX_BIND_PARAMS = 32000
+# Bereits geprüfte FK-Werte je Constraint; darüber wird der Cache verworfen (Speicher bleibt begrenzt)
+KNOWN_REFERENCES_LIMIT = 50_000
+
+RowConverter = Callable[[dict], dict]
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _value_parser(column: Column) -> Callable[[str], Any] | None:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    if python_type is uuid.UUID:
+        return uuid.UUID
+    if python_type is datetime:
+        return datetime.fromisoformat
+    if python_type is date:
+        return date.fromisoformat
+    return None
+
+
+def _missing_value(column: Column) -> Callable[[], Any]:
+    """
+    Wert für Spalten, die im Backup fehlen (Backup älter als die Spalte): Python-Default oder None.
+    """
+    default = column.default
+    if default is None:
+        return lambda: None
+    if default.is_callable:
+        return lambda: default.arg(None)
+    if default.is_scalar:
+        return lambda: default.arg
+    return lambda: None
+
+
+def row_converter(table: Table, tenant_id: uuid.UUID) -> RowConverter:
+    """
+    Baut den Konverter einer Tabelle einmalig vor dem Restore: je Spalte steht fest, ob und wie
+    ein serialisierter Wert (UUID, Datum) zurückgewandelt wird. tenant_id wird immer gesetzt.
+    """
+    plan = [(column.name, _value_parser(column), _missing_value(column)) for column in table.c]
+
+    def convert(row: dict) -> dict:
+        converted: dict[str, Any] = {}
+        for name, parser, missing in plan:
+            if name not in row:
+                converted[name] = missing()
+                continue
+            value = row[name]
+            converted[name] = parser(value) if parser is not None and isinstance(value, str) else value
+        converted["tenant_id"] = tenant_id
+        return converted
+
+    return convert
+
+
+def upsert_batch_size(table: Table, configured: int) -> int:
+    # Mehrzeiliges INSERT: Zeilen x Spalten darf das Bind-Parameter-Limit nicht überschreiten
+    return max(1, min(configured, MAX_BIND_PARAMS // max(len(table.c), 1)))
+
+
+def row_key(table: Table, row: dict) -> tuple:
+    return tuple(str(row.get(col.name)) for col in table.primary_key.columns)
+
+
+def validate_row(table: Table, row: dict, tenant_id: str, line: int) -> None:
+    if "tenant_id" in row and str(row["tenant_id"]) != tenant_id:
+        raise HTTPException(status_code=400, detail=f"Tenant-ID stimmt nicht überein: {table.name} Zeile {line}")
+    for col in table.primary_key.columns:
+        if row.get(col.name) is None:
+            raise HTTPException(status_code=400, detail=f"Primärschlüssel fehlt in {table.name} Zeile {line}")
+
+
+def take(rows: Iterator[dict], size: int) -> list[dict]:
+    return list(islice(rows, size))
+
+
+@dataclass(frozen=True)
+class ChainLink:
+    """
+    Ein Backup einer Restore-Kette (Objekte im Storage + meta.json).
+    """
+
+    backup_id: str
+    storage: BackupStorage
+    meta: dict
+
+    @property
+    def streaming(self) -> bool:
+        return is_streaming_format(self.meta)
+
+    def is_delta(self, table: Table) -> bool:
+        return table.name in (self.meta.get("incremental_tables") or [])
+
+    def open(self, filename: str) -> BinaryIO:
+        try:
+            return self.storage.open_read(backup_key(self.backup_id, filename))
+        except FileNotFoundError:
+            raise HTTPException(status_code=400, detail=f"Backup-Datei fehlt: {filename}") from None
+
+    def rows(self, table: Table) -> Iterator[dict]:
+        source = self.open(table_filename(table.name, streaming=self.streaming))
+        return iter_table_rows(source, streaming=self.streaming)
+
+
+def iter_chain_rows(links: list[ChainLink], table: Table) -> Iterator[dict]:
+    """
+    Zeilen einer Tabelle im Stand des letzten Kettenglieds. Gelesen wird vom neuesten Backup
+    rückwärts bis zum Voll-Backup; je Primärschlüssel gilt die neueste Version, Schlüssel ohne
+    Eintrag in der Schlüsseldatei (gelöscht) entfallen. Im Speicher liegen nur Schlüssel.
+    """
+    newest = links[-1]
+    if not newest.is_delta(table):
+        yield from newest.rows(table)
+        return
+    pending = {row_key(table, row) for row in iter_table_rows(newest.open(keys_filename(table.name)))}
+    for link in reversed(links):
+        for row in link.rows(table):
+            key = row_key(table, row)
+            if key in pending:
+                pending.discard(key)
+                yield row
+        if not pending or not link.is_delta(table):
+            break
+
+
+@dataclass
+class _ForeignKey:
+    name: str
+    local_columns: list[str]
+    ref_table: Table
+    ref_columns: list[str]
+    known: set[tuple] = field(default_factory=set)
+
+
+class ForeignKeyChecker:
+    """
+    Prüft FK-Werte Batch für Batch gegen die Datenbank. Tabellen werden in Abhängigkeits-
+    reihenfolge wiederhergestellt, referenzierte Zeilen aus dem Backup sind also bereits
+    geschrieben; es werden keine Referenzmengen über das ganze Backup aufgebaut.
+    """
+
+    def __init__(self, table: Table, tenant_id: uuid.UUID) -> None:
+        self.table = table
+        self.tenant_id = tenant_id
+        self.foreign_keys: list[_ForeignKey] = []
+        for constraint in table.foreign_key_constraints:
+            local_columns = [element.parent.name for element in constraint.elements]
+            if local_columns == ["tenant_id"]:
+                # wird beim Restore ohnehin auf den Ziel-Tenant gesetzt
+                continue
+            self.foreign_keys.append(
+                _ForeignKey(
+                    name=f"{table.name}.{','.join(local_columns)}",
+                    local_columns=local_columns,
+                    ref_table=next(iter(constraint.elements)).column.table,
+                    ref_columns=[element.column.name for element in constraint.elements],
+                )
+            )
+
+    async def check(self, db: AsyncSession, rows: list[dict], first_line: int) -> None:
+        for fk in self.foreign_keys:
+            values = {
+                tuple(row.get(col) for col in fk.local_columns)
+                for row in rows
+                if all(row.get(col) is not None for col in fk.local_columns)
+            }
+            unknown = {value for value in values if tuple(str(v) for v in value) not in fk.known}
+            if not unknown:
+                continue
+            ref_cols = [fk.ref_table.c[col] for col in fk.ref_columns]
+            query = select(*ref_cols).distinct()
+            if "tenant_id" in fk.ref_table.c:
+                query = query.where(fk.ref_table.c.tenant_id == self.tenant_id)
+            if len(ref_cols) == 1:
+                query = query.where(ref_cols[0].in_([value[0] for value in unknown]))
+            else:
+                query = query.where(tuple_(*ref_cols).in_(unknown))
+            found = {tuple(str(v) for v in row) for row in (await db.execute(query)).all()}
+            missing = {tuple(str(v) for v in value) for value in unknown} - found
+            if missing:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        "Referenzielle Integrität verletzt: "
+                        f"{fk.name} -> {fk.ref_table.name} (Batch ab Zeile {first_line})"
+                    ),
+                )
+            if len(fk.known) + len(found) > KNOWN_REFERENCES_LIMIT:
+                fk.known.clear()
+            fk.known |= found
+
+
+@dataclass
+class RestoreCheckpoint:
+    """
+    Fortschritt eines Restores; nach jedem geschriebenen Batch gespeichert. Ein abgebrochener
+    Restore setzt mit `resume` nach der letzten vollständigen Tabelle bzw. dem letzten Batch fort.
+    """
+
+    backup_id: str
+    chain: list[str]
+    status: str = "running"
+    completed_tables: list[str] = field(default_factory=list)
+    table: str | None = None
+    table_rows: int = 0
+    rows_written: int = 0
+    started_at: str = field(default_factory=_now_iso)
+    updated_at: str = field(default_factory=_now_iso)
+    finished_at: str | None = None
+    error: str | None = None
+
+    @classmethod
+    def load(cls, storage: BackupStorage, backup_id: str) -> RestoreCheckpoint | None:
+        try:
+            return cls(**json.loads(read_bytes(storage, restore_state_key(backup_id))))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+
+    def save(self, storage: BackupStorage) -> None:
+        self.updated_at = _now_iso()
+        payload = json.dumps(asdict(self), ensure_ascii=False).encode("utf-8")
+        write_bytes(storage, restore_state_key(self.backup_id), payload)
+
+    def resumable_for(self, chain: list[str]) -> bool:
+        return self.status != "completed" and self.chain == chain
@@ -1,48 +1,199 @@
 from __future__ import annotations
 
+import io
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
-import shutil
-from typing import Protocol
+from typing import BinaryIO, Iterator, Protocol
+
+# Blockgröße beim Lesen/Streamen von Objekten
+READ_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    key: str
+    size_bytes: int
+
+    @property
+    def name(self) -> str:
+        return self.key.rsplit("/", 1)[-1]
+
+
+class ObjectWriter(Protocol):
+    """
+    Schreibziel für ein Objekt. Erst `close()` macht das Objekt sichtbar; `abort()` verwirft es.
+    """
+
+    def write(self, data: bytes) -> int: ...
+
+    def close(self) -> None: ...
+
+    def abort(self) -> None: ...
 
 
 class BackupStorage(Protocol):
-    def root(self) -> Path: ...
+    """
+    Objektspeicher für Backups, Job-Dateien und Restore-Checkpoints. Adressiert wird über
+    Schlüssel (`<backup_id>/<datei>`, `jobs/<id>/<datei>`), nie über lokale Pfade; alle
+    Methoden blockieren und laufen aus async-Code per `asyncio.to_thread`. Fehlende Objekte
+    lösen `FileNotFoundError` aus.
+    """
 
-    def index_path(self) -> Path: ...
+    def open_write(self, key: str) -> ObjectWriter: ...
 
-    def jobs_path(self) -> Path: ...
+    def open_read(self, key: str, *, start: int | None = None, end: int | None = None) -> BinaryIO: ...
 
-    def backup_dir(self, backup_id: str) -> Path: ...
+    def size(self, key: str) -> int: ...
 
-    def ensure_root(self) -> None: ...
+    def exists(self, key: str) -> bool: ...
 
-    def delete_backup(self, backup_id: str) -> None: ...
+    def list(self, prefix: str) -> list[StoredObject]: ...
 
+    def delete(self, key: str) -> None: ...
+
+    def delete_prefix(self, prefix: str) -> None: ...
+
+
+def backup_key(backup_id: str, name: str) -> str:
+    return f"{backup_id}/{name}"
+
+
+def job_key(job_id: str, name: str) -> str:
+    # Ein- und Ausgabedateien von Hintergrundjobs (Import/Export)
+    return f"jobs/{job_id}/{name}"
 
-@dataclass(frozen=True)
-class LocalBackupStorage:
-    root_path: Path
 
-    def root(self) -> Path:
-        return self.root_path
+def restore_state_key(backup_id: str) -> str:
+    # Checkpoint eines laufenden/abgebrochenen Restores (liegt nicht im unveränderlichen Backup-Ordner)
+    return f"restores/{backup_id}.json"
 
-    def index_path(self) -> Path:
-        return self.root_path / "index.json"
 
-    def jobs_path(self) -> Path:
-        return self.root_path / "jobs.json"
+def read_bytes(storage: BackupStorage, key: str) -> bytes:
+    with storage.open_read(key) as source:
+        return source.read()
 
-    def backup_dir(self, backup_id: str) -> Path:
-        return self.root_path / backup_id
 
-    def ensure_root(self) -> None:
-        self.root_path.mkdir(parents=True, exist_ok=True)
+def write_bytes(storage: BackupStorage, key: str, data: bytes) -> None:
+    writer = storage.open_write(key)
+    try:
+        writer.write(data)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
 
-    def delete_backup(self, backup_id: str) -> None:
-        folder = self.backup_dir(backup_id).resolve()
+
+def iter_object(
+    storage: BackupStorage,
+    key: str,
+    *,
+    start: int | None = None,
+    end: int | None = None,
+    chunk_size: int = READ_CHUNK,
+) -> Iterator[bytes]:
+    """
+    Liefert ein Objekt (bzw. den Bereich start..end inklusive) blockweise, z. B. für StreamingResponse.
+    """
+    with storage.open_read(key, start=start, end=end) as source:
+        while chunk := source.read(chunk_size):
+            yield chunk
+
+
+class _LocalWriter:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = path.with_name(f"{path.name}.part")
+        self._fh = self._tmp_path.open("wb")
+
+    def write(self, data: bytes) -> int:
+        return self._fh.write(data)
+
+    def close(self) -> None:
+        self._fh.close()
+        self._tmp_path.replace(self.path)
+
+    def abort(self) -> None:
+        self._fh.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class _RangeReader(io.RawIOBase):
+    """
+    Liest höchstens `remaining` Bytes ab der aktuellen Dateiposition.
+    """
+
+    def __init__(self, fh: BinaryIO, remaining: int) -> None:
+        self._fh = fh
+        self._remaining = remaining
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[: self._remaining]
+        count = self._fh.readinto(view)
+        self._remaining -= count
+        return count
+
+    def close(self) -> None:
+        self._fh.close()
+        super().close()
+
+
+@dataclass(frozen=True)
+class LocalBackupStorage:
+    root_path: Path
+
+    def _path(self, key: str) -> Path:
+        path = (self.root_path / key).resolve()
+        if not path.is_relative_to(self.root_path.resolve()):
+            raise FileNotFoundError(key)
+        return path
+
+    def open_write(self, key: str) -> ObjectWriter:
+        return _LocalWriter(self._path(key))
+
+    def open_read(self, key: str, *, start: int | None = None, end: int | None = None) -> BinaryIO:
+        path = self._path(key)
+        if not path.is_file():
+            raise FileNotFoundError(key)
+        fh = path.open("rb")
+        if start is None and end is None:
+            return fh
+        fh.seek(start or 0)
+        remaining = (end + 1 if end is not None else path.stat().st_size) - (start or 0)
+        return io.BufferedReader(_RangeReader(fh, remaining))
+
+    def size(self, key: str) -> int:
+        path = self._path(key)
+        if not path.is_file():
+            raise FileNotFoundError(key)
+        return path.stat().st_size
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def list(self, prefix: str) -> list[StoredObject]:
+        folder = self._path(prefix.rstrip("/"))
+        if not folder.is_dir():
+            return []
         root = self.root_path.resolve()
-        if folder.exists() and folder.is_dir() and folder.parent == root:
+        return [
+            StoredObject(key=path.relative_to(root).as_posix(), size_bytes=path.stat().st_size)
+            for path in sorted(folder.rglob("*"))
+            if path.is_file() and not path.name.endswith(".part")
+        ]
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def delete_prefix(self, prefix: str) -> None:
+        folder = self._path(prefix.rstrip("/"))
+        if folder.is_dir() and folder != self.root_path.resolve():
             shutil.rmtree(folder)
 
 
@@ -50,7 +201,11 @@ class UnsupportedBackupStorageError(ValueError):
     pass
 
 
-def get_backup_storage(driver: str, root_path: Path) -> LocalBackupStorage:
+def get_backup_storage(driver: str, root_path: Path) -> BackupStorage:
     if driver == "local":
         return LocalBackupStorage(root_path=root_path)
+    if driver == "s3":
+        from app.modules.admin.backup_storage_s3 import s3_storage_from_settings
+
+        return s3_storage_from_settings()
     raise UnsupportedBackupStorageError(f"Unbekannter Backup-Storage-Treiber: {driver}")
@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import io
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import BinaryIO
+from urllib.parse import quote
+from xml.etree import ElementTree
+
+import httpx
+
+from app.core.config import settings
+from app.modules.admin.backup_storage import ObjectWriter, StoredObject
+
+# S3-kompatibel (AWS, MinIO, Ceph ...): Pfad-URLs, Signatur nach AWS Signature Version 4
+_SERVICE = "s3"
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+class S3StorageError(RuntimeError):
+    pass
+
+
+def _local_name(tag: str) -> str:
+    # Namespace ignorieren ({http://s3.amazonaws.com/doc/2006-03-01/}Key -> Key)
+    return tag.rsplit("}", 1)[-1]
+
+
+def _find_text(element: ElementTree.Element, name: str) -> str | None:
+    for child in element:
+        if _local_name(child.tag) == name:
+            return child.text
+    return None
+
+
+def _quote(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+@dataclass(frozen=True)
+class S3Signer:
+    access_key_id: str
+    secret_access_key: str
+    region: str
+
+    def sign(self, request: httpx.Request, payload_sha256: str) -> None:
+        """
+        Setzt x-amz-date, x-amz-content-sha256 und Authorization (SigV4) auf dem Request.
+        """
+        now = datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        day = now.strftime("%Y%m%d")
+        request.headers["x-amz-date"] = amz_date
+        request.headers["x-amz-content-sha256"] = payload_sha256
+        headers = {
+            "host": request.headers["host"],
+            "x-amz-content-sha256": payload_sha256,
+            "x-amz-date": amz_date,
+        }
+        if "range" in request.headers:
+            headers["range"] = request.headers["range"]
+        signed_headers = ";".join(sorted(headers))
+        params = httpx.QueryParams(request.url.query.decode("ascii"))
+        query = sorted((_quote(key), _quote(value)) for key, value in params.multi_items())
+        canonical_request = "\n".join(
+            [
+                request.method,
+                quote(request.url.path, safe="/-_.~"),
+                "&".join(f"{key}={value}" for key, value in query),
+                "".join(f"{name}:{headers[name].strip()}\n" for name in sorted(headers)),
+                signed_headers,
+                payload_sha256,
+            ]
+        )
+        scope = f"{day}/{self.region}/{_SERVICE}/aws4_request"
+        string_to_sign = "\n".join(
+            [
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+            ]
+        )
+        key = _hmac(f"AWS4{self.secret_access_key}".encode("utf-8"), day)
+        for part in (self.region, _SERVICE, "aws4_request"):
+            key = _hmac(key, part)
+        signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+        request.headers["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key_id}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+
+
+class _ResponseReader(io.RawIOBase):
+    """
+    Dateiartige Sicht auf einen gestreamten Response-Body (für gzip/JSON-Leser).
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self._chunks = response.iter_bytes()
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+@dataclass
+class _MultipartWriter:
+    """
+    Puffert bis zur Teilgröße und lädt dann je einen Teil hoch; der Multipart-Upload wird erst
+    beim ersten vollen Teil angelegt. Kleine Objekte gehen beim Schließen als einfaches PUT raus.
+    """
+
+    storage: S3BackupStorage
+    key: str
+    part_size: int
+
+    def __post_init__(self) -> None:
+        self._buffer = bytearray()
+        self._upload_id: str | None = None
+        self._parts: list[tuple[int, str]] = []
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[: self.part_size])
+            del self._buffer[: self.part_size]
+            self._upload_part(part)
+        return len(data)
+
+    def _upload_part(self, part: bytes) -> None:
+        if self._upload_id is None:
+            response = self.storage._request("POST", self.key, params={"uploads": ""})
+            self._upload_id = _find_text(ElementTree.fromstring(response.content), "UploadId")
+            if not self._upload_id:
+                raise S3StorageError(f"Multipart-Upload ohne UploadId: {self.key}")
+        number = len(self._parts) + 1
+        response = self.storage._request(
+            "PUT",
+            self.key,
+            params={"partNumber": str(number), "uploadId": self._upload_id},
+            content=part,
+        )
+        self._parts.append((number, response.headers.get("etag", "")))
+
+    def close(self) -> None:
+        if self._upload_id is None:
+            self.storage._request("PUT", self.key, content=bytes(self._buffer))
+            return
+        if self._buffer:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        body = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>" for number, etag in self._parts
+        )
+        response = self.storage._request(
+            "POST",
+            self.key,
+            params={"uploadId": self._upload_id},
+            content=f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>".encode("utf-8"),
+        )
+        # S3 meldet Fehler beim Zusammensetzen teils mit Status 200 und <Error>-Body
+        if b"<Error>" in response.content:
+            raise S3StorageError(f"CompleteMultipartUpload fehlgeschlagen: {self.key}")
+
+    def abort(self) -> None:
+        self._buffer.clear()
+        if self._upload_id is not None:
+            self.storage._request("DELETE", self.key, params={"uploadId": self._upload_id}, missing_ok=True)
+            self._upload_id = None
+
+
+@dataclass(frozen=True)
+class S3BackupStorage:
+    """
+    Backup-Storage in einem S3-kompatiblen Bucket. Schreiben per Multipart-Upload (konstanter
+    Speicher je offenem Objekt: eine Teilgröße), Lesen gestreamt und optional per Range.
+    """
+
+    client: httpx.Client
+    bucket: str
+    signer: S3Signer
+    prefix: str = ""
+    part_size: int = 8 * 1024 * 1024
+
+    def _object_path(self, key: str) -> str:
+        return f"/{self.bucket}/{self.prefix}{key}"
+
+    def _build(
+        self,
+        method: str,
+        key: str | None,
+        *,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+    ) -> httpx.Request:
+        path = self._object_path(key) if key is not None else f"/{self.bucket}"
+        request = self.client.build_request(
+            method,
+            quote(path, safe="/-_.~"),
+            params=params,
+            headers=headers,
+            content=content,
+        )
+        self.signer.sign(request, hashlib.sha256(content).hexdigest() if content else _EMPTY_SHA256)
+        return request
+
+    def _request(
+        self,
+        method: str,
+        key: str | None,
+        *,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes = b"",
+        missing_ok: bool = False,
+    ) -> httpx.Response:
+        response = self.client.send(self._build(method, key, params=params, headers=headers, content=content))
+        if response.status_code == 404:
+            if missing_ok:
+                return response
+            raise FileNotFoundError(key)
+        if response.status_code >= 300:
+            raise S3StorageError(f"S3 {method} {key}: HTTP {response.status_code} {response.text[:200]}")
+        return response
+
+    def open_write(self, key: str) -> ObjectWriter:
+        return _MultipartWriter(storage=self, key=key, part_size=self.part_size)
+
+    def open_read(self, key: str, *, start: int | None = None, end: int | None = None) -> BinaryIO:
+        headers = {}
+        if start is not None or end is not None:
+            headers["range"] = f"bytes={start or 0}-{'' if end is None else end}"
+        response = self.client.send(self._build("GET", key, headers=headers), stream=True)
+        if response.status_code >= 300:
+            response.read()
+            response.close()
+            if response.status_code == 404:
+                raise FileNotFoundError(key)
+            raise S3StorageError(f"S3 GET {key}: HTTP {response.status_code}")
+        return io.BufferedReader(_ResponseReader(response))
+
+    def size(self, key: str) -> int:
+        response = self._request("HEAD", key)
+        return int(response.headers.get("content-length", 0))
+
+    def exists(self, key: str) -> bool:
+        return self._request("HEAD", key, missing_ok=True).status_code != 404
+
+    def list(self, prefix: str) -> list[StoredObject]:
+        objects: list[StoredObject] = []
+        params = {"list-type": "2", "prefix": f"{self.prefix}{prefix}"}
+        while True:
+            root = ElementTree.fromstring(self._request("GET", None, params=params).content)
+            for element in root:
+                if _local_name(element.tag) != "Contents":
+                    continue
+                key = (_find_text(element, "Key") or "").removeprefix(self.prefix)
+                objects.append(StoredObject(key=key, size_bytes=int(_find_text(element, "Size") or 0)))
+            token = _find_text(root, "NextContinuationToken")
+            if (_find_text(root, "IsTruncated") or "").lower() != "true" or not token:
+                break
+            params = {**params, "continuation-token": token}
+        return sorted(objects, key=lambda item: item.key)
+
+    def delete(self, key: str) -> None:
+        self._request("DELETE", key, missing_ok=True)
+
+    def delete_prefix(self, prefix: str) -> None:
+        for item in self.list(prefix):
+            self.delete(item.key)
+
+
+@lru_cache
+def _http_client(endpoint_url: str, timeout_seconds: float) -> httpx.Client:
+    # Ein Client pro Prozess: Verbindungen zum Endpoint werden wiederverwendet
+    return httpx.Client(base_url=endpoint_url, timeout=timeout_seconds)
+
+
+def s3_storage_from_settings() -> S3BackupStorage:
+    if not settings.BACKUP_S3_ENDPOINT_URL or not settings.BACKUP_S3_BUCKET:
+        raise S3StorageError("BACKUP_S3_ENDPOINT_URL und BACKUP_S3_BUCKET müssen gesetzt sein")
+    prefix = settings.BACKUP_S3_PREFIX.strip("/")
+    return S3BackupStorage(
+        client=_http_client(settings.BACKUP_S3_ENDPOINT_URL, settings.BACKUP_S3_TIMEOUT_SECONDS),
+        bucket=settings.BACKUP_S3_BUCKET,
+        signer=S3Signer(
+            access_key_id=settings.BACKUP_S3_ACCESS_KEY_ID or "",
+            secret_access_key=settings.BACKUP_S3_SECRET_ACCESS_KEY or "",
+            region=settings.BACKUP_S3_REGION,
+        ),
+        prefix=f"{prefix}/" if prefix else "",
+        part_size=settings.BACKUP_S3_PART_SIZE_MB * 1024 * 1024,
+    )
@@ -1,32 +1,72 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict
 from datetime import date, datetime, timedelta, timezone
 import hashlib
 import json
-import shutil
 import uuid
 from pathlib import Path
 import time
+from typing import Iterator, Literal
 import logging
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import select, tuple_
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.schema import Table
 
 from app.core.config import settings
-from app.core.db import get_db, get_sessionmaker
+from app.core.db import get_db, get_read_db, get_sessionmaker
 from app.models.audit_log import AdminAuditLog
+from app.models.backup import BackupJob, BackupRecord
 from app.models.base import Base
 from app.models.tenant import Tenant
 from app.modules.admin.audit import write_audit_log
-from app.modules.admin.backup_storage import BackupStorage, get_backup_storage, UnsupportedBackupStorageError
+from app.modules.admin import backup_index
+from app.modules.admin.backup_format import (
+    BACKUP_FORMAT,
+    NdjsonGzipWriter,
+    file_checksum,
+    is_streaming_format,
+    keys_filename,
+    table_filename,
+)
+from app.modules.admin.backup_restore import (
+    ChainLink,
+    ForeignKeyChecker,
+    RestoreCheckpoint,
+    iter_chain_rows,
+    row_converter,
+    take,
+    upsert_batch_size,
+    validate_row,
+)
+from app.modules.admin.backup_storage import (
+    BackupStorage,
+    backup_key,
+    get_backup_storage,
+    iter_object,
+    read_bytes,
+    restore_state_key,
+    UnsupportedBackupStorageError,
+    write_bytes,
+)
 from app.modules.admin.schemas import AuditOut
-from app.observability.metrics import backup_jobs_total, backup_job_duration_seconds, backup_job_retries_total
+from app.modules.inventory.rollup import rebuild_consumption_rollup
+from app.observability.metrics import (
+    backup_job_duration_seconds,
+    backup_job_retries_total,
+    backup_jobs_total,
+    backup_restore_rows_total,
+    backup_tenant_duration_seconds,
+    backup_tenant_last_duration_seconds,
+    backup_tenant_rows_per_second,
+    backup_tenant_rows_total,
+)
 
 
 logger = logging.getLogger("app.backups")
@@ -46,11 +86,16 @@ class BackupEntry(BaseModel):
     created_at: str
     status: str
     restored_at: str | None = None
+    # full | incremental (nur Änderungen seit parent_id; Restore spielt die Kette ab)
+    kind: str = "full"
+    parent_id: str | None = None
+    snapshot_at: str | None = None
     files: list[BackupFileInfo] = []
 
 
 class BackupListResponse(BaseModel):
     items: list[BackupEntry]
+    total: int = 0
 
 
 class BackupActionResponse(BaseModel):
@@ -61,6 +106,7 @@ class BackupActionResponse(BaseModel):
 class BackupJobEntry(BaseModel):
     id: str
     status: str
+    kind: str = "full"
     created_at: str
     trigger: str | None = None
     scheduled_at: str | None = None
@@ -68,7 +114,9 @@ class BackupJobEntry(BaseModel):
     finished_at: str | None = None
     total: int = 0
     processed: int = 0
+    failed: int = 0
     backup_ids: list[str] = []
+    failed_tenants: list[str] = []
     error: str | None = None
 
 
@@ -77,7 +125,27 @@ class BackupJobResponse(BaseModel):
     message: str
 
 
-_jobs_lock = asyncio.Lock()
+class BackupRestoreStatus(BaseModel):
+    backup_id: str
+    chain: list[str]
+    status: str
+    completed_tables: list[str] = []
+    table: str | None = None
+    table_rows: int = 0
+    rows_written: int = 0
+    started_at: str
+    updated_at: str
+    finished_at: str | None = None
+    error: str | None = None
+
+
+# Zeilen pro Cursor-Fetch bzw. pro komprimiert geschriebenem Block beim Tabellen-Export
+BACKUP_EXPORT_CHUNK_SIZE = 1000
+# Inkrementell: Sicherheitsabstand auf den Snapshot des Vorgängers (Uhrenabweichung, laufende Transaktionen)
+INCREMENTAL_OVERLAP = timedelta(minutes=5)
+# Index/Jobs älterer Versionen (nur noch für die einmalige Übernahme in die Datenbank)
+LEGACY_INDEX_KEY = "index.json"
+LEGACY_JOBS_KEY = "jobs.json"
 
 router = APIRouter(prefix="/backups", tags=["admin-backups"])
 
@@ -96,28 +164,17 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _backup_root() -> Path:
-    return _storage().root()
-
-
-def _index_path() -> Path:
-    return _storage().index_path()
-
-
-def _jobs_path() -> Path:
-    return _storage().jobs_path()
-
-
-def _ensure_storage() -> None:
-    _storage().ensure_root()
-
+def _read_json(storage: BackupStorage, key: str) -> dict:
+    return json.loads(read_bytes(storage, key))
 
-def _read_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
 
-
-def _write_json(path: Path, payload: dict) -> None:
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+def _write_json(storage: BackupStorage, key: str, payload: dict) -> dict[str, str | int]:
+    """
+    Schreibt ein JSON-Objekt und liefert dessen Manifest-Eintrag (checksum, size_bytes).
+    """
+    data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    write_bytes(storage, key, data)
+    return {"checksum": hashlib.sha256(data).hexdigest(), "size_bytes": len(data)}
 
 
 def _json_bytes(payload: dict) -> bytes:
@@ -165,15 +222,36 @@ def _ensure_models_imported() -> None:
     import app.models.user  # noqa: F401
 
 
+# Abgeleitete Tabellen werden nicht gesichert, sondern nach dem Restore neu aufgebaut
+_DERIVED_TABLES = {"inventory_consumption_monthly"}
+# Betriebsdaten (Job-Queue) gehören nicht zu den Tenant-Daten
+_OPERATIONAL_TABLES = {"background_jobs", "backups", "email_outbox"}
+# Tabellen ohne Updates: neue Zeilen sind über den serverseitigen Einfügezeitpunkt erkennbar
+# (nicht created_at: das kann der Client rückdatieren und fiele sonst aus jedem Delta heraus)
+_APPEND_ONLY_TABLES = {"inventory_movements": "recorded_at"}
+
+
 def _tenant_tables() -> list[Table]:
     _ensure_models_imported()
     tables = []
     for table in Base.metadata.sorted_tables:
-        if "tenant_id" in table.c:
+        if "tenant_id" in table.c and table.name not in _DERIVED_TABLES | _OPERATIONAL_TABLES:
             tables.append(table)
     return tables
 
 
+def _change_column(table: Table):
+    """
+    Spalte, über die inkrementelle Backups geänderte Zeilen finden; None = immer vollständig sichern.
+    """
+    if "updated_at" in table.c:
+        return table.c.updated_at
+    insert_column = _APPEND_ONLY_TABLES.get(table.name)
+    if insert_column is not None and insert_column in table.c:
+        return table.c[insert_column]
+    return None
+
+
 def _serialize_value(value: object) -> object:
     if isinstance(value, (datetime, date)):
         return value.isoformat()
@@ -186,128 +264,109 @@ def _serialize_row(row: dict) -> dict:
     return {key: _serialize_value(value) for key, value in row.items()}
 
 
-def _load_index(prune: bool = False) -> list[dict]:
-    if not _index_path().exists():
-        return []
-    items = _read_json(_index_path()).get("items", [])
-    if not prune:
-        return items
-    pruned_items = _apply_retention(items)
-    if pruned_items != items:
-        _write_json(_index_path(), {"items": pruned_items})
-    return pruned_items
-
-
-def _save_index(items: list[dict]) -> None:
-    _ensure_storage()
-    pruned_items = _apply_retention(items)
-    _write_json(_index_path(), {"items": pruned_items})
-
-
-def _load_jobs() -> list[dict]:
-    if not _jobs_path().exists():
-        return []
-    return _read_json(_jobs_path()).get("items", [])
-
-
-def _save_jobs(items: list[dict]) -> None:
-    _ensure_storage()
-    _write_json(_jobs_path(), {"items": items})
+def _stored_files(backup_id: str) -> list[dict]:
+    """
+    Dateiliste eines Backups aus dem Storage (ein LIST-Aufruf); nur für Altbestand ohne `files`.
+    """
+    return [{"name": item.name, "size_bytes": item.size_bytes} for item in _storage().list(f"{backup_id}/")]
 
 
-def _backup_dir(backup_id: str) -> Path:
-    return _storage().backup_dir(backup_id)
+def _manifest_files(manifest: dict[str, dict]) -> list[dict]:
+    return [{"name": name, "size_bytes": int(info["size_bytes"])} for name, info in sorted(manifest.items())]
 
 
-def _collect_files(backup_id: str) -> list[BackupFileInfo]:
-    folder = _backup_dir(backup_id)
-    files: list[BackupFileInfo] = []
-    if not folder.exists():
-        return files
-    for path in sorted(folder.glob("*.json")):
-        size_bytes = path.stat().st_size
-        files.append(
-            BackupFileInfo(
-                name=path.name,
-                size_bytes=size_bytes,
-                size_label=_format_size(size_bytes),
-            )
+def _collect_files(record: BackupRecord) -> list[BackupFileInfo]:
+    return [
+        BackupFileInfo(
+            name=item["name"],
+            size_bytes=item["size_bytes"],
+            size_label=_format_size(item["size_bytes"]),
         )
-    return files
+        for item in record.files or []
+    ]
 
 
-def _parse_created_at(value: str | None) -> datetime | None:
-    if not value:
-        return None
-    try:
-        parsed = datetime.fromisoformat(value)
-    except ValueError:
-        return None
-    if parsed.tzinfo is None:
-        return parsed.replace(tzinfo=timezone.utc)
-    return parsed
+async def _fill_missing_files(db: AsyncSession, records: list[BackupRecord]) -> None:
+    """
+    Ergänzt die Dateiliste von Backups aus der Zeit vor `backups.files` einmalig aus dem Storage.
+    """
+    missing = [record for record in records if record.files is None]
+    for record in missing:
+        record.files = await asyncio.to_thread(_stored_files, str(record.id))
+    if missing:
+        await db.commit()
 
 
 def _delete_backup_files(backup_id: str) -> None:
-    _storage().delete_backup(backup_id)
+    storage = _storage()
+    storage.delete_prefix(f"{backup_id}/")
+    storage.delete(restore_state_key(backup_id))
 
 
-def _apply_retention(items: list[dict]) -> list[dict]:
+async def _apply_retention() -> int:
+    """
+    Entfernt Backups außerhalb von BACKUP_RETENTION_MAX_DAYS/-MAX_COUNT (Index-Zeilen, dann Dateien).
+    """
     max_days = settings.BACKUP_RETENTION_MAX_DAYS
     max_count = settings.BACKUP_RETENTION_MAX_COUNT
     if not max_days and not max_count:
-        return items
-
-    now = datetime.now(timezone.utc)
-    remaining = items
-    removed: list[dict] = []
-
-    if max_days is not None:
-        cutoff = now - timedelta(days=max_days)
-        next_remaining: list[dict] = []
-        for item in remaining:
-            created_at = _parse_created_at(item.get("created_at"))
-            if created_at and created_at < cutoff:
-                removed.append(item)
-            else:
-                next_remaining.append(item)
-        remaining = next_remaining
-
-    if max_count is not None and len(remaining) > max_count:
-        earliest = datetime.min.replace(tzinfo=timezone.utc)
-        sorted_items = sorted(
-            remaining,
-            key=lambda item: _parse_created_at(item.get("created_at")) or earliest,
-            reverse=True,
-        )
-        keep = sorted_items[:max_count]
-        keep_ids = {item.get("id") for item in keep}
-        removed.extend([item for item in remaining if item.get("id") not in keep_ids])
-        remaining = keep
-
-    for item in removed:
-        backup_id = item.get("id")
-        if backup_id:
-            _delete_backup_files(backup_id)
-
-    return remaining
-
-
-def _build_entry(payload: dict) -> BackupEntry:
-    entry = BackupEntry(**payload)
-    entry.files = _collect_files(entry.id)
-    return entry
+        return 0
+    async with get_sessionmaker()() as db:
+        removed = await backup_index.expired_backup_ids(db, max_days=max_days, max_count=max_count)
+        if not removed:
+            return 0
+        await db.execute(delete(BackupRecord).where(BackupRecord.id.in_(removed)))
+        await db.commit()
+    for backup_id in removed:
+        await asyncio.to_thread(_delete_backup_files, str(backup_id))
+    return len(removed)
+
+
+def _iso(value: datetime | None) -> str | None:
+    value = backup_index.aware(value)
+    return value.isoformat() if value else None
+
+
+def _build_entry(record: BackupRecord) -> BackupEntry:
+    return BackupEntry(
+        id=str(record.id),
+        scope=record.scope,
+        tenant_id=str(record.tenant_id) if record.tenant_id else None,
+        tenant_slug=record.tenant_slug,
+        created_at=_iso(record.created_at),
+        status=record.status,
+        restored_at=_iso(record.restored_at),
+        kind=record.kind,
+        parent_id=str(record.parent_id) if record.parent_id else None,
+        snapshot_at=_iso(record.snapshot_at),
+        files=_collect_files(record),
+    )
 
 
-def _build_job(payload: dict) -> BackupJobEntry:
-    return BackupJobEntry(**payload)
+def _build_job(job: BackupJob, backup_ids: list[str] | None = None) -> BackupJobEntry:
+    return BackupJobEntry(
+        id=str(job.id),
+        status=job.status,
+        kind=job.kind,
+        created_at=_iso(job.created_at),
+        trigger=job.trigger,
+        scheduled_at=_iso(job.scheduled_at),
+        started_at=_iso(job.started_at),
+        finished_at=_iso(job.finished_at),
+        total=job.total,
+        processed=job.processed,
+        failed=job.failed,
+        backup_ids=backup_ids or [],
+        failed_tenants=list(job.failed_tenants or []),
+        error=job.error,
+    )
 
 
-def _write_backup_files(backup_id: str, files: dict[str, dict]) -> None:
-    folder = _backup_dir(backup_id)
-    folder.mkdir(parents=True, exist_ok=True)
-    for name, content in files.items():
-        _write_json(folder / name, content)
+async def _get_backup_or_404(db: AsyncSession, backup_id: str) -> BackupRecord:
+    record = await backup_index.get_backup(db, backup_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail="Backup nicht gefunden")
+    return record
 
 
 def _checksum_info(payload: dict) -> dict[str, str | int]:
@@ -318,21 +377,25 @@ def _checksum_info(payload: dict) -> dict[str, str | int]:
     }
 
 
-def _build_file_manifest(files: dict[str, dict]) -> dict[str, dict]:
-    manifest: dict[str, dict] = {}
-    for name, content in files.items():
-        manifest[name] = _checksum_info(content)
-    return manifest
+def _backup_meta(backup_id: str) -> dict:
+    try:
+        return _read_json(_storage(), backup_key(backup_id, "meta.json"))
+    except FileNotFoundError:
+        raise HTTPException(status_code=400, detail="Meta-Datei fehlt im Backup") from None
 
 
-def _verify_backup_manifest(backup_id: str, manifest: dict[str, dict]) -> None:
-    folder = _backup_dir(backup_id)
+def _verify_backup_manifest(backup_id: str, manifest: dict[str, dict], *, streaming: bool = True) -> None:
+    """
+    Prüft Größe und SHA-256 aller Dateien. Format v2: über die Dateibytes (blockweise gelesen),
+    Format v1: über das normalisierte JSON-Dokument.
+    """
+    storage = _storage()
     for name, meta in manifest.items():
-        file_path = folder / name
-        if not file_path.exists():
-            raise HTTPException(status_code=400, detail=f"Backup-Datei fehlt: {name}")
-        payload = _read_json(file_path)
-        info = _checksum_info(payload)
+        key = backup_key(backup_id, name)
+        try:
+            info = file_checksum(storage.open_read(key)) if streaming else _checksum_info(_read_json(storage, key))
+        except FileNotFoundError:
+            raise HTTPException(status_code=400, detail=f"Backup-Datei fehlt: {name}") from None
         expected_checksum = meta.get("checksum")
         expected_size = meta.get("size_bytes")
         if expected_checksum != info["checksum"] or expected_size != info["size_bytes"]:
@@ -342,223 +405,82 @@ def _verify_backup_manifest(backup_id: str, manifest: dict[str, dict]) -> None:
             )
 
 
-def _table_filename(table: Table) -> str:
-    return f"{table.name}.json"
-
-
-def _table_by_name() -> dict[str, Table]:
-    return {table.name: table for table in _tenant_tables()}
-
-
-def _build_reference_sets(table_rows: dict[str, list[dict]]) -> dict[tuple[str, str], set]:
-    reference_sets: dict[tuple[str, str], set] = {}
-    for table_name, rows in table_rows.items():
-        if not rows:
-            continue
-        for row in rows:
-            for col_name, value in row.items():
-                reference_sets.setdefault((table_name, col_name), set()).add(value)
-    return reference_sets
-
-
-def _validate_row_level(
-    tenant_id: uuid.UUID,
-    table_rows: dict[str, list[dict]],
-    tables: dict[str, Table],
-) -> None:
-    tenant_id_str = str(tenant_id)
-    for table_name, rows in table_rows.items():
-        table = tables.get(table_name)
-        if not table:
-            continue
-        pk_columns = [col.name for col in table.primary_key.columns]
-        for idx, row in enumerate(rows):
-            if "tenant_id" in row and row["tenant_id"] not in {tenant_id_str, tenant_id}:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Tenant-ID stimmt nicht überein: {table_name} Zeile {idx + 1}",
-                )
-            for pk in pk_columns:
-                if row.get(pk) is None:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Primärschlüssel fehlt in {table_name} Zeile {idx + 1}",
-                    )
-
-
-def _validate_foreign_keys_simple(
-    table_rows: dict[str, list[dict]],
-    tables: dict[str, Table],
-) -> None:
-    reference_sets = _build_reference_sets(table_rows)
-    for table_name, rows in table_rows.items():
-        table = tables.get(table_name)
-        if not table or not rows:
-            continue
-        for fk in table.foreign_keys:
-            if len(fk.constraint.columns) != 1:
-                continue
-            ref_table = fk.column.table.name
-            ref_column = fk.column.name
-            if ref_table not in table_rows:
-                continue
-            local_column = fk.parent.name
-            allowed = reference_sets.get((ref_table, ref_column), set())
-            for idx, row in enumerate(rows):
-                value = row.get(local_column)
-                if value is None:
-                    continue
-                if value not in allowed:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=(
-                            "Referenzielle Integrität verletzt: "
-                            f"{table_name}.{local_column} -> {ref_table}.{ref_column} "
-                            f"(Zeile {idx + 1})"
-                        ),
-                    )
+def _table_filename(table: Table, *, streaming: bool = True) -> str:
+    return table_filename(table.name, streaming=streaming)
 
 
-def _validate_foreign_keys_composite(
-    table_rows: dict[str, list[dict]],
-    tables: dict[str, Table],
-) -> None:
-    for table_name, rows in table_rows.items():
-        table = tables.get(table_name)
-        if not table or not rows:
-            continue
-        for constraint in table.foreign_key_constraints:
-            if len(constraint.columns) <= 1:
-                continue
-            ref_table = next(iter(constraint.elements)).column.table
-            if ref_table.name not in table_rows:
-                continue
-            local_columns = [element.parent.name for element in constraint.elements]
-            ref_columns = [element.column.name for element in constraint.elements]
-            ref_rows = table_rows.get(ref_table.name, [])
-            if not ref_rows:
-                continue
-            ref_set = {
-                tuple(ref_row.get(ref_col) for ref_col in ref_columns)
-                for ref_row in ref_rows
-                if all(ref_row.get(ref_col) is not None for ref_col in ref_columns)
-            }
-            for idx, row in enumerate(rows):
-                local_tuple = tuple(row.get(col) for col in local_columns)
-                if any(value is None for value in local_tuple):
-                    continue
-                if local_tuple not in ref_set:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=(
-                            "Referenzielle Integrität verletzt (Composite FK): "
-                            f"{table_name} -> {ref_table.name} (Zeile {idx + 1})"
-                        ),
-                    )
+def _keys_filename(table: Table) -> str:
+    return keys_filename(table.name)
 
 
-async def _validate_foreign_keys_db(
-    db: AsyncSession,
-    tenant_id: uuid.UUID,
-    table_rows: dict[str, list[dict]],
-    tables: dict[str, Table],
-) -> None:
-    for table_name, rows in table_rows.items():
-        table = tables.get(table_name)
-        if not table or not rows:
-            continue
-        for constraint in table.foreign_key_constraints:
-            ref_table = next(iter(constraint.elements)).column.table
-            if ref_table.name in table_rows:
-                continue
-            local_columns = [element.parent.name for element in constraint.elements]
-            ref_columns = [element.column.name for element in constraint.elements]
-            values = {
-                tuple(row.get(col) for col in local_columns)
-                for row in rows
-                if all(row.get(col) is not None for col in local_columns)
-            }
-            if not values:
-                continue
-            query = select(tuple_(*[ref_table.c[col] for col in ref_columns])).distinct()
-            if "tenant_id" in ref_table.c:
-                query = query.where(ref_table.c.tenant_id == tenant_id)
-            if len(ref_columns) == 1:
-                query = query.where(ref_table.c[ref_columns[0]].in_([value[0] for value in values]))
-            else:
-                query = query.where(tuple_(*[ref_table.c[col] for col in ref_columns]).in_(values))
-            result = await db.execute(query)
-            found = set(result.scalars().all()) if len(ref_columns) == 1 else set(result.all())
-            if len(ref_columns) == 1:
-                missing = {value[0] for value in values} - found
-            else:
-                missing = values - found
-            if missing:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Referenzielle Integrität verletzt (Live-DB): {table_name} -> {ref_table.name}",
-                )
-
-
-def _load_table_rows(backup_id: str) -> dict[str, list[dict]]:
-    rows_by_table: dict[str, list[dict]] = {}
-    for table in _tenant_tables():
-        table_file = _backup_dir(backup_id) / _table_filename(table)
-        if not table_file.exists():
-            raise HTTPException(status_code=400, detail=f"Backup-Datei fehlt: {table_file.name}")
-        payload = _read_json(table_file)
-        rows_by_table[table.name] = payload.get("rows", [])
-    return rows_by_table
+async def _incremental_parent(db: AsyncSession, tenant_id: uuid.UUID) -> BackupRecord | None:
+    """
+    Letztes Backup des Tenants, auf das ein inkrementelles Backup aufsetzen darf; None = Voll-Backup fällig.
+    """
+    latest = await backup_index.latest_tenant_backup(db, tenant_id)
+    if latest is None or latest.snapshot_at is None:
+        # keins vorhanden bzw. Backup aus der Zeit vor den Ketten
+        return None
+    restored_at = await backup_index.last_tenant_restore(db, tenant_id)
+    if restored_at is not None and restored_at >= backup_index.aware(latest.snapshot_at):
+        # Restore schreibt die Änderungs-Zeitstempel aus dem Backup zurück: zurückgerollte Zeilen
+        # wären für ein Delta unsichtbar, die Kette würde den Stand vor dem Restore liefern
+        return None
+    try:
+        chain = await backup_index.backup_chain(db, latest)
+    except HTTPException:
+        return None
+    if len(chain) - 1 >= settings.BACKUP_INCREMENTAL_MAX_CHAIN:
+        return None
+    base_created = backup_index.aware(chain[0].created_at)
+    if base_created < datetime.now(timezone.utc) - timedelta(days=settings.BACKUP_FULL_INTERVAL_DAYS):
+        return None
+    return latest
 
 
-async def _validate_backup_integrity(
-    db: AsyncSession,
-    tenant_id: uuid.UUID,
-    table_rows: dict[str, list[dict]],
-) -> None:
-    tables = _table_by_name()
-    _validate_row_level(tenant_id, table_rows, tables)
-    _validate_foreign_keys_simple(table_rows, tables)
-    _validate_foreign_keys_composite(table_rows, tables)
-    await _validate_foreign_keys_db(db, tenant_id, table_rows, tables)
+async def _stream_to_object(db: AsyncSession, stmt, storage: BackupStorage, key: str) -> dict:
+    writer = NdjsonGzipWriter(storage.open_write(key), compresslevel=settings.BACKUP_COMPRESSION_LEVEL)
+    try:
+        result = await db.stream(stmt.execution_options(yield_per=BACKUP_EXPORT_CHUNK_SIZE))
+        async for partition in result.mappings().partitions(BACKUP_EXPORT_CHUNK_SIZE):
+            rows = [_serialize_row(dict(row)) for row in partition]
+            await asyncio.to_thread(writer.write_rows, rows)
+        return await asyncio.to_thread(writer.close)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        raise
 
 
 async def _export_tenant_tables(
     db: AsyncSession,
     tenant_id: uuid.UUID,
-) -> tuple[dict[str, dict], dict[str, int]]:
-    files: dict[str, dict] = {}
+    backup_id: str,
+    *,
+    since: datetime | None = None,
+) -> tuple[dict[str, dict], dict[str, int], dict[str, int]]:
+    """
+    Schreibt jede Tenant-Tabelle per serverseitigem Cursor als NDJSON-gzip unter `<backup_id>/`.
+    Mit `since` (inkrementell) nur Zeilen, deren Änderungsspalte >= since ist, plus eine
+    Schlüsseldatei mit allen aktuellen Primärschlüsseln. Liefert Manifest-Einträge (Prüfsumme
+    während des Schreibens berechnet), Zeilenzahlen und Schlüsselzahlen (nur Delta-Tabellen).
+    """
+    manifest: dict[str, dict] = {}
     counts: dict[str, int] = {}
+    key_counts: dict[str, int] = {}
+    storage = _storage()
     for table in _tenant_tables():
         stmt = select(table).where(table.c.tenant_id == tenant_id)
-        result = await db.execute(stmt)
-        rows = [_serialize_row(dict(row)) for row in result.mappings().all()]
-        files[_table_filename(table)] = {"table": table.name, "rows": rows}
-        counts[table.name] = len(rows)
-    return files, counts
-
-
-def _coerce_row_types(table: Table, row: dict) -> dict:
-    coerced = {}
-    for column in table.c:
-        value = row.get(column.name)
-        if value is None:
-            coerced[column.name] = None
-            continue
-        python_type = None
-        try:
-            python_type = column.type.python_type
-        except NotImplementedError:
-            python_type = None
-        if python_type is uuid.UUID and isinstance(value, str):
-            coerced[column.name] = uuid.UUID(value)
-        elif python_type is datetime and isinstance(value, str):
-            coerced[column.name] = datetime.fromisoformat(value)
-        elif python_type is date and isinstance(value, str):
-            coerced[column.name] = date.fromisoformat(value)
-        else:
-            coerced[column.name] = value
-    return coerced
+        change_column = _change_column(table) if since is not None else None
+        if change_column is not None:
+            stmt = stmt.where(change_column >= since)
+            keys_stmt = select(*table.primary_key.columns).where(table.c.tenant_id == tenant_id)
+            keys_info = await _stream_to_object(db, keys_stmt, storage, backup_key(backup_id, _keys_filename(table)))
+            manifest[_keys_filename(table)] = keys_info
+            key_counts[table.name] = int(keys_info["rows"])
+        info = await _stream_to_object(db, stmt, storage, backup_key(backup_id, _table_filename(table)))
+        manifest[_table_filename(table)] = info
+        counts[table.name] = int(info["rows"])
+    return manifest, counts, key_counts
 
 
 def _upsert_stmt(table: Table, rows: list[dict], dialect_name: str):
@@ -576,40 +498,147 @@ def _upsert_stmt(table: Table, rows: list[dict], dialect_name: str):
     return stmt.on_conflict_do_update(index_elements=pk_cols, set_=update_cols)
 
 
+async def _next_batch(rows: Iterator[dict], size: int) -> list[dict]:
+    # Dekomprimieren/Parsen blockiert: im Thread, damit der Event-Loop frei bleibt
+    return await asyncio.to_thread(take, rows, size)
+
+
 async def _restore_tenant_tables(
     db: AsyncSession,
-    backup_id: str,
     tenant_id: uuid.UUID,
-    table_rows: dict[str, list[dict]] | None = None,
+    links: list[ChainLink],
+    checkpoint: RestoreCheckpoint,
+    storage: BackupStorage,
     expected_counts: dict[str, int] | None = None,
 ) -> None:
+    """
+    Stellt die Tenant-Tabellen in Abhängigkeitsreihenfolge wieder her: Zeilen werden aus den
+    Backup-Dateien gestreamt, je Batch geprüft (Zeile, FKs), konvertiert, per Upsert geschrieben
+    und committet. Nach jedem Batch wird der Checkpoint gespeichert; bereits übernommene
+    Tabellen/Zeilen aus einem früheren Lauf werden übersprungen (Upserts sind idempotent).
+    """
     dialect_name = db.get_bind().dialect.name
-    rows_by_table = table_rows or _load_table_rows(backup_id)
+    tenant_id_str = str(tenant_id)
     for table in _tenant_tables():
-        rows = rows_by_table.get(table.name, [])
-        if expected_counts is not None:
-            expected = expected_counts.get(table.name)
-            if expected is not None and expected != len(rows):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Backup-Daten inkonsistent für {table.name}: {len(rows)} != {expected}",
-                )
-        if not rows:
+        if table.name in checkpoint.completed_tables:
             continue
-        coerced_rows = [_coerce_row_types(table, row) for row in rows]
-        for row in coerced_rows:
-            row["tenant_id"] = tenant_id
-        stmt = _upsert_stmt(table, coerced_rows, dialect_name)
-        await db.execute(stmt)
+        skip = checkpoint.table_rows if checkpoint.table == table.name else 0
+        checkpoint.table = table.name
+        checkpoint.table_rows = skip
+        convert = row_converter(table, tenant_id)
+        fk_checker = ForeignKeyChecker(table, tenant_id)
+        batch_size = upsert_batch_size(table, settings.BACKUP_RESTORE_BATCH_SIZE)
+        rows = iter_chain_rows(links, table)
+        seen = 0
+        while raw_rows := await _next_batch(rows, batch_size):
+            first_line = seen + 1
+            seen += len(raw_rows)
+            if seen <= skip:
+                continue
+            if first_line <= skip:
+                raw_rows = raw_rows[skip - first_line + 1 :]
+                first_line = skip + 1
+            for offset, row in enumerate(raw_rows):
+                validate_row(table, row, tenant_id_str, first_line + offset)
+            batch = [convert(row) for row in raw_rows]
+            await fk_checker.check(db, batch, first_line)
+            await db.execute(_upsert_stmt(table, batch, dialect_name))
+            await db.commit()
+            backup_restore_rows_total.labels(table.name).inc(len(batch))
+            checkpoint.table_rows = seen
+            checkpoint.rows_written += len(batch)
+            await asyncio.to_thread(checkpoint.save, storage)
+        expected = (expected_counts or {}).get(table.name)
+        if expected is not None and expected != seen:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Backup-Daten inkonsistent für {table.name}: {seen} != {expected}",
+            )
+        logger.info("restore table done backup=%s table=%s rows=%s", checkpoint.backup_id, table.name, seen)
+        checkpoint.completed_tables.append(table.name)
+        checkpoint.table = None
+        checkpoint.table_rows = 0
+        await asyncio.to_thread(checkpoint.save, storage)
+
+
+class _ChunkSink:
+    """
+    Nicht-seekbares Ziel für ZipFile: sammelt geschriebene Bytes, bis der Generator sie abholt.
+    ZipFile schreibt dann Data-Descriptoren statt nachträglich Header zu patchen.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._offset = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
 
+    def tell(self) -> int:
+        return self._offset
 
-def _write_backup_zip(backup_id: str) -> Path:
-    folder = _backup_dir(backup_id)
-    zip_path = folder / f"{backup_id}.zip"
-    with ZipFile(zip_path, "w") as zip_file:
-        for path in folder.glob("*.json"):
-            zip_file.write(path, arcname=path.name)
-    return zip_path
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_backup_zip(backup_id: str, created_at: datetime) -> Iterator[bytes]:
+    """
+    Erzeugt das ZIP eines Backups beim Senden: Objekte werden blockweise aus dem Storage gelesen
+    und direkt weitergereicht, nichts wird lokal zwischengespeichert. Bereits komprimierte
+    Tabellendateien werden nur gespeichert, nicht erneut komprimiert.
+    """
+    storage = _storage()
+    sink = _ChunkSink()
+    with ZipFile(sink, "w") as zip_file:
+        for item in storage.list(f"{backup_id}/"):
+            if item.name.endswith(".zip"):
+                # ZIP-Cache älterer Versionen
+                continue
+            info = ZipInfo(item.name, date_time=created_at.timetuple()[:6])
+            info.compress_type = ZIP_STORED if item.name.endswith(".gz") else ZIP_DEFLATED
+            # Größe vorab setzen: ZipFile entscheidet daran über ZIP64
+            info.file_size = item.size_bytes
+            with zip_file.open(info, "w") as target:
+                for chunk in iter_object(storage, item.key):
+                    target.write(chunk)
+                    if data := sink.drain():
+                        yield data
+            if data := sink.drain():
+                yield data
+    if data := sink.drain():
+        yield data
+
+
+def _byte_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Einzelner Bereich aus dem Range-Header (`bytes=a-b`, `bytes=a-`, `bytes=-n`); None = ganze Datei.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header.removeprefix("bytes=").strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Bereich außerhalb der Datei",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, end
 
 
 async def _get_tenant_or_404(db: AsyncSession, tenant_id: str) -> Tenant:
@@ -623,188 +652,305 @@ async def _create_tenant_backup(
     db: AsyncSession,
     tenant: Tenant,
     actor: str,
+    *,
+    kind: str = "full",
 ) -> BackupEntry:
-    backup_id = str(uuid.uuid4())
-    created_at = _now_iso()
-    payload = {
-        "id": backup_id,
-        "scope": "tenant",
-        "tenant_id": str(tenant.id),
-        "tenant_slug": tenant.slug,
-        "created_at": created_at,
-        "status": "ok",
-        "restored_at": None,
-        "files": [],
-    }
+    record, _rows = await _backup_tenant(db, tenant, actor, kind=kind)
+    return _build_entry(record)
+
+
+async def _backup_tenant(
+    db: AsyncSession,
+    tenant: Tenant,
+    actor: str,
+    *,
+    kind: str = "full",
+    job_id: uuid.UUID | None = None,
+) -> tuple[BackupRecord, int]:
+    """
+    Sichert einen Tenant und liefert den Index-Eintrag sowie die Anzahl gesicherter Zeilen.
+    `kind="incremental"` setzt auf das letzte Backup auf; ohne geeigneten Vorgänger
+    (keine Kette, Kette zu lang/alt) entsteht ein Voll-Backup. Index-Eintrag, Audit-Log und
+    Job-Fortschritt landen in derselben Transaktion (Commit durch den Aufrufer).
+    """
+    record_id = uuid.uuid4()
+    backup_id = str(record_id)
+    created_at = datetime.now(timezone.utc)
+    # Snapshot vor dem Export: Änderungen während des Exports landen spätestens im nächsten Backup
+    snapshot_at = created_at
+    parent = await _incremental_parent(db, tenant.id) if kind == "incremental" else None
+    since = backup_index.aware(parent.snapshot_at) - INCREMENTAL_OVERLAP if parent else None
+    record = BackupRecord(
+        id=record_id,
+        scope="tenant",
+        tenant_id=tenant.id,
+        tenant_slug=tenant.slug,
+        status="ok",
+        kind="incremental" if parent else "full",
+        parent_id=parent.id if parent else None,
+        job_id=job_id,
+        created_at=created_at,
+        snapshot_at=snapshot_at,
+    )
     tenant_payload = {"id": str(tenant.id), "slug": tenant.slug, "name": tenant.name}
-    table_files, table_counts = await _export_tenant_tables(db, tenant.id)
-    files = {"tenant.json": tenant_payload, **table_files}
-    files["meta.json"] = {
-        "backup_id": backup_id,
-        "created_at": created_at,
-        "scope": "tenant",
-        "tables": list(table_counts.keys()),
-        "table_counts": table_counts,
-        "files": _build_file_manifest(files),
-        "checksum": _checksum_payload(tenant_payload),
-    }
-    _write_backup_files(backup_id, files)
-    items = [payload, *_load_index(prune=True)]
-    _save_index(items)
+    storage = _storage()
+    try:
+        tenant_key = backup_key(backup_id, "tenant.json")
+        tenant_info = await asyncio.to_thread(_write_json, storage, tenant_key, tenant_payload)
+        table_manifest, table_counts, key_counts = await _export_tenant_tables(db, tenant.id, backup_id, since=since)
+        manifest = {"tenant.json": tenant_info, **table_manifest}
+        meta_info = await asyncio.to_thread(
+            _write_json,
+            storage,
+            backup_key(backup_id, "meta.json"),
+            {
+                "backup_id": backup_id,
+                "created_at": created_at.isoformat(),
+                "scope": "tenant",
+                "format": BACKUP_FORMAT,
+                "kind": record.kind,
+                "parent_id": str(record.parent_id) if record.parent_id else None,
+                "since": since.isoformat() if since else None,
+                "snapshot_at": snapshot_at.isoformat(),
+                "tables": list(table_counts.keys()),
+                "table_counts": table_counts,
+                "incremental_tables": list(key_counts.keys()),
+                "key_counts": key_counts,
+                "files": manifest,
+                "checksum": _checksum_payload(tenant_payload),
+            },
+        )
+    except BaseException:
+        # Keine halben Backups liegen lassen (Retry legt ein neues an)
+        await asyncio.to_thread(_delete_backup_files, backup_id)
+        raise
+    record.files = _manifest_files({"meta.json": meta_info, **manifest})
+    db.add(record)
+    if job_id is not None:
+        await backup_index.increment_job(db, job_id, processed=1)
     await write_audit_log(
         db=db,
         actor=actor,
         action="backup.create",
         entity_type="backup",
         entity_id=backup_id,
-        payload={"scope": "tenant", "tenant_id": str(tenant.id), "tenant_slug": tenant.slug},
+        payload={
+            "scope": "tenant",
+            "tenant_id": str(tenant.id),
+            "tenant_slug": tenant.slug,
+            "kind": record.kind,
+            "parent_id": str(record.parent_id) if record.parent_id else None,
+        },
     )
-    return _build_entry(payload)
+    return record, sum(table_counts.values())
+
 
+async def _update_job(job_id: uuid.UUID, **values: object) -> None:
+    async with get_sessionmaker()() as db:
+        await backup_index.update_job(db, job_id, **values)
+        await db.commit()
 
-async def _update_job(job_id: str, **updates: object) -> BackupJobEntry:
-    async with _jobs_lock:
-        jobs = _load_jobs()
-        for job in jobs:
-            if job.get("id") == job_id:
-                job.update(updates)
-                _save_jobs(jobs)
-                return _build_job(job)
-    raise HTTPException(status_code=404, detail="Backup-Job nicht gefunden")
 
+async def _backup_tenant_with_retries(
+    tenant_id: uuid.UUID,
+    tenant_slug: str,
+    actor: str,
+    job_id: uuid.UUID,
+    kind: str = "full",
+) -> None:
+    """
+    Ein Tenant mit eigenen Retries; jeder Versuch läuft in einer eigenen Session, ein Fehler
+    betrifft nur diesen Tenant. Der Job-Zähler steigt im Commit des Backups.
+    """
+    sessionmaker = get_sessionmaker()
+    attempt = 0
+    while True:
+        started = time.perf_counter()
+        try:
+            async with sessionmaker() as db:
+                tenant = await db.get(Tenant, tenant_id)
+                if tenant is None:
+                    # zwischenzeitlich gelöscht: nichts zu sichern
+                    return
+                _record, rows = await _backup_tenant(db, tenant, actor, kind=kind, job_id=job_id)
+                await db.commit()
+        except Exception as exc:
+            attempt += 1
+            backup_job_retries_total.labels("failed").inc()
+            backup_tenant_duration_seconds.labels("failed").observe(time.perf_counter() - started)
+            if attempt > settings.BACKUP_JOB_MAX_RETRIES:
+                logger.warning("backup job failed for tenant %s after retries", tenant_slug)
+                async with sessionmaker() as db:
+                    await backup_index.record_job_failure(db, job_id, tenant_slug, str(exc))
+                    await db.commit()
+                try:
+                    await _send_backup_alert(
+                        "backup.job.tenant_failed",
+                        {"job_id": str(job_id), "tenant_slug": tenant_slug, "error": str(exc)},
+                    )
+                except Exception:
+                    logger.exception("backup alert webhook failed for tenant %s", tenant_slug)
+                return
+            await asyncio.sleep(settings.BACKUP_JOB_RETRY_DELAY_SECONDS)
+            continue
+        duration = time.perf_counter() - started
+        backup_tenant_duration_seconds.labels("ok").observe(duration)
+        backup_tenant_rows_total.inc(rows)
+        backup_tenant_last_duration_seconds.labels(tenant_slug).set(duration)
+        backup_tenant_rows_per_second.labels(tenant_slug).set(rows / duration if duration > 0 else 0)
+        return
 
-async def _run_backup_job(job_id: str, actor: str) -> None:
+
+async def _job_heartbeat(job_id: uuid.UUID, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await _update_job(job_id, heartbeat_at=datetime.now(timezone.utc))
+        except Exception:
+            logger.exception("backup job heartbeat failed for job %s", job_id)
+
+
+async def _run_backup_job(job_id: uuid.UUID, actor: str, kind: str = "full") -> None:
+    heartbeat = asyncio.create_task(
+        _job_heartbeat(job_id, max(settings.BACKUP_JOB_HEARTBEAT_TIMEOUT_SECONDS / 3, 1))
+    )
+    try:
+        await _execute_backup_job(job_id, actor, kind)
+    finally:
+        heartbeat.cancel()
+
+
+async def _execute_backup_job(job_id: uuid.UUID, actor: str, kind: str) -> None:
     started = time.perf_counter()
-    failed_tenants: list[str] = []
     try:
-        await _update_job(job_id, status="running", started_at=_now_iso())
-        sessionmaker = get_sessionmaker()
-        async with sessionmaker() as db:
-            tenants = (await db.execute(select(Tenant).order_by(Tenant.slug.asc()))).scalars().all()
-            await _update_job(job_id, total=len(tenants))
-            backup_ids: list[str] = []
-            processed = 0
-            for tenant in tenants:
-                attempt = 0
-                while True:
-                    try:
-                        entry = await _create_tenant_backup(db, tenant, actor)
-                        await db.commit()
-                        backup_ids.append(entry.id)
-                        processed += 1
-                        await _update_job(job_id, processed=processed, backup_ids=backup_ids)
-                        break
-                    except Exception as exc:
-                        await db.rollback()
-                        attempt += 1
-                        backup_job_retries_total.labels("failed").inc()
-                        if attempt > settings.BACKUP_JOB_MAX_RETRIES:
-                            failed_tenants.append(tenant.slug)
-                            logger.warning("backup job failed for tenant %s after retries", tenant.slug)
-                            await _update_job(
-                                job_id,
-                                error=f"Backup fehlgeschlagen für {tenant.slug}: {exc}",
-                            )
-                            try:
-                                await _send_backup_alert(
-                                    "backup.job.tenant_failed",
-                                    {"job_id": job_id, "tenant_slug": tenant.slug, "error": str(exc)},
-                                )
-                            except Exception:
-                                logger.exception("backup alert webhook failed for tenant %s", tenant.slug)
-                            break
-                        await asyncio.sleep(settings.BACKUP_JOB_RETRY_DELAY_SECONDS)
+        async with get_sessionmaker()() as db:
+            tenants = (await db.execute(select(Tenant.id, Tenant.slug).order_by(Tenant.slug.asc()))).all()
+        now = datetime.now(timezone.utc)
+        await _update_job(job_id, status="running", started_at=now, heartbeat_at=now, total=len(tenants))
+
+        queue: asyncio.Queue[tuple[uuid.UUID, str]] = asyncio.Queue()
+        for tenant_id, tenant_slug in tenants:
+            queue.put_nowait((tenant_id, tenant_slug))
+
+        async def worker() -> None:
+            while True:
+                try:
+                    tenant_id, tenant_slug = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await _backup_tenant_with_retries(tenant_id, tenant_slug, actor, job_id, kind)
+
+        # Begrenzte Parallelität: höchstens BACKUP_JOB_CONCURRENCY Tenants (und DB-Sessions) gleichzeitig
+        concurrency = max(1, min(settings.BACKUP_JOB_CONCURRENCY, len(tenants)))
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        async with get_sessionmaker()() as db:
+            job = await backup_index.get_job(db, job_id)
+        failed_tenants = list(job.failed_tenants or []) if job is not None else []
         status = "completed" if not failed_tenants else "completed_with_errors"
-        await _update_job(job_id, status=status, finished_at=_now_iso())
+        await _update_job(job_id, status=status, finished_at=datetime.now(timezone.utc))
+        await _apply_retention()
         backup_jobs_total.labels(status).inc()
         backup_job_duration_seconds.labels(status).observe(time.perf_counter() - started)
         if failed_tenants:
             try:
                 await _send_backup_alert(
                     "backup.job.completed_with_errors",
-                    {"job_id": job_id, "failed_tenants": failed_tenants},
+                    {"job_id": str(job_id), "failed_tenants": failed_tenants},
                 )
             except Exception:
                 logger.exception("backup alert webhook failed for job %s", job_id)
     except Exception as exc:
-        await _update_job(job_id, status="failed", finished_at=_now_iso(), error=str(exc))
+        await _update_job(job_id, status="failed", finished_at=datetime.now(timezone.utc), error=str(exc))
         backup_jobs_total.labels("failed").inc()
         backup_job_duration_seconds.labels("failed").observe(time.perf_counter() - started)
         try:
-            await _send_backup_alert("backup.job.failed", {"job_id": job_id, "error": str(exc)})
+            await _send_backup_alert("backup.job.failed", {"job_id": str(job_id), "error": str(exc)})
         except Exception:
             logger.exception("backup alert webhook failed for job %s", job_id)
 
 
-async def _enqueue_all_tenants_job(actor: str) -> BackupJobEntry:
-    job_payload = {
-        "id": str(uuid.uuid4()),
-        "status": "queued",
-        "created_at": _now_iso(),
-        "trigger": "manual",
-        "scheduled_at": None,
-        "started_at": None,
-        "finished_at": None,
-        "total": 0,
-        "processed": 0,
-        "backup_ids": [],
-        "error": None,
-    }
-    async with _jobs_lock:
-        jobs = [job_payload, *_load_jobs()]
-        _save_jobs(jobs)
-    asyncio.create_task(_run_backup_job(job_payload["id"], actor))
-    return _build_job(job_payload)
-
-
-def _has_active_jobs(jobs: list[dict]) -> bool:
-    return any(job.get("status") in {"queued", "running"} for job in jobs)
+async def _enqueue_all_tenants_job(actor: str, kind: str = "full") -> BackupJobEntry:
+    async with get_sessionmaker()() as db:
+        job = await backup_index.create_job(db, kind=kind, trigger="manual")
+        await db.commit()
+    asyncio.create_task(_run_backup_job(job.id, actor, kind))
+    return _build_job(job)
 
 
 async def enqueue_scheduled_job(actor: str) -> BackupJobEntry | None:
-    async with _jobs_lock:
-        jobs = _load_jobs()
-        if _has_active_jobs(jobs):
+    """
+    Legt den geplanten Job an, sofern keiner wartet oder läuft. Über Prozesse hinweg
+    serialisiert der Scheduler-Lock (Advisory Lock) Prüfung und Anlage.
+    """
+    kind = settings.BACKUP_SCHEDULE_KIND
+    async with get_sessionmaker()() as db:
+        # Jobs abgestürzter Prozesse dürfen den Scheduler nicht dauerhaft blockieren
+        if await _fail_stale_jobs(db):
+            await db.commit()
+        if await backup_index.has_active_jobs(db):
             return None
-        job_payload = {
-            "id": str(uuid.uuid4()),
-            "status": "queued",
-            "created_at": _now_iso(),
-            "trigger": "scheduler",
-            "scheduled_at": _now_iso(),
-            "started_at": None,
-            "finished_at": None,
-            "total": 0,
-            "processed": 0,
-            "backup_ids": [],
-            "error": None,
-        }
-        jobs = [job_payload, *jobs]
-        _save_jobs(jobs)
-    asyncio.create_task(_run_backup_job(job_payload["id"], actor))
-    return _build_job(job_payload)
+        job = await backup_index.create_job(db, kind=kind, trigger="scheduler", scheduled_at=datetime.now(timezone.utc))
+        await db.commit()
+    asyncio.create_task(_run_backup_job(job.id, actor, kind))
+    return _build_job(job)
+
+
+async def _fail_stale_jobs(db: AsyncSession) -> int:
+    stale = await backup_index.fail_stale_jobs(db, settings.BACKUP_JOB_HEARTBEAT_TIMEOUT_SECONDS)
+    if stale:
+        backup_jobs_total.labels("failed").inc(stale)
+        logger.warning("marked %s stale backup jobs as failed", stale)
+    return stale
+
+
+async def fail_stale_backup_jobs() -> int:
+    """
+    Beim Start: Jobs, die ein abgestürzter oder neu ausgerollter Prozess hinterlassen hat, beenden.
+    """
+    async with get_sessionmaker()() as db:
+        stale = await _fail_stale_jobs(db)
+        await db.commit()
+    return stale
+
+
+async def import_legacy_backup_index() -> None:
+    """
+    Übernimmt index.json/jobs.json älterer Versionen beim Start in die Datenbank.
+    """
+    storage = _storage()
+    if not await asyncio.to_thread(
+        lambda: storage.exists(LEGACY_INDEX_KEY) or storage.exists(LEGACY_JOBS_KEY)
+    ):
+        return
+    async with get_sessionmaker()() as db:
+        imported = await backup_index.import_legacy_index(db, storage, LEGACY_INDEX_KEY, LEGACY_JOBS_KEY)
+    logger.info("imported %s legacy backup index entries", imported)
 
 
 @router.get("", response_model=BackupListResponse)
 async def admin_list_backups(
     tenant_id: str | None = Query(default=None),
     scope: str | None = Query(default=None),
+    kind: Literal["full", "incremental"] | None = Query(default=None),
+    limit: int = Query(default=100, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
 ) -> BackupListResponse:
-    _ensure_storage()
     if scope and scope not in {"tenant", "all"}:
         raise HTTPException(status_code=400, detail="Ungültiger scope")
-    raw_items = _load_index(prune=True)
-    if tenant_id:
-        raw_items = [item for item in raw_items if item.get("tenant_id") == tenant_id]
-    if scope:
-        raw_items = [item for item in raw_items if item.get("scope") == scope]
-    items = [_build_entry(item) for item in raw_items]
-    return BackupListResponse(items=items)
+    await _apply_retention()
+    records, total = await backup_index.list_backups(
+        db, tenant_id=tenant_id, scope=scope, kind=kind, limit=limit, offset=offset
+    )
+    await _fill_missing_files(db, records)
+    items = [_build_entry(record) for record in records]
+    return BackupListResponse(items=items, total=total)
 
 
 @router.get("/history", response_model=list[AuditOut])
 async def admin_backup_history(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     action: str | None = Query(default=None),
     created_from: datetime | None = Query(default=None),
     created_to: datetime | None = Query(default=None),
@@ -839,117 +985,171 @@ async def admin_backup_history(
 
 
 @router.get("/jobs", response_model=list[BackupJobEntry])
-async def admin_list_backup_jobs() -> list[BackupJobEntry]:
-    jobs = _load_jobs()
-    return [_build_job(job) for job in jobs]
+async def admin_list_backup_jobs(
+    status: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> list[BackupJobEntry]:
+    jobs = await backup_index.list_jobs(db, status=status, limit=limit, offset=offset)
+    backup_ids = await backup_index.job_backup_ids(db, [job.id for job in jobs])
+    return [_build_job(job, backup_ids.get(job.id)) for job in jobs]
 
 
 @router.get("/jobs/{job_id}", response_model=BackupJobEntry)
-async def admin_get_backup_job(job_id: str) -> BackupJobEntry:
-    jobs = _load_jobs()
-    match = next((job for job in jobs if job.get("id") == job_id), None)
-    if not match:
+async def admin_get_backup_job(job_id: str, db: AsyncSession = Depends(get_db)) -> BackupJobEntry:
+    job = await backup_index.get_job(db, job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Backup-Job nicht gefunden")
-    return _build_job(match)
+    backup_ids = await backup_index.job_backup_ids(db, [job.id])
+    return _build_job(job, backup_ids.get(job.id))
 
 
 @router.get("/{backup_id}", response_model=BackupEntry)
-async def admin_get_backup(backup_id: str) -> BackupEntry:
-    items = _load_index(prune=True)
-    match = next((item for item in items if item["id"] == backup_id), None)
-    if not match:
-        raise HTTPException(status_code=404, detail="Backup nicht gefunden")
-    return _build_entry(match)
+async def admin_get_backup(backup_id: str, db: AsyncSession = Depends(get_db)) -> BackupEntry:
+    record = await _get_backup_or_404(db, backup_id)
+    await _fill_missing_files(db, [record])
+    return _build_entry(record)
 
 
 @router.get("/{backup_id}/download")
-async def admin_download_backup(backup_id: str) -> FileResponse:
-    items = _load_index(prune=True)
-    match = next((item for item in items if item["id"] == backup_id), None)
-    if not match:
-        raise HTTPException(status_code=404, detail="Backup nicht gefunden")
-    zip_path = _write_backup_zip(backup_id)
-    return FileResponse(
-        zip_path,
+async def admin_download_backup(backup_id: str, db: AsyncSession = Depends(get_db)) -> StreamingResponse:
+    record = await _get_backup_or_404(db, backup_id)
+    backup_id = str(record.id)
+    return StreamingResponse(
+        _iter_backup_zip(backup_id, backup_index.aware(record.created_at)),
         media_type="application/zip",
-        filename=f"{backup_id}.zip",
+        headers={"Content-Disposition": f'attachment; filename="{backup_id}.zip"'},
     )
 
 
 @router.get("/{backup_id}/files/{filename}")
-async def admin_download_backup_file(backup_id: str, filename: str) -> FileResponse:
-    items = _load_index(prune=True)
-    match = next((item for item in items if item["id"] == backup_id), None)
-    if not match:
-        raise HTTPException(status_code=404, detail="Backup nicht gefunden")
-    folder = _backup_dir(backup_id)
-    file_path = (folder / filename).resolve()
-    if not file_path.exists() or file_path.parent != folder.resolve():
-        raise HTTPException(status_code=404, detail="Datei nicht gefunden")
-    return FileResponse(
-        file_path,
-        media_type="application/json",
-        filename=filename,
+async def admin_download_backup_file(
+    backup_id: str,
+    filename: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Einzelne Backup-Datei, direkt aus dem Storage gestreamt; unterstützt `Range` (206) zum Fortsetzen.
+    """
+    record = await _get_backup_or_404(db, backup_id)
+    storage = _storage()
+    key = backup_key(str(record.id), filename)
+    try:
+        size = await asyncio.to_thread(storage.size, key)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Datei nicht gefunden") from None
+    byte_range = _byte_range(request.headers.get("range"), size)
+    start, end = byte_range or (0, size - 1)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Content-Length": str(end - start + 1),
+    }
+    if byte_range is not None:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        iter_object(storage, key, start=start if byte_range else None, end=end if byte_range else None),
+        status_code=206 if byte_range else 200,
+        media_type="application/gzip" if filename.endswith(".gz") else "application/json",
+        headers=headers,
     )
 
+
 @router.post("/tenants/{tenant_id}", response_model=BackupActionResponse)
 async def admin_create_tenant_backup(
     tenant_id: str,
     request: Request,
+    kind: Literal["full", "incremental"] = Query(default="full"),
     db: AsyncSession = Depends(get_db),
 ) -> BackupActionResponse:
     tenant = await _get_tenant_or_404(db, tenant_id)
     actor = request.headers.get("x-admin-actor") or "system"
-    entry = await _create_tenant_backup(db, tenant, actor)
+    entry = await _create_tenant_backup(db, tenant, actor, kind=kind)
     await db.commit()
+    await _apply_retention()
     return BackupActionResponse(backup=entry, message="Tenant-Backup erstellt")
 
 
 @router.post("/all", response_model=BackupJobResponse)
 async def admin_create_all_tenants_backup(
     request: Request,
+    kind: Literal["full", "incremental"] = Query(default="full"),
 ) -> BackupJobResponse:
     actor = request.headers.get("x-admin-actor") or "system"
-    job = await _enqueue_all_tenants_job(actor)
+    job = await _enqueue_all_tenants_job(actor, kind)
     return BackupJobResponse(job=job, message="Backup-Job für alle Tenants gestartet")
 
 
+@router.get("/{backup_id}/restore", response_model=BackupRestoreStatus)
+async def admin_get_restore_status(backup_id: str) -> BackupRestoreStatus:
+    checkpoint = await asyncio.to_thread(RestoreCheckpoint.load, _storage(), backup_id)
+    if checkpoint is None:
+        raise HTTPException(status_code=404, detail="Kein Restore für dieses Backup")
+    return BackupRestoreStatus(**asdict(checkpoint))
+
+
 @router.post("/{backup_id}/restore", response_model=BackupActionResponse)
 async def admin_restore_backup(
     backup_id: str,
     request: Request,
+    resume: bool = Query(default=False, description="Abgebrochenen Restore ab dem letzten Checkpoint fortsetzen"),
     db: AsyncSession = Depends(get_db),
 ) -> BackupActionResponse:
-    items = _load_index(prune=True)
-    match = next((item for item in items if item["id"] == backup_id), None)
-    if not match:
-        raise HTTPException(status_code=404, detail="Backup nicht gefunden")
-    if match.get("scope") != "tenant":
+    record = await _get_backup_or_404(db, backup_id)
+    backup_id = str(record.id)
+    if record.scope != "tenant":
         raise HTTPException(status_code=400, detail="Restore unterstützt nur Tenant-Backups")
-    if not match.get("tenant_id"):
+    if record.tenant_id is None:
         raise HTTPException(status_code=400, detail="Tenant-ID fehlt im Backup")
-    await _get_tenant_or_404(db, match["tenant_id"])
-    meta_path = _backup_dir(backup_id) / "meta.json"
-    if not meta_path.exists():
-        raise HTTPException(status_code=400, detail="Meta-Datei fehlt im Backup")
-    meta = _read_json(meta_path)
-    expected_counts = meta.get("table_counts", {})
-    manifest = meta.get("files")
-    if isinstance(manifest, dict):
-        _verify_backup_manifest(backup_id, manifest)
-    else:
-        raise HTTPException(status_code=400, detail="Checksum-Metadaten fehlen im Backup")
-    table_rows = _load_table_rows(backup_id)
-    await _validate_backup_integrity(db, uuid.UUID(match["tenant_id"]), table_rows)
-    await _restore_tenant_tables(
-        db=db,
-        backup_id=backup_id,
-        tenant_id=uuid.UUID(match["tenant_id"]),
-        table_rows=table_rows,
-        expected_counts=expected_counts if isinstance(expected_counts, dict) else None,
-    )
-    match["restored_at"] = _now_iso()
-    _save_index(items)
+    tenant_id = record.tenant_id
+    await _get_tenant_or_404(db, tenant_id)
+    storage = _storage()
+    links = []
+    for link in await backup_index.backup_chain(db, record):
+        link_id = str(link.id)
+        link_meta = await asyncio.to_thread(_backup_meta, link_id)
+        manifest = link_meta.get("files")
+        if not isinstance(manifest, dict):
+            raise HTTPException(status_code=400, detail="Checksum-Metadaten fehlen im Backup")
+        await asyncio.to_thread(
+            _verify_backup_manifest, link_id, manifest, streaming=is_streaming_format(link_meta)
+        )
+        links.append(ChainLink(backup_id=link_id, storage=storage, meta=link_meta))
+    meta = links[-1].meta
+    # Nach dem Abspielen der Kette: Delta-Tabellen haben so viele Zeilen wie Schlüssel im letzten Glied
+    expected_counts = {**(meta.get("table_counts") or {}), **(meta.get("key_counts") or {})}
+    chain_ids = [link.backup_id for link in links]
+    checkpoint = await asyncio.to_thread(RestoreCheckpoint.load, storage, backup_id) if resume else None
+    if checkpoint is None or not checkpoint.resumable_for(chain_ids):
+        checkpoint = RestoreCheckpoint(backup_id=backup_id, chain=chain_ids)
+    checkpoint.status = "running"
+    checkpoint.error = None
+    checkpoint.finished_at = None
+    await asyncio.to_thread(checkpoint.save, storage)
+    try:
+        await _restore_tenant_tables(
+            db=db,
+            tenant_id=tenant_id,
+            links=links,
+            checkpoint=checkpoint,
+            storage=storage,
+            expected_counts=expected_counts,
+        )
+    except Exception as exc:
+        await db.rollback()
+        checkpoint.status = "failed"
+        checkpoint.error = exc.detail if isinstance(exc, HTTPException) else str(exc) or exc.__class__.__name__
+        await asyncio.to_thread(checkpoint.save, storage)
+        logger.warning("restore failed backup=%s table=%s error=%s", backup_id, checkpoint.table, checkpoint.error)
+        raise
+    checkpoint.status = "completed"
+    checkpoint.finished_at = _now_iso()
+    await asyncio.to_thread(checkpoint.save, storage)
+    await rebuild_consumption_rollup(db, tenant_id=tenant_id)
+    record.restored_at = datetime.now(timezone.utc)
+    db.add(record)
     actor = request.headers.get("x-admin-actor") or "system"
     await write_audit_log(
         db=db,
@@ -957,7 +1157,13 @@ async def admin_restore_backup(
         action="backup.restore",
         entity_type="backup",
         entity_id=backup_id,
-        payload={"scope": match.get("scope"), "table_counts": expected_counts},
+        payload={
+            "scope": record.scope,
+            "table_counts": expected_counts,
+            "chain": chain_ids,
+            "rows_written": checkpoint.rows_written,
+        },
     )
     await db.commit()
-    return BackupActionResponse(backup=_build_entry(match), message="Restore angestoßen")
+    await _fill_missing_files(db, [record])
+    return BackupActionResponse(backup=_build_entry(record), message="Restore angestoßen")
@@ -5,7 +5,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
-from app.core.db import get_db
+from app.core.db import get_read_db
 from app.models.membership import Membership
 from app.models.tenant import Tenant
 from app.models.user import User
@@ -14,7 +14,7 @@ router = APIRouter(prefix="/diagnostics", tags=["admin-diagnostics"])
 
 
 @router.get("")
-async def admin_diagnostics(db: AsyncSession = Depends(get_db)) -> dict:
+async def admin_diagnostics(db: AsyncSession = Depends(get_read_db)) -> dict:
     """
     Diagnostik für typische Dateninkonsistenzen.
     Liefert nur Read-Informationen, keine Änderungen.
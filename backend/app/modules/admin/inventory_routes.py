@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+from typing import IO
+
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Path, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy import func, select, delete
@@ -8,7 +11,7 @@ from io import BytesIO, StringIO
 from openpyxl import Workbook, load_workbook
 
 from app.core.deps import get_admin_actor, require_admin_key
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.models.category import Category
 from app.models.item import Item
 from app.models.item_unit import ItemUnit
@@ -18,7 +21,11 @@ from app.models.tenant import Tenant
 from app.models.tenant_setting import TenantSetting
 from app.modules.admin.demo_seed import seed_kunde1_inventory
 from app.modules.admin.schemas import DemoInventorySeedOut
-from app.modules.inventory.routes import _normalize_sku, CSV_COLUMNS
+from app.modules.inventory.pagination import PagingMode, paginate_items
+from app.modules.inventory.search import apply_item_search
+from app.modules.inventory.routes import _normalize_sku, _parse_bool, _validate_order_mode, CSV_COLUMNS
+from app.modules.jobs.schemas import JobOut
+from app.modules.jobs.service import JobRun, enqueue_job, job_handler, job_to_out
 from app.modules.inventory.schemas import (
     CategoryCreate,
     CategoryOut,
@@ -104,7 +111,7 @@ async def admin_import_demo_inventory(db: AsyncSession = Depends(get_db)) -> Dem
 
 
 @router.get("/categories", response_model=list[CategoryOut])
-async def admin_list_categories(db: AsyncSession = Depends(get_db)) -> list[CategoryOut]:
+async def admin_list_categories(db: AsyncSession = Depends(get_read_db)) -> list[CategoryOut]:
     rows = (
         await db.scalars(
             select(Category).where(Category.tenant_id.is_(None)).order_by(Category.is_system.desc(), Category.name.asc())
@@ -190,7 +197,7 @@ async def admin_delete_category(
 
 
 @router.get("/types", response_model=list[GlobalTypeOut])
-async def admin_list_types(db: AsyncSession = Depends(get_db)) -> list[GlobalTypeOut]:
+async def admin_list_types(db: AsyncSession = Depends(get_read_db)) -> list[GlobalTypeOut]:
     rows = (await db.scalars(select(GlobalType).order_by(GlobalType.name.asc()))).all()
     return [_global_type_out(entry) for entry in rows]
 
@@ -311,7 +318,7 @@ async def admin_import_categories(
 @router.get("/categories/export")
 async def admin_export_categories(
     format: str = Query("csv", pattern="^(csv|xlsx)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     import csv
 
@@ -345,7 +352,7 @@ async def admin_export_categories(
 
 
 @router.get("/units", response_model=list[ItemUnitOut])
-async def admin_list_units(db: AsyncSession = Depends(get_db)) -> list[ItemUnitOut]:
+async def admin_list_units(db: AsyncSession = Depends(get_read_db)) -> list[ItemUnitOut]:
     rows = (await db.scalars(select(ItemUnit).order_by(ItemUnit.code.asc()))).all()
     return [ItemUnitOut(code=row.code, label=row.label, is_active=row.is_active) for row in rows]
 
@@ -422,7 +429,7 @@ async def admin_import_units(
 @router.get("/units/export")
 async def admin_export_units(
     format: str = Query("csv", pattern="^(csv|xlsx)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     import csv
 
@@ -463,7 +470,10 @@ async def admin_list_items(
     active: bool | None = Query(default=True),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db),
+    paging: PagingMode = Query(default="offset", description="offset (Default) oder cursor (Keyset auf name, id)"),
+    cursor: str | None = Query(default=None, description="next_cursor der Vorseite, aktiviert den Cursor-Modus"),
+    include_total: bool | None = Query(default=None, description="Gesamtanzahl zählen (Default: nur im Offset-Modus)"),
+    db: AsyncSession = Depends(get_read_db),
 ) -> ItemsPage:
     base = select(Item).where(Item.tenant_id.is_(None))
     if active is not None:
@@ -472,16 +482,18 @@ async def admin_list_items(
         base = base.where(Item.category_id == category_id)
     if type_id:
         base = base.where(Item.type_id == type_id)
-    if q:
-        like = f"%{q}%"
-        base = base.where(
-            (Item.sku.ilike(like)) | (Item.barcode.ilike(like)) | (Item.name.ilike(like))
-        )
+    base, rank = apply_item_search(base, q, dialect_name=db.get_bind().dialect.name)
 
-    total = await db.scalar(select(func.count()).select_from(base.subquery()))
-    rows = (
-        await db.scalars(base.order_by(Item.name.asc()).offset((page - 1) * page_size).limit(page_size))
-    ).all()
+    rows, total, next_cursor = await paginate_items(
+        db,
+        base,
+        page=page,
+        page_size=page_size,
+        paging=paging,
+        cursor=cursor,
+        include_total=include_total,
+        rank=rank,
+    )
     category_ids = {row.category_id for row in rows if row.category_id}
     categories = {}
     if category_ids:
@@ -490,9 +502,10 @@ async def admin_list_items(
 
     return ItemsPage(
         items=[_item_out_admin(row, categories.get(row.category_id)) for row in rows],
-        total=total or 0,
+        total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -621,12 +634,16 @@ async def admin_delete_item(item_id: str, db: AsyncSession = Depends(get_db)) ->
 
 
 def _rows_from_csv_or_excel(file: UploadFile) -> list[dict]:
+    return _rows_from_source(file.filename, file.file)
+
+
+def _rows_from_source(filename: str | None, source: IO[bytes]) -> list[dict]:
     import csv
 
-    filename = (file.filename or "").lower()
+    filename = (filename or "").lower()
     if filename.endswith((".xlsx", ".xls")):
         try:
-            wb = load_workbook(BytesIO(file.file.read()))
+            wb = load_workbook(BytesIO(source.read()))
             ws = wb.active
         except Exception as exc:  # noqa: BLE001
             raise HTTPException(status_code=400, detail={"error": {"code": "invalid_excel", "message": str(exc)}})
@@ -643,7 +660,7 @@ def _rows_from_csv_or_excel(file: UploadFile) -> list[dict]:
         return data
 
     # CSV mit Semikolon
-    content = file.file.read()
+    content = source.read()
     try:
         text = content.decode("utf-8-sig")
     except UnicodeDecodeError:
@@ -673,6 +690,33 @@ async def admin_import_items(
     db: AsyncSession = Depends(get_db),
 ):
     rows = _rows_from_csv_or_excel(file)
+    return await _import_global_item_rows(db, rows)
+
+
+@router.post("/items/import/jobs", response_model=JobOut, status_code=202)
+async def admin_enqueue_items_import(
+    file: UploadFile = File(...),
+    actor: str = Depends(get_admin_actor),
+    db: AsyncSession = Depends(get_db),
+) -> JobOut:
+    """
+    Import globaler Artikel als Hintergrundjob; Status per `GET /admin/jobs/{id}`.
+    """
+    job = await enqueue_job(db, kind="admin.items_import", actor=actor, upload=file)
+    return job_to_out(job)
+
+
+@job_handler("admin.items_import")
+async def _run_items_import_job(run: JobRun) -> dict:
+    with await run.open_input() as source:
+        rows = await asyncio.to_thread(_rows_from_source, run.input_filename, source)
+    await run.progress(0, total=len(rows))
+    summary = await _import_global_item_rows(run.db, rows)
+    await run.progress(len(rows), total=len(rows))
+    return summary
+
+
+async def _import_global_item_rows(db: AsyncSession, rows: list[dict]) -> dict:
     _ensure_columns(rows, CSV_COLUMNS)
 
     imported = 0
@@ -772,7 +816,7 @@ async def admin_import_items(
 @router.get("/items/export")
 async def admin_export_items(
     format: str = Query("csv", pattern="^(csv|xlsx)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     import csv
 
@@ -859,7 +903,7 @@ async def admin_export_items(
 @router.get("/industries/overlap-counts", response_model=IndustryOverlapCounts)
 async def admin_get_industry_overlap_counts(
     item_ids: list[str] | None = Query(default=None),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> IndustryOverlapCounts:
     query = select(IndustryArticle.item_id, func.count(IndustryArticle.industry_id)).group_by(IndustryArticle.item_id)
     if item_ids:
@@ -870,7 +914,7 @@ async def admin_get_industry_overlap_counts(
 
 
 @router.get("/industries", response_model=list[IndustryOut])
-async def admin_list_industries(db: AsyncSession = Depends(get_db)) -> list[IndustryOut]:
+async def admin_list_industries(db: AsyncSession = Depends(get_read_db)) -> list[IndustryOut]:
     rows = (await db.scalars(select(Industry).order_by(Industry.name.asc()))).all()
     return [
         IndustryOut(
@@ -943,7 +987,7 @@ async def admin_delete_industry(
 @router.get("/industries/{industry_id}/items", response_model=list[ItemOut])
 async def admin_list_industry_items(
     industry_id: str = Path(...),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[ItemOut]:
     industry = await db.get(Industry, industry_id)
     if industry is None:
@@ -968,7 +1012,7 @@ async def admin_list_industry_items(
 async def admin_export_industry_items(
     industry_id: str,
     format: str = Query("csv", pattern="^(csv|xlsx)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     import csv
 
@@ -1043,11 +1087,53 @@ async def admin_import_industry_items(
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db),
 ) -> IndustryMappingImportResult:
+    industry = await _industry_or_404(db, industry_id)
+    rows = _rows_from_csv_or_excel(file)
+    return await _import_industry_mapping_rows(db, industry, rows)
+
+
+@router.post(
+    "/industries/{industry_id}/items/import/jobs",
+    response_model=JobOut,
+    status_code=202,
+)
+async def admin_enqueue_industry_items_import(
+    industry_id: str,
+    file: UploadFile = File(...),
+    actor: str = Depends(get_admin_actor),
+    db: AsyncSession = Depends(get_db),
+) -> JobOut:
+    industry = await _industry_or_404(db, industry_id)
+    job = await enqueue_job(
+        db,
+        kind="admin.industry_items_import",
+        actor=actor,
+        params={"industry_id": str(industry.id)},
+        upload=file,
+    )
+    return job_to_out(job)
+
+
+@job_handler("admin.industry_items_import")
+async def _run_industry_items_import_job(run: JobRun) -> dict:
+    industry = await _industry_or_404(run.db, run.params["industry_id"])
+    with await run.open_input() as source:
+        rows = await asyncio.to_thread(_rows_from_source, run.input_filename, source)
+    result = await _import_industry_mapping_rows(run.db, industry, rows)
+    await run.progress(len(rows), total=len(rows))
+    return result.model_dump()
+
+
+async def _industry_or_404(db: AsyncSession, industry_id: str) -> Industry:
     industry = await db.get(Industry, industry_id)
     if industry is None:
         raise HTTPException(status_code=404, detail={"error": {"code": "industry_not_found", "message": "Branche nicht gefunden"}})
+    return industry
 
-    rows = _rows_from_csv_or_excel(file)
+
+async def _import_industry_mapping_rows(
+    db: AsyncSession, industry: Industry, rows: list[dict]
+) -> IndustryMappingImportResult:
     _ensure_columns(rows, ("sku",))
 
     normalized_skus = {
@@ -15,6 +15,8 @@ from app.modules.admin.audit import write_audit_log
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 from app.core.security import hash_password
+from app.core.deps_auth import invalidate_principal_cache
+from app.core.tenant import invalidate_tenant_cache
 
 ALLOWED_ROLES = {"tenant_admin", "staff", "readonly"}
 
@@ -99,6 +101,7 @@ async def update_tenant(
     )
 
     await db.commit()
+    invalidate_tenant_cache(slug=tenant.slug, tenant_id=tenant.id)
     await db.refresh(tenant)
     return tenant
 
@@ -146,6 +149,7 @@ async def delete_tenant(db: AsyncSession, *, actor: str, tenant: Tenant) -> None
     )
 
     await db.commit()
+    invalidate_tenant_cache(slug=payload["slug"], tenant_id=tenant.id)
 
 
 
@@ -273,6 +277,8 @@ async def create_tenant_user(
     )
 
     await db.commit()
+    if not created_user:
+        invalidate_principal_cache(user_id=user.id)
     return TenantUserOut(
         membership_id=str(membership.id),
         user_id=str(user.id),
@@ -344,6 +350,8 @@ async def update_tenant_user(
     )
 
     await db.commit()
+    # user_is_active/Passwort wirken tenantübergreifend, daher alle Einträge des Users verwerfen
+    invalidate_principal_cache(user_id=user.id)
 
     return TenantUserOut(
         membership_id=str(membership.id),
@@ -394,6 +402,7 @@ async def delete_tenant_user(
     )
 
     await db.commit()
+    invalidate_principal_cache(user_id=user.id, tenant_id=tenant_id)
 
 
 async def create_membership(
@@ -488,6 +497,7 @@ async def update_membership(
     )
 
     await db.commit()
+    invalidate_principal_cache(user_id=membership.user_id, tenant_id=membership.tenant_id)
     await db.refresh(membership)
     return membership
 
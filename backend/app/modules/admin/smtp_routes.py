@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.db import get_db
 from app.core.email_settings import EmailSettings, load_email_settings, upsert_email_settings
-from app.core.email_utils import send_email
+from app.core.email_utils import send_email_async
 
 router = APIRouter(prefix="/smtp", tags=["admin", "admin-smtp"])
 logger = logging.getLogger(__name__)
@@ -69,7 +69,7 @@ async def test_smtp_settings(payload: SmtpTestRequest, request: Request, db: Asy
     email_settings = await load_email_settings(db)
     request_id = getattr(request.state, "request_id", None)
 
-    ok, error, resolved_ips = send_email(
+    ok, error, resolved_ips = await send_email_async(
         email_settings=email_settings,
         recipient=payload.email,
         subject="SMTP Test",
@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.email_settings import EmailSettings, load_email_settings, upsert_email_settings
-from app.core.email_utils import send_email
+from app.core.email_utils import send_email_async
 from app.core.db import get_db
 
 
@@ -123,7 +123,7 @@ async def admin_system_email_test(
     db: AsyncSession = Depends(get_db),
 ) -> SystemActionResponse:
     email_settings = await load_email_settings(db)
-    ok, error, _resolved = send_email(
+    ok, error, _resolved = await send_email_async(
         email_settings=email_settings,
         recipient=payload.email,
         subject="SMTP Test",
@@ -5,7 +5,7 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.core.deps import get_admin_actor
 from app.models.tenant import Tenant
 from app.modules.admin.schemas import TenantUserCreate, TenantUserOut, TenantUserUpdate
@@ -20,7 +20,7 @@ router = APIRouter(
 @router.get("", response_model=list[TenantUserOut])
 async def admin_list_tenant_users(
     tenant_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     q: str | None = Query(default=None, max_length=200),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
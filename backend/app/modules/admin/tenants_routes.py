@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
 from app.core.deps import get_admin_actor
 from app.models.tenant import Tenant
 from app.modules.admin.schemas import TenantCreate, TenantOut, TenantUpdate
@@ -18,7 +18,7 @@ router = APIRouter(prefix="/tenants", tags=["admin-tenants"])
 
 @router.get("", response_model=list[TenantOut])
 async def admin_list_tenants(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     q: str | None = Query(default=None, max_length=200),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db import get_db
+from app.core.db import get_db, get_read_db
+from app.core.deps_auth import invalidate_principal_cache
 from app.core.security import hash_password
 from app.models.user import User
 from app.modules.admin.schemas import UserCreate, UserOut, UserUpdate
@@ -29,7 +30,7 @@ def _user_payload_safe(user: User) -> dict:
 
 
 @router.get("", response_model=list[UserOut])
-async def admin_list_users(db: AsyncSession = Depends(get_db)) -> list[UserOut]:
+async def admin_list_users(db: AsyncSession = Depends(get_read_db)) -> list[UserOut]:
     result = await db.execute(select(User).order_by(User.email))
     users = list(result.scalars().all())
 
@@ -129,6 +130,7 @@ async def admin_update_user(user_id: uuid.UUID, payload: UserUpdate, db: AsyncSe
     )
 
     await db.commit()
+    invalidate_principal_cache(user_id=user.id)
     await db.refresh(user)
 
     return UserOut(
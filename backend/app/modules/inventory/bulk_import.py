@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category import Category
+from app.models.item import Item
+
+# Zeilen pro INSERT ... ON CONFLICT (bleibt mit ~15 Spalten unter den Parameter-Limits
+# von asyncpg (32767) und SQLite)
+UPSERT_CHUNK_SIZE = 1000
+# SKUs pro IN-Liste beim Vorladen bestehender Artikel
+SKU_LOOKUP_CHUNK_SIZE = 5000
+
+ADMIN_ITEM_READONLY = "Admin-Artikel sind schreibgeschützt"
+
+# Standardwerte für neue Artikel (Spalten, die der Import nicht liefert)
+_ITEM_DEFAULTS: dict[str, Any] = {
+    "barcode": "",
+    "description": "",
+    "category_id": None,
+    "quantity": 0,
+    "min_stock": 0,
+    "max_stock": 0,
+    "target_stock": 0,
+    "recommended_stock": 0,
+    "order_mode": 0,
+    "unit": "pcs",
+    "is_active": True,
+    "is_admin_created": False,
+}
+
+
+def _dialect_insert(dialect_name: str):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert
+
+
+def _chunks(values: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+async def load_category_ids(db: AsyncSession, *, tenant_id: uuid.UUID) -> dict[str, uuid.UUID]:
+    """
+    Alle für den Tenant sichtbaren Kategorien als {lower(name): id} (eine Query).
+    Tenant-Kategorien haben Vorrang vor globalen Kategorien gleichen Namens.
+    """
+    rows = (
+        await db.execute(
+            select(func.lower(Category.name), Category.id, Category.tenant_id).where(
+                or_(Category.tenant_id == tenant_id, Category.tenant_id.is_(None))
+            )
+        )
+    ).all()
+    mapping: dict[str, uuid.UUID] = {}
+    for name, category_id, owner in sorted(rows, key=lambda row: row[2] is not None):
+        mapping[name.strip()] = category_id
+    return mapping
+
+
+async def load_existing_items(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    skus: Iterable[str],
+) -> dict[str, bool]:
+    """
+    Bestehende Artikel zu den SKUs als {sku: is_admin_created}, in IN-Blöcken statt pro Zeile.
+    """
+    unique = list(dict.fromkeys(skus))
+    existing: dict[str, bool] = {}
+    for chunk in _chunks(unique, SKU_LOOKUP_CHUNK_SIZE):
+        rows = await db.execute(
+            select(Item.sku, Item.is_admin_created).where(Item.tenant_id == tenant_id, Item.sku.in_(chunk))
+        )
+        existing.update({sku: bool(is_admin) for sku, is_admin in rows.all()})
+    return existing
+
+
+async def upsert_items(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    rows: Sequence[dict[str, Any]],
+    update_columns: Sequence[str],
+    protect_admin_items: bool = True,
+    chunk_size: int = UPSERT_CHUNK_SIZE,
+) -> None:
+    """
+    Schreibt Artikel blockweise per `INSERT ... ON CONFLICT (tenant_id, sku) DO UPDATE`.
+
+    `rows` enthalten mindestens `sku` und `name`; fehlende Spalten bekommen für neue Artikel die
+    Standardwerte. Bei Konflikten werden nur `update_columns` überschrieben, Admin-Artikel
+    (optional) gar nicht. SKUs müssen innerhalb von `rows` eindeutig sein.
+    """
+    if not rows:
+        return
+
+    dialect_insert = _dialect_insert(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        await _upsert_items_orm(
+            db, tenant_id=tenant_id, rows=rows, update_columns=update_columns, protect_admin_items=protect_admin_items
+        )
+        return
+
+    table = Item.__table__
+    for chunk in _chunks(rows, chunk_size):
+        values = [{**_ITEM_DEFAULTS, **row, "id": uuid.uuid4(), "tenant_id": tenant_id} for row in chunk]
+        stmt = dialect_insert(table).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tenant_id", "sku"],
+            # onupdate greift bei ON CONFLICT nicht: updated_at explizit mitsetzen (inkrementelle Backups)
+            set_={
+                **{column: stmt.excluded[column] for column in update_columns},
+                "updated_at": datetime.now(timezone.utc),
+            },
+            where=table.c.is_admin_created.is_(False) if protect_admin_items else None,
+        )
+        await db.execute(stmt)
+
+
+async def _upsert_items_orm(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    rows: Sequence[dict[str, Any]],
+    update_columns: Sequence[str],
+    protect_admin_items: bool,
+) -> None:
+    # Fallback für Dialekte ohne ON CONFLICT: ein Lookup pro Block statt pro Zeile
+    for chunk in _chunks(rows, SKU_LOOKUP_CHUNK_SIZE):
+        existing = {
+            item.sku: item
+            for item in (
+                await db.scalars(
+                    select(Item).where(Item.tenant_id == tenant_id, Item.sku.in_([row["sku"] for row in chunk]))
+                )
+            ).all()
+        }
+        for row in chunk:
+            item = existing.get(row["sku"])
+            if item is None:
+                db.add(Item(**{**_ITEM_DEFAULTS, **row, "tenant_id": tenant_id}))
+            elif not (protect_admin_items and item.is_admin_created):
+                for column in update_columns:
+                    setattr(item, column, row[column])
+        await db.flush()
+
+
+async def apply_item_rows(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    rows: Sequence[tuple[int, dict[str, Any]]],
+    update_columns: Sequence[str],
+    errors: list[dict[str, str]],
+    protect_admin_items: bool = True,
+) -> tuple[int, int]:
+    """
+    Schreibt bereits validierte Importzeilen `(zeilennummer, werte)` und liefert (neu, aktualisiert).
+
+    Mehrfach vorkommende SKUs: die letzte Zeile gewinnt, frühere landen in `errors`.
+    Bestehende Admin-Artikel werden (optional) als Fehler gemeldet und nicht angefasst.
+    """
+    latest: dict[str, tuple[int, dict[str, Any]]] = {}
+    for row_num, values in rows:
+        previous = latest.get(values["sku"])
+        if previous is not None:
+            errors.append(
+                {"row": str(previous[0]), "error": f"SKU '{values['sku']}' mehrfach vorhanden, Zeile {row_num} wird verwendet"}
+            )
+        latest[values["sku"]] = (row_num, values)
+
+    existing = await load_existing_items(db, tenant_id=tenant_id, skus=latest)
+    to_write: list[dict[str, Any]] = []
+    imported = 0
+    updated = 0
+    for sku, (row_num, values) in latest.items():
+        if sku in existing:
+            if protect_admin_items and existing[sku]:
+                errors.append({"row": str(row_num), "error": ADMIN_ITEM_READONLY})
+                continue
+            updated += 1
+        else:
+            imported += 1
+        to_write.append(values)
+
+    await upsert_items(
+        db,
+        tenant_id=tenant_id,
+        rows=to_write,
+        update_columns=update_columns,
+        protect_admin_items=protect_admin_items,
+    )
+    return imported, updated
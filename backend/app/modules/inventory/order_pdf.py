@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from io import BytesIO
+
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+# Bewusst ohne App-Importe (DB, Settings): die Funktionen laufen auch in Pool-Prozessen
+
+
+@dataclass(frozen=True)
+class OrderPdfLine:
+    name: str
+    quantity: int
+    sku: str
+    barcode: str
+
+
+@dataclass(frozen=True)
+class OrderPdfData:
+    """
+    Serialisierbare Sicht auf eine Bestellung für das PDF-Rendering.
+    """
+
+    number: str
+    status: str
+    note: str | None
+    created_at: str
+    lines: tuple[OrderPdfLine, ...]
+
+
+def _draw_order(pdf: canvas.Canvas, order: OrderPdfData) -> None:
+    width, height = A4
+    y = height - 40
+
+    pdf.setFont("Helvetica-Bold", 14)
+    pdf.drawString(40, y, f"Bestellung {order.number}")
+    y -= 20
+    pdf.setFont("Helvetica", 10)
+    pdf.drawString(40, y, f"Status: {order.status}")
+    y -= 15
+    if order.note:
+        pdf.drawString(40, y, f"Notiz: {order.note}")
+        y -= 15
+    pdf.drawString(40, y, f"Angelegt: {order.created_at}")
+    y -= 25
+
+    pdf.setFont("Helvetica-Bold", 11)
+    pdf.drawString(40, y, "Positionen:")
+    y -= 18
+    pdf.setFont("Helvetica", 10)
+
+    headers = ["Artikel", "Menge", "SKU", "Barcode"]
+    col_x = [40, 250, 320, 420]
+    for idx, header in enumerate(headers):
+        pdf.drawString(col_x[idx], y, header)
+    y -= 12
+    pdf.line(40, y, width - 40, y)
+    y -= 14
+
+    for line in order.lines:
+        if y < 60:
+            pdf.showPage()
+            y = height - 40
+            pdf.setFont("Helvetica", 10)
+        values = [line.name, str(line.quantity), line.sku, line.barcode]
+        for idx, value in enumerate(values):
+            pdf.drawString(col_x[idx], y, value)
+        y -= 14
+
+    pdf.showPage()
+
+
+def render_orders_pdf(orders: list[OrderPdfData]) -> bytes:
+    """
+    Rendert eine oder mehrere Bestellungen in ein PDF (jede Bestellung beginnt auf einer neuen Seite).
+    """
+    buf = BytesIO()
+    pdf = canvas.Canvas(buf, pagesize=A4)
+    for order in orders:
+        _draw_order(pdf, order)
+    pdf.save()
+    return buf.getvalue()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import uuid
+from typing import Literal
+
+from fastapi import HTTPException
+from sqlalchemy import ColumnElement, Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.item import Item
+
+PagingMode = Literal["offset", "cursor"]
+
+
+def encode_item_cursor(item: Item) -> str:
+    """
+    Opaquer Cursor für die Sortierung (name, id).
+    """
+    raw = json.dumps([item.name, str(item.id)], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_item_cursor(cursor: str) -> tuple[str, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name, item_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return str(name), uuid.UUID(str(item_id))
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail={"error": {"code": "invalid_cursor", "message": "Cursor ist ungültig"}},
+        )
+
+
+async def paginate_items(
+    db: AsyncSession,
+    base: Select,
+    *,
+    page: int,
+    page_size: int,
+    paging: PagingMode,
+    cursor: str | None,
+    include_total: bool | None,
+    rank: ColumnElement | None = None,
+) -> tuple[list[Item], int | None, str | None]:
+    """
+    Liefert (rows, total, next_cursor) für eine gefilterte Item-Query.
+
+    - Offset-Modus (Default, Altclients): OFFSET/LIMIT, Gesamtanzahl wird standardmäßig gezählt
+    - Cursor-Modus (`paging=cursor` oder gesetzter `cursor`): Keyset auf (name, id), Zählung nur auf Wunsch
+    - `rank` (Suchrelevanz) sortiert nur im Offset-Modus vor; der Keyset braucht die stabile Ordnung (name, id)
+    """
+    use_cursor = paging == "cursor" or cursor is not None
+    if include_total is None:
+        include_total = not use_cursor
+
+    total: int | None = None
+    if include_total:
+        total = await db.scalar(select(func.count()).select_from(base.order_by(None).subquery())) or 0
+
+    ordered = base.order_by(Item.name.asc(), Item.id.asc())
+    if not use_cursor:
+        if rank is not None:
+            ordered = base.order_by(rank.desc(), Item.name.asc(), Item.id.asc())
+        rows = (await db.scalars(ordered.offset((page - 1) * page_size).limit(page_size))).all()
+        return list(rows), total, None
+
+    if cursor:
+        last_name, last_id = decode_item_cursor(cursor)
+        ordered = ordered.where(
+            or_(
+                Item.name > last_name,
+                and_(Item.name == last_name, Item.id > last_id),
+            )
+        )
+
+    # Eine Zeile mehr laden, um zu wissen, ob es eine Folgeseite gibt
+    rows = list((await db.scalars(ordered.limit(page_size + 1))).all())
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = encode_item_cursor(rows[-1])
+    return rows, total, next_cursor
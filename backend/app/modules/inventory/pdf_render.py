@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import multiprocessing
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.modules.inventory.order_pdf import OrderPdfData, render_orders_pdf
+
+# Abgeschlossene/stornierte Bestellungen ändern sich nicht mehr: PDF darf gecacht werden
+IMMUTABLE_ORDER_STATUSES = frozenset({"COMPLETED", "CANCELED"})
+
+_executor: Executor | None = None
+
+# (tenant_id, order_id, status) -> PDF
+_pdf_cache: TTLCache[tuple[str, str, str], bytes] = TTLCache(
+    name="order_pdf",
+    max_entries=settings.ORDER_PDF_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ORDER_PDF_CACHE_TTL_SECONDS,
+)
+
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if settings.PDF_RENDER_POOL == "process":
+            # spawn statt fork: der API-Prozess hat bereits Threads (DB-Treiber, Event-Loop)
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.PDF_RENDER_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=settings.PDF_RENDER_WORKERS, thread_name_prefix="pdf")
+    return _executor
+
+
+def shutdown_pdf_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+async def render_pdf(orders: list[OrderPdfData]) -> bytes:
+    """
+    Rendert im begrenzten Worker-Pool; der Event-Loop bleibt für andere Requests frei.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), render_orders_pdf, orders)
+
+
+def is_cacheable(status: str) -> bool:
+    return status in IMMUTABLE_ORDER_STATUSES
+
+
+def order_pdf_etag(order_id: str, status: str) -> str:
+    digest = hashlib.sha1(f"order-pdf:{order_id}:{status}".encode("utf-8")).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def render_order_pdf_cached(*, tenant_id: str, order_id: str, data: OrderPdfData) -> bytes:
+    """
+    PDF einer einzelnen Bestellung; unveränderliche Bestellungen kommen aus dem Cache.
+    """
+    if not is_cacheable(data.status):
+        return await render_pdf([data])
+    key = (tenant_id, order_id, data.status)
+    cached = _pdf_cache.get(key)
+    if cached is not None:
+        return cached
+    pdf_bytes = await render_pdf([data])
+    _pdf_cache.set(key, pdf_bytes)
+    return pdf_bytes
+
+
+def build_zip(files: list[tuple[str, bytes]]) -> bytes:
+    buf = BytesIO()
+    # PDFs sind bereits komprimiert
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_STORED) as archive:
+        for name, data in files:
+            archive.writestr(name, data)
+    return buf.getvalue()
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Iterable
+
+from sqlalchemy import Date, Select, case, cast, delete, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.consumption_rollup import InventoryConsumptionMonthly
+from app.models.item import Item
+from app.models.movement import InventoryMovement
+
+
+@dataclass(frozen=True)
+class ConsumptionRow:
+    period: str  # YYYY-MM
+    item_id: uuid.UUID
+    item_name: str
+    item_sku: str
+    category_id: uuid.UUID | None
+    qty_sum: float
+
+
+def month_start(value: date | datetime) -> date:
+    """
+    Monatsanfang (UTC) für ein Datum oder einen Zeitstempel; naive Zeitstempel gelten als UTC.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        value = value.date()
+    return value.replace(day=1)
+
+
+def _add_months(value: date, months: int) -> date:
+    idx = value.year * 12 + (value.month - 1) + months
+    return date(idx // 12, idx % 12 + 1, 1)
+
+
+def _utc_midnight(value: date) -> datetime:
+    return datetime.combine(value, time.min).replace(tzinfo=timezone.utc)
+
+
+def _month_expr(dialect_name: str):
+    if dialect_name == "postgresql":
+        return cast(func.date_trunc("month", func.timezone("UTC", InventoryMovement.created_at)), Date)
+    # SQLite (Tests): ISO-Text 'YYYY-MM-01'
+    return func.date(InventoryMovement.created_at, "start of month")
+
+
+def _period_key(value: Any) -> str:
+    if isinstance(value, str):
+        return value[:7]
+    return value.strftime("%Y-%m")
+
+
+def _dialect_insert(dialect_name: str):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert
+
+
+async def record_movement(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    item_id: uuid.UUID,
+    movement_type: str,
+    qty: int,
+    created_at: datetime,
+) -> None:
+    """
+    Schreibt eine Bewegung in die Monats-Rollup-Tabelle fort (atomarer Upsert, gleiche Transaktion
+    wie die Bewegung selbst).
+    """
+    await record_movements(db, tenant_id=tenant_id, movements=[(item_id, movement_type, qty, created_at)])
+
+
+async def record_movements(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    movements: Iterable[tuple[uuid.UUID, str, int, datetime]],
+) -> None:
+    """
+    Bulk-Variante von `record_movement` für (item_id, type, qty, created_at)-Tupel.
+    Bewegungen werden vorab pro (Artikel, Monat) verdichtet, damit ein einziger Upsert reicht.
+    """
+    totals: dict[tuple[uuid.UUID, date], list[int]] = {}
+    for item_id, movement_type, qty, created_at in movements:
+        bucket = totals.setdefault((item_id, month_start(created_at)), [0, 0])
+        if movement_type == "OUT":
+            bucket[0] += qty
+        elif movement_type == "IN":
+            bucket[1] += qty
+    if not totals:
+        return
+
+    dialect_insert = _dialect_insert(db.get_bind().dialect.name)
+    if dialect_insert is None:
+        for (item_id, month), (qty_out, qty_in) in totals.items():
+            row = await db.get(InventoryConsumptionMonthly, (tenant_id, item_id, month))
+            if row is None:
+                db.add(
+                    InventoryConsumptionMonthly(
+                        tenant_id=tenant_id, item_id=item_id, month=month, qty_out=qty_out, qty_in=qty_in
+                    )
+                )
+            else:
+                row.qty_out += qty_out
+                row.qty_in += qty_in
+        return
+
+    table = InventoryConsumptionMonthly.__table__
+    stmt = dialect_insert(table).values(
+        [
+            {"tenant_id": tenant_id, "item_id": item_id, "month": month, "qty_out": qty_out, "qty_in": qty_in}
+            for (item_id, month), (qty_out, qty_in) in totals.items()
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["tenant_id", "item_id", "month"],
+        set_={
+            "qty_out": table.c.qty_out + stmt.excluded.qty_out,
+            "qty_in": table.c.qty_in + stmt.excluded.qty_in,
+        },
+    )
+    await db.execute(stmt)
+
+
+async def rebuild_consumption_rollup(db: AsyncSession, *, tenant_id: uuid.UUID | None = None) -> int:
+    """
+    Baut die Rollup-Tabelle aus den Rohbewegungen neu auf (alle Tenants oder einer).
+    Liefert die Anzahl geschriebener Monatszeilen. Commit liegt beim Aufrufer.
+    """
+    month_col = _month_expr(db.get_bind().dialect.name)
+    source = select(
+        InventoryMovement.tenant_id,
+        InventoryMovement.item_id,
+        month_col,
+        func.coalesce(func.sum(case((InventoryMovement.type == "OUT", InventoryMovement.qty), else_=0)), 0),
+        func.coalesce(func.sum(case((InventoryMovement.type == "IN", InventoryMovement.qty), else_=0)), 0),
+    ).group_by(InventoryMovement.tenant_id, InventoryMovement.item_id, month_col)
+    cleanup = delete(InventoryConsumptionMonthly)
+    if tenant_id is not None:
+        source = source.where(InventoryMovement.tenant_id == tenant_id)
+        cleanup = cleanup.where(InventoryConsumptionMonthly.tenant_id == tenant_id)
+
+    await db.execute(cleanup)
+    result = await db.execute(
+        insert(InventoryConsumptionMonthly).from_select(
+            ["tenant_id", "item_id", "month", "qty_out", "qty_in"],
+            source,
+        )
+    )
+    return max(result.rowcount or 0, 0)
+
+
+def _consumption_window(start: date, end: date, today: date | None) -> tuple[date, date, bool]:
+    """
+    (erster vollständiger Monat, Rollup-Ende exklusiv, Rollup nutzbar?) für [start, end].
+    """
+    current_month = month_start(today or datetime.now(timezone.utc).date())
+    first_full = start if start.day == 1 else _add_months(month_start(start), 1)
+    rollup_end = min(month_start(end + timedelta(days=1)), current_month)  # exklusiv
+    return first_full, rollup_end, first_full < rollup_end
+
+
+def raw_consumption_query(
+    dialect_name: str,
+    *,
+    tenant_id: uuid.UUID,
+    start: date,
+    end: date,
+    category_id: str | None = None,
+    item_ids: list[str] | None = None,
+    today: date | None = None,
+) -> Select:
+    """
+    OUT-Summen aus den Rohbewegungen für die Zeiträume, die der Rollup nicht abdeckt
+    (nutzt ix_inventory_movements_tenant_type_created_at).
+    """
+    first_full, rollup_end, use_rollup = _consumption_window(start, end, today)
+    start_dt = _utc_midnight(start)
+    end_dt = _utc_midnight(end + timedelta(days=1))
+    if use_rollup:
+        raw_range = or_(
+            (InventoryMovement.created_at >= start_dt) & (InventoryMovement.created_at < _utc_midnight(first_full)),
+            (InventoryMovement.created_at >= _utc_midnight(rollup_end)) & (InventoryMovement.created_at < end_dt),
+        )
+    else:
+        raw_range = (InventoryMovement.created_at >= start_dt) & (InventoryMovement.created_at < end_dt)
+
+    period_col = _month_expr(dialect_name).label("period")
+    raw_q = (
+        select(
+            period_col,
+            Item.id,
+            Item.name,
+            Item.sku,
+            Item.category_id,
+            func.sum(InventoryMovement.qty),
+        )
+        .join(Item, InventoryMovement.item_id == Item.id)
+        .where(
+            InventoryMovement.tenant_id == tenant_id,
+            InventoryMovement.type == "OUT",
+            raw_range,
+        )
+    )
+    if category_id:
+        raw_q = raw_q.where(Item.category_id == category_id)
+    if item_ids:
+        raw_q = raw_q.where(Item.id.in_(item_ids))
+    return raw_q.group_by(period_col, Item.id, Item.name, Item.sku, Item.category_id)
+
+
+async def load_monthly_consumption(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    start: date,
+    end: date,
+    category_id: str | None = None,
+    item_ids: list[str] | None = None,
+    today: date | None = None,
+) -> list[ConsumptionRow]:
+    """
+    OUT-Mengen pro Artikel und Monat im Zeitraum [start, end] (inklusive).
+
+    Vollständig abgedeckte, abgeschlossene Monate kommen aus der Rollup-Tabelle; angeschnittene
+    Randmonate und der laufende Monat werden aus den Rohbewegungen gezählt.
+    """
+    first_full, rollup_end, use_rollup = _consumption_window(start, end, today)
+
+    rows: list[ConsumptionRow] = []
+
+    if use_rollup:
+        rollup_q = (
+            select(
+                InventoryConsumptionMonthly.month,
+                Item.id,
+                Item.name,
+                Item.sku,
+                Item.category_id,
+                InventoryConsumptionMonthly.qty_out,
+            )
+            .join(Item, InventoryConsumptionMonthly.item_id == Item.id)
+            .where(
+                InventoryConsumptionMonthly.tenant_id == tenant_id,
+                InventoryConsumptionMonthly.month >= first_full,
+                InventoryConsumptionMonthly.month < rollup_end,
+                InventoryConsumptionMonthly.qty_out > 0,
+            )
+        )
+        if category_id:
+            rollup_q = rollup_q.where(Item.category_id == category_id)
+        if item_ids:
+            rollup_q = rollup_q.where(Item.id.in_(item_ids))
+        for month, item_id, name, sku, cat_id, qty_out in (await db.execute(rollup_q)).all():
+            rows.append(ConsumptionRow(_period_key(month), item_id, name, sku, cat_id, float(qty_out)))
+
+    raw_q = raw_consumption_query(
+        db.get_bind().dialect.name,
+        tenant_id=tenant_id,
+        start=start,
+        end=end,
+        category_id=category_id,
+        item_ids=item_ids,
+        today=today,
+    )
+    for period, item_id, name, sku, cat_id, qty_sum in (await db.execute(raw_q)).all():
+        rows.append(ConsumptionRow(_period_key(period), item_id, name, sku, cat_id, float(qty_sum or 0.0)))
+
+    rows.sort(key=lambda row: row.period)
+    return rows
@@ -1,24 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 import logging
 from datetime import date, datetime, timedelta, timezone
-from io import BytesIO, StringIO
-from typing import Any, Literal
+from io import BytesIO, TextIOWrapper
+from itertools import islice
+from typing import IO, Any, AsyncIterator, Awaitable, Callable, Literal
 
 from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, UploadFile, Request
-from fastapi.responses import StreamingResponse
-from sqlalchemy import func, or_, select
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import Select, func, or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload
-from sqlalchemy.ext.asyncio import AsyncSession
-from openpyxl import Workbook, load_workbook
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-
-from app.core.db import get_db
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from openpyxl import load_workbook
+
+from app.core.config import settings
+from app.core.db import get_db, get_read_db, read_sessionmaker_for, release_connection
+from app.core.exports import (
+    XLSX_MEDIA_TYPE,
+    csv_chunks,
+    csv_response,
+    iter_rows,
+    stream_rows,
+    xlsx_chunks,
+    xlsx_response,
+)
 from app.core.email_settings import EmailSettings, load_email_settings
-from app.core.email_utils import smtp_ping, send_email
+from app.core.email_utils import send_email_async, smtp_ping_async
+from app.core.mail_outbox import enqueue_email
 from app.core.deps_auth import CurrentUserContext, get_current_user, require_owner_or_admin
 from app.core.deps_tenant import get_tenant_context
 from app.core.tenant import TenantContext
@@ -54,6 +65,9 @@ from app.modules.inventory.schemas import (
     ReorderItem,
     InventoryBulkUpdateRequest,
     InventoryBulkUpdateResult,
+    MovementBatchEntryResult,
+    MovementBatchRequest,
+    MovementBatchResponse,
     MovementItemOut,
     MovementOut,
     MovementPayload,
@@ -70,6 +84,22 @@ from app.modules.inventory.schemas import (
     MassImportResult,
     EmailSendResponse,
 )
+from app.modules.inventory.bulk_import import apply_item_rows, load_category_ids
+from app.modules.inventory.order_pdf import OrderPdfData, OrderPdfLine
+from app.modules.inventory.pdf_render import (
+    build_zip,
+    etag_matches,
+    is_cacheable,
+    order_pdf_etag,
+    render_order_pdf_cached,
+    render_pdf,
+)
+from app.modules.inventory.pagination import PagingMode, paginate_items
+from app.modules.inventory.rollup import load_monthly_consumption, record_movement, record_movements
+from app.modules.inventory.search import apply_item_search
+from app.modules.inventory.stock import StockDelta, apply_stock_delta, apply_stock_deltas
+from app.modules.jobs.schemas import JobOut
+from app.modules.jobs.service import JobRun, enqueue_job, job_handler, job_to_out
 from app.modules.support.schemas import GlobalCustomerSettingsOut, HelpInfoOut, SalesContactOut, SupportHoursEntry
 from app.modules.support.service import get_or_create_global_customer_settings
 
@@ -124,6 +154,7 @@ async def list_units(
     db: AsyncSession = Depends(get_db),
 ) -> list[ItemUnitOut]:
     rows = (await db.scalars(select(ItemUnit).where(ItemUnit.is_active == True))).all()  # noqa: E712
+    await release_connection(db)
     return [ItemUnitOut(code=u.code, label=u.label, is_active=u.is_active) for u in rows]
 
 
@@ -340,29 +371,30 @@ async def list_items(
     active: bool | None = Query(default=True),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=500),
+    paging: PagingMode = Query(default="offset", description="offset (Default) oder cursor (Keyset auf name, id)"),
+    cursor: str | None = Query(default=None, description="next_cursor der Vorseite, aktiviert den Cursor-Modus"),
+    include_total: bool | None = Query(default=None, description="Gesamtanzahl zählen (Default: nur im Offset-Modus)"),
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> ItemsPage:
     base = select(Item).where(Item.tenant_id == ctx.tenant.id)
     if active is not None:
         base = base.where(Item.is_active.is_(active))
     if category_id:
         base = base.where(Item.category_id == category_id)
-    if q:
-        like = f"%{q}%"
-        base = base.where(
-            or_(
-                Item.sku.ilike(like),
-                Item.barcode.ilike(like),
-                Item.name.ilike(like),
-            )
-        )
+    base, rank = apply_item_search(base, q, dialect_name=db.get_bind().dialect.name)
 
-    total = await db.scalar(select(func.count()).select_from(base.subquery()))
-    rows = (
-        await db.scalars(base.order_by(Item.name.asc()).offset((page - 1) * page_size).limit(page_size))
-    ).all()
+    rows, total, next_cursor = await paginate_items(
+        db,
+        base,
+        page=page,
+        page_size=page_size,
+        paging=paging,
+        cursor=cursor,
+        include_total=include_total,
+        rank=rank,
+    )
 
     # Preload categories for output
     category_ids = {row.category_id for row in rows if row.category_id}
@@ -375,15 +407,17 @@ async def list_items(
 
     return ItemsPage(
         items=[_item_out(row, categories.get(row.category_id)) for row in rows],
-        total=total or 0,
+        total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
-@router.get("/items/{item_id}", response_model=ItemOut)
+# :uuid-Konverter, damit statische Pfade wie /items/export nicht hier landen
+@router.get("/items/{item_id:uuid}", response_model=ItemOut)
 async def get_item(
-    item_id: str,
+    item_id: uuid.UUID,
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -560,58 +594,27 @@ async def _aggregate_consumption(
     if start > end:
         raise HTTPException(status_code=400, detail={"error": {"code": "invalid_range", "message": "from muss vor to liegen"}})
 
-    start_dt = datetime.combine(start, datetime.min.time()).replace(tzinfo=timezone.utc)
-    end_dt = datetime.combine(end + timedelta(days=1), datetime.min.time()).replace(tzinfo=timezone.utc)
-
-    period_col = func.date_trunc("month", InventoryMovement.created_at).label("period")
-
-    base = (
-        select(
-            period_col,
-            Item.id.label("item_id"),
-            Item.name.label("item_name"),
-            Item.sku.label("item_sku"),
-            Item.category_id.label("category_id"),
-            func.sum(InventoryMovement.qty).label("qty_sum"),
-        )
-        .join(Item, InventoryMovement.item_id == Item.id)
-        .where(
-            InventoryMovement.tenant_id == ctx.tenant.id,
-            InventoryMovement.type == "OUT",
-            InventoryMovement.created_at >= start_dt,
-            InventoryMovement.created_at < end_dt,
-        )
+    grouped = await load_monthly_consumption(
+        db,
+        tenant_id=ctx.tenant.id,
+        start=start,
+        end=end,
+        category_id=category_id,
+        item_ids=item_ids,
     )
-    if category_id:
-        base = base.where(Item.category_id == category_id)
-    if item_ids:
-        base = base.where(Item.id.in_(item_ids))
-
-    grouped = (
-        await db.execute(
-            base.group_by(
-                period_col,
-                Item.id,
-                Item.name,
-                Item.sku,
-                Item.category_id,
-            ).order_by(period_col)
-        )
-    ).all()
 
     series_map: dict[str, dict[str, Any]] = {}
     months: set[str] = set()
 
     for row in grouped:
-        period: datetime = row.period
-        month_key = period.strftime("%Y-%m")
+        month_key = row.period
         months.add(month_key)
         item_id = str(row.item_id)
         entry = series_map.setdefault(
             item_id,
             {"name": row.item_name, "category_id": row.category_id, "months": {}},
         )
-        entry["months"][month_key] = float(row.qty_sum or 0.0)
+        entry["months"][month_key] = entry["months"].get(month_key, 0.0) + row.qty_sum
 
     month_list = sorted(months)
 
@@ -692,7 +695,7 @@ async def get_report(
     limit: int | None = Query(default=5),
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> ReportResponse:
     start_date = _parse_date(from_, "from")
     end_date = _parse_date(to, "to")
@@ -720,7 +723,7 @@ async def get_report_consumption(
     limit: int | None = Query(default=5),
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> ReportResponse:
     return await get_report(
         from_=from_,
@@ -748,7 +751,7 @@ async def export_report(
     limit: int | None = Query(default=5),
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     if format not in {"csv", "excel"}:
         raise HTTPException(status_code=400, detail={"error": {"code": "invalid_format", "message": "Format muss csv oder excel sein"}})
@@ -766,40 +769,11 @@ async def export_report(
         db=db,
     )
 
-    rows: list[tuple[str, str, float]] = []
-    for serie in report.series:
-        for point in serie.data:
-            rows.append((serie.label, point.period, point.value))
-
+    rows = [(serie.label, point.period, point.value) for serie in report.series for point in serie.data]
+    header = ["Artikel", "Monat", "Verbrauch"]
     if format == "csv":
-        import csv
-
-        buf = StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(["Artikel", "Monat", "Verbrauch"])
-        for artikel, month, value in rows:
-            writer.writerow([artikel, month, value])
-        buf.seek(0)
-        return StreamingResponse(
-            iter([buf.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": 'attachment; filename="verbrauch.csv"'},
-        )
-
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Verbrauch"
-    ws.append(["Artikel", "Monat", "Verbrauch"])
-    for artikel, month, value in rows:
-        ws.append([artikel, month, value])
-    out = BytesIO()
-    wb.save(out)
-    out.seek(0)
-    return StreamingResponse(
-        out,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": 'attachment; filename="verbrauch.xlsx"'},
-    )
+        return csv_response(csv_chunks(header, iter_rows(rows)), "verbrauch.csv")
+    return xlsx_response(xlsx_chunks("Verbrauch", header, iter_rows(rows)), "verbrauch.xlsx")
 
 
 # ----------------------
@@ -892,7 +866,7 @@ async def list_orders(
     limit: int = Query(default=100, ge=1, le=500),
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[OrderOut]:
     stmt = (
         select(InventoryOrder)
@@ -987,6 +961,7 @@ async def complete_order(
     order.status = "COMPLETED"
     order.completed_at = now
 
+    deltas: dict[Any, int] = {}
     for order_item in order.items:
         item = item_map.get(str(order_item.item_id))
         if item is None:
@@ -994,7 +969,7 @@ async def complete_order(
                 status_code=400,
                 detail={"error": {"code": "order_item_missing", "message": "Artikel für Bestellung fehlt"}},
             )
-        item.quantity += order_item.quantity
+        deltas[item.id] = deltas.get(item.id, 0) + order_item.quantity
         movement = InventoryMovement(
             tenant_id=ctx.tenant.id,
             item_id=item.id,
@@ -1006,7 +981,26 @@ async def complete_order(
             created_at=now,
         )
         db.add(movement)
+        await record_movement(
+            db,
+            tenant_id=ctx.tenant.id,
+            item_id=item.id,
+            movement_type="IN",
+            qty=order_item.quantity,
+            created_at=now,
+        )
 
+    applied = await apply_stock_deltas(
+        db,
+        tenant_id=ctx.tenant.id,
+        items=list(item_map.values()),
+        deltas={item_id: StockDelta(delta=delta) for item_id, delta in deltas.items()},
+    )
+    if len(applied) != len(deltas):
+        raise HTTPException(
+            status_code=400,
+            detail={"error": {"code": "order_item_missing", "message": "Artikel für Bestellung fehlt"}},
+        )
     await db.commit()
     await db.refresh(order)
     return _order_to_out(order, item_map)
@@ -1039,23 +1033,8 @@ async def _get_email_settings(db: AsyncSession) -> EmailSettings:
     return await load_email_settings(db)
 
 
-def _smtp_ping(email_settings: EmailSettings, request_id: str | None = None) -> tuple[bool, list[str], str | None]:
-    return smtp_ping(email_settings, logger=logger, request_id=request_id)
-
-
-def _send_email_message(*, to_email: str, subject: str, body: str, email_settings: EmailSettings, request_id: str | None, actor: str | None) -> EmailSendResponse:
-    ok, error, resolved_ips = send_email(
-        email_settings=email_settings,
-        recipient=to_email,
-        subject=subject,
-        body=body,
-        request_id=request_id,
-        actor=actor,
-        logger=logger,
-    )
-    if not ok:
-        return EmailSendResponse(ok=False, error=error)
-    return EmailSendResponse(ok=True, error=None)
+async def _smtp_ping(email_settings: EmailSettings, request_id: str | None = None) -> tuple[bool, list[str], str | None]:
+    return await smtp_ping_async(email_settings, logger=logger, request_id=request_id)
 
 
 def _format_order_email(
@@ -1087,55 +1066,25 @@ def _format_order_email(
     return subject, body
 
 
-def _build_order_pdf(order: InventoryOrder, item_map: dict[str, Item]) -> bytes:
-    buf = BytesIO()
-    pdf = canvas.Canvas(buf, pagesize=A4)
-    width, height = A4
-    y = height - 40
-
-    pdf.setFont("Helvetica-Bold", 14)
-    pdf.drawString(40, y, f"Bestellung {order.number}")
-    y -= 20
-    pdf.setFont("Helvetica", 10)
-    pdf.drawString(40, y, f"Status: {order.status}")
-    y -= 15
-    if order.note:
-        pdf.drawString(40, y, f"Notiz: {order.note}")
-        y -= 15
-    pdf.drawString(40, y, f"Angelegt: {order.created_at}")
-    y -= 25
-
-    pdf.setFont("Helvetica-Bold", 11)
-    pdf.drawString(40, y, "Positionen:")
-    y -= 18
-    pdf.setFont("Helvetica", 10)
-
-    headers = ["Artikel", "Menge", "SKU", "Barcode"]
-    col_x = [40, 250, 320, 420]
-    for idx, header in enumerate(headers):
-        pdf.drawString(col_x[idx], y, header)
-    y -= 12
-    pdf.line(40, y, width - 40, y)
-    y -= 14
-
+def _order_pdf_data(order: InventoryOrder, item_map: dict[str, Item]) -> OrderPdfData:
+    lines = []
     for oi in order.items:
-        if y < 60:
-            pdf.showPage()
-            y = height - 40
-            pdf.setFont("Helvetica", 10)
         item = item_map.get(str(oi.item_id))
-        name = item.name if item else "(unbekannt)"
-        sku = item.sku if item else "-"
-        barcode = item.barcode if item else "-"
-        values = [name, str(oi.quantity), sku, barcode]
-        for idx, value in enumerate(values):
-            pdf.drawString(col_x[idx], y, value)
-        y -= 14
-
-    pdf.showPage()
-    pdf.save()
-    buf.seek(0)
-    return buf.getvalue()
+        lines.append(
+            OrderPdfLine(
+                name=item.name if item else "(unbekannt)",
+                quantity=oi.quantity,
+                sku=item.sku if item else "-",
+                barcode=item.barcode if item else "-",
+            )
+        )
+    return OrderPdfData(
+        number=order.number,
+        status=order.status,
+        note=order.note,
+        created_at=str(order.created_at),
+        lines=tuple(lines),
+    )
 
 
 @router.post("/orders/{order_id}/email", response_model=EmailSendResponse, dependencies=[Depends(require_owner_or_admin)])
@@ -1156,34 +1105,118 @@ async def send_order_email(
         return EmailSendResponse(ok=False, error="Kein Empfänger konfiguriert")
 
     email_settings = await _get_email_settings(db)
-    request_id = getattr(request.state, "request_id", None)
+    if not email_settings.is_configured():
+        return EmailSendResponse(ok=False, error="SMTP Konfiguration fehlt (Host/Port/From sind erforderlich)")
+
     subject, body = _format_order_email(order, item_map, recipient, payload.note)
-    return _send_email_message(
-        to_email=recipient,
+    # Zustellung (inkl. Retries) übernimmt der Outbox-Dispatcher
+    entry = await enqueue_email(
+        db,
+        recipient=recipient,
         subject=subject,
         body=body,
-        email_settings=email_settings,
-        request_id=request_id,
+        tenant_id=ctx.tenant.id,
         actor=request.headers.get("x-admin-actor"),
+        request_id=getattr(request.state, "request_id", None),
     )
+    return EmailSendResponse(ok=True, error=None, queued=True, outbox_id=str(entry.id))
 
 
 @router.get("/orders/{order_id}/pdf")
 async def get_order_pdf(
     order_id: str,
+    request: Request,
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-):
-    order = await _get_order_or_404(order_id=order_id, ctx=ctx, db=db, load_items=True)
+) -> Response:
+    """
+    PDF einer Bestellung. Abgeschlossene/stornierte Bestellungen sind unveränderlich und werden
+    mit ETag ausgeliefert (If-None-Match -> 304 ohne erneutes Rendern).
+    """
+    order = await _get_order_or_404(order_id=order_id, ctx=ctx, db=db)
+    headers = {"Content-Disposition": f'attachment; filename="order-{order.number}.pdf"'}
+    if is_cacheable(order.status):
+        etag = order_pdf_etag(str(order.id), order.status)
+        headers.update({"ETag": etag, "Cache-Control": "private, no-cache"})
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+    else:
+        headers["Cache-Control"] = "no-store"
+
+    await db.refresh(order, attribute_names=["items"])
     item_ids = {str(oi.item_id) for oi in order.items}
     item_map = await _items_by_ids(db=db, ctx=ctx, item_ids=item_ids)
+    pdf_bytes = await render_order_pdf_cached(
+        tenant_id=str(ctx.tenant.id),
+        order_id=str(order.id),
+        data=_order_pdf_data(order, item_map),
+    )
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
+
 
-    pdf_bytes = _build_order_pdf(order, item_map)
-    filename = f"order-{order.number}.pdf"
-    return StreamingResponse(
-        iter([pdf_bytes]),
-        media_type="application/pdf",
+@router.post("/orders/pdf")
+async def get_orders_pdf_batch(
+    payload: inv_schemas.OrderPdfBatchRequest,
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """
+    Sammeldruck: mehrere Bestellungen als ein PDF oder als ZIP mit einem PDF je Bestellung.
+    """
+    if len(payload.order_ids) > settings.ORDER_PDF_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": {
+                    "code": "too_many_orders",
+                    "message": f"Maximal {settings.ORDER_PDF_BATCH_MAX} Bestellungen pro Sammeldruck",
+                }
+            },
+        )
+    try:
+        order_uuids = list(dict.fromkeys(uuid.UUID(str(raw)) for raw in payload.order_ids))
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=404,
+            detail={"error": {"code": "order_not_found", "message": "Bestellung nicht gefunden"}},
+        )
+    orders = (
+        await db.scalars(
+            select(InventoryOrder)
+            .where(InventoryOrder.tenant_id == ctx.tenant.id, InventoryOrder.id.in_(order_uuids))
+            .options(selectinload(InventoryOrder.items))
+        )
+    ).all()
+    if len(orders) != len(order_uuids):
+        raise HTTPException(
+            status_code=404,
+            detail={"error": {"code": "order_not_found", "message": "Bestellung nicht gefunden"}},
+        )
+    by_id = {order.id: order for order in orders}
+    ordered = [by_id[order_uuid] for order_uuid in order_uuids]
+    item_map = await _items_by_ids(
+        db=db, ctx=ctx, item_ids={str(oi.item_id) for order in ordered for oi in order.items}
+    )
+    data = [_order_pdf_data(order, item_map) for order in ordered]
+
+    if payload.format == "zip":
+        rendered = await asyncio.gather(
+            *(
+                render_order_pdf_cached(tenant_id=str(ctx.tenant.id), order_id=str(order.id), data=entry)
+                for order, entry in zip(ordered, data)
+            )
+        )
+        files = [(f"order-{order.number}.pdf", pdf_bytes) for order, pdf_bytes in zip(ordered, rendered)]
+        content = await asyncio.to_thread(build_zip, files)
+        media_type, filename = "application/zip", "orders.zip"
+    else:
+        content = await render_pdf(data)
+        media_type, filename = "application/pdf", "orders.pdf"
+    return Response(
+        content=content,
+        media_type=media_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
@@ -1209,6 +1242,17 @@ MASS_EXPORT_COLUMNS = [
     "Letzte Bestellung",
     "Bestellt",
 ]
+# Zeilen pro Block beim Excel-Massenimport (ein Lookup, ein Upsert, ein Commit je Block)
+SETTINGS_IMPORT_CHUNK_SIZE = 1000
+_SETTINGS_IMPORT_UPDATE_COLUMNS: tuple[str, ...] = (
+    "name",
+    "barcode",
+    "category_id",
+    "target_stock",
+    "min_stock",
+    "quantity",
+    "description",
+)
 
 
 def _settings_to_out(settings: TenantSetting) -> TenantSettingsOut:
@@ -1375,52 +1419,58 @@ async def get_help_info(
 @router.get("/settings/export", dependencies=[Depends(require_owner_or_admin)])
 async def export_settings_inventory(
     ctx: TenantContext = Depends(get_tenant_context),
-    db: AsyncSession = Depends(get_db),
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(read_sessionmaker_for),
 ):
-    rows = (
-        await db.execute(
-            select(Item, Category)
-            .outerjoin(Category, Category.id == Item.category_id)
-            .where(Item.tenant_id == ctx.tenant.id)
-            .order_by(Item.name.asc())
-        )
-    ).all()
+    return xlsx_response(_settings_export_chunks(ctx.tenant.id, sessionmaker), "settings_export.xlsx")
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Export"
-    ws.append(MASS_EXPORT_COLUMNS)
-
-    for item, category in rows:
-        ws.append(
-            [
-                item.sku,
-                item.name,
-                item.barcode,
-                category.name if category else "",
-                item.target_stock,
-                item.min_stock,
-                item.quantity,
-                "",
-                "",
-                str(ctx.tenant.id),
-                "",
-                "",
-                item.description or "",
-                "",
-                "",
-                "",
-            ]
-        )
 
-    buf = BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    return StreamingResponse(
-        buf,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": 'attachment; filename="settings_export.xlsx"'},
+@router.post(
+    "/settings/export/jobs",
+    response_model=JobOut,
+    status_code=202,
+    dependencies=[Depends(require_owner_or_admin)],
+)
+async def enqueue_settings_export(
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> JobOut:
+    job = await enqueue_job(db, kind="inventory.settings_export", tenant_id=ctx.tenant.id, actor=user_ctx.user.email)
+    return job_to_out(job)
+
+
+def _settings_export_chunks(
+    tenant_id: uuid.UUID, sessionmaker: async_sessionmaker[AsyncSession] | None = None
+) -> AsyncIterator[bytes]:
+    stmt = (
+        select(Item, Category)
+        .outerjoin(Category, Category.id == Item.category_id)
+        .where(Item.tenant_id == tenant_id)
+        .order_by(Item.name.asc())
     )
+    tenant_label = str(tenant_id)
+    rows = (
+        [
+            item.sku,
+            item.name,
+            item.barcode,
+            category.name if category else "",
+            item.target_stock,
+            item.min_stock,
+            item.quantity,
+            "",
+            "",
+            tenant_label,
+            "",
+            "",
+            item.description or "",
+            "",
+            "",
+            "",
+        ]
+        async for item, category in stream_rows(stmt, sessionmaker=sessionmaker)
+    )
+    return xlsx_chunks("Export", MASS_EXPORT_COLUMNS, rows)
 
 
 @router.post("/settings/import", response_model=MassImportResult, dependencies=[Depends(require_owner_or_admin)])
@@ -1429,77 +1479,138 @@ async def import_settings_inventory(
     ctx: TenantContext = Depends(get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> MassImportResult:
-    content = await file.read()
+    """
+    Massenimport aus der Settings-Excel. Die Datei wird im read-only Modus gestreamt und in
+    Blöcken verarbeitet: pro Block ein SKU-Lookup, ein Upsert und ein Commit.
+    """
+    # UploadFile liegt bereits als (Spooled-)Temp-Datei vor, kein zusätzliches read() in den Speicher
+    return await _import_settings_workbook(db, tenant_id=ctx.tenant.id, source=file.file)
+
+
+@router.post(
+    "/settings/import/jobs",
+    response_model=JobOut,
+    status_code=202,
+    dependencies=[Depends(require_owner_or_admin)],
+)
+async def enqueue_settings_import(
+    file: UploadFile = File(...),
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> JobOut:
+    """
+    Excel-Massenimport als Hintergrundjob; Fortschritt (Zeilen) per `GET /inventory/jobs/{id}`.
+    """
+    job = await enqueue_job(
+        db, kind="inventory.settings_import", tenant_id=ctx.tenant.id, actor=user_ctx.user.email, upload=file
+    )
+    return job_to_out(job)
+
+
+@job_handler("inventory.settings_import")
+async def _run_settings_import_job(run: JobRun) -> dict:
+    with await run.open_input() as source:
+        result = await _import_settings_workbook(
+            run.db, tenant_id=run.tenant_id, source=source, on_progress=run.progress
+        )
+    return result.model_dump()
+
+
+async def _import_settings_workbook(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    source: IO[bytes],
+    on_progress: Callable[[int], Awaitable[None]] | None = None,
+) -> MassImportResult:
     try:
-        wb = load_workbook(BytesIO(content))
+        wb = await asyncio.to_thread(load_workbook, source, read_only=True, data_only=True)
     except Exception:  # noqa: BLE001
         raise HTTPException(
             status_code=400,
             detail={"error": {"code": "invalid_excel", "message": "Datei konnte nicht gelesen werden"}},
         )
-    ws = wb.active
-    headers = [str(cell.value or "").strip() for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-    missing = [col for col in MASS_EXPORT_COLUMNS if col not in headers]
-    if missing:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": {"code": "missing_columns", "message": f"Fehlende Spalten: {', '.join(missing)}"}},
-        )
-    idx = {name: headers.index(name) for name in headers}
-
-    imported = 0
-    updated = 0
-    errors: list[dict[str, str]] = []
-
-    for row_num, row in enumerate(ws.iter_rows(min_row=2), start=2):
-        try:
-            sku_raw = str(row[idx["Artikel-ID"]].value or "").strip()
-            name = str(row[idx["Name"]].value or "").strip()
-            barcode = str(row[idx["Barcode"]].value or "").strip()
-            if not sku_raw or not name or not barcode:
-                raise ValueError("Artikel-ID, Name und Barcode sind Pflicht")
-
-            category_name = str(row[idx["Kategorie"]].value or "").strip()
-            category = await _category_by_name(db=db, ctx=ctx, name=category_name) if category_name else None
-            if category_name and category is None:
-                raise ValueError(f"Kategorie '{category_name}' nicht gefunden")
-
-            target_stock = int(row[idx["Soll"]].value or 0)
-            min_stock = int(row[idx["Min"]].value or 0)
-            quantity = int(row[idx["Bestand"]].value or 0)
-            description = str(row[idx["Beschreibung"]].value or "").strip()
-
-            normalized_sku = _normalize_sku(sku_raw)
-
-            item = await db.scalar(select(Item).where(Item.tenant_id == ctx.tenant.id, Item.sku == normalized_sku))
-            if item:
-                item.name = name
-                item.barcode = barcode
-                item.category_id = category.id if category else None
-                item.target_stock = target_stock
-                item.min_stock = min_stock
-                item.quantity = quantity
-                item.description = description
-                updated += 1
-            else:
-                new_item = Item(
-                    tenant_id=ctx.tenant.id,
-                    sku=normalized_sku,
-                    barcode=barcode,
-                    name=name,
-                    category_id=category.id if category else None,
-                    target_stock=target_stock,
-                    min_stock=min_stock,
-                    quantity=quantity,
-                    description=description,
-                )
-                db.add(new_item)
-                imported += 1
-        except Exception as e:  # noqa: BLE001
-            errors.append({"row": str(row_num), "error": str(e)})
-
-    await db.commit()
-    return MassImportResult(imported=imported, updated=updated, errors=errors)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header_row = await asyncio.to_thread(next, rows, ())
+        headers = [str(value or "").strip() for value in header_row]
+        missing = [col for col in MASS_EXPORT_COLUMNS if col not in headers]
+        if missing:
+            raise HTTPException(
+                status_code=400,
+                detail={"error": {"code": "missing_columns", "message": f"Fehlende Spalten: {', '.join(missing)}"}},
+            )
+        idx = {name: headers.index(name) for name in headers}
+
+        categories = await load_category_ids(db, tenant_id=tenant_id)
+        result = MassImportResult(imported=0, updated=0, errors=[])
+        row_num = 1
+        while chunk := await asyncio.to_thread(lambda: list(islice(rows, SETTINGS_IMPORT_CHUNK_SIZE))):
+            valid_rows: list[tuple[int, dict[str, Any]]] = []
+            for values in chunk:
+                row_num += 1
+                if all(value is None for value in values):
+                    continue
+                result.processed += 1
+                try:
+                    valid_rows.append((row_num, _settings_import_row(values, idx, categories)))
+                except Exception as e:  # noqa: BLE001
+                    result.errors.append({"row": str(row_num), "error": str(e)})
+
+            imported, updated = await apply_item_rows(
+                db,
+                tenant_id=tenant_id,
+                rows=valid_rows,
+                update_columns=_SETTINGS_IMPORT_UPDATE_COLUMNS,
+                errors=result.errors,
+                protect_admin_items=False,
+            )
+            await db.commit()
+            result.imported += imported
+            result.updated += updated
+            result.chunks += 1
+            if on_progress is not None:
+                await on_progress(result.processed)
+            logger.info(
+                "settings import progress",
+                extra={"tenant_id": str(tenant_id), "rows": result.processed, "chunks": result.chunks},
+            )
+    finally:
+        wb.close()
+
+    result.errors.sort(key=lambda error: int(error["row"]))
+    return result
+
+
+def _settings_import_row(
+    values: tuple[Any, ...], idx: dict[str, int], categories: dict[str, uuid.UUID]
+) -> dict[str, Any]:
+    def cell(column: str) -> Any:
+        pos = idx[column]
+        return values[pos] if pos < len(values) else None
+
+    sku_raw = str(cell("Artikel-ID") or "").strip()
+    name = str(cell("Name") or "").strip()
+    barcode = str(cell("Barcode") or "").strip()
+    if not sku_raw or not name or not barcode:
+        raise ValueError("Artikel-ID, Name und Barcode sind Pflicht")
+
+    category_name = str(cell("Kategorie") or "").strip()
+    category_id = categories.get(category_name.lower()) if category_name else None
+    if category_name and category_id is None:
+        raise ValueError(f"Kategorie '{category_name}' nicht gefunden")
+
+    return {
+        "sku": _normalize_sku(sku_raw),
+        "name": name,
+        "barcode": barcode,
+        "category_id": category_id,
+        "target_stock": int(cell("Soll") or 0),
+        "min_stock": int(cell("Min") or 0),
+        "quantity": int(cell("Bestand") or 0),
+        "description": str(cell("Beschreibung") or "").strip(),
+    }
 
 
 @router.post("/settings/test-email", response_model=TestEmailResponse, dependencies=[Depends(require_owner_or_admin)])
@@ -1514,11 +1625,7 @@ async def send_test_email(
     """
     email_settings = await _get_email_settings(db)
     request_id = getattr(request.state, "request_id", None)
-    ok, resolved_ips, ping_error = _smtp_ping(email_settings, request_id)
-    if not ok:
-        return TestEmailResponse(ok=False, error=ping_error)
-
-    ok, error, _resolved = send_email(
+    ok, error, _resolved = await send_email_async(
         email_settings=email_settings,
         recipient=payload.email,
         subject="Test E-Mail Lagerverwaltung",
@@ -1541,7 +1648,7 @@ async def smtp_ping_endpoint(request: Request, db: AsyncSession = Depends(get_db
     """
     email_settings = await _get_email_settings(db)
     request_id = getattr(request.state, "request_id", None)
-    ok, resolved_ips, error = _smtp_ping(email_settings, request_id)
+    ok, resolved_ips, error = await _smtp_ping(email_settings, request_id)
     return inv_schemas.SmtpPingResponse(
         ok=ok,
         error=error,
@@ -1596,23 +1703,24 @@ async def get_reorder_recommendations(
 # ----------------------
 # Bewegungen (Bestandsbuchungen)
 # ----------------------
-@router.get("/movements", response_model=list[MovementOut])
-async def list_movements(
-    start: datetime | None = Query(default=None, description="Startzeitpunkt (inklusive, UTC oder lokal ISO8601)"),
-    end: datetime | None = Query(default=None, description="Endzeitpunkt (inklusive, UTC oder lokal ISO8601)"),
-    movement_type: Literal["IN", "OUT"] | None = Query(default=None, alias="type"),
-    category_id: str | None = Query(default=None),
-    item_ids: list[str] | None = Query(default=None, alias="item_ids"),
-    limit: int = Query(default=200, ge=1, le=1000, description="Maximale Anzahl zurückgegebener Bewegungen"),
-    ctx: TenantContext = Depends(get_tenant_context),
-    user_ctx: CurrentUserContext = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
-) -> list[MovementOut]:
+def movements_query(
+    tenant_id: uuid.UUID,
+    *,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    movement_type: str | None = None,
+    category_id: str | None = None,
+    item_ids: list[str] | None = None,
+    limit: int = 200,
+) -> Select:
+    """
+    Bewegungsliste "neueste zuerst" (nutzt ix_inventory_movements_tenant_created_at).
+    """
     q = (
         select(InventoryMovement, Item, Category)
         .join(Item, InventoryMovement.item_id == Item.id)
         .outerjoin(Category, Category.id == Item.category_id)
-        .where(InventoryMovement.tenant_id == ctx.tenant.id)
+        .where(InventoryMovement.tenant_id == tenant_id)
     )
     if start:
         q = q.where(InventoryMovement.created_at >= start)
@@ -1624,12 +1732,31 @@ async def list_movements(
         q = q.where(Item.category_id == category_id)
     if item_ids:
         q = q.where(Item.id.in_(item_ids))
+    return q.order_by(InventoryMovement.created_at.desc()).limit(limit)
 
-    rows = (
-        await db.execute(
-            q.order_by(InventoryMovement.created_at.desc()).limit(limit)
-        )
-    ).all()
+
+@router.get("/movements", response_model=list[MovementOut])
+async def list_movements(
+    start: datetime | None = Query(default=None, description="Startzeitpunkt (inklusive, UTC oder lokal ISO8601)"),
+    end: datetime | None = Query(default=None, description="Endzeitpunkt (inklusive, UTC oder lokal ISO8601)"),
+    movement_type: Literal["IN", "OUT"] | None = Query(default=None, alias="type"),
+    category_id: str | None = Query(default=None),
+    item_ids: list[str] | None = Query(default=None, alias="item_ids"),
+    limit: int = Query(default=200, ge=1, le=1000, description="Maximale Anzahl zurückgegebener Bewegungen"),
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+) -> list[MovementOut]:
+    q = movements_query(
+        ctx.tenant.id,
+        start=start,
+        end=end,
+        movement_type=movement_type,
+        category_id=category_id,
+        item_ids=item_ids,
+        limit=limit,
+    )
+    rows = (await db.execute(q)).all()
 
     def _movement_to_out(movement: InventoryMovement, item: Item | None) -> MovementOut:
         return MovementOut(
@@ -1685,15 +1812,15 @@ async def create_movement(
         return {"ok": True, "item": _item_out(item, category), "movement_id": str(existing.id), "duplicate": True}
 
     delta = payload.qty if payload.type == "IN" else -payload.qty
-    new_qty = item.quantity + delta
-    if new_qty < 0:
+    new_qty = await apply_stock_delta(db, tenant_id=ctx.tenant.id, item=item, delta=delta)
+    if new_qty is None:
         raise HTTPException(
             status_code=400,
             detail={"error": {"code": "qty_negative", "message": "Bestand würde negativ werden"}},
         )
 
-    item.quantity = new_qty
     movement = InventoryMovement(
+        id=uuid.uuid4(),
         tenant_id=ctx.tenant.id,
         item_id=item.id,
         client_tx_id=payload.client_tx_id,
@@ -1704,14 +1831,213 @@ async def create_movement(
         created_at=payload.created_at or datetime.now(timezone.utc),
     )
     db.add(movement)
+    await record_movement(
+        db,
+        tenant_id=ctx.tenant.id,
+        item_id=item.id,
+        movement_type=movement.type,
+        qty=movement.qty,
+        created_at=movement.created_at,
+    )
     await db.commit()
-    await db.refresh(item)
-    await db.refresh(movement)
 
     category = await db.get(Category, item.category_id) if item.category_id else None
     return {"ok": True, "item": _item_out(item, category), "movement_id": str(movement.id), "duplicate": False}
 
 
+# Wie oft ein Batch bei parallel geänderten Beständen pro Artikel neu geplant wird
+_BATCH_STOCK_ATTEMPTS = 3
+
+
+def _plan_stock_entries(
+    entries: list[tuple[int, MovementPayload]],
+    start_qty: int,
+) -> tuple[list[tuple[int, MovementPayload]], list[int], StockDelta]:
+    """
+    Prüft die Buchungen eines Artikels in Request-Reihenfolge gegen `start_qty`.
+    Liefert (angenommene Einträge, abgelehnte Indizes, Gesamtänderung mit Mindestbestand).
+    """
+    accepted: list[tuple[int, MovementPayload]] = []
+    rejected: list[int] = []
+    running = 0
+    lowest = 0
+    for idx, entry in entries:
+        delta = entry.qty if entry.type == "IN" else -entry.qty
+        if start_qty + running + delta < 0:
+            rejected.append(idx)
+            continue
+        running += delta
+        lowest = min(lowest, running)
+        accepted.append((idx, entry))
+    return accepted, rejected, StockDelta(delta=running, required=-lowest)
+
+
+def _batch_error(entry: MovementPayload, code: str, message: str, item_id: Any = None) -> MovementBatchEntryResult:
+    return MovementBatchEntryResult(
+        client_tx_id=entry.client_tx_id,
+        status="error",
+        item_id=str(item_id) if item_id else None,
+        error_code=code,
+        error_message=message,
+    )
+
+
+@router.post(
+    "/movements/batch",
+    response_model=MovementBatchResponse,
+    dependencies=[Depends(require_owner_or_admin)],
+)
+async def create_movements_batch(
+    payload: MovementBatchRequest,
+    ctx: TenantContext = Depends(get_tenant_context),
+    db: AsyncSession = Depends(get_db),
+) -> MovementBatchResponse:
+    """
+    Bucht viele Bewegungen (z. B. Offline-Queue der Scanner) in einer Transaktion.
+
+    - Barcodes und client_tx_ids werden mengenbasiert aufgelöst (je eine Query)
+    - Einträge werden pro Artikel in Request-Reihenfolge geprüft; Fehler betreffen nur den einzelnen Eintrag
+    - Bestände werden mit einem UPDATE für alle Artikel atomar in SQL fortgeschrieben
+    - Wiederholte client_tx_ids im selben Batch erhalten das Ergebnis des ersten Eintrags
+    """
+    entries = payload.movements
+    barcodes = {entry.barcode.strip() for entry in entries}
+    tx_ids = {entry.client_tx_id for entry in entries}
+
+    items_by_barcode: dict[str, Item] = {}
+    for item in (
+        await db.scalars(select(Item).where(Item.tenant_id == ctx.tenant.id, Item.barcode.in_(barcodes)))
+    ).all():
+        items_by_barcode.setdefault(item.barcode, item)
+
+    known_tx: dict[str, InventoryMovement] = {
+        movement.client_tx_id: movement
+        for movement in (
+            await db.scalars(
+                select(InventoryMovement).where(
+                    InventoryMovement.tenant_id == ctx.tenant.id,
+                    InventoryMovement.client_tx_id.in_(tx_ids),
+                )
+            )
+        ).all()
+    }
+
+    results: list[MovementBatchEntryResult | None] = [None] * len(entries)
+    first_by_tx: dict[str, int] = {}
+    items_by_id: dict[Any, Item] = {}
+    pending: dict[Any, list[tuple[int, MovementPayload]]] = {}
+
+    for idx, entry in enumerate(entries):
+        existing = known_tx.get(entry.client_tx_id)
+        if existing is not None:
+            results[idx] = MovementBatchEntryResult(
+                client_tx_id=entry.client_tx_id,
+                status="duplicate",
+                movement_id=str(existing.id),
+                item_id=str(existing.item_id),
+            )
+            continue
+        if entry.client_tx_id in first_by_tx:
+            continue
+        first_by_tx[entry.client_tx_id] = idx
+
+        item = items_by_barcode.get(entry.barcode.strip())
+        if item is None:
+            results[idx] = _batch_error(entry, "item_not_found", "Artikel zum Barcode nicht gefunden")
+            continue
+        items_by_id[item.id] = item
+        pending.setdefault(item.id, []).append((idx, entry))
+
+    accepted: dict[Any, list[tuple[int, MovementPayload]]] = {}
+    start_qty = {item_id: items_by_id[item_id].quantity for item_id in pending}
+    for _attempt in range(_BATCH_STOCK_ATTEMPTS):
+        if not pending:
+            break
+        plans = {
+            item_id: _plan_stock_entries(item_entries, start_qty[item_id])
+            for item_id, item_entries in pending.items()
+        }
+        applied = await apply_stock_deltas(
+            db,
+            tenant_id=ctx.tenant.id,
+            items=[items_by_id[item_id] for item_id in plans],
+            deltas={item_id: plan[2] for item_id, plan in plans.items()},
+        )
+        for item_id in applied:
+            ok_entries, rejected, _change = plans[item_id]
+            accepted[item_id] = ok_entries
+            for idx in rejected:
+                results[idx] = _batch_error(
+                    entries[idx], "qty_negative", "Bestand würde negativ werden", item_id=item_id
+                )
+        pending = {item_id: item_entries for item_id, item_entries in pending.items() if item_id not in applied}
+        if pending:
+            # Bestand wurde parallel geändert: mit frischem Stand neu planen
+            fresh = await db.execute(select(Item.id, Item.quantity).where(Item.id.in_(list(pending))))
+            start_qty.update({item_id: quantity for item_id, quantity in fresh.all()})
+
+    for item_id, item_entries in pending.items():
+        for idx, entry in item_entries:
+            results[idx] = _batch_error(
+                entry, "concurrent_update", "Bestand wurde parallel geändert, bitte erneut senden", item_id=item_id
+            )
+
+    new_movements: list[InventoryMovement] = []
+    now = datetime.now(timezone.utc)
+    for item_id, ok_entries in accepted.items():
+        item = items_by_id[item_id]
+        for idx, entry in ok_entries:
+            movement = InventoryMovement(
+                id=uuid.uuid4(),
+                tenant_id=ctx.tenant.id,
+                item_id=item.id,
+                client_tx_id=entry.client_tx_id,
+                type=entry.type,
+                barcode=item.barcode,
+                qty=entry.qty,
+                note=entry.note,
+                created_at=entry.created_at or now,
+            )
+            new_movements.append(movement)
+            results[idx] = MovementBatchEntryResult(
+                client_tx_id=entry.client_tx_id,
+                status="ok",
+                movement_id=str(movement.id),
+                item_id=str(item.id),
+            )
+
+    for idx, entry in enumerate(entries):
+        if results[idx] is None:
+            first = results[first_by_tx[entry.client_tx_id]]
+            results[idx] = first.model_copy(update={"status": "duplicate"}) if first.status == "ok" else first
+
+    if new_movements:
+        db.add_all(new_movements)
+        await record_movements(
+            db,
+            tenant_id=ctx.tenant.id,
+            movements=[(m.item_id, m.type, m.qty, m.created_at) for m in new_movements],
+        )
+    await db.commit()
+
+    touched = [items_by_id[item_id] for item_id, ok_entries in accepted.items() if ok_entries]
+    category_ids = {item.category_id for item in touched if item.category_id}
+    categories: dict[Any, Category] = {}
+    if category_ids:
+        categories = {
+            c.id: c for c in (await db.scalars(select(Category).where(Category.id.in_(category_ids)))).all()
+        }
+
+    final_results = [result for result in results if result is not None]
+    return MovementBatchResponse(
+        results=final_results,
+        items=[_item_out(item, categories.get(item.category_id)) for item in touched],
+        applied=sum(1 for r in final_results if r.status == "ok"),
+        duplicates=sum(1 for r in final_results if r.status == "duplicate"),
+        failed=sum(1 for r in final_results if r.status == "error"),
+    )
+
+
 # ----------------------
 # Inventur (Bulk-Update & Export)
 # ----------------------
@@ -1749,46 +2075,44 @@ async def bulk_update_inventory(
 async def export_inventory(
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(read_sessionmaker_for),
 ):
-    rows = (
-        await db.execute(
-            select(Item, Category)
-            .outerjoin(Category, Category.id == Item.category_id)
-            .where(Item.tenant_id == ctx.tenant.id)
-            .order_by(Item.name.asc())
-        )
-    ).all()
+    return xlsx_response(_inventory_export_chunks(ctx.tenant.id, sessionmaker), "inventur.xlsx")
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Inventur"
 
-    headers = ["Artikel-ID", "Name", "Barcode", "Kategorie", "Soll", "Min", "Bestand"]
-    ws.append(headers)
-
-    for item, category in rows:
-        ws.append(
-            [
-                item.sku,
-                item.name,
-                item.barcode,
-                category.name if category else "",
-                item.target_stock,
-                item.min_stock,
-                item.quantity,
-            ]
-        )
+@router.post("/inventory/export/jobs", response_model=JobOut, status_code=202)
+async def enqueue_inventory_export(
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> JobOut:
+    job = await enqueue_job(db, kind="inventory.inventory_export", tenant_id=ctx.tenant.id, actor=user_ctx.user.email)
+    return job_to_out(job)
 
-    buf = BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    filename = "inventur.xlsx"
-    return StreamingResponse(
-        buf,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+
+def _inventory_export_chunks(
+    tenant_id: uuid.UUID, sessionmaker: async_sessionmaker[AsyncSession] | None = None
+) -> AsyncIterator[bytes]:
+    stmt = (
+        select(Item, Category)
+        .outerjoin(Category, Category.id == Item.category_id)
+        .where(Item.tenant_id == tenant_id)
+        .order_by(Item.name.asc())
     )
+    headers = ["Artikel-ID", "Name", "Barcode", "Kategorie", "Soll", "Min", "Bestand"]
+    rows = (
+        [
+            item.sku,
+            item.name,
+            item.barcode,
+            category.name if category else "",
+            item.target_stock,
+            item.min_stock,
+            item.quantity,
+        ]
+        async for item, category in stream_rows(stmt, sessionmaker=sessionmaker)
+    )
+    return xlsx_chunks("Inventur", headers, rows)
 
 
 # ----------------------
@@ -1809,25 +2133,29 @@ CSV_COLUMNS: tuple[str, ...] = (
     "recommended_stock",
     "order_mode",
 )
+# Spalten, die der CSV-Import bei bestehenden Artikeln überschreibt
+_CSV_IMPORT_UPDATE_COLUMNS: tuple[str, ...] = (
+    "barcode",
+    "name",
+    "description",
+    "category_id",
+    "quantity",
+    "unit",
+    "is_active",
+    "min_stock",
+    "max_stock",
+    "target_stock",
+    "recommended_stock",
+    "order_mode",
+)
+# Zeilen pro Block beim CSV-Import (ein Lookup, ein Upsert, ein Commit je Block)
+CSV_IMPORT_CHUNK_SIZE = 1000
 
 
 def _parse_bool(value: str) -> bool:
     return str(value).strip().lower() in {"1", "true", "yes", "y"}
 
 
-async def _category_by_name(
-    *, db: AsyncSession, ctx: TenantContext, name: str | None
-) -> Category | None:
-    if not name:
-        return None
-    return await db.scalar(
-        select(Category).where(
-            func.lower(Category.name) == func.lower(name.strip()),
-            or_(Category.tenant_id == ctx.tenant.id, Category.tenant_id.is_(None)),
-        )
-    )
-
-
 def _validate_order_mode(value: str) -> int:
     try:
         mode = int(value)
@@ -1844,143 +2172,214 @@ async def import_items(
     ctx: TenantContext = Depends(get_tenant_context),
     db: AsyncSession = Depends(get_db),
 ) -> dict:
-    import csv
-    content = await file.read()
-    try:
-        text = content.decode("utf-8-sig")
-    except UnicodeDecodeError:
-        raise HTTPException(status_code=400, detail={"error": {"code": "invalid_encoding", "message": "CSV nicht UTF-8"}})
+    return await _import_items_csv(db, tenant_id=ctx.tenant.id, source=file.file)
 
-    reader = csv.DictReader(text.splitlines())
-    if not reader.fieldnames:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": {"code": "invalid_csv", "message": "CSV hat keine Header-Zeile"}},
-        )
 
-    missing_columns = [col for col in CSV_COLUMNS if col not in reader.fieldnames]
-    if missing_columns:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": {"code": "missing_columns", "message": f"Fehlende Spalten: {', '.join(missing_columns)}"}},
-        )
+@router.post(
+    "/items/import/jobs",
+    response_model=JobOut,
+    status_code=202,
+    dependencies=[Depends(require_owner_or_admin)],
+)
+async def enqueue_items_import(
+    file: UploadFile = File(...),
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> JobOut:
+    """
+    CSV-Import als Hintergrundjob; Status per `GET /inventory/jobs/{id}`.
+    """
+    job = await enqueue_job(
+        db, kind="inventory.items_import", tenant_id=ctx.tenant.id, actor=user_ctx.user.email, upload=file
+    )
+    return job_to_out(job)
 
-    imported = 0
-    updated = 0
-    errors: list[dict[str, str]] = []
 
-    for idx, row in enumerate(reader, start=2):  # Start bei 2 wegen Header
+@job_handler("inventory.items_import")
+async def _run_items_import_job(run: JobRun) -> dict:
+    source = await run.open_input_stream()
+    try:
+        return await _import_items_csv(run.db, tenant_id=run.tenant_id, source=source, on_progress=run.progress)
+    finally:
+        source.close()
+
+
+def _csv_import_row(row: dict[str, Any], categories: dict[str, uuid.UUID]) -> dict[str, Any]:
+    sku_raw = (row.get("sku") or "").strip()
+    barcode = (row.get("barcode") or "").strip()
+    name = (row.get("name") or "").strip()
+    if not sku_raw or not barcode or not name:
+        raise ValueError("sku, barcode und name sind Pflicht")
+
+    category_name = (row.get("category") or "").strip()
+    category_id = categories.get(category_name.lower()) if category_name else None
+    if category_name and category_id is None:
+        raise ValueError(f"Kategorie '{category_name}' nicht gefunden")
+
+    return {
+        "sku": _normalize_sku(sku_raw),
+        "barcode": barcode,
+        "name": name,
+        "description": row.get("description") or "",
+        "category_id": category_id,
+        "quantity": int(row.get("qty") or 0),
+        "unit": row.get("unit") or "pcs",
+        "is_active": _parse_bool(row.get("is_active", "true")),
+        "min_stock": int(row.get("min_stock") or 0),
+        "max_stock": int(row.get("max_stock") or 0),
+        "target_stock": int(row.get("target_stock") or 0),
+        "recommended_stock": int(row.get("recommended_stock") or 0),
+        "order_mode": _validate_order_mode(row.get("order_mode") or "0"),
+    }
+
+
+async def _import_items_csv(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    source: IO[bytes],
+    on_progress: Callable[[int], Awaitable[None]] | None = None,
+) -> dict:
+    """
+    CSV-Import mit konstantem Speicherbedarf: die Datei wird zeilenweise gelesen und blockweise
+    (`CSV_IMPORT_CHUNK_SIZE`) geprüft, geschrieben und committet.
+    """
+    import csv
+
+    invalid_encoding = HTTPException(
+        status_code=400, detail={"error": {"code": "invalid_encoding", "message": "CSV nicht UTF-8"}}
+    )
+    text = TextIOWrapper(source, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text)
         try:
-            sku_raw = row.get("sku", "").strip()
-            barcode = row.get("barcode", "").strip()
-            name = row.get("name", "").strip()
-            if not sku_raw or not barcode or not name:
-                raise ValueError("sku, barcode und name sind Pflicht")
-
-            normalized_sku = _normalize_sku(sku_raw)
-            category_name = row.get("category", "")
-            category = await _category_by_name(db=db, ctx=ctx, name=category_name)
-            if category_name and category is None:
-                raise ValueError(f"Kategorie '{category_name}' nicht gefunden")
-
-            quantity = int(row.get("qty") or 0)
-            unit = row.get("unit") or "pcs"
-            is_active = _parse_bool(row.get("is_active", "true"))
-            min_stock = int(row.get("min_stock") or 0)
-            max_stock = int(row.get("max_stock") or 0)
-            target_stock = int(row.get("target_stock") or 0)
-            recommended_stock = int(row.get("recommended_stock") or 0)
-            order_mode = _validate_order_mode(row.get("order_mode") or "0")
-
-            item = await db.scalar(
-                select(Item).where(Item.tenant_id == ctx.tenant.id, Item.sku == normalized_sku)
+            fieldnames = await asyncio.to_thread(lambda: reader.fieldnames)
+        except UnicodeDecodeError:
+            raise invalid_encoding
+        if not fieldnames:
+            raise HTTPException(
+                status_code=400,
+                detail={"error": {"code": "invalid_csv", "message": "CSV hat keine Header-Zeile"}},
             )
-            if item:
-                if item.is_admin_created:
-                    errors.append({"row": str(idx), "error": "Admin-Artikel sind schreibgeschützt"})
-                    continue
-                item.barcode = barcode
-                item.name = name
-                item.description = row.get("description") or ""
-                item.category_id = category.id if category else None
-                item.quantity = quantity
-                item.unit = unit
-                item.is_active = is_active
-                item.min_stock = min_stock
-                item.max_stock = max_stock
-                item.target_stock = target_stock
-                item.recommended_stock = recommended_stock
-                item.order_mode = order_mode
-                updated += 1
-            else:
-                new_item = Item(
-                    tenant_id=ctx.tenant.id,
-                    sku=normalized_sku,
-                    barcode=barcode,
-                    name=name,
-                    description=row.get("description") or "",
-                    category_id=category.id if category else None,
-                    quantity=quantity,
-                    unit=unit,
-                    is_active=is_active,
-                    min_stock=min_stock,
-                    max_stock=max_stock,
-                    target_stock=target_stock,
-                    recommended_stock=recommended_stock,
-                    order_mode=order_mode,
-                    is_admin_created=False,
-                )
-                db.add(new_item)
-                imported += 1
-        except Exception as e:  # noqa: BLE001
-            errors.append({"row": str(idx), "error": str(e)})
 
-    await db.commit()
+        missing_columns = [col for col in CSV_COLUMNS if col not in fieldnames]
+        if missing_columns:
+            raise HTTPException(
+                status_code=400,
+                detail={"error": {"code": "missing_columns", "message": f"Fehlende Spalten: {', '.join(missing_columns)}"}},
+            )
+
+        categories = await load_category_ids(db, tenant_id=tenant_id)
+        errors: list[dict[str, str]] = []
+        imported = 0
+        updated = 0
+        processed = 0
+        rows = enumerate(reader, start=2)  # Start bei 2 wegen Header
+        while True:
+            try:
+                chunk = await asyncio.to_thread(lambda: list(islice(rows, CSV_IMPORT_CHUNK_SIZE)))
+            except UnicodeDecodeError:
+                raise invalid_encoding
+            if not chunk:
+                break
+            valid_rows: list[tuple[int, dict[str, Any]]] = []
+            for idx, row in chunk:
+                try:
+                    valid_rows.append((idx, _csv_import_row(row, categories)))
+                except Exception as e:  # noqa: BLE001
+                    errors.append({"row": str(idx), "error": str(e)})
+
+            chunk_imported, chunk_updated = await apply_item_rows(
+                db,
+                tenant_id=tenant_id,
+                rows=valid_rows,
+                update_columns=_CSV_IMPORT_UPDATE_COLUMNS,
+                errors=errors,
+            )
+            await db.commit()
+            imported += chunk_imported
+            updated += chunk_updated
+            processed += len(chunk)
+            if on_progress is not None:
+                await on_progress(processed)
+    finally:
+        # Quelle gehört dem Aufrufer
+        text.detach()
+
+    errors.sort(key=lambda error: int(error["row"]))
     return {"imported": imported, "updated": updated, "errors": errors}
 
 
 @router.get("/items/export")
 async def export_items(
+    format: Literal["json", "csv"] = Query(
+        default="json",
+        description="csv: gestreamte CSV-Datei; json: {'csv': ...} (veraltet, nur für Altclients)",
+    ),
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    sessionmaker: async_sessionmaker[AsyncSession] = Depends(read_sessionmaker_for),
+):
+    chunks = _items_csv_chunks(ctx.tenant.id, sessionmaker)
+    if format == "csv":
+        return csv_response(chunks, "items.csv")
+    return {"csv": "".join([chunk async for chunk in chunks])}
+
+
+@router.post("/items/export/jobs", response_model=JobOut, status_code=202)
+async def enqueue_items_export(
     ctx: TenantContext = Depends(get_tenant_context),
     user_ctx: CurrentUserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> dict:
-    import csv
-    from io import StringIO
+) -> JobOut:
+    job = await enqueue_job(db, kind="inventory.items_export", tenant_id=ctx.tenant.id, actor=user_ctx.user.email)
+    return job_to_out(job)
+
 
+def _items_csv_chunks(
+    tenant_id: uuid.UUID, sessionmaker: async_sessionmaker[AsyncSession] | None = None
+) -> AsyncIterator[str]:
+    stmt = (
+        select(Item, Category)
+        .outerjoin(Category, Category.id == Item.category_id)
+        .where(Item.tenant_id == tenant_id)
+        .order_by(Item.name.asc())
+    )
     rows = (
-        await db.scalars(
-            select(Item)
-            .where(Item.tenant_id == ctx.tenant.id)
-            .order_by(Item.name.asc())
-        )
-    ).all()
-    category_ids = {row.category_id for row in rows if row.category_id}
-    categories: dict[Any, Category] = {}
-    if category_ids:
-        cat_rows = (await db.scalars(select(Category).where(Category.id.in_(category_ids)))).all()
-        categories = {c.id: c for c in cat_rows}
+        [
+            item.sku,
+            item.barcode,
+            item.name,
+            item.description,
+            item.quantity,
+            item.unit,
+            item.is_active,
+            category.name if category else "",
+            item.min_stock,
+            item.max_stock,
+            item.target_stock,
+            item.recommended_stock,
+            item.order_mode,
+        ]
+        async for item, category in stream_rows(stmt, sessionmaker=sessionmaker)
+    )
+    return csv_chunks(CSV_COLUMNS, rows)
+
+
+def _register_export_job(
+    kind: str,
+    build: Callable[[uuid.UUID], AsyncIterator[str] | AsyncIterator[bytes]],
+    filename: str,
+    media_type: str,
+) -> None:
+    async def _run(run: JobRun) -> dict:
+        await run.write_result(filename, media_type, build(run.tenant_id))
+        return {"filename": filename}
+
+    job_handler(kind)(_run)
 
-    buf = StringIO()
-    writer = csv.DictWriter(buf, fieldnames=CSV_COLUMNS)
-    writer.writeheader()
-    for item in rows:
-        writer.writerow(
-            {
-                "sku": item.sku,
-                "barcode": item.barcode,
-                "name": item.name,
-                "description": item.description,
-                "qty": item.quantity,
-                "unit": item.unit,
-                "is_active": item.is_active,
-                "category": categories.get(item.category_id).name if item.category_id else "",
-                "min_stock": item.min_stock,
-                "max_stock": item.max_stock,
-                "target_stock": item.target_stock,
-                "recommended_stock": item.recommended_stock,
-                "order_mode": item.order_mode,
-            }
-        )
 
-    return {"csv": buf.getvalue()}
+_register_export_job("inventory.items_export", _items_csv_chunks, "items.csv", "text/csv")
+_register_export_job("inventory.inventory_export", _inventory_export_chunks, "inventur.xlsx", XLSX_MEDIA_TYPE)
+_register_export_job("inventory.settings_export", _settings_export_chunks, "settings_export.xlsx", XLSX_MEDIA_TYPE)
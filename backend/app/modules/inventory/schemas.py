@@ -106,9 +106,11 @@ class ItemOut(ItemBase):
 
 class ItemsPage(BaseModel):
     items: List[ItemOut]
-    total: int
+    # Im Cursor-Modus nur gesetzt, wenn include_total angefragt wurde
+    total: Optional[int] = None
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class SKUExistsResponse(BaseModel):
@@ -165,6 +167,30 @@ class MovementPayload(BaseModel):
         return v
 
 
+class MovementBatchRequest(BaseModel):
+    movements: List[MovementPayload] = Field(..., min_length=1, max_length=1000)
+
+
+class MovementBatchEntryResult(BaseModel):
+    """
+    Ergebnis pro Eintrag, gleiche Reihenfolge wie im Request.
+    """
+    client_tx_id: str
+    status: Literal["ok", "duplicate", "error"]
+    movement_id: Optional[str] = None
+    item_id: Optional[str] = None
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+class MovementBatchResponse(BaseModel):
+    results: List[MovementBatchEntryResult]
+    items: List[ItemOut]
+    applied: int
+    duplicates: int
+    failed: int
+
+
 class InventoryUpdate(BaseModel):
     item_id: str
     quantity: int = Field(..., ge=0)
@@ -367,6 +393,8 @@ class MassImportResult(BaseModel):
     imported: int
     updated: int
     errors: List[dict]
+    processed: int = Field(default=0, description="Gelesene Datenzeilen")
+    chunks: int = Field(default=0, description="Geschriebene (und committete) Blöcke")
 
 
 class TestEmailRequest(BaseModel):
@@ -383,9 +411,17 @@ class OrderEmailRequest(BaseModel):
     note: Optional[str] = Field(default=None, max_length=1024)
 
 
+class OrderPdfBatchRequest(BaseModel):
+    order_ids: List[str] = Field(..., min_length=1)
+    format: Literal["pdf", "zip"] = "pdf"
+
+
 class EmailSendResponse(BaseModel):
     ok: bool
     error: Optional[str] = None
+    # Versand läuft asynchron über die Outbox; ok heißt dann "eingereiht"
+    queued: bool = False
+    outbox_id: Optional[str] = None
 
 
 class SmtpPingResponse(BaseModel):
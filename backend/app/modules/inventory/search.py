@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from sqlalchemy import ColumnElement, Select, func, or_
+
+from app.models.item import Item
+
+# Ab dieser Länge kann pg_trgm den GIN-Index nutzen (ein Trigramm = 3 Zeichen)
+TRGM_MIN_QUERY_LENGTH = 3
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def apply_item_search(
+    base: Select,
+    q: str | None,
+    *,
+    dialect_name: str,
+) -> tuple[Select, ColumnElement | None]:
+    """
+    Wendet die Artikelsuche (SKU, Barcode, Name) auf `base` an.
+
+    Liefert (query, rank). `rank` ist ein Relevanz-Ausdruck für die Sortierung oder None.
+
+    - PostgreSQL: ILIKE wird über die pg_trgm GIN-Indizes (Migration 0018) bedient,
+      Ranking über `similarity()` (höchster Wert aus SKU, Barcode, Name)
+    - Andere Dialekte (SQLite in Tests): reines ILIKE ohne Ranking
+    """
+    q = (q or "").strip()
+    if not q:
+        return base, None
+
+    like = f"%{_escape_like(q)}%"
+    base = base.where(
+        or_(
+            Item.sku.ilike(like, escape="\\"),
+            Item.barcode.ilike(like, escape="\\"),
+            Item.name.ilike(like, escape="\\"),
+        )
+    )
+    if dialect_name != "postgresql" or len(q) < TRGM_MIN_QUERY_LENGTH:
+        return base, None
+
+    rank = func.greatest(
+        func.similarity(Item.sku, q),
+        func.similarity(Item.barcode, q),
+        func.similarity(Item.name, q),
+    )
+    return base, rank
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import case, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.item import Item
+
+
+@dataclass(frozen=True)
+class StockDelta:
+    """
+    Bestandsänderung für einen Artikel.
+
+    `required` ist der Mindestbestand vor der Buchung, damit kein Zwischenstand negativ wird
+    (für eine einzelne Buchung `max(0, -delta)`).
+    """
+
+    delta: int
+    required: int = 0
+
+    @classmethod
+    def single(cls, delta: int) -> "StockDelta":
+        return cls(delta=delta, required=max(0, -delta))
+
+
+async def apply_stock_delta(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    item: Item,
+    delta: int,
+) -> int | None:
+    """
+    Ändert den Bestand atomar in SQL (`quantity = quantity + delta`), ohne vorheriges Lesen.
+    Liefert den neuen Bestand oder None, wenn der Bestand negativ würde.
+    """
+    applied = await apply_stock_deltas(
+        db,
+        tenant_id=tenant_id,
+        items=[item],
+        deltas={item.id: StockDelta.single(delta)},
+    )
+    return applied.get(item.id)
+
+
+async def apply_stock_deltas(
+    db: AsyncSession,
+    *,
+    tenant_id: uuid.UUID,
+    items: list[Item],
+    deltas: dict[uuid.UUID, StockDelta],
+) -> dict[uuid.UUID, int]:
+    """
+    Bulk-Variante: ein UPDATE ... RETURNING für alle Artikel.
+
+    Nur Artikel mit `quantity >= required` werden geändert; der Rückgabewert enthält die neuen
+    Bestände der geänderten Artikel. Fehlende IDs bedeuten, dass der Bestand (inzwischen) nicht
+    reicht. Die übergebenen ORM-Objekte werden ohne Refresh auf den neuen Stand gesetzt.
+    """
+    if not deltas:
+        return {}
+
+    if len(deltas) == 1:
+        ((item_id, change),) = deltas.items()
+        delta_expr = change.delta
+        condition = Item.quantity >= change.required
+        id_filter = Item.id == item_id
+    else:
+        # Vergleich über Item.id, damit die IDs mit dem GUID-Typ gebunden werden
+        delta_expr = case(*((Item.id == item_id, change.delta) for item_id, change in deltas.items()), else_=0)
+        required_expr = case(
+            *((Item.id == item_id, change.required) for item_id, change in deltas.items()), else_=0
+        )
+        condition = Item.quantity >= required_expr
+        id_filter = Item.id.in_(list(deltas))
+
+    stmt = (
+        update(Item)
+        .where(Item.tenant_id == tenant_id, id_filter, condition)
+        .values(quantity=Item.quantity + delta_expr)
+        .returning(Item.id, Item.quantity)
+        .execution_options(synchronize_session=False)
+    )
+    applied = {row_id: quantity for row_id, quantity in (await db.execute(stmt)).all()}
+
+    for item in items:
+        if item.id in applied:
+            set_committed_value(item, "quantity", applied[item.id])
+    return applied
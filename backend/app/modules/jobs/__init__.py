@@ -0,0 +1 @@
+"""Hintergrundjobs (DB-Queue) für lange Importe und Exporte."""
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_db
+from app.core.deps_auth import CurrentUserContext, get_current_user
+from app.core.deps_tenant import get_tenant_context
+from app.core.tenant import TenantContext
+from app.models.background_job import BackgroundJob
+from app.modules.jobs.schemas import JobOut, JobsPage
+from app.modules.admin.backup_storage import iter_object, job_key
+from app.modules.jobs.service import RESULT_FILE, job_storage, job_to_out
+
+# Tenant-Sicht: nur Jobs des eigenen Tenants
+router = APIRouter(prefix="/inventory/jobs", tags=["inventory"])
+# Admin-Sicht (unter /admin eingebunden, Admin-Key über den Eltern-Router)
+admin_router = APIRouter(prefix="/jobs", tags=["admin-system"])
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(
+        status_code=404,
+        detail={"error": {"code": "job_not_found", "message": "Job nicht gefunden"}},
+    )
+
+
+async def _tenant_job_or_404(db: AsyncSession, ctx: TenantContext, job_id: uuid.UUID) -> BackgroundJob:
+    job = await db.get(BackgroundJob, job_id)
+    if job is None or job.tenant_id != ctx.tenant.id:
+        raise _not_found()
+    return job
+
+
+async def _result_response(job: BackgroundJob) -> StreamingResponse:
+    if job.status != "completed" or not job.result_filename:
+        raise HTTPException(
+            status_code=409,
+            detail={"error": {"code": "job_result_unavailable", "message": "Job hat (noch) keine Ergebnisdatei"}},
+        )
+    storage = job_storage()
+    key = job_key(str(job.id), RESULT_FILE)
+    if not await asyncio.to_thread(storage.exists, key):
+        raise HTTPException(
+            status_code=410,
+            detail={"error": {"code": "job_result_gone", "message": "Ergebnisdatei nicht mehr vorhanden"}},
+        )
+    return StreamingResponse(
+        iter_object(storage, key),
+        media_type=job.result_media_type,
+        headers={"Content-Disposition": f'attachment; filename="{job.result_filename}"'},
+    )
+
+
+@router.get("/{job_id}", response_model=JobOut)
+async def get_job(
+    job_id: uuid.UUID,
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> JobOut:
+    """
+    Status und Fortschritt eines Hintergrundjobs (Polling).
+    """
+    job = await _tenant_job_or_404(db, ctx, job_id)
+    return job_to_out(job, result_url=f"/inventory/jobs/{job.id}/result")
+
+
+@router.get("/{job_id}/result")
+async def download_job_result(
+    job_id: uuid.UUID,
+    ctx: TenantContext = Depends(get_tenant_context),
+    user_ctx: CurrentUserContext = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    job = await _tenant_job_or_404(db, ctx, job_id)
+    return await _result_response(job)
+
+
+@admin_router.get("", response_model=JobsPage)
+async def admin_list_jobs(
+    status: str | None = Query(default=None),
+    kind: str | None = Query(default=None),
+    tenant_id: uuid.UUID | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db),
+) -> JobsPage:
+    stmt = select(BackgroundJob)
+    if status:
+        stmt = stmt.where(BackgroundJob.status == status)
+    if kind:
+        stmt = stmt.where(BackgroundJob.kind == kind)
+    if tenant_id:
+        stmt = stmt.where(BackgroundJob.tenant_id == tenant_id)
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+    jobs = (
+        await db.scalars(stmt.order_by(BackgroundJob.created_at.desc()).limit(limit).offset(offset))
+    ).all()
+    return JobsPage(
+        items=[job_to_out(job, result_url=f"/admin/jobs/{job.id}/result") for job in jobs],
+        total=total or 0,
+    )
+
+
+@admin_router.get("/{job_id}", response_model=JobOut)
+async def admin_get_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> JobOut:
+    job = await db.get(BackgroundJob, job_id)
+    if job is None:
+        raise _not_found()
+    return job_to_out(job, result_url=f"/admin/jobs/{job.id}/result")
+
+
+@admin_router.get("/{job_id}/result")
+async def admin_download_job_result(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)) -> StreamingResponse:
+    job = await db.get(BackgroundJob, job_id)
+    if job is None:
+        raise _not_found()
+    return await _result_response(job)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobOut(BaseModel):
+    id: str
+    kind: str
+    status: str = Field(..., description="queued | running | completed | failed")
+    tenant_id: Optional[str] = None
+    processed: int = 0
+    total: Optional[int] = None
+    result: Optional[dict[str, Any]] = None
+    result_url: Optional[str] = Field(default=None, description="Download der Ergebnisdatei (falls vorhanden)")
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class JobsPage(BaseModel):
+    items: List[JobOut]
+    total: int
@@ -0,0 +1,331 @@
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, AsyncIterable, Awaitable, Callable
+
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import get_sessionmaker
+from app.models.background_job import BackgroundJob
+from app.modules.admin.backup_storage import BackupStorage, get_backup_storage, job_key
+from app.modules.jobs.schemas import JobOut
+
+# Ergebnisdatei im Job-Ordner (der Download-Name steht in result_filename)
+RESULT_FILE = "result"
+# Eingabedateien bis zu dieser Größe bleiben beim Öffnen im Speicher, größere als Temp-Datei
+INPUT_SPOOL_BYTES = 8 * 1024 * 1024
+FINISHED_JOB_STATUSES = ("completed", "failed")
+PURGE_BATCH_SIZE = 200
+
+JobHandler = Callable[["JobRun"], Awaitable[dict[str, Any] | None]]
+_HANDLERS: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    Registriert einen Handler für einen Job-Typ. Der Rückgabewert (dict) landet in `result`.
+    """
+
+    def decorator(func: JobHandler) -> JobHandler:
+        _HANDLERS[kind] = func
+        return func
+
+    return decorator
+
+
+def get_job_handler(kind: str) -> JobHandler | None:
+    return _HANDLERS.get(kind)
+
+
+def job_storage() -> BackupStorage:
+    return get_backup_storage(
+        driver=settings.BACKUP_STORAGE_DRIVER,
+        root_path=Path(settings.BACKUP_STORAGE_PATH).resolve(),
+    )
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _input_name(filename: str | None) -> str:
+    # Nur die Endung übernehmen (Handler unterscheiden CSV/XLSX daran), nie den Pfad
+    suffix = Path(filename or "").suffix.lower()
+    return f"input{suffix}" if suffix.isascii() and len(suffix) <= 8 else "input"
+
+
+def _copy_to(source: IO[bytes], storage: BackupStorage, key: str) -> None:
+    source.seek(0)
+    target = storage.open_write(key)
+    try:
+        shutil.copyfileobj(source, target, length=1024 * 1024)
+    except BaseException:
+        target.abort()
+        raise
+    target.close()
+
+
+def _spool_object(storage: BackupStorage, key: str) -> IO[bytes]:
+    spool = tempfile.SpooledTemporaryFile(max_size=INPUT_SPOOL_BYTES)
+    with storage.open_read(key) as source:
+        shutil.copyfileobj(source, spool, length=1024 * 1024)
+    spool.seek(0)
+    return spool
+
+
+@dataclass
+class JobRun:
+    """
+    Laufzeitkontext eines Handlers: eigene DB-Session, Job-Dateien im Storage, Fortschritt.
+    """
+
+    job_id: uuid.UUID
+    kind: str
+    tenant_id: uuid.UUID | None
+    actor: str | None
+    params: dict[str, Any]
+    input_filename: str | None
+    storage: BackupStorage
+    db: AsyncSession
+    result_filename: str | None = field(default=None, init=False)
+    result_media_type: str | None = field(default=None, init=False)
+
+    @property
+    def input_key(self) -> str:
+        return job_key(str(self.job_id), _input_name(self.input_filename))
+
+    async def open_input(self) -> IO[bytes]:
+        """
+        Eingabedatei als seekbarer Stream (openpyxl braucht seek); der Aufrufer schließt ihn.
+        """
+        return await asyncio.to_thread(_spool_object, self.storage, self.input_key)
+
+    async def open_input_stream(self) -> IO[bytes]:
+        """
+        Eingabedatei als sequentieller Stream direkt aus dem Storage (ohne Zwischenkopie);
+        der Aufrufer schließt ihn.
+        """
+        return await asyncio.to_thread(self.storage.open_read, self.input_key)
+
+    async def progress(self, processed: int, total: int | None = None) -> None:
+        """
+        Schreibt den Fortschritt in einer eigenen Transaktion (sofort für Polling sichtbar).
+        """
+        values: dict[str, Any] = {"processed": processed, "heartbeat_at": _now()}
+        if total is not None:
+            values["total"] = total
+        async with get_sessionmaker()() as db:
+            await db.execute(update(BackgroundJob).where(BackgroundJob.id == self.job_id).values(**values))
+            await db.commit()
+
+    async def heartbeat(self) -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(update(BackgroundJob).where(BackgroundJob.id == self.job_id).values(heartbeat_at=_now()))
+            await db.commit()
+
+    async def write_result(self, filename: str, media_type: str, chunks: AsyncIterable[str | bytes]) -> None:
+        """
+        Schreibt eine (gestreamte) Ergebnisdatei in den Job-Ordner.
+        """
+        target = await asyncio.to_thread(self.storage.open_write, job_key(str(self.job_id), RESULT_FILE))
+        try:
+            async for chunk in chunks:
+                data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+                await asyncio.to_thread(target.write, data)
+        except BaseException:
+            await asyncio.to_thread(target.abort)
+            raise
+        await asyncio.to_thread(target.close)
+        self.result_filename = filename
+        self.result_media_type = media_type
+
+
+async def enqueue_job(
+    db: AsyncSession,
+    *,
+    kind: str,
+    tenant_id: uuid.UUID | None = None,
+    actor: str | None = None,
+    params: dict[str, Any] | None = None,
+    upload: UploadFile | None = None,
+) -> BackgroundJob:
+    """
+    Legt einen Job an (Status queued) und kopiert eine hochgeladene Datei in den Job-Ordner.
+    Committet selbst, damit der Worker den Job sofort sieht.
+    """
+    if kind not in _HANDLERS:
+        raise ValueError(f"Unbekannter Job-Typ: {kind}")
+    job = BackgroundJob(
+        id=uuid.uuid4(),
+        kind=kind,
+        status="queued",
+        tenant_id=tenant_id,
+        actor=actor,
+        params=params or {},
+        input_filename=upload.filename if upload is not None else None,
+        processed=0,
+        attempts=0,
+        created_at=_now(),
+    )
+    if upload is not None:
+        key = job_key(str(job.id), _input_name(upload.filename))
+        # UploadFile liegt bereits als Temp-Datei vor: blockweise kopieren statt in den Speicher lesen
+        await asyncio.to_thread(_copy_to, upload.file, job_storage(), key)
+    db.add(job)
+    await db.commit()
+    return job
+
+
+async def claim_next_job(db: AsyncSession, *, worker_id: str) -> BackgroundJob | None:
+    """
+    Übernimmt den ältesten wartenden Job. `FOR UPDATE SKIP LOCKED` (PostgreSQL) plus bedingtes
+    UPDATE sorgen dafür, dass mehrere Worker denselben Job nie doppelt starten.
+    """
+    job_id = await db.scalar(
+        select(BackgroundJob.id)
+        .where(BackgroundJob.status == "queued")
+        .order_by(BackgroundJob.created_at.asc())
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if job_id is None:
+        await db.rollback()
+        return None
+    now = _now()
+    claimed = await db.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job_id, BackgroundJob.status == "queued")
+        .values(
+            status="running",
+            worker_id=worker_id,
+            started_at=now,
+            heartbeat_at=now,
+            attempts=BackgroundJob.attempts + 1,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    if claimed.rowcount != 1:
+        return None
+    return await db.get(BackgroundJob, job_id, populate_existing=True)
+
+
+async def requeue_stale_jobs(db: AsyncSession) -> int:
+    """
+    Laufende Jobs ohne Heartbeat (Worker abgestürzt) werden neu eingeplant bzw. nach
+    `JOB_MAX_ATTEMPTS` Versuchen als fehlgeschlagen markiert.
+    """
+    cutoff = _now() - timedelta(seconds=settings.JOB_HEARTBEAT_TIMEOUT_SECONDS)
+    stale = (BackgroundJob.status == "running") & (BackgroundJob.heartbeat_at < cutoff)
+    failed = await db.execute(
+        update(BackgroundJob)
+        .where(stale, BackgroundJob.attempts >= settings.JOB_MAX_ATTEMPTS)
+        .values(status="failed", finished_at=_now(), error="Worker-Abbruch, maximale Versuche erreicht")
+        .execution_options(synchronize_session=False)
+    )
+    requeued = await db.execute(
+        update(BackgroundJob)
+        .where(stale)
+        .values(status="queued", worker_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return (failed.rowcount or 0) + (requeued.rowcount or 0)
+
+
+async def purge_finished_jobs(db: AsyncSession, *, retention_days: int) -> int:
+    """
+    Löscht abgeschlossene Jobs, die älter als `retention_days` sind, samt Ein-/Ausgabedateien
+    (Uploads und Exporte enthalten komplette Tenant-Bestände). Erst der Storage, dann die Zeile:
+    schlägt das Löschen der Dateien fehl, bleibt der Job für den nächsten Lauf stehen.
+    """
+    cutoff = _now() - timedelta(days=retention_days)
+    storage = job_storage()
+    purged = 0
+    while True:
+        # ix_background_jobs_status_created_at
+        job_ids = list(
+            await db.scalars(
+                select(BackgroundJob.id)
+                .where(BackgroundJob.status.in_(FINISHED_JOB_STATUSES), BackgroundJob.created_at < cutoff)
+                .order_by(BackgroundJob.created_at.asc())
+                .limit(PURGE_BATCH_SIZE)
+            )
+        )
+        if not job_ids:
+            await db.rollback()
+            return purged
+        for job_id in job_ids:
+            await asyncio.to_thread(storage.delete_prefix, job_key(str(job_id), ""))
+        await db.execute(
+            delete(BackgroundJob).where(BackgroundJob.id.in_(job_ids)).execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        purged += len(job_ids)
+        if len(job_ids) < PURGE_BATCH_SIZE:
+            return purged
+
+
+async def finish_job(
+    job_id: uuid.UUID,
+    *,
+    status: str,
+    result: dict[str, Any] | None = None,
+    result_filename: str | None = None,
+    result_media_type: str | None = None,
+    error: str | None = None,
+) -> None:
+    async with get_sessionmaker()() as db:
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id)
+            .values(
+                status=status,
+                result=result,
+                result_filename=result_filename,
+                result_media_type=result_media_type,
+                error=error,
+                finished_at=_now(),
+                heartbeat_at=_now(),
+            )
+        )
+        await db.commit()
+
+
+def error_message(exc: BaseException) -> str:
+    """
+    Fehlertext für den Job-Status; HTTPException-Details im API-Format werden entpackt.
+    """
+    if isinstance(exc, HTTPException):
+        detail = exc.detail
+        if isinstance(detail, dict) and isinstance(detail.get("error"), dict):
+            return str(detail["error"].get("message") or detail["error"].get("code"))
+        return str(detail)
+    return str(exc) or exc.__class__.__name__
+
+
+def job_to_out(job: BackgroundJob, *, result_url: str | None = None) -> JobOut:
+    return JobOut(
+        id=str(job.id),
+        kind=job.kind,
+        status=job.status,
+        tenant_id=str(job.tenant_id) if job.tenant_id else None,
+        processed=job.processed,
+        total=job.total,
+        result=job.result,
+        result_url=result_url if job.status == "completed" and job.result_filename else None,
+        error=job.error,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
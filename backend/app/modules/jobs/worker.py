@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import os
+import socket
+import time
+import uuid
+
+from app.core.config import settings
+from app.core.db import get_sessionmaker
+from app.models.background_job import BackgroundJob
+from app.modules.jobs.service import (
+    JobRun,
+    claim_next_job,
+    error_message,
+    finish_job,
+    get_job_handler,
+    job_storage,
+    purge_finished_jobs,
+    requeue_stale_jobs,
+)
+from app.observability.metrics import background_job_duration_seconds, background_jobs_total
+
+logger = logging.getLogger("app.jobs")
+
+# Module, die beim Import ihre Handler per @job_handler registrieren
+JOB_HANDLER_MODULES = (
+    "app.modules.inventory.routes",
+    "app.modules.admin.inventory_routes",
+)
+
+# Aufräumen alter Jobs läuft nicht in jedem Poll-Zyklus
+PURGE_INTERVAL_SECONDS = 3600.0
+
+_worker_task: asyncio.Task | None = None
+
+
+def load_job_handlers() -> None:
+    for module in JOB_HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def _heartbeat(run: JobRun, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run.heartbeat()
+        except Exception:
+            logger.exception("job heartbeat failed job_id=%s", run.job_id)
+
+
+async def run_job(job: BackgroundJob) -> str:
+    """
+    Führt einen bereits übernommenen Job aus und liefert den Endstatus.
+    """
+    started = time.perf_counter()
+    handler = get_job_handler(job.kind)
+    if handler is None:
+        await finish_job(job.id, status="failed", error=f"Unbekannter Job-Typ: {job.kind}")
+        background_jobs_total.labels(job.kind, "failed").inc()
+        return "failed"
+
+    async with get_sessionmaker()() as db:
+        run = JobRun(
+            job_id=job.id,
+            kind=job.kind,
+            tenant_id=job.tenant_id,
+            actor=job.actor,
+            params=dict(job.params or {}),
+            input_filename=job.input_filename,
+            storage=job_storage(),
+            db=db,
+        )
+        heartbeat = asyncio.create_task(_heartbeat(run, max(settings.JOB_HEARTBEAT_TIMEOUT_SECONDS / 3, 1)))
+        try:
+            summary = await handler(run)
+        except Exception as exc:  # noqa: BLE001
+            await db.rollback()
+            logger.warning("job failed job_id=%s kind=%s error=%s", job.id, job.kind, exc)
+            status = "failed"
+            await finish_job(job.id, status=status, error=error_message(exc))
+        else:
+            status = "completed"
+            await finish_job(
+                job.id,
+                status=status,
+                result=summary,
+                result_filename=run.result_filename,
+                result_media_type=run.result_media_type,
+            )
+        finally:
+            heartbeat.cancel()
+
+    background_jobs_total.labels(job.kind, status).inc()
+    background_job_duration_seconds.labels(job.kind, status).observe(time.perf_counter() - started)
+    return status
+
+
+async def run_pending_jobs(*, worker_id: str | None = None, limit: int | None = None) -> int:
+    """
+    Arbeitet wartende Jobs nacheinander ab, bis die Queue leer ist (oder `limit` erreicht).
+    Liefert die Anzahl ausgeführter Jobs.
+    """
+    worker_id = worker_id or default_worker_id()
+    executed = 0
+    while limit is None or executed < limit:
+        async with get_sessionmaker()() as db:
+            job = await claim_next_job(db, worker_id=worker_id)
+        if job is None:
+            break
+        await run_job(job)
+        executed += 1
+    return executed
+
+
+async def purge_old_jobs() -> int:
+    if settings.JOB_RETENTION_DAYS is None:
+        return 0
+    async with get_sessionmaker()() as db:
+        purged = await purge_finished_jobs(db, retention_days=settings.JOB_RETENTION_DAYS)
+    if purged:
+        logger.info("purged finished jobs count=%s", purged)
+    return purged
+
+
+async def run_job_worker_loop(worker_id: str | None = None) -> None:
+    worker_id = worker_id or f"{default_worker_id()}:{uuid.uuid4().hex[:6]}"
+    next_purge = 0.0
+    while True:
+        try:
+            async with get_sessionmaker()() as db:
+                requeued = await requeue_stale_jobs(db)
+            if requeued:
+                logger.warning("requeued stale jobs count=%s", requeued)
+            if time.monotonic() >= next_purge:
+                next_purge = time.monotonic() + PURGE_INTERVAL_SECONDS
+                await purge_old_jobs()
+            await run_pending_jobs(worker_id=worker_id)
+        except Exception:
+            logger.exception("job worker cycle failed")
+        await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+
+def start_job_worker() -> None:
+    global _worker_task
+    if settings.JOB_WORKER_MODE != "app":
+        return
+    if _worker_task is None or _worker_task.done():
+        _worker_task = asyncio.create_task(run_job_worker_loop())
+
+
+def stop_job_worker() -> None:
+    global _worker_task
+    if _worker_task is not None:
+        _worker_task.cancel()
+        _worker_task = None
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class QueryStats:
+    """
+    Anzahl und Gesamtdauer der SQL-Statements eines Requests.
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+
+
+# Pro Request gesetzt (Middleware); ausserhalb von Requests (Worker, Scheduler) wird nichts gezählt
+_query_stats: ContextVar[QueryStats | None] = ContextVar("db_query_stats", default=None)
+
+
+def start_query_stats() -> tuple[QueryStats, Token]:
+    stats = QueryStats()
+    return stats, _query_stats.set(stats)
+
+
+def stop_query_stats(token: Token) -> None:
+    _query_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _query_stats.get() is not None:
+        context._query_started = time.perf_counter()
+
+
+def _record(context) -> None:
+    stats = _query_stats.get()
+    started = getattr(context, "_query_started", None)
+    if stats is None or started is None:
+        return
+    context._query_started = None
+    stats.count += 1
+    stats.seconds += time.perf_counter() - started
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    _record(context)
+
+
+def _handle_error(exception_context) -> None:
+    # fehlgeschlagene Statements kosten ebenfalls DB-Zeit
+    _record(exception_context.execution_context)
+
+
+def instrument_queries(engine: AsyncEngine) -> None:
+    """
+    Hängt die Statement-Zeitmessung an die Engine. Die Events laufen im Greenlet der Async-Session,
+    das den Context des aufrufenden Tasks übernimmt; so landen die Werte beim richtigen Request.
+    """
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from prometheus_client import CollectorRegistry, Counter, Histogram
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram
 
 # Dedicated registry to avoid default collectors unless needed later.
 metrics_registry = CollectorRegistry()
 
-# Total requests by method/path/status
+# Total requests by method/path/status (path = Route-Template, z.B. /inventory/items/{item_id})
 http_requests_total = Counter(
     "app_requests_total",
     "Total HTTP requests",
@@ -33,6 +33,23 @@ http_request_duration_seconds = Histogram(
     registry=metrics_registry,
 )
 
+# SQL-Statements je Request (Anzahl und summierte DB-Zeit) by method/path
+http_request_db_queries = Histogram(
+    "app_request_db_queries",
+    "Number of SQL statements executed per HTTP request",
+    ["method", "path"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+    registry=metrics_registry,
+)
+
+http_request_db_duration_seconds = Histogram(
+    "app_request_db_duration_seconds",
+    "Total time spent in SQL statements per HTTP request in seconds",
+    ["method", "path"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    registry=metrics_registry,
+)
+
 # Backup job metrics
 backup_jobs_total = Counter(
     "backup_jobs_total",
@@ -55,3 +72,130 @@ backup_job_duration_seconds = Histogram(
     buckets=(5, 10, 30, 60, 120, 300, 600, 1200, 1800),
     registry=metrics_registry,
 )
+
+# Backup je Tenant (innerhalb eines All-Tenant-Jobs)
+backup_tenant_duration_seconds = Histogram(
+    "backup_job_tenant_duration_seconds",
+    "Backup duration per tenant in seconds by attempt outcome",
+    ["status"],
+    buckets=(0.1, 0.5, 1, 2, 5, 10, 30, 60, 120, 300),
+    registry=metrics_registry,
+)
+
+backup_tenant_rows_total = Counter(
+    "backup_job_tenant_rows_total",
+    "Total rows exported by tenant backups",
+    registry=metrics_registry,
+)
+
+backup_tenant_last_duration_seconds = Gauge(
+    "backup_job_tenant_last_duration_seconds",
+    "Duration of the last successful backup per tenant in seconds",
+    ["tenant"],
+    registry=metrics_registry,
+)
+
+backup_tenant_rows_per_second = Gauge(
+    "backup_job_tenant_rows_per_second",
+    "Rows per second of the last successful backup per tenant",
+    ["tenant"],
+    registry=metrics_registry,
+)
+
+backup_restore_rows_total = Counter(
+    "backup_restore_rows_total",
+    "Total rows written by backup restores by table",
+    ["table"],
+    registry=metrics_registry,
+)
+
+# Hintergrundjobs (Import/Export-Worker)
+background_jobs_total = Counter(
+    "background_jobs_total",
+    "Total background jobs by kind and final status",
+    ["kind", "status"],
+    registry=metrics_registry,
+)
+
+background_job_duration_seconds = Histogram(
+    "background_job_duration_seconds",
+    "Background job run time in seconds by kind and final status",
+    ["kind", "status"],
+    buckets=(0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800),
+    registry=metrics_registry,
+)
+
+# E-Mail-Outbox (sent | retry | failed je Zustellversuch)
+email_outbox_deliveries_total = Counter(
+    "email_outbox_deliveries_total",
+    "Email outbox delivery attempts by outcome",
+    ["status"],
+    registry=metrics_registry,
+)
+
+# In-Process Cache Metriken (Hit-Ratio = hit / (hit + miss) pro cache)
+cache_requests_total = Counter(
+    "cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss)",
+    ["cache", "result"],
+    registry=metrics_registry,
+)
+
+cache_entries = Gauge(
+    "cache_entries",
+    "Current number of entries per in-process cache",
+    ["cache"],
+    registry=metrics_registry,
+)
+
+
+# Datenbank-Connection-Pool (engine = primary | ...)
+db_pool_checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection in seconds",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+    registry=metrics_registry,
+)
+
+db_pool_checkout_timeouts_total = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Total database connection checkouts that timed out (pool exhausted)",
+    ["engine"],
+    registry=metrics_registry,
+)
+
+db_pool_size = Gauge(
+    "db_pool_size",
+    "Configured number of persistent connections in the pool",
+    ["engine"],
+    registry=metrics_registry,
+)
+
+db_pool_connections_in_use = Gauge(
+    "db_pool_connections_in_use",
+    "Database connections currently checked out",
+    ["engine"],
+    registry=metrics_registry,
+)
+
+db_pool_connections_idle = Gauge(
+    "db_pool_connections_idle",
+    "Database connections idle in the pool",
+    ["engine"],
+    registry=metrics_registry,
+)
+
+db_read_sessions_total = Counter(
+    "db_read_sessions_total",
+    "Sessions opened by read-only endpoints by target database",
+    ["target"],
+    registry=metrics_registry,
+)
+
+db_pool_overflow = Gauge(
+    "db_pool_overflow",
+    "Database connections currently open beyond the pool size",
+    ["engine"],
+    registry=metrics_registry,
+)
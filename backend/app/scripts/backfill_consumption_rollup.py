@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from sqlalchemy import select
+
+from app.core.db import get_sessionmaker
+from app.models.tenant import Tenant
+from app.modules.inventory.rollup import rebuild_consumption_rollup
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Monats-Rollup (Verbrauch) aus inventory_movements neu aufbauen")
+    parser.add_argument("--tenant", help="Tenant-Slug; ohne Angabe werden alle Tenants neu aufgebaut")
+    args = parser.parse_args()
+
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        tenant_id = None
+        if args.tenant:
+            tenant_id = await db.scalar(select(Tenant.id).where(Tenant.slug == args.tenant))
+            if tenant_id is None:
+                raise SystemExit(f"Tenant '{args.tenant}' nicht gefunden")
+        written = await rebuild_consumption_rollup(db, tenant_id=tenant_id)
+        await db.commit()
+        print(f"Rollup neu aufgebaut: {written} Monatszeilen ({args.tenant or 'alle Tenants'}).")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
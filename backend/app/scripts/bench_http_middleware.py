@@ -0,0 +1,149 @@
+"""
+Benchmark des HTTP-Middleware-Stacks (Requests/Sekunde, in-process über ASGI).
+
+Vergleicht den bisherigen Stack aus drei `@app.middleware("http")`-Funktionen (BaseHTTPMiddleware,
+hier nachgebaut als "before") mit der reinen ASGI-Middleware `RequestContextMiddleware` ("after"),
+jeweils für `/meta` und den gestreamten CSV-Export `/inventory/items/export?format=csv`.
+Tenant, User und Artikel werden über die Admin-/Inventory-API angelegt. Das Access-Log wird
+während der Messung auf WARNING gestellt, damit die Ausgabe nicht das Ergebnis verfälscht.
+
+Aufruf (nur gegen eine Test-/Benchmark-DB!):
+    python -m app.scripts.bench_http_middleware --requests 2000 --concurrency 20 --items 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+
+import httpx
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.config import settings
+from app.core.db import has_read_replica, init_models, is_sqlite_database
+from app.core.middleware import RequestContextMiddleware
+from app.core.read_routing import is_write_request, mark_client_wrote
+from app.core.security import create_access_token
+from app.main import create_app
+from app.observability.metrics import http_request_duration_seconds, http_requests_total
+
+
+async def _legacy_request_id(request: Request, call_next):
+    request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
+    request.state.request_id = request_id
+    response = await call_next(request)
+    response.headers["X-Request-Id"] = request_id
+    return response
+
+
+async def _legacy_read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    if has_read_replica() and is_write_request(request.method) and response.status_code < 400:
+        cookie = mark_client_wrote(request.headers)
+        if cookie is not None:
+            response.headers.append("set-cookie", cookie)
+    return response
+
+
+async def _legacy_logging(request: Request, call_next):
+    start = time.perf_counter()
+    status_code: int | str = "error"
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        duration = time.perf_counter() - start
+        http_requests_total.labels(request.method, request.url.path, str(status_code)).inc()
+        http_request_duration_seconds.labels(request.method, request.url.path, str(status_code)).observe(duration)
+        logging.getLogger("app.request").info("request %s %s -> %s", request.method, request.url.path, status_code)
+
+
+def _build_app(variant: str) -> FastAPI:
+    app = create_app()
+    if variant == "before":
+        app.user_middleware = [m for m in app.user_middleware if m.cls is not RequestContextMiddleware]
+        for dispatch in (_legacy_request_id, _legacy_read_your_writes, _legacy_logging):
+            app.add_middleware(BaseHTTPMiddleware, dispatch=dispatch)
+    return app
+
+
+async def _prepare_tenant(client: httpx.AsyncClient, items: int) -> dict[str, str]:
+    admin = {"X-Admin-Key": settings.ADMIN_API_KEY, "X-Admin-Actor": "bench"}
+    slug = f"bench{uuid.uuid4().hex[:8]}"
+    r_tenant = await client.post("/admin/tenants", headers=admin, json={"slug": slug, "name": f"Benchmark {slug}"})
+    r_tenant.raise_for_status()
+    tenant_id = r_tenant.json()["id"]
+    r_user = await client.post(
+        f"/admin/tenants/{tenant_id}/users",
+        headers=admin,
+        json={
+            "email": f"{slug}@example.com",
+            "role": "staff",
+            "password": "BenchmarkPW123!",
+            "user_is_active": True,
+            "membership_is_active": True,
+        },
+    )
+    r_user.raise_for_status()
+    # Rolle kommt aus dem Token (owner darf Artikel anlegen)
+    token, _expires = create_access_token(subject=r_user.json()["user_id"], tenant_id=tenant_id, role="owner")
+    headers = {"Authorization": f"Bearer {token}", "X-Tenant-Slug": slug}
+    for idx in range(items):
+        r_item = await client.post(
+            "/inventory/items",
+            headers=headers,
+            json={"sku": f"b{idx:05d}", "barcode": f"b{idx:05d}", "name": f"Bench {idx}", "quantity": idx},
+        )
+        r_item.raise_for_status()
+    return headers
+
+
+async def _measure(
+    client: httpx.AsyncClient, url: str, headers: dict[str, str], requests: int, concurrency: int
+) -> float:
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark des HTTP-Middleware-Stacks")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--items", type=int, default=500, help="Artikel im Export")
+    args = parser.parse_args()
+
+    if is_sqlite_database():
+        await init_models()
+    apps = {variant: _build_app(variant) for variant in ("before", "after")}
+    logging.getLogger("app.request").setLevel(logging.WARNING)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=apps["after"]), base_url="http://bench") as client:
+        headers = await _prepare_tenant(client, args.items)
+
+    targets = {"/meta": {}, "/inventory/items/export?format=csv": headers}
+    for url, url_headers in targets.items():
+        for variant, app in apps.items():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                await _measure(client, url, url_headers, min(100, args.requests), args.concurrency)  # Warmup
+                rps = await _measure(client, url, url_headers, args.requests, args.concurrency)
+            print(f"{variant:<7} {url:<40} {rps:10.1f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
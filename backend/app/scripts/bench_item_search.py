@@ -0,0 +1,125 @@
+"""
+Benchmark für die Artikelsuche (GET /inventory/items?q=...).
+
+Legt einen Benchmark-Tenant mit N Artikeln an (falls noch nicht vorhanden) und misst
+p50/p95 der Such-Query einmal mit den pg_trgm-Indizes ("after") und einmal ohne
+("before", Indizes werden in einer Transaktion gedroppt und per Rollback wiederhergestellt).
+
+Aufruf (nur gegen eine Test-/Benchmark-DB!):
+    python -m app.scripts.bench_item_search --items 100000 --runs 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import string
+import time
+import uuid
+
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_sessionmaker
+from app.models.item import Item
+from app.models.tenant import Tenant
+from app.modules.inventory.pagination import paginate_items
+from app.modules.inventory.search import apply_item_search
+
+TRGM_INDEXES = ("ix_items_sku_trgm", "ix_items_barcode_trgm", "ix_items_name_trgm")
+WORDS = [
+    "Schraube", "Mutter", "Dübel", "Kabel", "Stecker", "Filter", "Dichtung", "Schlauch",
+    "Handschuh", "Klebeband", "Batterie", "Lampe", "Schalter", "Ventil", "Rohr", "Bürste",
+]
+QUERIES = ["schraub", "kabel 3", "Z_0042", "dichtung", "4006381", "lampe led", "ventil"]
+
+
+def _random_name(rng: random.Random) -> str:
+    size = rng.choice(["M4", "M6", "M8", "3m", "5m", "LED", "XL", "12V"])
+    return f"{rng.choice(WORDS)} {size} {''.join(rng.choices(string.ascii_uppercase, k=3))}"
+
+
+async def _ensure_tenant(db: AsyncSession, slug: str, items: int, seed: int) -> uuid.UUID:
+    tenant = await db.scalar(select(Tenant).where(Tenant.slug == slug))
+    if tenant is None:
+        tenant = Tenant(slug=slug, name=f"Benchmark {slug}", is_active=True)
+        db.add(tenant)
+        await db.flush()
+
+    existing = await db.scalar(select(Item.id).where(Item.tenant_id == tenant.id).limit(1))
+    if existing is None:
+        rng = random.Random(seed)
+        batch: list[dict] = []
+        for idx in range(items):
+            batch.append(
+                {
+                    "id": uuid.uuid4(),
+                    "tenant_id": tenant.id,
+                    "sku": f"z_{idx:07d}",
+                    "barcode": f"4006381{idx:06d}",
+                    "name": _random_name(rng),
+                    "description": "",
+                    "quantity": rng.randint(0, 500),
+                    "unit": "pcs",
+                    "is_active": True,
+                }
+            )
+            if len(batch) >= 5000:
+                await db.execute(insert(Item), batch)
+                batch.clear()
+        if batch:
+            await db.execute(insert(Item), batch)
+        await db.execute(text("ANALYZE items"))
+    await db.commit()
+    return tenant.id
+
+
+async def _measure(db: AsyncSession, tenant_id: uuid.UUID, runs: int) -> list[float]:
+    dialect_name = db.get_bind().dialect.name
+    timings: list[float] = []
+    for run in range(runs):
+        q = QUERIES[run % len(QUERIES)]
+        base = select(Item).where(Item.tenant_id == tenant_id, Item.is_active.is_(True))
+        base, rank = apply_item_search(base, q, dialect_name=dialect_name)
+        started = time.perf_counter()
+        await paginate_items(
+            db, base, page=1, page_size=50, paging="offset", cursor=None, include_total=True, rank=rank
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{label:<8} runs={len(ordered):<4} p50={statistics.median(ordered):8.2f}ms p95={p95:8.2f}ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark der Artikelsuche")
+    parser.add_argument("--slug", default="bench-search")
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        if db.get_bind().dialect.name != "postgresql":
+            raise SystemExit("Benchmark benötigt PostgreSQL (pg_trgm)")
+        tenant_id = await _ensure_tenant(db, args.slug, args.items, args.seed)
+
+        await _measure(db, tenant_id, 5)  # Warmup
+        _report("after", await _measure(db, tenant_id, args.runs))
+
+        # "before": Trigram-Indizes nur innerhalb dieser Transaktion entfernen
+        for index_name in TRGM_INDEXES:
+            await db.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        _report("before", await _measure(db, tenant_id, args.runs))
+        await db.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+"""
+Benchmark für Bewegungs-Queries (Liste "neueste zuerst" und Verbrauchsaggregation).
+
+Erzeugt per `generate_series` serverseitig Millionen Bewegungen für einen Benchmark-Tenant
+(falls noch nicht vorhanden) und misst p50/p95 sowie den Plan (EXPLAIN ANALYZE) der
+typischen Queries aus `list_movements` und dem Reporting.
+
+Aufruf (nur gegen eine Test-/Benchmark-DB!):
+    python -m app.scripts.bench_movements --movements 2000000 --items 2000 --runs 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.db import get_sessionmaker
+from app.models.tenant import Tenant
+
+QUERIES = {
+    "list_latest": """
+        SELECT id, item_id, type, qty, created_at
+        FROM inventory_movements
+        WHERE tenant_id = :tenant_id
+        ORDER BY created_at DESC
+        LIMIT 200
+    """,
+    "list_out_range": """
+        SELECT id, item_id, qty, created_at
+        FROM inventory_movements
+        WHERE tenant_id = :tenant_id AND type = 'OUT' AND created_at >= :start AND created_at <= :end
+        ORDER BY created_at DESC
+        LIMIT 200
+    """,
+    "consumption_90d": """
+        SELECT item_id, SUM(qty)
+        FROM inventory_movements
+        WHERE tenant_id = :tenant_id AND type = 'OUT' AND created_at >= :start AND created_at < :end
+        GROUP BY item_id
+    """,
+}
+
+
+async def _ensure_data(db: AsyncSession, slug: str, movements: int, items: int) -> uuid.UUID:
+    tenant_id = await db.scalar(select(Tenant.id).where(Tenant.slug == slug))
+    if tenant_id is None:
+        tenant = Tenant(slug=slug, name=f"Benchmark {slug}", is_active=True)
+        db.add(tenant)
+        await db.flush()
+        tenant_id = tenant.id
+
+    existing = await db.scalar(
+        text("SELECT count(*) FROM inventory_movements WHERE tenant_id = :tenant_id"),
+        {"tenant_id": tenant_id},
+    )
+    if not existing:
+        await db.execute(
+            text(
+                """
+                INSERT INTO items (id, tenant_id, sku, barcode, name, description, quantity, min_stock,
+                                   max_stock, target_stock, recommended_stock, order_mode, unit,
+                                   is_active, is_admin_created)
+                SELECT gen_random_uuid(), :tenant_id, 'z_bench' || g, 'bench' || g, 'Bench Artikel ' || g, '',
+                       0, 0, 0, 0, 0, 0, 'pcs', true, false
+                FROM generate_series(1, :items) AS g
+                """
+            ),
+            {"tenant_id": tenant_id, "items": items},
+        )
+        # Bewegungen gleichmäßig über ~3 Jahre verteilt, 70 % OUT
+        await db.execute(
+            text(
+                """
+                WITH item_ids AS (
+                    SELECT array_agg(id) AS ids FROM items WHERE tenant_id = :tenant_id
+                )
+                INSERT INTO inventory_movements (id, tenant_id, item_id, client_tx_id, type, barcode, qty, created_at)
+                SELECT gen_random_uuid(), :tenant_id, ids[1 + (g % array_length(ids, 1))], 'bench-' || g,
+                       CASE WHEN g % 10 < 7 THEN 'OUT' ELSE 'IN' END, '', 1 + (g % 20),
+                       now() - (g % (3 * 365 * 24 * 60)) * interval '1 minute'
+                FROM generate_series(1, :movements) AS g, item_ids
+                """
+            ),
+            {"tenant_id": tenant_id, "movements": movements},
+        )
+        await db.execute(text("ANALYZE inventory_movements"))
+    await db.commit()
+    return tenant_id
+
+
+def _report(label: str, timings: list[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(f"{label:<16} runs={len(ordered):<4} p50={statistics.median(ordered):8.2f}ms p95={p95:8.2f}ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark der Bewegungs-Queries")
+    parser.add_argument("--slug", default="bench-movements")
+    parser.add_argument("--movements", type=int, default=2_000_000)
+    parser.add_argument("--items", type=int, default=2_000)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--explain", action="store_true", help="EXPLAIN (ANALYZE, BUFFERS) je Query ausgeben")
+    args = parser.parse_args()
+
+    sessionmaker = get_sessionmaker()
+    async with sessionmaker() as db:
+        if db.get_bind().dialect.name != "postgresql":
+            raise SystemExit("Benchmark benötigt PostgreSQL")
+        tenant_id = await _ensure_data(db, args.slug, args.movements, args.items)
+
+        now = datetime.now(timezone.utc)
+        params = {"tenant_id": tenant_id, "start": now - timedelta(days=90), "end": now}
+        for name, sql in QUERIES.items():
+            timings: list[float] = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                await db.execute(text(sql), params)
+                timings.append((time.perf_counter() - started) * 1000)
+            _report(name, timings)
+            if args.explain:
+                plan = (await db.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"), params)).scalars().all()
+                print("\n".join(plan))
+        await db.rollback()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
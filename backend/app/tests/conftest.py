@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.security import create_access_token
+from app.main import app
+from app.tests.helpers import admin_headers
+
+
+@dataclass
+class TenantSession:
+    tenant_id: str
+    slug: str
+    user_id: str
+    membership_id: str
+    headers: dict[str, str]
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(app)
+
+
+@pytest.fixture
+def tenant_session(client: TestClient):
+    """
+    Legt Tenant + User über die Admin API an und liefert Header mit Access Token.
+    Die Rolle kommt aus dem Token, damit auch owner/admin-Routen testbar sind.
+    """
+
+    def _create(role: str = "owner") -> TenantSession:
+        slug = f"t{uuid.uuid4().hex[:10]}"
+        r_tenant = client.post("/admin/tenants", headers=admin_headers(), json={"slug": slug, "name": f"Tenant {slug}"})
+        assert r_tenant.status_code == 201, r_tenant.text
+        tenant_id = r_tenant.json()["id"]
+
+        r_user = client.post(
+            f"/admin/tenants/{tenant_id}/users",
+            headers=admin_headers(),
+            json={
+                "email": f"{slug}@example.com",
+                "role": "staff",
+                "password": "VeryStrongPW123!",
+                "user_is_active": True,
+                "membership_is_active": True,
+            },
+        )
+        assert r_user.status_code == 201, r_user.text
+        user = r_user.json()
+
+        token, _expires = create_access_token(subject=user["user_id"], tenant_id=tenant_id, role=role)
+        return TenantSession(
+            tenant_id=tenant_id,
+            slug=slug,
+            user_id=user["user_id"],
+            membership_id=user["membership_id"],
+            headers={"Authorization": f"Bearer {token}", "X-Tenant-Slug": slug},
+        )
+
+    return _create
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from app.core.config import settings
+
+
+def admin_headers(actor: str = "pytest") -> dict[str, str]:
+    return {
+        "X-Admin-Key": settings.ADMIN_API_KEY,
+        "X-Admin-Actor": actor,
+        "Content-Type": "application/json",
+    }
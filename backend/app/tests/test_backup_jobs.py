@@ -0,0 +1,490 @@
+from __future__ import annotations
+
+import gzip
+import json
+import uuid
+import zipfile
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from sqlalchemy import delete, select, update
+
+import app.modules.admin.backups_routes as backups
+from app.core.config import settings
+from app.core.db import get_sessionmaker
+from app.models.backup import BackupJob, BackupRecord
+from app.models.item import Item
+from app.models.movement import InventoryMovement
+from app.modules.admin import backup_index
+from app.tests.helpers import admin_headers
+
+
+@pytest.fixture(autouse=True)
+def _backup_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "BACKUP_STORAGE_PATH", str(tmp_path))
+    monkeypatch.setattr(settings, "BACKUP_JOB_CONCURRENCY", 3)
+    monkeypatch.setattr(settings, "BACKUP_JOB_MAX_RETRIES", 1)
+    monkeypatch.setattr(settings, "BACKUP_JOB_RETRY_DELAY_SECONDS", 0)
+
+
+async def _run_job() -> dict:
+    async with get_sessionmaker()() as db:
+        job = await backup_index.create_job(db, kind="full", trigger="manual")
+        await db.commit()
+    await backups._run_backup_job(job.id, "pytest")
+    async with get_sessionmaker()() as db:
+        job = await backup_index.get_job(db, job.id)
+        backup_ids = await backup_index.job_backup_ids(db, [job.id])
+        return backups._build_job(job, backup_ids.get(job.id)).model_dump()
+
+
+def test_all_tenants_backup_runs_in_parallel_and_isolates_failures(client, tenant_session, monkeypatch):
+    sessions = [tenant_session() for _ in range(4)]
+    broken = uuid.UUID(sessions[0].tenant_id)
+    calls: dict[uuid.UUID, int] = {}
+    export = backups._export_tenant_tables
+
+    async def flaky_export(db, tenant_id, backup_id, **kwargs):
+        calls[tenant_id] = calls.get(tenant_id, 0) + 1
+        if tenant_id == broken:
+            raise RuntimeError("export kaputt")
+        return await export(db, tenant_id, backup_id, **kwargs)
+
+    monkeypatch.setattr(backups, "_export_tenant_tables", flaky_export)
+
+    with client:
+        job = client.portal.call(_run_job)
+
+    assert job["status"] == "completed_with_errors"
+    assert job["processed"] == job["total"] - 1
+    assert job["failed"] == 1
+    assert len(job["backup_ids"]) == job["processed"]
+    # Retries nur für den fehlerhaften Tenant
+    assert calls[broken] == 2
+    assert all(count == 1 for tenant_id, count in calls.items() if tenant_id != broken)
+
+    # Alle parallel geschriebenen Backups landen im Index
+    r_list = client.get("/admin/backups", headers=admin_headers(), params={"limit": 500})
+    indexed = {item["id"] for item in r_list.json()["items"]}
+    assert set(job["backup_ids"]) <= indexed
+    r_job = client.get(f"/admin/backups/jobs/{job['id']}", headers=admin_headers())
+    assert r_job.json()["failed_tenants"] == job["failed_tenants"]
+
+
+def test_tenant_backup_is_streamed_ndjson_gzip_and_restorable(client, tenant_session):
+    session = tenant_session()
+    for idx in range(3):
+        r = client.post(
+            "/inventory/items",
+            headers=session.headers,
+            json={"sku": f"bk{idx}", "barcode": f"bk{idx}", "name": f"Backup {idx}", "quantity": idx},
+        )
+        assert r.status_code == 200, r.text
+
+    r_backup = client.post(f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers())
+    assert r_backup.status_code == 200, r_backup.text
+    backup = r_backup.json()["backup"]
+    names = {entry["name"] for entry in backup["files"]}
+    assert {"meta.json", "tenant.json", "items.ndjson.gz"} <= names
+
+    folder = Path(settings.BACKUP_STORAGE_PATH) / backup["id"]
+    meta = json.loads((folder / "meta.json").read_text(encoding="utf-8"))
+    assert meta["format"] == "ndjson-gzip-v2"
+    assert meta["table_counts"]["items"] == 3
+    assert meta["files"]["items.ndjson.gz"]["rows"] == 3
+    with gzip.open(folder / "items.ndjson.gz", "rt", encoding="utf-8") as fh:
+        assert sorted(json.loads(line)["name"] for line in fh) == ["Backup 0", "Backup 1", "Backup 2"]
+
+    r_restore = client.post(f"/admin/backups/{backup['id']}/restore", headers=admin_headers())
+    assert r_restore.status_code == 200, r_restore.text
+
+    r_zip = client.get(f"/admin/backups/{backup['id']}/download", headers=admin_headers())
+    assert r_zip.status_code == 200
+    assert "items.ndjson.gz" in zipfile.ZipFile(BytesIO(r_zip.content)).namelist()
+
+    # Manipulierte Datei fällt bei der Prüfsummenprüfung auf
+    (folder / "items.ndjson.gz").write_bytes(gzip.compress(b'{"sku":"x"}\n'))
+    r_broken = client.post(f"/admin/backups/{backup['id']}/restore", headers=admin_headers())
+    assert r_broken.status_code == 400
+
+
+def test_incremental_backup_contains_changes_and_restores_chain(client, tenant_session):
+    session = tenant_session()
+    item_ids = []
+    for idx in range(3):
+        r = client.post(
+            "/inventory/items",
+            headers=session.headers,
+            json={"sku": f"inc{idx}", "barcode": f"inc{idx}", "name": f"Inkrement {idx}", "quantity": idx},
+        )
+        assert r.status_code == 200, r.text
+        item_ids.append(r.json()["id"])
+
+    r_full = client.post(
+        f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers(), params={"kind": "incremental"}
+    )
+    assert r_full.status_code == 200, r_full.text
+    full = r_full.json()["backup"]
+    # ohne Vorgänger wird ein Voll-Backup angelegt
+    assert full["kind"] == "full"
+
+    # Snapshot des Voll-Backups vor die Änderungen legen (Überlappungsfenster überspringen)
+    async def _backdate_snapshot(backup_id: str) -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(
+                update(BackupRecord)
+                .where(BackupRecord.id == uuid.UUID(backup_id))
+                .values(snapshot_at=datetime(2000, 1, 1, tzinfo=timezone.utc))
+            )
+            await db.commit()
+
+    with client:
+        client.portal.call(_backdate_snapshot, full["id"])
+
+    async def _age_items() -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(Item.__table__.update().values(updated_at=datetime(1999, 1, 1, tzinfo=timezone.utc)))
+            await db.commit()
+
+    async def _delete_item(item_id: str) -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(delete(Item).where(Item.id == uuid.UUID(item_id)))
+            await db.commit()
+
+    with client:
+        client.portal.call(_age_items)
+    r_patch = client.patch(f"/inventory/items/{item_ids[0]}", headers=session.headers, json={"name": "Geändert"})
+    assert r_patch.status_code == 200, r_patch.text
+    with client:
+        client.portal.call(_delete_item, item_ids[1])
+    r_new = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "inc3", "barcode": "inc3", "name": "Inkrement 3", "quantity": 3},
+    )
+    assert r_new.status_code == 200, r_new.text
+
+    r_inc = client.post(
+        f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers(), params={"kind": "incremental"}
+    )
+    assert r_inc.status_code == 200, r_inc.text
+    inc = r_inc.json()["backup"]
+    assert inc["kind"] == "incremental"
+    assert inc["parent_id"] == full["id"]
+
+    folder = Path(settings.BACKUP_STORAGE_PATH) / inc["id"]
+    with gzip.open(folder / "items.ndjson.gz", "rt", encoding="utf-8") as fh:
+        assert sorted(json.loads(line)["name"] for line in fh) == ["Geändert", "Inkrement 3"]
+    with gzip.open(folder / "items.keys.ndjson.gz", "rt", encoding="utf-8") as fh:
+        assert len(fh.readlines()) == 3
+
+    r_restore = client.post(f"/admin/backups/{inc['id']}/restore", headers=admin_headers())
+    assert r_restore.status_code == 200, r_restore.text
+    r_items = client.get("/inventory/items", headers=session.headers, params={"page_size": 50})
+    assert sorted(item["name"] for item in r_items.json()["items"]) == ["Geändert", "Inkrement 2", "Inkrement 3"]
+
+    # Ohne Voll-Backup ist die Kette nicht wiederherstellbar
+    async def _drop_backup(backup_id: str) -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(delete(BackupRecord).where(BackupRecord.id == uuid.UUID(backup_id)))
+            await db.commit()
+
+    with client:
+        client.portal.call(_drop_backup, full["id"])
+    r_broken = client.post(f"/admin/backups/{inc['id']}/restore", headers=admin_headers())
+    assert r_broken.status_code == 400
+
+
+def test_incremental_backup_includes_backdated_movements(client, tenant_session):
+    session = tenant_session()
+    r_item = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "bd1", "barcode": "bd1", "name": "Rückdatiert", "quantity": 5},
+    )
+    assert r_item.status_code == 200, r_item.text
+
+    r_full = client.post(
+        f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers(), params={"kind": "incremental"}
+    )
+    assert r_full.status_code == 200, r_full.text
+    full = r_full.json()["backup"]
+    assert full["kind"] == "full"
+
+    # Offline-Replay: created_at liegt weit vor dem Snapshot des Voll-Backups
+    r_move = client.post(
+        "/inventory/movements",
+        headers=session.headers,
+        json={
+            "client_tx_id": "offline-1",
+            "type": "OUT",
+            "barcode": "bd1",
+            "qty": 2,
+            "created_at": "2001-01-01T08:00:00+00:00",
+        },
+    )
+    assert r_move.status_code == 200, r_move.text
+
+    r_inc = client.post(
+        f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers(), params={"kind": "incremental"}
+    )
+    assert r_inc.status_code == 200, r_inc.text
+    inc = r_inc.json()["backup"]
+    assert inc["kind"] == "incremental"
+    folder = Path(settings.BACKUP_STORAGE_PATH) / inc["id"]
+    with gzip.open(folder / "inventory_movements.ndjson.gz", "rt", encoding="utf-8") as fh:
+        assert [json.loads(line)["client_tx_id"] for line in fh] == ["offline-1"]
+
+    r_restore = client.post(f"/admin/backups/{inc['id']}/restore", headers=admin_headers())
+    assert r_restore.status_code == 200, r_restore.text
+
+    async def _movement_qtys() -> list[int]:
+        async with get_sessionmaker()() as db:
+            rows = await db.scalars(
+                select(InventoryMovement.qty).where(InventoryMovement.tenant_id == uuid.UUID(session.tenant_id))
+            )
+            return list(rows)
+
+    with client:
+        assert client.portal.call(_movement_qtys) == [2]
+
+
+def test_incremental_backup_after_restore_starts_new_chain(client, tenant_session):
+    session = tenant_session()
+    r_item = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "rc1", "barcode": "rc1", "name": "A", "quantity": 1},
+    )
+    assert r_item.status_code == 200, r_item.text
+    item_id = r_item.json()["id"]
+
+    # Änderungszeitpunkt ausserhalb des Überlappungsfensters späterer Deltas
+    async def _age_item() -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(
+                update(Item)
+                .where(Item.id == uuid.UUID(item_id))
+                .values(updated_at=datetime(2000, 1, 1, tzinfo=timezone.utc))
+            )
+            await db.commit()
+
+    with client:
+        client.portal.call(_age_item)
+
+    def _backup() -> dict:
+        r = client.post(
+            f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers(), params={"kind": "incremental"}
+        )
+        assert r.status_code == 200, r.text
+        return r.json()["backup"]
+
+    def _item_name() -> str:
+        r = client.get(f"/inventory/items/{item_id}", headers=session.headers)
+        assert r.status_code == 200, r.text
+        return r.json()["name"]
+
+    b1 = _backup()
+    assert b1["kind"] == "full"
+    r_patch = client.patch(f"/inventory/items/{item_id}", headers=session.headers, json={"name": "B"})
+    assert r_patch.status_code == 200, r_patch.text
+    b2 = _backup()
+    assert b2["kind"] == "incremental"
+
+    r_restore = client.post(f"/admin/backups/{b1['id']}/restore", headers=admin_headers())
+    assert r_restore.status_code == 200, r_restore.text
+    assert _item_name() == "A"
+
+    # Zurückgerollte Zeile trägt wieder den alten Zeitstempel: kein Delta auf B2
+    b3 = _backup()
+    assert b3["kind"] == "full"
+    assert b3["parent_id"] is None
+
+    r_patch = client.patch(f"/inventory/items/{item_id}", headers=session.headers, json={"name": "C"})
+    assert r_patch.status_code == 200, r_patch.text
+    r_restore = client.post(f"/admin/backups/{b3['id']}/restore", headers=admin_headers())
+    assert r_restore.status_code == 200, r_restore.text
+    assert _item_name() == "A"
+
+
+def test_restore_runs_in_batches_and_resumes_after_failure(client, tenant_session, monkeypatch):
+    session = tenant_session()
+    for idx in range(5):
+        r = client.post(
+            "/inventory/items",
+            headers=session.headers,
+            json={"sku": f"rs{idx}", "barcode": f"rs{idx}", "name": f"Restore {idx}", "quantity": idx},
+        )
+        assert r.status_code == 200, r.text
+    r_backup = client.post(f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers())
+    assert r_backup.status_code == 200, r_backup.text
+    backup_id = r_backup.json()["backup"]["id"]
+
+    monkeypatch.setattr(settings, "BACKUP_RESTORE_BATCH_SIZE", 2)
+    upsert = backups._upsert_stmt
+    item_batches: list[int] = []
+
+    def failing_upsert(table, rows, dialect_name):
+        if table.name == "items":
+            item_batches.append(len(rows))
+            if len(item_batches) == 2:
+                raise backups.HTTPException(status_code=503, detail="Datenbank nicht erreichbar")
+        return upsert(table, rows, dialect_name)
+
+    monkeypatch.setattr(backups, "_upsert_stmt", failing_upsert)
+    r_failed = client.post(f"/admin/backups/{backup_id}/restore", headers=admin_headers())
+    assert r_failed.status_code == 503
+    state = client.get(f"/admin/backups/{backup_id}/restore", headers=admin_headers()).json()
+    assert state["status"] == "failed"
+    assert state["table"] == "items"
+    assert state["table_rows"] == 2
+    assert "categories" in state["completed_tables"]
+
+    r_resumed = client.post(f"/admin/backups/{backup_id}/restore", headers=admin_headers(), params={"resume": True})
+    assert r_resumed.status_code == 200, r_resumed.text
+    # Fortsetzung ab Zeile 3: keine bereits geschriebenen Items erneut
+    assert item_batches == [2, 2, 2, 1]
+    state = client.get(f"/admin/backups/{backup_id}/restore", headers=admin_headers()).json()
+    assert state["status"] == "completed"
+    assert "items" in state["completed_tables"]
+
+
+def test_legacy_index_is_imported_and_listing_is_paginated(client, tenant_session):
+    session = tenant_session()
+    root = Path(settings.BACKUP_STORAGE_PATH)
+    legacy_ids = [str(uuid.uuid4()) for _ in range(3)]
+    job_id = str(uuid.uuid4())
+    (root / "index.json").write_text(
+        json.dumps(
+            {
+                "items": [
+                    {
+                        "id": backup_id,
+                        "scope": "tenant",
+                        "tenant_id": session.tenant_id,
+                        "tenant_slug": "legacy",
+                        "created_at": f"2026-01-0{idx + 1}T00:00:00+00:00",
+                        "status": "ok",
+                    }
+                    for idx, backup_id in enumerate(legacy_ids)
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    (root / "jobs.json").write_text(
+        json.dumps(
+            {
+                "items": [
+                    {
+                        "id": job_id,
+                        "status": "running",
+                        "created_at": "2026-01-01T00:00:00+00:00",
+                        "backup_ids": legacy_ids[:1],
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    with client:
+        client.portal.call(backups.import_legacy_backup_index)
+    assert not (root / "index.json").exists()
+
+    r_page = client.get(
+        "/admin/backups", headers=admin_headers(), params={"tenant_id": session.tenant_id, "limit": 2, "offset": 1}
+    )
+    assert r_page.status_code == 200, r_page.text
+    assert r_page.json()["total"] == 3
+    # neueste zuerst
+    assert [item["id"] for item in r_page.json()["items"]] == [legacy_ids[1], legacy_ids[0]]
+
+    r_job = client.get(f"/admin/backups/jobs/{job_id}", headers=admin_headers())
+    # ein "laufender" Job aus der Datei gehört zu keinem lebenden Prozess mehr
+    assert r_job.json()["status"] == "failed"
+    assert r_job.json()["backup_ids"] == legacy_ids[:1]
+
+
+def test_backup_listing_uses_stored_file_list(client, tenant_session, monkeypatch):
+    session = tenant_session()
+    created = []
+    for _ in range(2):
+        r = client.post(f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers())
+        assert r.status_code == 200, r.text
+        created.append(r.json()["backup"])
+    folder = Path(settings.BACKUP_STORAGE_PATH) / created[0]["id"]
+    on_disk = {path.name: path.stat().st_size for path in folder.iterdir()}
+    assert {entry["name"]: entry["size_bytes"] for entry in created[0]["files"]} == on_disk
+
+    # Altbestand ohne gespeicherte Dateiliste
+    async def _forget_files(backup_id: str) -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(update(BackupRecord).where(BackupRecord.id == uuid.UUID(backup_id)).values(files=None))
+            await db.commit()
+
+    with client:
+        client.portal.call(_forget_files, created[0]["id"])
+
+    listed: list[str] = []
+    stored_files = backups._stored_files
+
+    def _counting_stored_files(backup_id: str) -> list[dict]:
+        listed.append(backup_id)
+        return stored_files(backup_id)
+
+    monkeypatch.setattr(backups, "_stored_files", _counting_stored_files)
+    for _ in range(2):
+        r_list = client.get("/admin/backups", headers=admin_headers(), params={"tenant_id": session.tenant_id})
+        assert r_list.status_code == 200, r_list.text
+        files = {item["id"]: {entry["name"] for entry in item["files"]} for item in r_list.json()["items"]}
+        assert files[created[0]["id"]] == set(on_disk)
+        assert "items.ndjson.gz" in files[created[1]["id"]]
+    # nur der Altbestand wird einmal aus dem Storage gelesen und dann gespeichert
+    assert listed == [created[0]["id"]]
+
+
+def test_stale_running_job_does_not_block_scheduler(client, monkeypatch):
+    started_runs: list[uuid.UUID] = []
+
+    async def _fake_run(job_id: uuid.UUID, actor: str, kind: str = "full") -> None:
+        started_runs.append(job_id)
+
+    monkeypatch.setattr(backups, "_run_backup_job", _fake_run)
+    monkeypatch.setattr(settings, "BACKUP_JOB_HEARTBEAT_TIMEOUT_SECONDS", 60)
+
+    async def _create_running_job(heartbeat_at: datetime) -> uuid.UUID:
+        async with get_sessionmaker()() as db:
+            await db.execute(update(BackupJob).values(status="completed"))
+            job = await backup_index.create_job(db, kind="full", trigger="scheduler")
+            await backup_index.update_job(
+                db, job.id, status="running", started_at=heartbeat_at, heartbeat_at=heartbeat_at
+            )
+            await db.commit()
+            return job.id
+
+    async def _job_status(job_id: uuid.UUID) -> tuple[str, str | None]:
+        async with get_sessionmaker()() as db:
+            job = await backup_index.get_job(db, job_id)
+            return job.status, job.error
+
+    with client:
+        # Prozess lebt noch (frischer Heartbeat): Scheduler wartet
+        alive = client.portal.call(_create_running_job, datetime.now(timezone.utc))
+        assert client.portal.call(backups.enqueue_scheduled_job, "pytest") is None
+        assert client.portal.call(_job_status, alive)[0] == "running"
+
+        # Prozess abgestürzt: Job wird beendet, der nächste geplante Job startet
+        crashed = client.portal.call(_create_running_job, datetime.now(timezone.utc) - timedelta(minutes=10))
+        entry = client.portal.call(backups.enqueue_scheduled_job, "pytest")
+        assert entry is not None
+        status, error = client.portal.call(_job_status, crashed)
+        assert status == "failed" and "Heartbeat" in error
+        assert [str(job_id) for job_id in started_runs] == [entry.id]
+
+        # Beim Start werden hinterlassene Jobs ebenfalls beendet
+        leftover = client.portal.call(_create_running_job, datetime.now(timezone.utc) - timedelta(minutes=10))
+        assert client.portal.call(backups.fail_stale_backup_jobs) == 1
+        assert client.portal.call(_job_status, leftover)[0] == "failed"
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import re
+import uuid
+import zipfile
+from io import BytesIO
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.modules.admin import backup_storage_s3
+from app.modules.admin.backup_storage import iter_object, read_bytes, write_bytes
+from app.modules.admin.backup_storage_s3 import S3BackupStorage, S3Signer
+from app.tests.helpers import admin_headers
+
+_NS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+class FakeS3:
+    """
+    Minimaler S3-Ersatz (Pfad-URLs) für MockTransport: Objekte, Multipart, Range, ListObjectsV2.
+    """
+
+    def __init__(self, bucket: str, *, page_size: int = 2) -> None:
+        self.bucket = bucket
+        self.page_size = page_size
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.completed_uploads = 0
+        self.aborted_uploads = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"].startswith("AWS4-HMAC-SHA256 Credential=test-key/")
+        body = request.read()
+        assert request.headers["x-amz-content-sha256"] == hashlib.sha256(body).hexdigest()
+        bucket, _, key = request.url.path.lstrip("/").partition("/")
+        assert bucket == self.bucket
+        params = request.url.params
+        if request.method == "GET" and not key:
+            return self._list(params)
+        if request.method == "POST" and "uploads" in params:
+            upload_id = uuid.uuid4().hex
+            self.uploads[upload_id] = {}
+            return httpx.Response(
+                200,
+                text=f'<InitiateMultipartUploadResult xmlns="{_NS}"><UploadId>{upload_id}</UploadId>'
+                "</InitiateMultipartUploadResult>",
+            )
+        if request.method == "PUT" and "uploadId" in params:
+            self.uploads[params["uploadId"]][int(params["partNumber"])] = body
+            return httpx.Response(200, headers={"etag": f'"{hashlib.md5(body).hexdigest()}"'})
+        if request.method == "POST" and "uploadId" in params:
+            parts = self.uploads.pop(params["uploadId"])
+            numbers = [int(value) for value in re.findall(r"<PartNumber>(\d+)</PartNumber>", body.decode())]
+            assert numbers == sorted(parts)
+            self.objects[key] = b"".join(parts[number] for number in numbers)
+            self.completed_uploads += 1
+            return httpx.Response(200, text="<CompleteMultipartUploadResult/>")
+        if request.method == "DELETE" and "uploadId" in params:
+            self.uploads.pop(params["uploadId"], None)
+            self.aborted_uploads += 1
+            return httpx.Response(204)
+        if request.method == "PUT":
+            self.objects[key] = body
+            return httpx.Response(200)
+        if request.method == "DELETE":
+            self.objects.pop(key, None)
+            return httpx.Response(204)
+        if key not in self.objects:
+            return httpx.Response(404, text="<Error><Code>NoSuchKey</Code></Error>")
+        data = self.objects[key]
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"content-length": str(len(data))})
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("range", ""))
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else len(data) - 1
+            return httpx.Response(206, content=data[start : end + 1])
+        return httpx.Response(200, content=data)
+
+    def _list(self, params: httpx.QueryParams) -> httpx.Response:
+        assert params["list-type"] == "2"
+        keys = sorted(key for key in self.objects if key.startswith(params.get("prefix", "")))
+        offset = int(params.get("continuation-token", "0"))
+        page = keys[offset : offset + self.page_size]
+        truncated = offset + self.page_size < len(keys)
+        contents = "".join(
+            f"<Contents><Key>{key}</Key><Size>{len(self.objects[key])}</Size></Contents>" for key in page
+        )
+        token = f"<NextContinuationToken>{offset + self.page_size}</NextContinuationToken>" if truncated else ""
+        return httpx.Response(
+            200,
+            text=(
+                f'<ListBucketResult xmlns="{_NS}"><IsTruncated>{str(truncated).lower()}</IsTruncated>'
+                f"{contents}{token}</ListBucketResult>"
+            ),
+        )
+
+
+def _client(fake: FakeS3) -> httpx.Client:
+    return httpx.Client(base_url="http://minio.test:9000", transport=httpx.MockTransport(fake))
+
+
+def _storage(fake: FakeS3, *, part_size: int = 8) -> S3BackupStorage:
+    return S3BackupStorage(
+        client=_client(fake),
+        bucket=fake.bucket,
+        signer=S3Signer(access_key_id="test-key", secret_access_key="secret", region="eu-central-1"),
+        prefix="lager/",
+        part_size=part_size,
+    )
+
+
+def test_s3_storage_multipart_range_and_listing():
+    fake = FakeS3("backups")
+    storage = _storage(fake)
+
+    writer = storage.open_write("b1/items.ndjson.gz")
+    for chunk in (b"0123456", b"789abcdef", b"ghij"):
+        writer.write(chunk)
+    assert "lager/b1/items.ndjson.gz" not in fake.objects
+    writer.close()
+    assert fake.objects["lager/b1/items.ndjson.gz"] == b"0123456789abcdefghij"
+    assert fake.completed_uploads == 1
+
+    # Kleine Objekte: einfaches PUT, kein Multipart
+    write_bytes(storage, "b1/meta.json", b"{}")
+    write_bytes(storage, "b1/tenant.json", b"{}")
+    assert fake.completed_uploads == 1
+
+    assert read_bytes(storage, "b1/items.ndjson.gz") == b"0123456789abcdefghij"
+    assert b"".join(iter_object(storage, "b1/items.ndjson.gz", start=5, end=9, chunk_size=2)) == b"56789"
+    assert storage.size("b1/items.ndjson.gz") == 20
+    assert [(item.key, item.size_bytes) for item in storage.list("b1/")] == [
+        ("b1/items.ndjson.gz", 20),
+        ("b1/meta.json", 2),
+        ("b1/tenant.json", 2),
+    ]
+
+    aborted = storage.open_write("b1/broken.ndjson.gz")
+    aborted.write(b"x" * 20)
+    aborted.abort()
+    assert fake.aborted_uploads == 1 and not fake.uploads
+    assert not storage.exists("b1/broken.ndjson.gz")
+
+    storage.delete_prefix("b1/")
+    assert storage.list("b1/") == []
+    with pytest.raises(FileNotFoundError):
+        storage.open_read("b1/meta.json")
+
+
+def test_backup_download_and_restore_on_s3_driver(client, tenant_session, monkeypatch):
+    fake = FakeS3("backups")
+    monkeypatch.setattr(settings, "BACKUP_STORAGE_DRIVER", "s3")
+    monkeypatch.setattr(settings, "BACKUP_S3_ENDPOINT_URL", "http://minio.test:9000")
+    monkeypatch.setattr(settings, "BACKUP_S3_BUCKET", "backups")
+    monkeypatch.setattr(settings, "BACKUP_S3_ACCESS_KEY_ID", "test-key")
+    monkeypatch.setattr(settings, "BACKUP_S3_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setattr(settings, "BACKUP_S3_PREFIX", "")
+    monkeypatch.setattr(backup_storage_s3, "_http_client", lambda *args: _client(fake))
+
+    session = tenant_session()
+    for idx in range(3):
+        r = client.post(
+            "/inventory/items",
+            headers=session.headers,
+            json={"sku": f"s3{idx}", "barcode": f"s3{idx}", "name": f"S3 {idx}", "quantity": idx},
+        )
+        assert r.status_code == 200, r.text
+
+    r_backup = client.post(f"/admin/backups/tenants/{session.tenant_id}", headers=admin_headers())
+    assert r_backup.status_code == 200, r_backup.text
+    backup = r_backup.json()["backup"]
+    assert f"{backup['id']}/items.ndjson.gz" in fake.objects
+    assert {"meta.json", "items.ndjson.gz"} <= {entry["name"] for entry in backup["files"]}
+
+    r_zip = client.get(f"/admin/backups/{backup['id']}/download", headers=admin_headers())
+    assert r_zip.status_code == 200, r_zip.text
+    with zipfile.ZipFile(BytesIO(r_zip.content)) as archive:
+        assert archive.testzip() is None
+        assert archive.getinfo("items.ndjson.gz").compress_type == zipfile.ZIP_STORED
+        items = gzip.decompress(archive.read("items.ndjson.gz")).decode("utf-8").splitlines()
+        assert sorted(json.loads(line)["name"] for line in items) == ["S3 0", "S3 1", "S3 2"]
+
+    meta = fake.objects[f"{backup['id']}/meta.json"]
+    r_range = client.get(
+        f"/admin/backups/{backup['id']}/files/meta.json", headers={**admin_headers(), "Range": "bytes=0-9"}
+    )
+    assert r_range.status_code == 206
+    assert r_range.content == meta[:10]
+    assert r_range.headers["content-range"] == f"bytes 0-9/{len(meta)}"
+    r_out = client.get(
+        f"/admin/backups/{backup['id']}/files/meta.json", headers={**admin_headers(), "Range": f"bytes={len(meta)}-"}
+    )
+    assert r_out.status_code == 416
+
+    r_restore = client.post(f"/admin/backups/{backup['id']}/restore", headers=admin_headers())
+    assert r_restore.status_code == 200, r_restore.text
+    assert f"restores/{backup['id']}.json" in fake.objects
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from app.core.db import get_sessionmaker
+from app.models.consumption_rollup import InventoryConsumptionMonthly
+from app.modules.inventory.rollup import rebuild_consumption_rollup
+
+
+def _move(client, session, movement_type: str, qty: int, created_at: str) -> None:
+    r = client.post(
+        "/inventory/movements",
+        headers=session.headers,
+        json={
+            "client_tx_id": uuid.uuid4().hex,
+            "type": movement_type,
+            "barcode": "bc-rollup",
+            "qty": qty,
+            "created_at": created_at,
+        },
+    )
+    assert r.status_code == 200, r.text
+
+
+async def _rollup_rows(tenant_id: str) -> list[tuple[str, int, int]]:
+    async with get_sessionmaker()() as db:
+        rows = (
+            await db.scalars(
+                select(InventoryConsumptionMonthly)
+                .where(InventoryConsumptionMonthly.tenant_id == uuid.UUID(tenant_id))
+                .order_by(InventoryConsumptionMonthly.month)
+            )
+        ).all()
+        return [(row.month.isoformat(), row.qty_out, row.qty_in) for row in rows]
+
+
+async def _rebuild(tenant_id: str) -> None:
+    async with get_sessionmaker()() as db:
+        await rebuild_consumption_rollup(db, tenant_id=uuid.UUID(tenant_id))
+        await db.commit()
+
+
+def test_report_reads_rollup_and_raw_current_month(client, tenant_session):
+    session = tenant_session()
+    r_item = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "rollup", "barcode": "bc-rollup", "name": "Rollup Artikel", "quantity": 0},
+    )
+    assert r_item.status_code == 200, r_item.text
+
+    now = datetime.now(timezone.utc)
+    _move(client, session, "IN", 100, "2025-01-05T08:00:00+00:00")
+    _move(client, session, "OUT", 5, "2025-01-10T08:00:00+00:00")
+    _move(client, session, "OUT", 2, "2025-01-20T08:00:00+00:00")
+    _move(client, session, "OUT", 7, "2025-02-20T08:00:00+00:00")
+    _move(client, session, "OUT", 3, now.isoformat())
+
+    with client:
+        rows = client.portal.call(_rollup_rows, session.tenant_id)
+        assert rows[:2] == [("2025-01-01", 7, 100), ("2025-02-01", 7, 0)]
+        assert rows[-1] == (now.strftime("%Y-%m-01"), 3, 0)
+
+        client.portal.call(_rebuild, session.tenant_id)
+        assert client.portal.call(_rollup_rows, session.tenant_id) == rows
+
+    def report(start: str, end: str) -> dict[str, float]:
+        r = client.get(
+            "/inventory/report",
+            headers=session.headers,
+            params={"from": start, "to": end, "mode": "all", "aggregate": "false"},
+        )
+        assert r.status_code == 200, r.text
+        series = r.json()["series"]
+        assert len(series) == 1
+        return {point["period"]: point["value"] for point in series[0]["data"]}
+
+    full = report("2025-01-01", now.date().isoformat())
+    assert full["2025-01"] == 7
+    assert full["2025-02"] == 7
+    assert full[now.strftime("%Y-%m")] == 3
+
+    # Angeschnittener Startmonat kommt aus den Rohdaten (nur die Buchung vom 20.01.)
+    partial = report("2025-01-15", "2025-02-28")
+    assert partial == {"2025-01": 2, "2025-02": 7}
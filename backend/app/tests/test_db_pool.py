@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.requests import Request
+
+from app.core import db as db_module
+from app.core.config import settings
+from app.core.deps_auth import get_current_user, invalidate_principal_cache
+from app.core.deps_tenant import get_tenant_context
+from app.core.tenant import invalidate_tenant_cache
+from app.observability.metrics import metrics_registry
+
+
+def _sample(name: str, engine: str) -> float:
+    return metrics_registry.get_sample_value(name, {"engine": engine}) or 0.0
+
+
+def test_engine_kwargs_apply_pool_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 12)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 3)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 2.5)
+    monkeypatch.setattr(settings, "DB_POOL_RECYCLE_SECONDS", 600)
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 0)
+
+    kwargs = db_module.engine_kwargs(make_url("postgresql+asyncpg://u:p@db/app"), name="primary")
+    assert kwargs["poolclass"] is db_module.InstrumentedAsyncQueuePool
+    assert (kwargs["pool_size"], kwargs["max_overflow"], kwargs["pool_timeout"], kwargs["pool_recycle"]) == (
+        12,
+        3,
+        2.5,
+        600,
+    )
+    assert kwargs["pool_pre_ping"] is False and kwargs["echo"] is False
+    assert kwargs["connect_args"] == {"statement_cache_size": 0}
+
+    # SQLite: Pools des Treibers, keine Pool-Parameter
+    sqlite_kwargs = db_module.engine_kwargs(make_url("sqlite+aiosqlite:///./x.db"), name="primary")
+    assert "pool_size" not in sqlite_kwargs
+
+
+def test_pool_metrics_report_usage_and_checkout_timeouts(client, tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=db_module.InstrumentedAsyncQueuePool,
+        pool_logging_name="pytest",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    db_module.instrument_pool(engine, "pytest")
+    timeouts_before = _sample("db_pool_checkout_timeouts_total", "pytest")
+
+    async def exhaust_pool() -> float:
+        async with engine.connect() as conn:
+            await conn.execute(text("select 1"))
+            in_use = _sample("db_pool_connections_in_use", "pytest")
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+        await engine.dispose()
+        return in_use
+
+    with client:
+        in_use = client.portal.call(exhaust_pool)
+
+    assert in_use == 1
+    assert _sample("db_pool_size", "pytest") == 1
+    assert _sample("db_pool_checkout_timeouts_total", "pytest") == timeouts_before + 1
+    # zwei Checkouts gemessen, einer davon hat bis zum Timeout gewartet
+    assert _sample("db_pool_checkout_wait_seconds_count", "pytest") >= 2
+    assert _sample("db_pool_checkout_wait_seconds_sum", "pytest") >= 0.05
+
+
+def test_auth_dependencies_release_connection_before_handler(client, tenant_session):
+    session = tenant_session()
+    invalidate_tenant_cache()
+    invalidate_principal_cache()
+    engine = db_module.get_engine()
+    checked_out = {"current": 0, "total": 0}
+
+    def on_checkout(*_args):
+        checked_out["current"] += 1
+        checked_out["total"] += 1
+
+    def on_checkin(*_args):
+        checked_out["current"] -= 1
+
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/inventory/units",
+            "headers": [(b"x-tenant-slug", session.slug.encode())],
+        }
+    )
+
+    async def resolve_dependencies():
+        async with db_module.get_sessionmaker()() as db:
+            tenant_ctx = await get_tenant_context(request, db)
+            after_tenant = checked_out["current"]
+            user_ctx = await get_current_user(session.headers["Authorization"], tenant_ctx, db)
+            return after_tenant, checked_out["current"], user_ctx.user.email, db.in_transaction()
+
+    with client:
+        event.listen(engine.sync_engine, "checkout", on_checkout)
+        event.listen(engine.sync_engine, "checkin", on_checkin)
+        try:
+            after_tenant, after_user, email, in_transaction = client.portal.call(resolve_dependencies)
+            cold_checkouts = checked_out["total"]
+            client.portal.call(resolve_dependencies)
+        finally:
+            event.remove(engine.sync_engine, "checkout", on_checkout)
+            event.remove(engine.sync_engine, "checkin", on_checkin)
+
+    # Cache-Miss: Lookups laufen, die Verbindung ist vor dem Handler aber wieder im Pool
+    assert cold_checkouts >= 2
+    assert (after_tenant, after_user, in_transaction) == (0, 0, False)
+    # geladene Objekte bleiben nutzbar (nicht expired)
+    assert email == f"{session.slug}@example.com"
+    # Cache-Treffer: gar keine Verbindung
+    assert checked_out["total"] == cold_checkouts
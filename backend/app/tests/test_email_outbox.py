@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import socketserver
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.db import get_sessionmaker
+from app.core.email_settings import EmailSettings, upsert_email_settings
+from app.core.email_utils import SmtpConnectionPool, smtp_pool
+from app.core.mail_outbox import deliver_due_emails, enqueue_email, purge_finished_emails
+from app.models.email_outbox import EmailOutbox
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    """
+    Minimaler SMTP-Server (ohne TLS/Auth) für die Tests; zählt Verbindungen und Mails.
+    """
+
+    def handle(self) -> None:
+        self.server.connections += 1
+        self.wfile.write(b"220 stub ESMTP\r\n")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii", "replace").strip().upper()
+            if command.startswith("EHLO"):
+                self.wfile.write(b"250-stub\r\n250 8BITMIME\r\n")
+            elif command == "DATA":
+                self.wfile.write(b"354 go ahead\r\n")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                time.sleep(self.server.delay)
+                self.server.messages += 1
+                self.wfile.write(b"250 queued\r\n")
+            elif command == "QUIT":
+                self.wfile.write(b"221 bye\r\n")
+                return
+            else:
+                # HELO, MAIL, RCPT, RSET, NOOP
+                self.wfile.write(b"250 ok\r\n")
+
+
+class _SmtpServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    connections = 0
+    messages = 0
+    delay = 0.0
+
+
+@pytest.fixture
+def smtp_server():
+    server = _SmtpServer(("127.0.0.1", 0), _SmtpHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    smtp_pool.close_all()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _outbox_settings(monkeypatch):
+    # Zustellung explizit im Test anstoßen statt über den In-App-Dispatcher
+    monkeypatch.setattr(settings, "JOB_WORKER_MODE", "worker")
+
+
+async def _configure_smtp(port: int) -> None:
+    async with get_sessionmaker()() as db:
+        await upsert_email_settings(
+            db, host="127.0.0.1", port=port, user=None, password=None, from_email="lager@example.com", use_tls=False
+        )
+        await db.commit()
+
+
+async def _enqueue(count: int) -> None:
+    async with get_sessionmaker()() as db:
+        await db.execute(EmailOutbox.__table__.delete())
+        await db.commit()
+        for idx in range(count):
+            await enqueue_email(db, recipient=f"kunde{idx}@example.com", subject=f"Bestellung {idx}", body="Test")
+
+
+async def _entries() -> list[EmailOutbox]:
+    async with get_sessionmaker()() as db:
+        return list((await db.scalars(select(EmailOutbox).order_by(EmailOutbox.subject))).all())
+
+
+def test_outbox_delivers_over_one_connection(client, smtp_server):
+    with client:
+        client.portal.call(_configure_smtp, smtp_server.server_address[1])
+        client.portal.call(_enqueue, 3)
+        assert client.portal.call(deliver_due_emails) == 3
+        entries = client.portal.call(_entries)
+
+    assert [entry.status for entry in entries] == ["sent", "sent", "sent"]
+    assert smtp_server.messages == 3
+    assert smtp_server.connections == 1
+
+
+def test_outbox_retries_with_backoff(client, smtp_server, monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 2)
+    port = smtp_server.server_address[1]
+    smtp_server.shutdown()
+    smtp_server.server_close()
+
+    with client:
+        client.portal.call(_configure_smtp, port)
+        client.portal.call(_enqueue, 1)
+        before = datetime.now(timezone.utc)
+        assert client.portal.call(deliver_due_emails) == 1
+        (entry,) = client.portal.call(_entries)
+        assert entry.status == "pending"
+        assert entry.attempts == 1
+        assert entry.last_error
+        next_attempt = entry.next_attempt_at.replace(tzinfo=entry.next_attempt_at.tzinfo or timezone.utc)
+        assert next_attempt >= before + timedelta(seconds=settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS)
+        # noch nicht fällig: kein weiterer Versuch
+        assert client.portal.call(deliver_due_emails) == 0
+
+        async def _make_due() -> None:
+            async with get_sessionmaker()() as db:
+                await db.execute(EmailOutbox.__table__.update().values(next_attempt_at=before))
+                await db.commit()
+
+        client.portal.call(_make_due)
+        assert client.portal.call(deliver_due_emails) == 1
+        (entry,) = client.portal.call(_entries)
+    assert entry.status == "failed"
+    assert entry.attempts == 2
+
+
+def test_finished_emails_are_purged_after_retention(client, monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_OUTBOX_RETENTION_DAYS", 30)
+    old = datetime.now(timezone.utc) - timedelta(days=31)
+
+    async def _seed() -> None:
+        await _enqueue(4)
+        async with get_sessionmaker()() as db:
+            entries = (await db.scalars(select(EmailOutbox).order_by(EmailOutbox.subject))).all()
+            # sent/failed alt, sent jung, pending alt (wird noch zugestellt)
+            for entry, status, last_attempt in zip(
+                entries,
+                ("sent", "failed", "sent", "pending"),
+                (old, old, datetime.now(timezone.utc), old),
+            ):
+                entry.status = status
+                entry.next_attempt_at = last_attempt
+            await db.commit()
+
+    with client:
+        client.portal.call(_seed)
+        assert client.portal.call(purge_finished_emails) == 2
+        entries = client.portal.call(_entries)
+
+    assert [(entry.subject, entry.status) for entry in entries] == [("Bestellung 2", "sent"), ("Bestellung 3", "pending")]
+
+
+def test_order_email_is_queued(client, tenant_session, smtp_server):
+    session = tenant_session()
+    r_item = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "mail1", "barcode": "mail1", "name": "Mail Artikel", "quantity": 1},
+    )
+    assert r_item.status_code == 200, r_item.text
+    r_order = client.post(
+        "/inventory/orders",
+        headers=session.headers,
+        json={"items": [{"item_id": r_item.json()["id"], "quantity": 2}]},
+    )
+    assert r_order.status_code == 201, r_order.text
+
+    with client:
+        client.portal.call(_configure_smtp, smtp_server.server_address[1])
+        client.portal.call(_enqueue, 0)
+        r = client.post(
+            f"/inventory/orders/{r_order.json()['id']}/email",
+            headers=session.headers,
+            json={"email": "einkauf@example.com"},
+        )
+        assert r.status_code == 200, r.text
+        assert r.json()["queued"] is True
+        assert smtp_server.messages == 0
+        assert client.portal.call(deliver_due_emails) == 1
+    assert smtp_server.messages == 1
+
+
+def test_pool_sends_in_parallel_over_separate_connections(smtp_server):
+    smtp_server.delay = 0.5
+    pool = SmtpConnectionPool(max_idle=2)
+    email_settings = EmailSettings(
+        host="127.0.0.1",
+        port=smtp_server.server_address[1],
+        user=None,
+        password=None,
+        from_email="lager@example.com",
+        use_tls=False,
+    )
+
+    def _send(idx: int) -> None:
+        message = EmailMessage()
+        message["From"] = email_settings.from_email
+        message["To"] = f"kunde{idx}@example.com"
+        message["Subject"] = f"Parallel {idx}"
+        message.set_content("Test")
+        pool.send(email_settings, message)
+
+    try:
+        started = time.perf_counter()
+        threads = [threading.Thread(target=_send, args=(idx,)) for idx in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # kein globaler Lock: beide Mails warten gleichzeitig auf den Server
+        assert time.perf_counter() - started < 2 * smtp_server.delay
+        assert smtp_server.messages == 2
+        assert smtp_server.connections == 2
+
+        smtp_server.delay = 0.0
+        _send(2)
+        assert smtp_server.messages == 3
+        assert smtp_server.connections == 2
+    finally:
+        pool.close_all()
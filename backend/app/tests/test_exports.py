@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import csv
+from io import BytesIO, StringIO
+
+from openpyxl import load_workbook
+
+
+def _create_items(client, session, count: int) -> None:
+    for idx in range(count):
+        r = client.post(
+            "/inventory/items",
+            headers=session.headers,
+            json={"sku": f"exp{idx:03d}", "barcode": f"exp{idx:03d}", "name": f"Export {idx:03d}", "quantity": idx},
+        )
+        assert r.status_code == 200, r.text
+
+
+def test_items_export_streams_csv_and_keeps_json_fallback(client, tenant_session):
+    session = tenant_session()
+    _create_items(client, session, 3)
+
+    r_csv = client.get("/inventory/items/export", headers=session.headers, params={"format": "csv"})
+    assert r_csv.status_code == 200, r_csv.text
+    assert r_csv.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(StringIO(r_csv.text)))
+    assert [row["name"] for row in rows] == ["Export 000", "Export 001", "Export 002"]
+    assert rows[2]["qty"] == "2"
+
+    r_json = client.get("/inventory/items/export", headers=session.headers)
+    assert r_json.status_code == 200, r_json.text
+    assert r_json.json()["csv"] == r_csv.text
+
+
+def test_inventory_export_streams_write_only_workbook(client, tenant_session):
+    session = tenant_session()
+    _create_items(client, session, 2)
+
+    r = client.get("/inventory/inventory/export", headers=session.headers)
+    assert r.status_code == 200, r.text
+    ws = load_workbook(BytesIO(r.content)).active
+    values = [list(row) for row in ws.iter_rows(values_only=True)]
+    assert values[0][:3] == ["Artikel-ID", "Name", "Barcode"]
+    assert [row[1] for row in values[1:]] == ["Export 000", "Export 001"]
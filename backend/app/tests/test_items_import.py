@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import uuid
+from io import BytesIO
+
+from openpyxl import Workbook
+from sqlalchemy import select, update
+
+from app.core.db import get_sessionmaker
+from app.core.exports import XLSX_MEDIA_TYPE
+from app.models.item import Item
+
+HEADER = "sku,barcode,name,description,qty,unit,is_active,category,min_stock,max_stock,target_stock,recommended_stock,order_mode"
+
+
+async def _mark_admin_created(tenant_id: str, sku: str) -> None:
+    async with get_sessionmaker()() as db:
+        await db.execute(
+            update(Item)
+            .where(Item.tenant_id == uuid.UUID(tenant_id), Item.sku == sku)
+            .values(is_admin_created=True)
+        )
+        await db.commit()
+
+
+async def _items(tenant_id: str) -> dict[str, tuple[str, int, bool]]:
+    async with get_sessionmaker()() as db:
+        rows = (await db.scalars(select(Item).where(Item.tenant_id == uuid.UUID(tenant_id)))).all()
+        return {item.sku: (item.name, item.quantity, item.category_id is not None) for item in rows}
+
+
+def _upload(client, session, lines: list[str]):
+    body = "\n".join([HEADER, *lines]).encode("utf-8")
+    return client.post(
+        "/inventory/items/import",
+        headers=session.headers,
+        files={"file": ("items.csv", body, "text/csv")},
+    )
+
+
+def test_csv_import_upserts_in_bulk_and_reports_row_errors(client, tenant_session):
+    session = tenant_session()
+    r_cat = client.post("/inventory/categories", headers=session.headers, json={"name": "Handschuhe"})
+    assert r_cat.status_code == 200, r_cat.text
+    for sku in ("keep", "locked"):
+        r = client.post(
+            "/inventory/items",
+            headers=session.headers,
+            json={"sku": sku, "barcode": f"bc-{sku}", "name": f"Alt {sku}", "quantity": 1},
+        )
+        assert r.status_code == 200, r.text
+
+    with client:
+        client.portal.call(_mark_admin_created, session.tenant_id, "z_locked")
+
+    r = _upload(
+        client,
+        session,
+        [
+            "keep,bc-keep,Neu keep,,5,pcs,true,handschuhe,0,0,0,0,0",
+            "new1,bc-new1,Neu 1,,2,pcs,true,,0,0,0,0,0",
+            "locked,bc-locked,Versuch,,9,pcs,true,,0,0,0,0,0",
+            "bad,bc-bad,Kaputt,,1,pcs,true,Unbekannt,0,0,0,0,0",
+            "new1,bc-new1,Neu 1 final,,3,pcs,true,,0,0,0,0,1",
+            ",bc-x,Ohne SKU,,1,pcs,true,,0,0,0,0,0",
+        ],
+    )
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["imported"], body["updated"]) == (1, 1)
+    assert [error["row"] for error in body["errors"]] == ["3", "4", "5", "7"]
+    assert body["errors"][1]["error"] == "Admin-Artikel sind schreibgeschützt"
+
+    with client:
+        items = client.portal.call(_items, session.tenant_id)
+    assert items["z_keep"] == ("Neu keep", 5, True)
+    assert items["z_new1"] == ("Neu 1 final", 3, False)
+    assert items["z_locked"] == ("Alt locked", 1, False)
+    assert "z_bad" not in items
+
+
+def test_settings_excel_import_streams_in_chunks(client, tenant_session, monkeypatch):
+    import app.modules.inventory.routes as inventory_routes
+
+    monkeypatch.setattr(inventory_routes, "SETTINGS_IMPORT_CHUNK_SIZE", 2)
+    session = tenant_session()
+    r = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "xl1", "barcode": "bc-xl1", "name": "Alt", "quantity": 1},
+    )
+    assert r.status_code == 200, r.text
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(inventory_routes.MASS_EXPORT_COLUMNS)
+    columns = inventory_routes.MASS_EXPORT_COLUMNS
+
+    def row(**values):
+        return [values.get(column) for column in columns]
+
+    ws.append(row(**{"Artikel-ID": "xl1", "Name": "Neu", "Barcode": "bc-xl1", "Bestand": 4}))
+    ws.append(row(**{"Artikel-ID": "xl2", "Name": "Zwei", "Barcode": "bc-xl2", "Soll": 10}))
+    ws.append(row(**{"Artikel-ID": "xl3", "Name": "Drei", "Barcode": "bc-xl3", "Kategorie": "Fehlt"}))
+    ws.append(row(**{"Artikel-ID": "xl4", "Name": "Vier", "Barcode": "bc-xl4", "Bestand": 2}))
+    ws.append(row(**{"Name": "Ohne ID"}))
+    buf = BytesIO()
+    wb.save(buf)
+
+    r = client.post(
+        "/inventory/settings/import",
+        headers=session.headers,
+        files={"file": ("import.xlsx", buf.getvalue(), XLSX_MEDIA_TYPE)},
+    )
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert (body["imported"], body["updated"], body["processed"], body["chunks"]) == (2, 1, 5, 3)
+    assert [error["row"] for error in body["errors"]] == ["4", "6"]
+
+    with client:
+        items = client.portal.call(_items, session.tenant_id)
+    assert items["z_xl1"] == ("Neu", 4, False)
+    assert items["z_xl4"] == ("Vier", 2, False)
+    assert "z_xl3" not in items
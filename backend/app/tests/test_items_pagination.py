@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+
+def _create_item(client, session, idx: int, name: str) -> None:
+    r = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": f"sku{idx}", "barcode": f"bc{idx}", "name": name, "quantity": 1},
+    )
+    assert r.status_code == 200, r.text
+
+
+def test_list_items_cursor_mode_walks_all_pages(client, tenant_session):
+    session = tenant_session()
+    # Doppelte Namen prüfen den id-Tiebreaker im Cursor
+    names = ["Alpha", "Beta", "Beta", "Gamma", "Delta", "Beta", "Omega"]
+    for idx, name in enumerate(names):
+        _create_item(client, session, idx, name)
+
+    seen: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"paging": "cursor", "page_size": 3}
+        if cursor:
+            params["cursor"] = cursor
+        r = client.get("/inventory/items", headers=session.headers, params=params)
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["total"] is None
+        seen.extend(item["id"] for item in body["items"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert len(seen) == len(names)
+    assert len(set(seen)) == len(names)
+
+    r_offset = client.get("/inventory/items", headers=session.headers, params={"page_size": 50})
+    assert r_offset.status_code == 200, r_offset.text
+    offset_body = r_offset.json()
+    assert offset_body["total"] == len(names)
+    assert offset_body["next_cursor"] is None
+    assert [item["id"] for item in offset_body["items"]] == seen
+
+    r_total = client.get(
+        "/inventory/items",
+        headers=session.headers,
+        params={"paging": "cursor", "include_total": True, "page_size": 2},
+    )
+    assert r_total.json()["total"] == len(names)
+
+    r_bad = client.get("/inventory/items", headers=session.headers, params={"cursor": "not-a-cursor"})
+    assert r_bad.status_code == 400
+    assert r_bad.json()["error"]["code"] == "invalid_cursor"
+
+
+def test_list_items_search_matches_sku_barcode_name_literally(client, tenant_session):
+    session = tenant_session()
+    _create_item(client, session, 1, "Schraube M6")
+    _create_item(client, session, 2, "Kabel 50% Rabatt")
+    _create_item(client, session, 3, "Kabel 5 m")
+
+    def search(q: str) -> list[str]:
+        r = client.get("/inventory/items", headers=session.headers, params={"q": q})
+        assert r.status_code == 200, r.text
+        return sorted(item["name"] for item in r.json()["items"])
+
+    assert search("schraub") == ["Schraube M6"]
+    assert search("kabel") == ["Kabel 5 m", "Kabel 50% Rabatt"]
+    # % und _ sind Literale, keine Wildcards
+    assert search("50%") == ["Kabel 50% Rabatt"]
+    assert search("5_") == []
+    assert search("bc3") == ["Kabel 5 m"]
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import csv
+import uuid
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.core.db import get_sessionmaker
+from app.models.background_job import BackgroundJob
+from app.modules.inventory import routes as inventory_routes
+from app.modules.jobs.service import JobRun
+from app.modules.jobs.worker import purge_old_jobs, run_pending_jobs
+from app.tests.helpers import admin_headers
+
+HEADER = "sku,barcode,name,description,qty,unit,is_active,category,min_stock,max_stock,target_stock,recommended_stock,order_mode"
+
+
+@pytest.fixture(autouse=True)
+def _job_settings(monkeypatch, tmp_path):
+    # Jobs explizit im Test abarbeiten statt über den In-App-Worker
+    monkeypatch.setattr(settings, "JOB_WORKER_MODE", "worker")
+    monkeypatch.setattr(settings, "BACKUP_STORAGE_PATH", str(tmp_path))
+
+
+def test_import_job_runs_in_worker_and_reports_progress(client, tenant_session):
+    session = tenant_session()
+    body = "\n".join([HEADER, "job1,bc-job1,Job 1,,4,pcs,true,,0,0,0,0,0", ",bc-x,Ohne SKU,,1,pcs,true,,0,0,0,0,0"])
+
+    r = client.post(
+        "/inventory/items/import/jobs",
+        headers=session.headers,
+        files={"file": ("items.csv", body.encode("utf-8"), "text/csv")},
+    )
+    assert r.status_code == 202, r.text
+    job = r.json()
+    assert job["status"] == "queued"
+
+    with client:
+        assert client.portal.call(run_pending_jobs) == 1
+
+    r_status = client.get(f"/inventory/jobs/{job['id']}", headers=session.headers)
+    assert r_status.status_code == 200, r_status.text
+    status = r_status.json()
+    assert status["status"] == "completed"
+    assert status["processed"] == 2
+    assert status["result"]["imported"] == 1
+    assert status["result"]["errors"][0]["row"] == "3"
+    assert status["result_url"] is None
+
+    r_items = client.get("/inventory/items", headers=session.headers, params={"q": "Job 1"})
+    assert r_items.json()["total"] == 1
+
+    other = tenant_session()
+    assert client.get(f"/inventory/jobs/{job['id']}", headers=other.headers).status_code == 404
+
+
+def test_import_job_streams_input_in_chunks(client, tenant_session, monkeypatch):
+    monkeypatch.setattr(inventory_routes, "CSV_IMPORT_CHUNK_SIZE", 2)
+    progress: list[int] = []
+    record_progress = JobRun.progress
+
+    async def _progress(self, processed: int, total: int | None = None) -> None:
+        progress.append(processed)
+        await record_progress(self, processed, total)
+
+    monkeypatch.setattr(JobRun, "progress", _progress)
+    session = tenant_session()
+    lines = [HEADER] + [f"ch{idx},bc-ch{idx},Chunk {idx},,{idx},pcs,true,,0,0,0,0,0" for idx in range(5)]
+    r = client.post(
+        "/inventory/items/import/jobs",
+        headers=session.headers,
+        files={"file": ("items.csv", "\n".join(lines).encode("utf-8"), "text/csv")},
+    )
+    assert r.status_code == 202, r.text
+    r_broken = client.post(
+        "/inventory/items/import/jobs",
+        headers=session.headers,
+        files={"file": ("items.csv", HEADER.encode("utf-8") + b"\n\xff\xfe,x\n", "text/csv")},
+    )
+    assert r_broken.status_code == 202, r_broken.text
+
+    with client:
+        assert client.portal.call(run_pending_jobs) == 2
+
+    status = client.get(f"/inventory/jobs/{r.json()['id']}", headers=session.headers).json()
+    assert status["status"] == "completed"
+    assert status["result"]["imported"] == 5
+    assert status["processed"] == 5
+    # Fortschritt je Block statt einmal am Ende
+    assert progress == [2, 4, 5]
+
+    broken = client.get(f"/inventory/jobs/{r_broken.json()['id']}", headers=session.headers).json()
+    assert broken["status"] == "failed"
+    assert broken["error"] == "CSV nicht UTF-8"
+
+
+def test_export_job_writes_result_file(client, tenant_session):
+    session = tenant_session()
+    for idx in range(3):
+        r = client.post(
+            "/inventory/items",
+            headers=session.headers,
+            json={"sku": f"jx{idx}", "barcode": f"jx{idx}", "name": f"Job Export {idx}", "quantity": idx},
+        )
+        assert r.status_code == 200, r.text
+
+    r = client.post("/inventory/items/export/jobs", headers=session.headers)
+    assert r.status_code == 202, r.text
+    job_id = r.json()["id"]
+    assert client.get(f"/inventory/jobs/{job_id}/result", headers=session.headers).status_code == 409
+
+    with client:
+        client.portal.call(run_pending_jobs)
+
+    status = client.get(f"/inventory/jobs/{job_id}", headers=session.headers).json()
+    assert status["status"] == "completed"
+    assert status["result_url"] == f"/inventory/jobs/{job_id}/result"
+
+    r_file = client.get(status["result_url"], headers=session.headers)
+    assert r_file.status_code == 200
+    assert 'filename="items.csv"' in r_file.headers["content-disposition"]
+    rows = list(csv.DictReader(StringIO(r_file.text)))
+    assert [row["name"] for row in rows] == ["Job Export 0", "Job Export 1", "Job Export 2"]
+
+
+def test_failed_job_keeps_error_message(client, tenant_session):
+    session = tenant_session()
+    r = client.post(
+        "/inventory/items/import/jobs",
+        headers=session.headers,
+        files={"file": ("items.csv", b"sku,name\nx,y", "text/csv")},
+    )
+    assert r.status_code == 202, r.text
+    job_id = r.json()["id"]
+
+    with client:
+        client.portal.call(run_pending_jobs)
+
+    r_admin = client.get(f"/admin/jobs/{job_id}", headers=admin_headers())
+    assert r_admin.status_code == 200, r_admin.text
+    job = r_admin.json()
+    assert job["status"] == "failed"
+    assert job["error"].startswith("Fehlende Spalten")
+
+    listing = client.get("/admin/jobs", headers=admin_headers(), params={"status": "failed", "tenant_id": session.tenant_id})
+    assert [entry["id"] for entry in listing.json()["items"]] == [job_id]
+
+
+def test_finished_jobs_are_purged_with_their_files(client, tenant_session, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETENTION_DAYS", 7)
+    session = tenant_session()
+    r_old = client.post("/inventory/items/export/jobs", headers=session.headers)
+    assert r_old.status_code == 202, r_old.text
+    old_id = r_old.json()["id"]
+    with client:
+        client.portal.call(run_pending_jobs)
+    r_recent = client.post("/inventory/items/export/jobs", headers=session.headers)
+    recent_id = r_recent.json()["id"]
+    r_queued = client.post("/inventory/items/export/jobs", headers=session.headers)
+    queued_id = r_queued.json()["id"]
+
+    async def _backdate(job_ids: list[str]) -> None:
+        async with get_sessionmaker()() as db:
+            await db.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id.in_([uuid.UUID(job_id) for job_id in job_ids]))
+                .values(created_at=datetime(2000, 1, 1, tzinfo=timezone.utc))
+            )
+            await db.commit()
+
+    jobs_root = Path(settings.BACKUP_STORAGE_PATH) / "jobs"
+    assert (jobs_root / old_id / "result").is_file()
+    with client:
+        client.portal.call(_backdate, [old_id, queued_id])
+        assert client.portal.call(purge_old_jobs) >= 1
+
+    assert not (jobs_root / old_id).exists()
+    assert client.get(f"/inventory/jobs/{old_id}", headers=session.headers).status_code == 404
+    # wartende und junge Jobs bleiben
+    assert client.get(f"/inventory/jobs/{queued_id}", headers=session.headers).status_code == 200
+    assert client.get(f"/inventory/jobs/{recent_id}", headers=session.headers).status_code == 200
+
+    # keine wartenden Jobs für den In-App-Worker späterer Tests liegen lassen
+    with client:
+        client.portal.call(run_pending_jobs)
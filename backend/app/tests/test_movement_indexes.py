@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from app.core.db import get_sessionmaker, is_sqlite_database
+from app.modules.inventory.rollup import raw_consumption_query
+from app.modules.inventory.routes import movements_query
+
+pytestmark = pytest.mark.skipif(is_sqlite_database(), reason="EXPLAIN-Prüfung nur auf PostgreSQL")
+
+
+class _Explain(Executable, ClauseElement):
+    """
+    EXPLAIN um ein ORM-Statement; Parameter werden vom Dialekt gebunden wie im echten Aufruf.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, stmt) -> None:
+        self.stmt = stmt
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.stmt, **kw)
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+async def _explain(stmt) -> set[str]:
+    async with get_sessionmaker()() as db:
+        # Leere Testtabellen würde der Planner sonst sequentiell lesen
+        await db.execute(text("SET LOCAL enable_seqscan = off"))
+        raw = (await db.execute(_Explain(stmt))).scalar_one()
+        await db.rollback()
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    return _index_names(plan)
+
+
+def test_movement_queries_use_composite_indexes(client):
+    tenant_id = uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    # Statements genau so, wie Bewegungsliste und Verbrauchsbericht sie absetzen
+    list_stmt = movements_query(tenant_id)
+    filtered_list_stmt = movements_query(tenant_id, start=now - timedelta(days=30), end=now, limit=50)
+    report_stmt = raw_consumption_query(
+        "postgresql", tenant_id=tenant_id, start=date(today.year - 1, today.month, 15), end=today, today=today
+    )
+    with client:
+        list_indexes = client.portal.call(_explain, list_stmt)
+        filtered_list_indexes = client.portal.call(_explain, filtered_list_stmt)
+        report_indexes = client.portal.call(_explain, report_stmt)
+
+    assert "ix_inventory_movements_tenant_created_at" in list_indexes
+    assert "ix_inventory_movements_tenant_created_at" in filtered_list_indexes
+    assert "ix_inventory_movements_tenant_type_created_at" in report_indexes
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+
+def _create_item(client, session, barcode: str, quantity: int) -> dict:
+    r = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": barcode, "barcode": barcode, "name": f"Artikel {barcode}", "quantity": quantity},
+    )
+    assert r.status_code == 200, r.text
+    return r.json()
+
+
+def test_movement_batch_applies_in_order_with_per_entry_results(client, tenant_session):
+    session = tenant_session()
+    item_a = _create_item(client, session, "bat-a", 5)
+    item_b = _create_item(client, session, "bat-b", 0)
+
+    r_single = client.post(
+        "/inventory/movements",
+        headers=session.headers,
+        json={"client_tx_id": "tx-0", "type": "IN", "barcode": "bat-b", "qty": 1},
+    )
+    assert r_single.status_code == 200, r_single.text
+
+    movements = [
+        {"client_tx_id": "tx-0", "type": "IN", "barcode": "bat-b", "qty": 1},  # bereits gebucht
+        {"client_tx_id": "tx-1", "type": "OUT", "barcode": "bat-a", "qty": 3},
+        {"client_tx_id": "tx-2", "type": "OUT", "barcode": "bat-a", "qty": 3},  # wäre negativ (5-3-3)
+        {"client_tx_id": "tx-3", "type": "IN", "barcode": "bat-a", "qty": 10},
+        {"client_tx_id": "tx-4", "type": "OUT", "barcode": "bat-a", "qty": 3},
+        {"client_tx_id": "tx-5", "type": "OUT", "barcode": "unbekannt", "qty": 1},
+        {"client_tx_id": "tx-3", "type": "IN", "barcode": "bat-a", "qty": 10},  # Dublette im Batch
+        {"client_tx_id": "tx-6", "type": "IN", "barcode": "bat-b", "qty": 4},
+    ]
+    r = client.post("/inventory/movements/batch", headers=session.headers, json={"movements": movements})
+    assert r.status_code == 200, r.text
+    body = r.json()
+
+    assert [res["status"] for res in body["results"]] == [
+        "duplicate", "ok", "error", "ok", "ok", "error", "duplicate", "ok",
+    ]
+    assert body["results"][2]["error_code"] == "qty_negative"
+    assert body["results"][5]["error_code"] == "item_not_found"
+    assert body["results"][6]["movement_id"] == body["results"][3]["movement_id"]
+    assert (body["applied"], body["duplicates"], body["failed"]) == (4, 2, 2)
+
+    quantities = {item["id"]: item["quantity"] for item in body["items"]}
+    assert quantities == {item_a["id"]: 9, item_b["id"]: 5}
+
+    r_replay = client.post("/inventory/movements/batch", headers=session.headers, json={"movements": movements})
+    assert r_replay.status_code == 200, r_replay.text
+    replay = r_replay.json()
+    # Gebuchte Einträge sind jetzt Dubletten; nur der zuvor abgelehnte tx-2 passt nun in den Bestand
+    assert (replay["applied"], replay["duplicates"], replay["failed"]) == (1, 6, 1)
+    assert replay["results"][2]["status"] == "ok"
+
+    r_item = client.get(f"/inventory/items/{item_a['id']}", headers=session.headers)
+    assert r_item.json()["quantity"] == 6
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from app.core.config import settings
+from app.modules.inventory.pdf_render import shutdown_pdf_pool
+
+
+@pytest.fixture(autouse=True)
+def _thread_pool(monkeypatch):
+    monkeypatch.setattr(settings, "PDF_RENDER_POOL", "thread")
+    shutdown_pdf_pool()
+    yield
+    shutdown_pdf_pool()
+
+
+def _create_order(client, session, sku: str) -> dict:
+    r_item = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": sku, "barcode": sku, "name": f"PDF {sku}", "quantity": 1},
+    )
+    assert r_item.status_code == 200, r_item.text
+    r_order = client.post(
+        "/inventory/orders",
+        headers=session.headers,
+        json={"items": [{"item_id": r_item.json()["id"], "quantity": 3}]},
+    )
+    assert r_order.status_code == 201, r_order.text
+    return r_order.json()
+
+
+def test_completed_order_pdf_supports_conditional_get(client, tenant_session):
+    session = tenant_session()
+    order = _create_order(client, session, "pdf1")
+
+    r_open = client.get(f"/inventory/orders/{order['id']}/pdf", headers=session.headers)
+    assert r_open.status_code == 200
+    assert r_open.content.startswith(b"%PDF")
+    assert "etag" not in r_open.headers
+
+    assert client.post(f"/inventory/orders/{order['id']}/complete", headers=session.headers).status_code == 200
+    r_done = client.get(f"/inventory/orders/{order['id']}/pdf", headers=session.headers)
+    assert r_done.status_code == 200
+    etag = r_done.headers["etag"]
+
+    r_again = client.get(
+        f"/inventory/orders/{order['id']}/pdf", headers={**session.headers, "If-None-Match": etag}
+    )
+    assert r_again.status_code == 304
+    assert r_again.content == b""
+
+
+def test_batch_pdf_and_zip(client, tenant_session):
+    session = tenant_session()
+    orders = [_create_order(client, session, f"pdfb{idx}") for idx in range(3)]
+    order_ids = [order["id"] for order in orders]
+
+    r_pdf = client.post("/inventory/orders/pdf", headers=session.headers, json={"order_ids": order_ids})
+    assert r_pdf.status_code == 200, r_pdf.text
+    assert r_pdf.headers["content-type"] == "application/pdf"
+    assert r_pdf.content.count(b"/Type /Page\n") + r_pdf.content.count(b"/Type /Page ") >= 3
+
+    r_zip = client.post(
+        "/inventory/orders/pdf", headers=session.headers, json={"order_ids": order_ids, "format": "zip"}
+    )
+    assert r_zip.status_code == 200, r_zip.text
+    names = zipfile.ZipFile(BytesIO(r_zip.content)).namelist()
+    assert names == [f"order-{order['number']}.pdf" for order in orders]
+
+    other = tenant_session()
+    r_foreign = client.post("/inventory/orders/pdf", headers=other.headers, json={"order_ids": order_ids})
+    assert r_foreign.status_code == 404
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from app.tests.helpers import admin_headers
+
+
+def test_principal_cache_evicted_on_membership_change(client, tenant_session):
+    session = tenant_session()
+
+    for _ in range(2):
+        r_units = client.get("/inventory/units", headers=session.headers)
+        assert r_units.status_code == 200, r_units.text
+
+    metrics = client.get("/metrics").text
+    assert 'cache_requests_total{cache="principal",result="hit"}' in metrics
+
+    r_patch = client.patch(
+        f"/admin/tenants/{session.tenant_id}/users/{session.membership_id}",
+        headers=admin_headers(),
+        json={"membership_is_active": False},
+    )
+    assert r_patch.status_code == 200, r_patch.text
+
+    r_units = client.get("/inventory/units", headers=session.headers)
+    assert r_units.status_code == 403
+    assert r_units.json()["error"]["code"] == "no_membership"
+
+
+def test_principal_cache_evicted_on_user_deactivation(client, tenant_session):
+    session = tenant_session()
+    assert client.get("/inventory/units", headers=session.headers).status_code == 200
+
+    r_patch = client.patch(
+        f"/admin/users/{session.user_id}",
+        headers=admin_headers(),
+        json={"is_active": False},
+    )
+    assert r_patch.status_code == 200, r_patch.text
+
+    r_units = client.get("/inventory/units", headers=session.headers)
+    assert r_units.status_code == 403
+    assert r_units.json()["error"]["code"] == "user_inactive"
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core import db as db_module
+from app.core import read_routing
+from app.core.config import settings
+from app.models.base import Base
+from app.modules.inventory.routes import CSV_COLUMNS
+from app.observability.metrics import metrics_registry
+
+
+@pytest.fixture
+def replica(monkeypatch, tmp_path):
+    """
+    Zweite SQLite-Datenbank als Replica: gleiches Schema, aber (wie bei Replikations-Lag) ohne
+    die zuvor auf der Primary geschriebenen Daten.
+    """
+    monkeypatch.setattr(settings, "DATABASE_READ_URL", f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    monkeypatch.setattr(db_module, "_read_engine", None)
+    monkeypatch.setattr(db_module, "_read_sessionmaker", None)
+    read_routing._recent_writers.clear()
+    yield
+    read_routing._recent_writers.clear()
+
+
+async def _create_replica_schema() -> None:
+    db_module._import_models()
+    db_module.get_read_sessionmaker()
+    async with db_module._read_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def _item_names(client, session) -> list[str]:
+    r = client.get("/inventory/items", headers=session.headers, params={"page_size": 50})
+    assert r.status_code == 200, r.text
+    return sorted(item["name"] for item in r.json()["items"])
+
+
+def test_read_routes_use_replica_except_right_after_own_writes(client, tenant_session, replica):
+    session = tenant_session()
+    r = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "rr1", "barcode": "rr1", "name": "Primary", "quantity": 1},
+    )
+    assert r.status_code == 200, r.text
+    with client:
+        client.portal.call(_create_replica_schema)
+    client.cookies.clear()
+    read_routing._recent_writers.clear()
+
+    # Listen lesen von der Replica (dort fehlt das Item noch)
+    assert _item_names(client, session) == []
+
+    r_write = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "rr2", "barcode": "rr2", "name": "Eigene Änderung", "quantity": 1},
+    )
+    assert r_write.status_code == 200, r_write.text
+    assert read_routing.READ_PRIMARY_COOKIE in r_write.cookies
+    # read-your-writes: derselbe Client liest direkt danach von der Primary
+    assert _item_names(client, session) == ["Eigene Änderung", "Primary"]
+
+    # auch ohne Cookie (z.B. Scanner-Client) über die Credentials erkannt
+    client.cookies.clear()
+    assert _item_names(client, session) == ["Eigene Änderung", "Primary"]
+
+    # ein anderer Client ohne eigene Schreibzugriffe liest weiter von der Replica
+    other = tenant_session()
+    client.cookies.clear()
+    assert _item_names(client, other) == []
+
+
+def test_streamed_export_reads_from_replica(client, tenant_session, replica):
+    session = tenant_session()
+    r = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "rx1", "barcode": "rx1", "name": "Nur Primary", "quantity": 1},
+    )
+    assert r.status_code == 200, r.text
+    with client:
+        client.portal.call(_create_replica_schema)
+    client.cookies.clear()
+    read_routing._recent_writers.clear()
+    replica_reads = metrics_registry.get_sample_value("db_read_sessions_total", {"target": "replica"}) or 0.0
+
+    # Export streamt nach dem Handler in eigener Session: die muss auf der Replica laufen
+    r_export = client.get("/inventory/items/export", headers=session.headers, params={"format": "csv"})
+    assert r_export.status_code == 200, r_export.text
+    assert r_export.text.strip().splitlines() == [",".join(CSV_COLUMNS)]
+    assert metrics_registry.get_sample_value("db_read_sessions_total", {"target": "replica"}) == replica_reads + 1
+
+    # read-your-writes gilt auch für Exporte
+    r_write = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "rx2", "barcode": "rx2", "name": "Neu", "quantity": 1},
+    )
+    assert r_write.status_code == 200, r_write.text
+    r_export = client.get("/inventory/items/export", headers=session.headers, params={"format": "csv"})
+    assert len(r_export.text.strip().splitlines()) == 3
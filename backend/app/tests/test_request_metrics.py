@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import uuid
+
+from app.observability.metrics import metrics_registry
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return metrics_registry.get_sample_value(name, labels) or 0.0
+
+
+def test_request_metrics_use_route_template_and_count_queries(client, tenant_session):
+    session = tenant_session()
+    template = "/inventory/items/{item_id}"
+    requests_before = _sample("app_requests_total", {"method": "GET", "path": template, "status": "404"})
+    queries_before = _sample("app_request_db_queries_sum", {"method": "GET", "path": template})
+
+    paths = [f"/inventory/items/{uuid.uuid4()}" for _ in range(3)]
+    for path in paths:
+        r = client.get(path, headers=session.headers)
+        assert r.status_code == 404, r.text
+
+    assert _sample("app_requests_total", {"method": "GET", "path": template, "status": "404"}) == requests_before + 3
+    # Statements aus Dependencies (Cache-Miss) und Handler landen beim Request
+    assert _sample("app_request_db_queries_sum", {"method": "GET", "path": template}) >= queries_before + 3
+    assert _sample("app_request_db_duration_seconds_count", {"method": "GET", "path": template}) >= 3
+
+    paths.append(f"/does-not-exist/{uuid.uuid4()}")
+    assert client.get(paths[-1]).status_code == 404
+    assert _sample("app_requests_total", {"method": "GET", "path": "unmatched", "status": "404"}) >= 1
+
+    # keine Zeitreihe pro konkreter ID
+    scrape = client.get("/metrics").text
+    assert not any(path in scrape for path in paths)
+
+
+def test_request_middleware_sets_request_id_and_measures_streaming_body(client, tenant_session):
+    session = tenant_session()
+    r_meta = client.get("/meta", headers={"X-Request-Id": "req-123"})
+    assert r_meta.headers.get_list("x-request-id") == ["req-123"]
+
+    r_missing = client.get(f"/inventory/items/{uuid.uuid4()}", headers=session.headers)
+    assert r_missing.status_code == 404
+    # Fehlerantworten setzen die ID selbst; die Middleware darf sie nicht doppeln
+    assert len(r_missing.headers.get_list("x-request-id")) == 1
+
+    labels = {"method": "GET", "path": "/inventory/items/export"}
+    queries_before = _sample("app_request_db_queries_sum", labels)
+    # Tenant/Principal liegen jetzt im Cache: SQL läuft nur noch beim Streamen des Bodys
+    r_export = client.get("/inventory/items/export", headers=session.headers, params={"format": "csv"})
+    assert r_export.status_code == 200, r_export.text
+    assert r_export.text.startswith("sku")
+    assert _sample("app_request_db_queries_sum", labels) > queries_before
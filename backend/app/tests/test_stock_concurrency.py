@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+
+from httpx import AsyncClient, Response
+from sqlalchemy import func, select
+
+from app.core.db import get_sessionmaker
+from app.main import app
+from app.models.movement import InventoryMovement
+
+PARALLEL_REQUESTS = 25
+START_QTY = 10
+
+
+async def _booked_movements(item_id: str) -> int:
+    async with get_sessionmaker()() as db:
+        return await db.scalar(
+            select(func.count()).select_from(InventoryMovement).where(InventoryMovement.item_id == uuid.UUID(item_id))
+        )
+
+
+def test_parallel_out_movements_never_oversell(client, tenant_session):
+    session = tenant_session()
+    r_item = client.post(
+        "/inventory/items",
+        headers=session.headers,
+        json={"sku": "stress", "barcode": "stress", "name": "Stress", "quantity": START_QTY},
+    )
+    assert r_item.status_code == 200, r_item.text
+    item_id = r_item.json()["id"]
+
+    async def _scan_in_parallel() -> list[Response]:
+        # gleichzeitige Requests in einem Event-Loop (TestClient arbeitet sequentiell)
+        async with AsyncClient(app=app, base_url="http://test") as async_client:
+
+            async def scan(idx: int) -> Response:
+                return await async_client.post(
+                    "/inventory/movements",
+                    headers=session.headers,
+                    json={"client_tx_id": f"stress-{idx}", "type": "OUT", "barcode": "stress", "qty": 1},
+                )
+
+            return await asyncio.gather(*(scan(idx) for idx in range(PARALLEL_REQUESTS)))
+
+    with client:
+        responses = client.portal.call(_scan_in_parallel)
+        booked = client.portal.call(_booked_movements, item_id)
+
+    statuses = sorted(r.status_code for r in responses)
+    assert statuses.count(200) == START_QTY
+    assert all(r.json()["error"]["code"] == "qty_negative" for r in responses if r.status_code == 400)
+    assert booked == START_QTY
+
+    r_final = client.get(f"/inventory/items/{item_id}", headers=session.headers)
+    assert r_final.json()["quantity"] == 0
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import uuid
+
+from app.core.cache import TTLCache
+from app.tests.helpers import admin_headers
+
+
+def test_ttl_cache_expires_and_evicts_lru():
+    now = [0.0]
+    cache: TTLCache[str, int] = TTLCache(name="test", max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a ist jetzt zuletzt genutzt
+    cache.set("c", 3)
+    assert cache.get("b") is None  # b wurde verdrängt
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_tenant_resolve_cache_is_invalidated_on_update(client):
+    slug = f"c{uuid.uuid4().hex[:8]}"
+    r_create = client.post(
+        "/admin/tenants",
+        headers=admin_headers(),
+        json={"slug": slug, "name": "Cache Tenant"},
+    )
+    assert r_create.status_code == 201, r_create.text
+    tenant_id = r_create.json()["id"]
+
+    for _ in range(2):
+        r_ping = client.get("/inventory/ping", headers={"X-Tenant-Slug": slug})
+        assert r_ping.status_code == 200, r_ping.text
+        assert r_ping.json()["tenant"]["name"] == "Cache Tenant"
+
+    r_patch = client.patch(
+        f"/admin/tenants/{tenant_id}",
+        headers=admin_headers(),
+        json={"name": "Renamed", "is_active": False},
+    )
+    assert r_patch.status_code == 200, r_patch.text
+
+    r_ping = client.get("/inventory/ping", headers={"X-Tenant-Slug": slug})
+    assert r_ping.status_code == 404
+
+    client.patch(
+        f"/admin/tenants/{tenant_id}",
+        headers=admin_headers(),
+        json={"is_active": True},
+    )
+    r_ping = client.get("/inventory/ping", headers={"X-Tenant-Slug": slug})
+    assert r_ping.status_code == 200, r_ping.text
+    assert r_ping.json()["tenant"]["name"] == "Renamed"
+
+    metrics = client.get("/metrics").text
+    assert 'cache_requests_total{cache="tenant",result="hit"}' in metrics
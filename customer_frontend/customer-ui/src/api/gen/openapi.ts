@@ -1620,6 +1620,13 @@ export interface components {
             ok: boolean;
             /** Error */
             error?: string | null;
+            /**
+             * Queued
+             * @default false
+             */
+            queued?: boolean;
+            /** Outbox Id */
+            outbox_id?: string | null;
         };
         /** HTTPValidationError */
         HTTPValidationError: {
@@ -1984,6 +1991,18 @@ export interface components {
             updated: number;
             /** Errors */
             errors: Record<string, never>[];
+            /**
+             * Processed
+             * @description Gelesene Datenzeilen
+             * @default 0
+             */
+            processed?: number;
+            /**
+             * Chunks
+             * @description Geschriebene (und committete) Blöcke
+             * @default 0
+             */
+            chunks?: number;
         };
         /** MembershipCreate */
         MembershipCreate: {
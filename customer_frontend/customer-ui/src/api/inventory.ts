@@ -100,8 +100,12 @@ export async function importItems(token: string, file: File, mapping?: Record<st
 }
 
 export async function exportItems(token: string) {
-  const res = await api.get<{ csv: string }>("/inventory/items/export", { headers: authHeaders(token) });
-  return res.data.csv;
+  const res = await api.get<string>("/inventory/items/export", {
+    headers: authHeaders(token),
+    params: { format: "csv" },
+    responseType: "text",
+  });
+  return res.data;
 }
 
 export async function exportInventory(token: string) {